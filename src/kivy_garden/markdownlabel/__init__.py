@@ -14,28 +14,43 @@ Example usage::
 """
 
 import re
+from functools import partial
 
 from kivy.uix.boxlayout import BoxLayout
 from kivy.clock import Clock
 from kivy.uix.stencilview import StencilView
 
-import mistune
-from mistune.plugins.table import table
-from mistune.plugins.formatting import strikethrough
-
 from ._version import __version__
+from .ast_cache import get_ast_cache
+from .background_parser import submit_parse
+from .block_reconciler import BlockKeyCache, match_blocks, renderer_signature
+from .canvas_document import CanvasDocument
+from .compact_ast import Node, is_token, to_dicts
+from .document_stats import EMPTY_STATS, compute_block_stats, merge_stats
+from .incremental_parser import IncrementalParser
 from .inline_renderer import InlineRenderer
 from .kivy_renderer import KivyRenderer
 from .markdown_serializer import MarkdownSerializer
+from .markdown_view import MarkdownView
+from .parser_registry import DEFAULT_PLUGINS, get_parser
+from .progressive_build import ProgressiveBuild
+from .prewarm import prewarm
 from .properties import MarkdownLabelProperties
+from .render_config import RenderConfig, get_renderer
 from .rendering import MarkdownLabelRendering
+from .texture_bands import TextureBands
 from .utils import collect_widget_ids, extract_font_tags, find_labels_recursive
+from .widget_pool import get_widget_pool
 
 __all__ = (
     'MarkdownLabel',
+    'MarkdownView',
+    'MarkdownFeed',
+    'IncrementalParser',
     'InlineRenderer',
     'KivyRenderer',
     'MarkdownSerializer',
+    'prewarm',
     'find_labels_recursive',
     'collect_widget_ids',
     'extract_font_tags',
@@ -93,6 +108,9 @@ class MarkdownLabel(MarkdownLabelProperties, MarkdownLabelRendering, BoxLayout):
     Events:
         on_ref_press: Dispatched when a link is clicked. The event data
             contains the URL of the clicked link.
+        on_render_complete: Dispatched when a build has finished and the
+            displayed content matches ``text``. With ``build_budget_ms`` set,
+            this is after the last frame of a progressive build.
 
     Example::
 
@@ -100,18 +118,26 @@ class MarkdownLabel(MarkdownLabelProperties, MarkdownLabelRendering, BoxLayout):
         label.bind(on_ref_press=lambda instance, ref: print(f'Clicked: {ref}'))
     """
 
-    __events__ = ('on_ref_press',)
+    __events__ = ('on_ref_press', 'on_render_complete')
 
     def __init__(self, **kwargs):
         super(MarkdownLabel, self).__init__(**kwargs)
         self.orientation = 'vertical'
         self._in_update_style = False
+        # RenderConfig of the current styling, dropped when a styling
+        # property changes (see _get_render_config)
+        self._render_config = None
 
         # Deferred rebuild system for batching property changes
         self._pending_rebuild = False
         self._rebuild_trigger = Clock.create_trigger(
             self._do_rebuild, timeout=-1
         )
+        # Running time-sliced build for build_budget_ms, continued each frame
+        self._progressive_build = None
+        self._progressive_trigger = Clock.create_trigger(
+            self._continue_progressive_build, timeout=0
+        )
 
         # Store user's size_hint_y value before potential override
         self._user_size_hint_y = kwargs.get('size_hint_y', 1)
@@ -141,13 +167,42 @@ class MarkdownLabel(MarkdownLabelProperties, MarkdownLabelRendering, BoxLayout):
         # Rebuild when width changes so texture snapshots match actual size.
         self.bind(width=self._on_width_changed_for_texture)
 
-        # Store the parsed AST tokens
+        # Store the parsed AST tokens with their statistics (see _set_ast_tokens)
         self._ast_tokens = []
-
-        # Create mistune parser with plugins
-        self._parser = mistune.create_markdown(renderer=None)
-        table(self._parser)
-        strikethrough(self._parser)
+        self._ast_block_stats = []
+        self._ast_stats = EMPTY_STATS
+        self._ast_stats_tokens = self._ast_tokens
+
+        # mistune parser shared by every label with the same plugin set
+        self._parser_plugins = DEFAULT_PLUGINS
+        self._parser = get_parser(self._parser_plugins)
+        # Created lazily when incremental_parse is enabled or text is streamed
+        self._incremental_parser = None
+        self.bind(incremental_parse=self._on_incremental_parse_changed)
+
+        # One rendered widget (or None) per top-level AST token with its
+        # structural key, kept from widget-mode builds for block reuse.
+        self._block_widgets = None
+        self._block_keys = None
+        self._block_signature = None
+        self._block_source = None
+        # Keys of the last keyed tokens, so unchanged token objects are not
+        # hashed again
+        self._block_key_cache = BlockKeyCache()
+        # Captured content, block layout and link zones of incremental
+        # texture-mode builds (see _update_texture_blocks)
+        self._texture_bands = None
+        self._texture_block_extents = None
+        self._texture_block_zones = None
+        # Takes effect with the next rebuild (see _on_widget_pooling_changed)
+        self.bind(widget_pooling=self._on_widget_pooling_changed)
+        # Streaming state for append_text()
+        self._streaming = False
+        self._appending_text = False
+        # Background parse state for async_parse; bumping the generation
+        # invalidates results of jobs that are still running.
+        self._async_parse_future = None
+        self._parse_generation = 0
 
         # Bind text property to rebuild widgets
         self.bind(text=self._on_text_changed)
@@ -178,6 +233,9 @@ class MarkdownLabel(MarkdownLabelProperties, MarkdownLabelRendering, BoxLayout):
         self.bind(link_color=self._make_style_callback('link_color'))
         self.bind(code_bg_color=self._make_style_callback('code_bg_color'))
         self.bind(image_size_mode=self._make_style_callback('image_size_mode'))
+        self.bind(table_mode=self._make_style_callback('table_mode'))
+        self.bind(table_column_sizing=self._make_style_callback('table_column_sizing'))
+        self.bind(code_tile_lines=self._make_style_callback('code_tile_lines'))
         self.bind(fallback_enabled=self._make_style_callback('fallback_enabled'))
         self.bind(fallback_fonts=self._make_style_callback('fallback_fonts'))
         self.bind(fallback_font_scales=self._make_style_callback('fallback_font_scales'))
@@ -203,10 +261,21 @@ class MarkdownLabel(MarkdownLabelProperties, MarkdownLabelRendering, BoxLayout):
 
         # Initial build if text is provided
         if self.text:
-            self._rebuild_widgets()
+            if self._can_parse_async():
+                self._start_async_parse()
+            else:
+                self._rebuild_widgets()
 
     def _on_text_changed(self, instance, value):
         """Callback when text property changes."""
+        if self._appending_text:
+            return
+        if self._streaming:
+            # A plain assignment ends the stream.
+            self._streaming = False
+            if not self.incremental_parse:
+                self._incremental_parser = None
+        self._cancel_async_parse()
         self._schedule_rebuild()
 
     def _make_style_callback(self, prop_name):
@@ -217,6 +286,7 @@ class MarkdownLabel(MarkdownLabelProperties, MarkdownLabelRendering, BoxLayout):
 
     def _on_style_changed(self, instance, value, prop_name=None):
         """Callback when a styling property changes."""
+        self._render_config = None
         if self._in_update_style:
             return
 
@@ -250,6 +320,7 @@ class MarkdownLabel(MarkdownLabelProperties, MarkdownLabelRendering, BoxLayout):
 
     def _on_strict_label_mode_changed(self, instance, value):
         """Handle strict_label_mode property changes."""
+        self._render_config = None
         if value:
             self._unbind_minimum_height_to_height()
             self.size_hint_y = self._user_size_hint_y
@@ -275,19 +346,84 @@ class MarkdownLabel(MarkdownLabelProperties, MarkdownLabelRendering, BoxLayout):
     def _schedule_rebuild(self):
         """Schedule a rebuild for the next frame."""
         self._pending_rebuild = True
+        self._cancel_progressive_build()
         self._rebuild_trigger()
 
     def _do_rebuild(self, dt=None):
         """Execute the deferred rebuild."""
         if self._pending_rebuild:
             self._pending_rebuild = False
-            self._rebuild_widgets()
+            if self._can_parse_async():
+                self._start_async_parse()
+            else:
+                self._rebuild_widgets()
 
     def force_rebuild(self):
-        """Force an immediate synchronous rebuild."""
+        """Force an immediate synchronous rebuild.
+
+        The whole widget tree is built before this returns, even when
+        ``build_budget_ms`` is set; a running progressive build is replaced.
+        """
         self._rebuild_trigger.cancel()
         self._pending_rebuild = False
-        self._rebuild_widgets()
+        self._cancel_async_parse()
+        self._rebuild_widgets(progressive=False)
+
+    def _can_parse_async(self):
+        """Return True when the next rebuild may parse on the worker thread.
+
+        Incremental parsing and streaming keep per-label parser state and
+        always parse on the main thread.
+        """
+        return (self.async_parse and bool(self.text)
+                and not (self.incremental_parse or self._streaming))
+
+    def _start_async_parse(self):
+        """Parse on the background worker and commit the result via Clock."""
+        self._cancel_async_parse()
+        generation = self._parse_generation
+        config = self._get_render_config()
+        future = submit_parse(self.text, self._parser_plugins, config.renderer_kwargs(), self.compact_ast)
+        self._async_parse_future = future
+
+        def on_done(done_future):
+            # Runs on the worker thread; Clock scheduling is thread-safe.
+            Clock.schedule_once(
+                partial(self._commit_async_parse, generation, done_future, config), 0
+            )
+        future.add_done_callback(on_done)
+
+    def _cancel_async_parse(self):
+        """Invalidate the in-flight background parse, if any."""
+        self._parse_generation += 1
+        if self._async_parse_future is not None:
+            self._async_parse_future.cancel()
+            self._async_parse_future = None
+
+    def _commit_async_parse(self, generation, future, config, dt=None):
+        """Build widgets from a finished background parse on the main thread.
+
+        Results are dropped when the text changed or a rebuild was requested
+        while the job ran. Prerendered markup is only used when the styling
+        is still the one the job rendered with.
+        """
+        if generation != self._parse_generation or future.cancelled():
+            return
+        self._async_parse_future = None
+        if self._pending_rebuild:
+            return
+
+        try:
+            result = future.result()
+        except Exception:
+            # Re-run on the main thread so errors surface like a normal build.
+            self._rebuild_widgets()
+            return
+
+        inline_markup = None
+        if config == self._get_render_config():
+            inline_markup = result.inline_markup
+        self._rebuild_widgets(tokens=list(result.tokens), inline_markup=inline_markup)
 
     def _bind_minimum_height_to_height(self):
         """Bind minimum_height to height once using a stable callback."""
@@ -341,47 +477,108 @@ class MarkdownLabel(MarkdownLabelProperties, MarkdownLabelRendering, BoxLayout):
         clipping_container.size_hint_x = None
         self._attach_clipping_bindings(clipping_container, bind_height=bind_height)
 
-    def _rebuild_widgets(self):
-        """Parse the Markdown text and rebuild the widget tree."""
-        self._detach_clipping_bindings()
-        self.clear_widgets()
-        self._aggregated_refs = {}
+    def _on_incremental_parse_changed(self, instance, value):
+        """Drop the cached incremental parse state when disabled."""
+        if not value and not self._streaming:
+            self._incremental_parser = None
+
+    def _on_widget_pooling_changed(self, instance, value):
+        """Render with or without the widget pool from the next rebuild on."""
+        self._render_config = None
+
+    def _release_widget(self, widget):
+        """Detach ``widget``, returning its pooled widgets to the widget pool."""
+        if self.widget_pooling:
+            get_widget_pool().release(widget)
+        elif widget.parent is not None:
+            widget.parent.remove_widget(widget)
+
+    def _reset_block_state(self):
+        """Forget the per-block widgets of the previous build."""
+        self._block_widgets = None
+        self._block_keys = None
+        self._block_signature = None
+        self._block_source = None
+        self._texture_bands = None
+        self._texture_block_extents = None
+        self._texture_block_zones = None
+
+    def _parse_tokens(self):
+        """Parse ``self.text`` into top-level AST tokens.
+
+        With ``incremental_parse`` enabled, or while text is streamed through
+        :meth:`append_text`, only the blocks touched since the previous parse
+        are re-parsed; these tokens stay mistune dicts because the incremental
+        parser keeps them anyway. Otherwise the shared AST cache is consulted
+        first, so text that was parsed before (by any label) is not parsed
+        again, and ``compact_ast`` selects compact nodes.
+
+        Returns:
+            List of top-level tokens (dicts or compact nodes). The list is owned
+            by the caller; the tokens may be shared and must not be mutated.
+        """
+        if self.incremental_parse or self._streaming:
+            if self._incremental_parser is None:
+                self._incremental_parser = IncrementalParser(self._parser)
+            return self._incremental_parser.parse(self.text)
 
-        if not self.text:
-            self._ast_tokens = []
-            return
+        return get_ast_cache().parse(self._parser, self.text, self._parser_plugins,
+                                     compact=self.compact_ast)
 
-        # Parse Markdown to AST
-        result = self._parser.parse(self.text)
-        tokens = result[0] if isinstance(result, tuple) else result
+    def _set_ast_tokens(self, tokens):
+        """Store ``tokens`` as the current AST and compute its statistics.
 
-        # Normalize degenerate single structural tokens (e.g., lone markers) to a
-        # paragraph token so they render as a Label, while keeping strict Markdown
-        # semantics for meaningful content.
-        if self._is_degenerate_single_block(tokens):
-            tokens = [{
-                'type': 'paragraph',
-                'children': [{'type': 'text', 'raw': self.text}]
-            }]
+        Statistics are kept per top-level block. Leading tokens that are the
+        same objects as in the previous AST (blocks reused by the incremental
+        parser or unchanged by a streamed append) keep their statistics, and
+        blocks prewarmed with their statistics take them from the AST cache,
+        so only the remaining blocks are walked.
 
+        Args:
+            tokens: Top-level tokens of the document
+        """
+        old_tokens = self._ast_tokens
+        old_stats = self._ast_block_stats
+        keep = 0
+        if len(old_stats) == len(old_tokens):
+            limit = min(len(old_tokens), len(tokens))
+            while keep < limit and tokens[keep] is old_tokens[keep]:
+                keep += 1
+
+        cache = get_ast_cache()
+        block_stats = old_stats[:keep]
+        for token in tokens[keep:]:
+            stats = cache.block_stats(token)
+            block_stats.append(stats if stats is not None else compute_block_stats(token))
         self._ast_tokens = tokens
+        self._ast_block_stats = block_stats
+        self._ast_stats = merge_stats(block_stats)
+        self._ast_stats_tokens = tokens
 
-        # Create renderer with current styling properties
-        renderer = KivyRenderer(
+    def _get_render_config(self):
+        """Return the RenderConfig for the current styling properties.
+
+        The config is built once and kept until a styling property changes,
+        so rebuilds reuse it and the shared renderer for it.
+        """
+        config = self._render_config
+        if config is not None:
+            return config
+        config = RenderConfig.from_kwargs(
             base_font_size=self.base_font_size,
             code_font_name=self.code_font_name,
-            link_color=list(self.link_color),
+            link_color=self.link_color,
             link_style=self.link_style,
-            code_bg_color=list(self.code_bg_color),
+            code_bg_color=self.code_bg_color,
             font_name=self.font_name,
-            color=list(self.color),
+            color=self.color,
             outline_width=self.outline_width,
-            outline_color=list(self.outline_color),
-            disabled_outline_color=list(self.disabled_outline_color),
+            outline_color=self.outline_color,
+            disabled_outline_color=self.disabled_outline_color,
             line_height=self.line_height,
             halign=self._get_effective_halign(),
             valign=self.valign,
-            text_size=list(self.text_size) if self.text_size else [None, None],
+            text_size=self.text_size if self.text_size else (None, None),
             unicode_errors=self.unicode_errors,
             strip=self.strip,
             font_family=self.font_family,
@@ -391,7 +588,7 @@ class MarkdownLabel(MarkdownLabelProperties, MarkdownLabelRendering, BoxLayout):
             font_kerning=self.font_kerning,
             font_blended=self.font_blended,
             disabled=self.disabled,
-            disabled_color=list(self.disabled_color),
+            disabled_color=self.disabled_color,
             mipmap=self.mipmap,
             base_direction=self.base_direction,
             text_language=self.text_language,
@@ -399,25 +596,192 @@ class MarkdownLabel(MarkdownLabelProperties, MarkdownLabelRendering, BoxLayout):
             max_lines=int(self.max_lines),
             shorten_from=self.shorten_from,
             split_str=self.split_str,
-            text_padding=list(self.text_padding),
+            text_padding=self.text_padding,
             strict_label_mode=self.strict_label_mode,
             image_size_mode=self.image_size_mode,
-            ellipsis_options=dict(self.ellipsis_options),
+            table_mode=self.table_mode,
+            table_column_sizing=self.table_column_sizing,
+            code_tile_lines=int(self.code_tile_lines),
+            ellipsis_options=self.ellipsis_options,
             limit_render_to_text_bbox=self.limit_render_to_text_bbox,
             fallback_enabled=self.fallback_enabled,
-            fallback_fonts=list(self.fallback_fonts),
-            fallback_font_scales=dict(self.fallback_font_scales)
+            fallback_fonts=self.fallback_fonts,
+            fallback_font_scales=self.fallback_font_scales,
+            widget_pooling=self.widget_pooling
         )
+        self._render_config = config
+        return config
 
-        # Render AST to widget tree
-        content = renderer(self._ast_tokens, None)
+    def _get_renderer_kwargs(self):
+        """Return KivyRenderer keyword arguments for the current styling properties."""
+        return self._get_render_config().renderer_kwargs()
 
-        # Apply text_size bindings consistently using rendering mixin logic
-        self._update_text_size_bindings_in_place(content)
+    def _create_renderer(self, config=None, inline_markup=None):
+        """Return a KivyRenderer configured from the current styling properties.
+
+        Renderers are shared between rebuilds and labels with the same
+        config. Builds with prerendered inline markup get a private renderer.
+        """
+        if config is None:
+            config = self._get_render_config()
+        if not inline_markup:
+            return get_renderer(config)
+        renderer = KivyRenderer(**config.renderer_kwargs())
+        renderer.inline_markup = inline_markup
+        return renderer
+
+    def _render_blocks_reusing(self, renderer, tokens, keys):
+        """Render top-level tokens, reusing widgets of unchanged blocks.
+
+        Widgets from the previous widget-mode build are matched to the new
+        tokens by structural key; only unmatched tokens are rendered.
+
+        Args:
+            renderer: KivyRenderer used for new blocks
+            tokens: Top-level AST tokens to render
+            keys: Structural keys parallel to ``tokens``
+
+        Returns:
+            List of block widgets parallel to ``tokens``
+        """
+        old_widgets = self._block_widgets or []
+        matches = match_blocks(self._block_keys or [], keys)
+        if self.widget_pooling:
+            # Return discarded blocks first so new blocks can reuse their widgets.
+            kept = set(matches)
+            for old_index, widget in enumerate(old_widgets):
+                if old_index not in kept and widget is not None:
+                    self._release_widget(widget)
+
+        widgets = []
+        for token, old_index in zip(tokens, matches):
+            widget = old_widgets[old_index] if old_index is not None else None
+            if widget is None:
+                widget = renderer.render_block(token)
+            elif widget.parent is not None:
+                widget.parent.remove_widget(widget)
+            widgets.append(widget)
+        return widgets
+
+    def _rebuild_widgets(self, tokens=None, inline_markup=None, progressive=True):
+        """Parse the Markdown text and rebuild the widget tree.
+
+        Args:
+            tokens: Top-level tokens of ``self.text`` parsed ahead of time, or
+                None to parse now
+            inline_markup: Inline markup prerendered for ``tokens`` with the
+                current styling (see ``InlineRenderer.prerender``)
+            progressive: Allow spreading the build over frames when
+                ``build_budget_ms`` is set
+        """
+        self._cancel_progressive_build()
+        # After a text change, widgets of the previous widget-mode build are
+        # reused for blocks whose tokens are unchanged (same structure, same
+        # renderer config). Rebuilds for any other reason recreate everything.
+        previous_signature = self._block_signature
+        previous_source = self._block_source
+
+        if not self.text:
+            self._clear_content()
+            self._set_ast_tokens([])
+            self._reset_block_state()
+            self.dispatch('on_render_complete')
+            return
+
+        # Parse Markdown to AST
+        if tokens is None:
+            tokens = self._parse_tokens()
+
+        # Normalize degenerate single structural tokens (e.g., lone markers) to a
+        # paragraph token so they render as a Label, while keeping strict Markdown
+        # semantics for meaningful content.
+        if self._is_degenerate_single_block(tokens):
+            if isinstance(tokens[0], Node):
+                tokens = [Node('paragraph', children=(Node('text', raw=self.text),))]
+            else:
+                tokens = [{
+                    'type': 'paragraph',
+                    'children': [{'type': 'text', 'raw': self.text}]
+                }]
+
+        self._set_ast_tokens(tokens)
+
+        config = self._get_render_config()
+        renderer = self._create_renderer(config, inline_markup)
+        signature = renderer_signature(config, self.render_mode)
 
         # Determine effective render mode
         effective_render_mode = self._get_effective_render_mode()
 
+        # Render AST to widget tree, keeping the per-token widgets so later
+        # rebuilds and streamed appends can reuse unchanged blocks.
+        keys = self._block_key_cache.keys(tokens)
+        reuse_blocks = (effective_render_mode in ('widgets', 'hybrid', 'canvas', 'texture')
+                        and signature == previous_signature
+                        and self.text != previous_source)
+        progressive = progressive and self.build_budget_ms > 0
+        if (self.widget_pooling and not reuse_blocks
+                and (effective_render_mode == 'widgets' or not progressive)):
+            # The displayed content is replaced by this build anyway; return
+            # its widgets to the pool first so the build can reuse them.
+            self._clear_content()
+
+        if reuse_blocks:
+            block_widgets = self._render_blocks_reusing(renderer, tokens, keys)
+            if (effective_render_mode == 'texture'
+                    and self._update_texture_blocks(block_widgets)):
+                self._block_widgets = block_widgets
+                self._block_keys = keys
+                self._block_source = self.text
+                self.dispatch('on_render_complete')
+                return
+        elif progressive:
+            build = ProgressiveBuild(renderer, tokens, keys, signature,
+                                     effective_render_mode, self.build_budget_ms)
+            build.render_slice()
+            if not build.done:
+                self._start_progressive_build(build)
+                return
+            block_widgets = build.widgets
+        else:
+            block_widgets = renderer.render_blocks(tokens)
+
+        self._commit_blocks(renderer, block_widgets, keys, signature, effective_render_mode)
+
+    def _clear_content(self):
+        """Remove the displayed content and its hit-test zones."""
+        self._detach_clipping_bindings()
+        if self.widget_pooling:
+            for child in list(self.children):
+                self._release_widget(child)
+        else:
+            self.clear_widgets()
+        self._aggregated_refs = {}
+
+    def _commit_blocks(self, renderer, block_widgets, keys, signature,
+                       effective_render_mode, complete=True):
+        """Replace the displayed content with rendered block widgets.
+
+        Args:
+            renderer: KivyRenderer that rendered the blocks
+            block_widgets: Widgets parallel to ``keys`` (None for skipped tokens)
+            keys: Structural keys of the blocks
+            signature: Renderer signature of the build
+            effective_render_mode: ``'widgets'``, ``'texture'``, ``'hybrid'``
+                or ``'canvas'``
+            complete: False when more blocks of a progressive build follow;
+                the per-block state is then left unset and
+                ``on_render_complete`` is not dispatched
+        """
+        self._clear_content()
+        self._reset_block_state()
+        if effective_render_mode == 'hybrid':
+            block_widgets = self._wrap_heavy_blocks(block_widgets)
+        content = renderer.create_root(block_widgets)
+
+        # Apply text_size bindings consistently using rendering mixin logic
+        self._update_text_size_bindings_in_place(content)
+
         # Handle texture render mode
         if effective_render_mode == 'texture':
             self._bind_ref_press_events(content)
@@ -435,32 +799,199 @@ class MarkdownLabel(MarkdownLabelProperties, MarkdownLabelRendering, BoxLayout):
                 else:
                     self.add_widget(image)
 
+                # The captured widgets are no longer needed, unless their
+                # bands are captured later as they near the viewport or
+                # redrawn after text changes.
+                if not isinstance(image, TextureBands):
+                    self._release_widget(content)
+                elif self.incremental_texture and complete:
+                    self._record_texture_blocks(image, block_widgets)
+                    self._block_widgets = block_widgets
+                    self._block_keys = keys
+                    self._block_signature = signature
+                    self._block_source = self.text
                 self._bind_child_size_changes(self)
+                self.dispatch('on_render_complete')
                 return
 
             # Texture rendering failed and widget-mode fallback will be used.
             # Ensure stale texture hit-test zones never survive fallback.
             self._aggregated_refs = {}
 
-        # Widget render mode (default)
-        self._bind_ref_press_events(content)
+        # Widget render mode (default). In canvas mode the blocks stay in
+        # the detached root, drawn by a single CanvasDocument.
+        if effective_render_mode == 'canvas':
+            blocks = [CanvasDocument(content=content, size_hint_y=None)]
+        else:
+            blocks = list(reversed(content.children))
+            for child in blocks:
+                content.remove_widget(child)
+        for child in blocks:
+            self._bind_ref_press_events(child)
+        if complete:
+            self._block_widgets = block_widgets
+            self._block_keys = keys
+            self._block_signature = signature
+            self._block_source = self.text
         needs_clipping = self._needs_clipping()
 
         if needs_clipping:
             clipping_container = _ClippingContainer()
             self._configure_clipping_container(clipping_container)
 
-            for child in reversed(list(content.children)):
-                content.remove_widget(child)
+            for child in blocks:
                 clipping_container.add_widget(child)
 
             self.add_widget(clipping_container)
         else:
-            for child in reversed(list(content.children)):
-                content.remove_widget(child)
+            for child in blocks:
                 self.add_widget(child)
 
         self._bind_child_size_changes(self)
+        if complete:
+            self.dispatch('on_render_complete')
+
+    def _start_progressive_build(self, build):
+        """Show the first slice of ``build`` and continue it on later frames.
+
+        In widget mode the rendered blocks are displayed right away. In
+        texture, hybrid and canvas mode the previous content stays visible
+        until every block is rendered.
+        """
+        self._progressive_build = build
+        self._reset_block_state()
+        if build.render_mode == 'widgets':
+            self._commit_blocks(build.renderer, build.widgets, build.keys,
+                                build.signature, 'widgets', complete=False)
+        self._progressive_trigger()
+
+    def _continue_progressive_build(self, dt=None):
+        """Render the next slice of the running progressive build."""
+        build = self._progressive_build
+        if build is None:
+            return
+        if renderer_signature(self._get_render_config(), self.render_mode) != build.signature:
+            # Styling changed since the build started; blocks rendered from
+            # now on would not match, so start over with the new styling.
+            self._rebuild_widgets()
+            return
+
+        widgets = build.render_slice()
+        if build.render_mode == 'widgets':
+            self._attach_progressive_blocks(build.renderer, widgets)
+
+        if not build.done:
+            self._progressive_trigger()
+            return
+
+        self._progressive_build = None
+        if build.render_mode == 'widgets':
+            self._block_widgets = build.widgets
+            self._block_keys = build.keys
+            self._block_signature = build.signature
+            self._block_source = self.text
+            self.dispatch('on_render_complete')
+        else:
+            self._commit_blocks(build.renderer, build.widgets, build.keys,
+                                build.signature, build.render_mode)
+
+    def _attach_progressive_blocks(self, renderer, widgets):
+        """Append blocks rendered by a progressive build to the display."""
+        content = renderer.create_root(widgets)
+        self._update_text_size_bindings_in_place(content)
+        self._bind_ref_press_events(content)
+
+        container = self._active_clipping_container or self
+        for child in reversed(list(content.children)):
+            content.remove_widget(child)
+            container.add_widget(child)
+            self._bind_child_size_changes(child)
+
+    def _cancel_progressive_build(self):
+        """Stop the running progressive build, if any."""
+        self._progressive_trigger.cancel()
+        self._progressive_build = None
+
+    def append_text(self, chunk):
+        """Append ``chunk`` to ``text``, re-rendering only the trailing blocks.
+
+        Intended for output that arrives piece by piece, such as streamed chat
+        responses. Top-level blocks that were already closed keep their AST
+        tokens and widgets; only the trailing open block (paragraph, list,
+        fence, table, ...) is re-parsed and rebuilt, so the cost of an append
+        grows with the size of that block rather than the whole text.
+
+        Falls back to a regular deferred rebuild when there is no widget tree
+        to patch (first chunk, texture mode without ``incremental_texture``,
+        or a rebuild already pending).
+        Assigning ``text`` directly ends the stream.
+
+        Args:
+            chunk: Markdown text to append
+        """
+        if not chunk:
+            return
+
+        self._streaming = True
+        self._appending_text = True
+        try:
+            self.text += chunk
+        finally:
+            self._appending_text = False
+
+        if self._pending_rebuild or self._block_widgets is None:
+            self._schedule_rebuild()
+            return
+
+        self._rebuild_trailing_blocks()
+
+    def _rebuild_trailing_blocks(self):
+        """Re-render the blocks whose tokens changed since the last build.
+
+        Tokens reused by the incremental parser are identical objects, so the
+        unchanged leading blocks are found by identity and their widgets are
+        kept. Everything after the first changed token is replaced.
+        """
+        old_tokens = self._ast_tokens
+        tokens = self._parse_tokens()
+
+        config = self._get_render_config()
+        if (self._is_degenerate_single_block(tokens)
+                or len(old_tokens) != len(self._block_widgets)
+                or renderer_signature(config, self.render_mode) != self._block_signature):
+            self.force_rebuild()
+            return
+
+        self._set_ast_tokens(tokens)
+        if self._get_effective_render_mode() != 'widgets':
+            self.force_rebuild()
+            return
+
+        keep = 0
+        limit = min(len(old_tokens), len(tokens))
+        while keep < limit and tokens[keep] is old_tokens[keep]:
+            keep += 1
+
+        container = self._active_clipping_container or self
+        for widget in self._block_widgets[keep:]:
+            if widget is not None and widget.parent is container:
+                self._release_widget(widget)
+
+        renderer = self._create_renderer(config)
+        new_widgets = renderer.render_blocks(tokens[keep:])
+        content = renderer.create_root(new_widgets)
+        self._update_text_size_bindings_in_place(content)
+        self._bind_ref_press_events(content)
+
+        for child in reversed(list(content.children)):
+            content.remove_widget(child)
+            container.add_widget(child)
+            self._bind_child_size_changes(child)
+
+        self._block_widgets = self._block_widgets[:keep] + new_widgets
+        self._block_source = self.text
+        self._block_keys = self._block_key_cache.keys(tokens)
+        self.dispatch('on_render_complete')
 
     def on_touch_down(self, touch):
         """Handle touch events, including texture mode link hit-testing."""
@@ -483,6 +1014,10 @@ class MarkdownLabel(MarkdownLabelProperties, MarkdownLabelRendering, BoxLayout):
         """Event handler for link clicks."""
         pass
 
+    def on_render_complete(self):
+        """Event handler for finished builds."""
+        pass
+
     def _is_degenerate_single_block(self, tokens):
         """Return True when mistune produced a single, content-less block token.
 
@@ -512,13 +1047,20 @@ class MarkdownLabel(MarkdownLabelProperties, MarkdownLabelRendering, BoxLayout):
             return True
 
         for child in token.get('children', []) or []:
-            if isinstance(child, dict) and self._has_meaningful_content(child):
+            if is_token(child) and self._has_meaningful_content(child):
                 return True
 
         return False
 
     def get_ast(self):
-        """Return the parsed AST tokens."""
+        """Return the parsed AST tokens.
+
+        Token dicts may be shared with other labels through the AST cache and
+        must be treated as read-only. With ``compact_ast`` enabled, new dicts
+        are built from the compact nodes on each call.
+        """
+        if self._ast_tokens and isinstance(self._ast_tokens[0], Node):
+            return to_dicts(self._ast_tokens)
         return self._ast_tokens
 
     def to_markdown(self):
@@ -566,3 +1108,8 @@ class MarkdownLabel(MarkdownLabelProperties, MarkdownLabelRendering, BoxLayout):
 
         if style_changed:
             self._update_styles_in_place()
+
+
+# Imported after MarkdownLabel is defined: markdown_feed imports it from this
+# package to create the labels of its rows.
+from .markdown_feed import MarkdownFeed
@@ -0,0 +1,258 @@
+"""
+AST Cache
+=========
+
+Content-addressed cache of parsed Markdown documents.
+
+Entries are keyed by a hash of the source text and the parser plugin set, so
+any widget showing text that was parsed before - repeated help snippets,
+re-opened chat threads, recycled list rows - gets its tokens without running
+mistune again. The cache has a memory budget in bytes and evicts the least
+recently used entries when it is exceeded.
+
+Cached token trees are shared between all users of an entry. They are stored
+as tuples and handed out as new lists, so callers may replace or reorder
+top-level tokens freely, but the tokens themselves must be treated as
+read-only. Entries hold either token dicts or compact nodes; the form is part
+of the key. Entries filled by :func:`~kivy_garden.markdownlabel.prewarm.prewarm`
+also carry the statistics of each top-level block, which labels look up by
+token with :meth:`ASTCache.block_stats` instead of walking the blocks again.
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .compact_ast import Node, compact as compact_tokens
+from .document_stats import DocumentStats
+
+# Default memory budget of the shared cache (8 MiB)
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+
+def make_cache_key(text: str, plugins: Iterable[str], compact: bool = False) -> bytes:
+    """Return the cache key for ``text`` parsed with ``plugins``.
+
+    Args:
+        text: Markdown source text
+        plugins: mistune plugin names the parser was created with
+        compact: Whether the entry holds compact nodes instead of token dicts
+
+    Returns:
+        16-byte digest of the plugin set, the token form and the text
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update('\x00'.join(plugins).encode('utf-8'))
+    digest.update(b'\x02' if compact else b'\x01')
+    digest.update(text.encode('utf-8', 'surrogatepass'))
+    return digest.digest()
+
+
+def estimate_size(tokens: Any) -> int:
+    """Estimate the memory used by a token tree in bytes.
+
+    Containers shared within the tree are counted once.
+
+    Args:
+        tokens: Token list, token dict, compact node or leaf value
+
+    Returns:
+        Approximate size of all containers and values in the tree
+    """
+    size = 0
+    seen = set()
+    stack = [tokens]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, (dict, list, tuple, Node)):
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+        size += sys.getsizeof(value)
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, Node):
+            stack.extend((value.raw, value.children, value.attrs, value.extra))
+    return size
+
+
+class ASTCache:
+    """Thread-safe LRU cache of parsed token lists with a byte budget.
+
+    Args:
+        max_bytes: Memory budget in bytes; 0 disables caching
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._entries: 'OrderedDict[bytes, Tuple[Tuple[Dict[str, Any], ...], int]]' = OrderedDict()
+        # id(token) -> (token, statistics) for entries stored with block stats
+        self._block_stats: Dict[int, Tuple[Any, DocumentStats]] = {}
+        self._lock = threading.Lock()
+        self._max_bytes = max(0, int(max_bytes))
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._entries
+
+    @property
+    def max_bytes(self) -> int:
+        """Memory budget in bytes. Lowering it evicts entries immediately."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        with self._lock:
+            self._max_bytes = max(0, int(value))
+            self._evict()
+
+    def get(self, key: bytes) -> Optional[List[Dict[str, Any]]]:
+        """Return the tokens stored under ``key`` and count a hit or miss.
+
+        Args:
+            key: Key from :func:`make_cache_key`
+
+        Returns:
+            New list of the cached (shared, read-only) tokens, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(entry[0])
+
+    def block_stats(self, token: Any) -> Optional[DocumentStats]:
+        """Return the statistics stored for a cached top-level ``token``.
+
+        Args:
+            token: Top-level token as returned by :meth:`get` or :meth:`parse`
+
+        Returns:
+            Statistics of the block, or None if its entry was stored without
+            them or has been evicted
+        """
+        with self._lock:
+            entry = self._block_stats.get(id(token))
+        if entry is None or entry[0] is not token:
+            return None
+        return entry[1]
+
+    def put(self, key: bytes, tokens: Iterable[Dict[str, Any]],
+            block_stats: Optional[Sequence[DocumentStats]] = None) -> bool:
+        """Store ``tokens`` under ``key``.
+
+        Entries larger than the whole budget are not stored.
+
+        Args:
+            key: Key from :func:`make_cache_key`
+            tokens: Top-level tokens of the parsed document
+            block_stats: Statistics of each token, from
+                :func:`~kivy_garden.markdownlabel.document_stats.compute_block_stats`
+
+        Returns:
+            True if the entry was stored
+        """
+        frozen = tuple(tokens)
+        size = estimate_size(frozen)
+        with self._lock:
+            if size > self._max_bytes:
+                return False
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._forget(previous)
+            if block_stats is not None:
+                for token, stats in zip(frozen, block_stats):
+                    self._block_stats[id(token)] = (token, stats)
+            self._entries[key] = (frozen, size)
+            self.current_bytes += size
+            self._evict()
+            return True
+
+    def parse(self, parser: Any, text: str, plugins: Iterable[str],
+              compact: bool = False) -> List[Any]:
+        """Return the tokens of ``text``, parsing only on a cache miss.
+
+        Args:
+            parser: mistune parser created with ``plugins`` and ``renderer=None``
+            text: Markdown source text
+            plugins: Plugin names used for the cache key
+            compact: Return compact nodes (see ``compact_ast``) instead of dicts
+
+        Returns:
+            New list of top-level tokens
+        """
+        key = make_cache_key(text, plugins, compact)
+        tokens = self.get(key)
+        if tokens is not None:
+            return tokens
+
+        result = parser.parse(text)
+        tokens = result[0] if isinstance(result, tuple) else result
+        if compact:
+            tokens = compact_tokens(tokens)
+        self.put(key, tokens)
+        return list(tokens)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._block_stats.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the cache counters.
+
+        Returns:
+            Dict with ``hits``, ``misses``, ``entries``, ``current_bytes`` and
+            ``max_bytes``
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'current_bytes': self.current_bytes,
+                'max_bytes': self._max_bytes,
+            }
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the budget is met."""
+        while self._entries and self.current_bytes > self._max_bytes:
+            _, entry = self._entries.popitem(last=False)
+            self._forget(entry)
+
+    def _forget(self, entry: Tuple[Tuple[Any, ...], int]) -> None:
+        """Release the bytes and block statistics of a removed entry."""
+        tokens, size = entry
+        self.current_bytes -= size
+        block_stats = self._block_stats
+        for token in tokens:
+            stored = block_stats.get(id(token))
+            if stored is not None and stored[0] is token:
+                del block_stats[id(token)]
+
+
+_shared_cache = ASTCache()
+
+
+def get_ast_cache() -> ASTCache:
+    """Return the process-wide AST cache used by MarkdownLabel.
+
+    Returns:
+        Shared :class:`ASTCache` instance
+    """
+    return _shared_cache
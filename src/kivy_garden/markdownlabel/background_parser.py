@@ -0,0 +1,81 @@
+"""
+Background Parser
+=================
+
+Worker-thread parsing for MarkdownLabel's ``async_parse`` mode.
+
+Parsing and inline markup generation are pure Python and touch no GL state,
+so they can run off the Kivy main thread. Jobs run on a single shared worker
+thread, which uses its own parser from the parser registry and fills the
+shared AST cache. Widget creation stays on the main thread.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from .ast_cache import get_ast_cache
+from .kivy_renderer import KivyRenderer
+from .parser_registry import get_parser
+
+
+class ParseResult(NamedTuple):
+    """Output of a background parse job.
+
+    Attributes:
+        tokens: Top-level AST tokens of the document
+        inline_markup: Prerendered inline markup keyed by ``id()`` of each
+            inline children list in ``tokens``
+    """
+    tokens: List[Any]
+    inline_markup: Dict[int, str]
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared worker, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='markdownlabel-parse')
+        return _executor
+
+
+def parse_document(text: str, plugins: Iterable[str],
+                   renderer_kwargs: Dict[str, Any], compact: bool = False) -> ParseResult:
+    """Parse ``text`` and prerender its inline markup.
+
+    Safe to call from any thread.
+
+    Args:
+        text: Markdown source text
+        plugins: mistune plugin names
+        renderer_kwargs: KivyRenderer keyword arguments for the inline styling
+        compact: Produce compact nodes instead of token dicts
+
+    Returns:
+        ParseResult for ``text``
+    """
+    plugins = tuple(plugins)
+    tokens = get_ast_cache().parse(get_parser(plugins), text, plugins, compact)
+    inline_markup = KivyRenderer(**renderer_kwargs).inline_renderer.prerender(tokens)
+    return ParseResult(tokens, inline_markup)
+
+
+def submit_parse(text: str, plugins: Iterable[str], renderer_kwargs: Dict[str, Any],
+                 compact: bool = False) -> 'Future[ParseResult]':
+    """Run :func:`parse_document` on the background worker.
+
+    Args:
+        text: Markdown source text
+        plugins: mistune plugin names
+        renderer_kwargs: KivyRenderer keyword arguments for the inline styling
+        compact: Produce compact nodes instead of token dicts
+
+    Returns:
+        Future resolving to a ParseResult
+    """
+    return _get_executor().submit(parse_document, text, tuple(plugins), renderer_kwargs, compact)
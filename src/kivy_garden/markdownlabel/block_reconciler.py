@@ -0,0 +1,106 @@
+"""
+Block Reconciliation
+====================
+
+Helpers for reusing rendered top-level block widgets across rebuilds.
+
+Each top-level AST token gets a structural key. When the text changes, the old
+and new key sequences are diffed and widgets of blocks whose keys match are
+kept instead of being rendered again.
+"""
+
+import hashlib
+from difflib import SequenceMatcher
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+def block_key(token: Dict[str, Any]) -> bytes:
+    """Return a structural key for a top-level AST token.
+
+    Tokens with equal content (type, children, attributes and raw text) get
+    equal keys regardless of their position in the document.
+
+    Args:
+        token: Top-level mistune AST token
+
+    Returns:
+        16-byte digest of the token structure
+    """
+    return hashlib.blake2b(repr(token).encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+class BlockKeyCache:
+    """Keys of the tokens of the last keyed document, by token identity.
+
+    Incremental parsing returns the same token objects for blocks an edit
+    did not touch, so only new token objects are hashed and keying follows
+    the size of the edit. Entries hold their token, which keeps its ``id``
+    from being reused while the entry exists.
+    """
+
+    def __init__(self):
+        self._entries: Dict[int, Tuple[Any, bytes]] = {}
+
+    def keys(self, tokens: Sequence[Any]) -> List[bytes]:
+        """Return the :func:`block_key` of every token.
+
+        The entries are replaced by those of ``tokens``.
+
+        Args:
+            tokens: Top-level AST tokens
+
+        Returns:
+            Keys parallel to ``tokens``
+        """
+        known = self._entries
+        entries: Dict[int, Tuple[Any, bytes]] = {}
+        keys = []
+        for token in tokens:
+            entry = known.get(id(token))
+            if entry is None or entry[0] is not token:
+                entry = (token, block_key(token))
+            entries[id(token)] = entry
+            keys.append(entry[1])
+        self._entries = entries
+        return keys
+
+
+def renderer_signature(config: Hashable, render_mode: str) -> Tuple[str, Hashable]:
+    """Return a comparable signature of the rendering configuration.
+
+    Block widgets are only reused when they were rendered with the same
+    configuration, so changing any structure property still rebuilds them.
+
+    Args:
+        config: RenderConfig the blocks are rendered with
+        render_mode: Requested render mode of the MarkdownLabel
+
+    Returns:
+        Hashable signature; equal signatures mean equal configurations
+    """
+    return render_mode, config
+
+
+def match_blocks(old_keys: Sequence[bytes], new_keys: Sequence[bytes]) -> List[Optional[int]]:
+    """Match new blocks to reusable old blocks by key.
+
+    Matches preserve document order (longest matching runs first), so every
+    old block is reused at most once.
+
+    Args:
+        old_keys: Keys of the previously rendered blocks
+        new_keys: Keys of the blocks to render
+
+    Returns:
+        List parallel to ``new_keys`` with the index of the matching old block,
+        or None where a new widget must be rendered
+    """
+    matches: List[Optional[int]] = [None] * len(new_keys)
+    if not old_keys or not new_keys:
+        return matches
+
+    matcher = SequenceMatcher(None, old_keys, new_keys, autojunk=False)
+    for old_start, new_start, size in matcher.get_matching_blocks():
+        for offset in range(size):
+            matches[new_start + offset] = old_start + offset
+    return matches
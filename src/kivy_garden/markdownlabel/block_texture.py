@@ -0,0 +1,224 @@
+"""
+Block Texture
+=============
+
+Single blocks of a document cached as textures.
+
+``render_mode='texture'`` captures the whole document through one Fbo, so
+one image or one document taller than the maximum texture size sends
+everything back to widgets. With ``render_mode='hybrid'`` MarkdownLabel
+instead picks the blocks whose widget trees are expensive (tables, code
+blocks and long lists, by the complexity score of
+:class:`~kivy_garden.markdownlabel.document_stats.DocumentStats`) and wraps
+each of them in a :class:`BlockTexture`, while paragraphs, headings and
+images stay live widgets.
+
+A BlockTexture keeps the rendered block outside the widget tree. Whenever
+its width changes it lays the block out at that width, captures its canvas
+into an Fbo and draws the texture, so the block costs the window one
+Rectangle instead of its Labels and layouts. The links of the block are
+kept as :attr:`~kivy_garden.markdownlabel.ref_zones.RefZoneBehavior.ref_zones`.
+Blocks that cannot be captured are shown as live widgets instead.
+"""
+
+import warnings
+from math import ceil
+from typing import Any, Optional
+
+from kivy.clock import Clock
+from kivy.graphics import ClearBuffers, ClearColor, Color, Fbo, Rectangle
+from kivy.properties import BooleanProperty, ObjectProperty
+from kivy.uix.label import Label
+from kivy.uix.layout import Layout
+from kivy.uix.widget import Widget
+
+from .canvas_table import CanvasTable
+from .code_tiles import TiledCodeBlock
+from .document_stats import DocumentStats
+from .ref_zones import RefZoneBehavior, RefZones, collect_ref_zones
+
+# Largest width or height of a block texture
+MAX_TEXTURE_DIM = 8192
+
+# Minimum complexity score of a block captured in hybrid mode, by block type.
+# Every table and code block qualifies; lists once they have about 20 items.
+HYBRID_TEXTURE_SCORES = {'table': 80, 'block_code': 50, 'list': 120}
+
+# Layout passes needed for heights to propagate through nested blocks
+_SETTLE_PASSES = 3
+
+
+def _has_viewport_widgets(widget: Widget) -> bool:
+    """Return True if ``widget`` contains rows or tiles rasterized on demand."""
+    if isinstance(widget, CanvasTable) and widget.virtualized:
+        return True
+    if isinstance(widget, TiledCodeBlock) and widget.lazy:
+        return True
+    return any(_has_viewport_widgets(child) for child in widget.children)
+
+
+def wants_block_texture(token: Any, stats: DocumentStats, widget: Optional[Widget]) -> bool:
+    """Return True if the block rendered from ``token`` is captured in hybrid mode.
+
+    Args:
+        token: Top-level token of the block
+        stats: Statistics of the block, see
+            :func:`~kivy_garden.markdownlabel.document_stats.compute_block_stats`
+        widget: Widget rendered for the block
+
+    Blocks with images stay widgets, as images load asynchronously. Blocks
+    with virtualized tables or lazily rasterized code tiles stay widgets too,
+    as they already rasterize only what is visible.
+    """
+    if widget is None or isinstance(widget, BlockTexture):
+        return False
+    threshold = HYBRID_TEXTURE_SCORES.get(token.get('type'))
+    if threshold is None or stats.complexity_score < threshold:
+        return False
+    if 'image' in stats.type_counts:
+        return False
+    return not _has_viewport_widgets(widget)
+
+
+def _settle(widget: Widget) -> None:
+    """Lay out ``widget`` and its descendants and update their text."""
+    if isinstance(widget, Layout):
+        widget.do_layout()
+    elif isinstance(widget, Label):
+        widget.texture_update()
+    elif isinstance(widget, (CanvasTable, TiledCodeBlock)):
+        widget.measure()
+    for child in widget.children:
+        _settle(child)
+    # Children may have changed height; update this layout's minimum size.
+    if isinstance(widget, Layout):
+        widget.do_layout()
+
+
+class BlockTexture(RefZoneBehavior, Widget):
+    """Widget drawing a captured texture of a block kept outside the tree.
+
+    The block is laid out at the BlockTexture's width and captured again
+    on each width change and on :meth:`refresh`. With ``size_hint_y=None``
+    the BlockTexture takes the height of the block. Touches on links in the
+    texture dispatch ``on_ref_press``.
+    """
+
+    block = ObjectProperty(None, allownone=True)
+    """Rendered block widget, not parented while it is shown as a texture."""
+
+    live = BooleanProperty(False)
+    """True while the block is shown as a child widget because it could not
+    be captured, for example when it is taller than :data:`MAX_TEXTURE_DIM`."""
+
+    def __init__(self, **kwargs):
+        self._fbo: Optional[Fbo] = None
+        self._trigger_refresh = Clock.create_trigger(self.refresh, -1)
+        super().__init__(**kwargs)
+        with self.canvas:
+            Color(1, 1, 1, 1)
+            self._rect = Rectangle(pos=self.pos, size=(0, 0))
+        fbind = self.fbind
+        fbind('block', self._on_block)
+        # Width changes come from the parent's layout pass; capturing right
+        # away lets that pass see the new height.
+        fbind('width', self.refresh)
+        fbind('pos', self._update_pos)
+        if self.block is not None:
+            self._on_block(self, self.block)
+
+    def _on_block(self, instance, block):
+        """Forward link presses of a new block and capture it."""
+        for child in list(self.children):
+            child.funbind('height', self._on_live_height)
+            self.remove_widget(child)
+        self.live = False
+        if block is not None:
+            self._forward_ref_presses(block)
+        self._trigger_refresh()
+
+    def _forward_ref_presses(self, widget: Widget) -> None:
+        """Dispatch link presses inside the block, when it is live, as our own."""
+        if isinstance(widget, (Label, RefZoneBehavior)):
+            widget.fbind('on_ref_press', self._on_block_ref_press)
+        for child in widget.children:
+            self._forward_ref_presses(child)
+
+    def _on_block_ref_press(self, instance, ref):
+        self.dispatch('on_ref_press', ref)
+
+    def _update_pos(self, *largs):
+        """Move the texture, or the live block, with the widget."""
+        self._rect.pos = self.pos
+        if self.live and self.block is not None:
+            self.block.pos = self.pos
+
+    def refresh(self, *largs) -> None:
+        """Lay out the block at the current width and capture it again.
+
+        Called on width changes; call it after changing the block's style.
+        """
+        self._trigger_refresh.cancel()
+        block = self.block
+        if block is None or self.width <= 0:
+            return
+        if block.parent is self:
+            block.funbind('height', self._on_live_height)
+            self.remove_widget(block)
+
+        block.pos = (0, 0)
+        block.width = self.width
+        for _ in range(_SETTLE_PASSES):
+            _settle(block)
+
+        width = int(ceil(block.width))
+        height = int(ceil(block.height))
+        if not 0 < width <= MAX_TEXTURE_DIM or not 0 < height <= MAX_TEXTURE_DIM:
+            self._show_live()
+            return
+
+        zones: RefZones = {}
+        collect_ref_zones(block, zones, -block.x, -block.y)
+        try:
+            fbo = Fbo(size=(width, height))
+            with fbo:
+                ClearColor(0, 0, 0, 0)
+                ClearBuffers()
+            fbo.add(block.canvas)
+            fbo.draw()
+            fbo.remove(block.canvas)
+        except Exception as e:
+            warnings.warn(
+                f"Block texture capture failed, showing the block as widgets: {e}",
+                RuntimeWarning
+            )
+            self._show_live()
+            return
+
+        self._fbo = fbo
+        self.live = False
+        self.ref_zones = zones
+        self._rect.texture = fbo.texture
+        self._rect.size = (width, height)
+        self._rect.pos = self.pos
+        if self.size_hint_y is None:
+            self.height = height
+
+    def _show_live(self) -> None:
+        """Show the block as a child widget instead of a texture."""
+        block = self.block
+        self._fbo = None
+        self._rect.texture = None
+        self._rect.size = (0, 0)
+        self.ref_zones = {}
+        self.live = True
+        block.pos = self.pos
+        if block.parent is None:
+            self.add_widget(block)
+            block.fbind('height', self._on_live_height)
+        self._on_live_height(block, block.height)
+
+    def _on_live_height(self, block, height):
+        """Follow the height of the live block."""
+        if self.size_hint_y is None:
+            self.height = height
@@ -0,0 +1,144 @@
+"""
+Canvas Document
+===============
+
+A whole rendered document drawn by one widget.
+
+In widget mode every heading, paragraph, table cell and list marker is a
+widget in the window's tree, so touches, layout passes and property
+dispatch walk all of them. Texture mode avoids that by capturing the tree
+into one Fbo, which limits documents to the maximum texture size.
+
+With ``render_mode='canvas'`` MarkdownLabel lays the rendered blocks out in
+their root BoxLayout as usual but does not add them to the window's tree. A
+:class:`CanvasDocument` draws the root's canvas, which holds the text
+textures of all blocks as Rectangle instructions, inside its own canvas.
+The window sees a single widget, and documents of any height can be drawn.
+The detached blocks stay laid out, so width changes and in-place style
+updates reach the text without a rebuild. Links are hit-tested through the
+document's :attr:`~kivy_garden.markdownlabel.ref_zones.RefZoneBehavior.ref_zones`.
+"""
+
+from typing import Optional
+
+from kivy.clock import Clock
+from kivy.graphics import InstructionGroup, PopMatrix, PushMatrix, Translate
+from kivy.properties import ObjectProperty
+from kivy.uix.layout import Layout
+from kivy.uix.widget import Widget
+
+from .canvas_table import CanvasTable
+from .code_tiles import TiledCodeBlock
+from .ref_zones import RefZoneBehavior, RefZones, collect_ref_zones
+
+
+def rasterize_whole_blocks(widget: Widget) -> None:
+    """Turn off row and tile virtualization in ``widget`` and its descendants.
+
+    Virtualized tables and lazy code tiles rasterize what is visible in
+    their ScrollView; content captured into a texture or drawn outside the
+    widget tree has to be rasterized as a whole.
+    """
+    if isinstance(widget, CanvasTable) and widget.virtualized:
+        widget.virtualized = False
+        widget.measure()
+    elif isinstance(widget, TiledCodeBlock) and widget.lazy:
+        widget.lazy = False
+        widget.measure()
+    for child in widget.children:
+        rasterize_whole_blocks(child)
+
+
+def _layout_pending(widget: Widget) -> bool:
+    """Return True if ``widget`` or a descendant has a layout pass scheduled."""
+    if isinstance(widget, Layout) and widget._trigger_layout.is_triggered:
+        return True
+    return any(_layout_pending(child) for child in widget.children)
+
+
+class CanvasDocument(RefZoneBehavior, Widget):
+    """Widget drawing a detached, laid-out widget tree in its canvas.
+
+    :attr:`content` is laid out at the document's width with its bottom left
+    corner at the document's position. With ``size_hint_y=None`` the
+    document takes the height of the content. Touches on links dispatch
+    ``on_ref_press``.
+    """
+
+    content = ObjectProperty(None, allownone=True)
+    """Root widget of the drawn blocks, typically a vertical BoxLayout whose
+    height follows its minimum height. It must not have a parent."""
+
+    def __init__(self, **kwargs):
+        self._bound_content: Optional[Widget] = None
+        self._trigger_ref_zones = Clock.create_trigger(self.update_ref_zones, -1)
+        super().__init__(**kwargs)
+        with self.canvas:
+            PushMatrix()
+            self._translate = Translate(self.x, self.y)
+            self._content_group = InstructionGroup()
+            PopMatrix()
+        fbind = self.fbind
+        fbind('content', self._on_content)
+        fbind('width', self._on_width)
+        fbind('pos', self._update_translate)
+        if self.content is not None:
+            self._on_content(self, self.content)
+
+    def _on_content(self, instance, content):
+        """Draw a new content tree instead of the previous one."""
+        previous = self._bound_content
+        if previous is not None:
+            previous.funbind('height', self._on_content_height)
+        self._content_group.clear()
+        self._bound_content = content
+        self.ref_zones = {}
+        if content is None:
+            return
+
+        rasterize_whole_blocks(content)
+        content.size_hint = (None, None)
+        content.pos = (0, 0)
+        content.width = self.width
+        content.fbind('height', self._on_content_height)
+        self._content_group.add(content.canvas)
+        self._on_content_height(content, content.height)
+
+    def _on_width(self, instance, width):
+        """Lay the content out at the new width."""
+        if self.content is not None:
+            self.content.width = width
+            self._trigger_ref_zones()
+
+    def _on_content_height(self, content, height):
+        """Follow the height of the content."""
+        if self.size_hint_y is None:
+            self.height = height
+        self._trigger_ref_zones()
+
+    def _update_translate(self, *largs):
+        """Move the drawn content with the widget."""
+        self._translate.xy = self.pos
+
+    def update_ref_zones(self, *largs) -> None:
+        """Collect the link zones of the content at its current layout.
+
+        While a layout in the content has a pending pass, for example a
+        nested list placed by its parent, the collection is deferred until
+        it ran.
+        """
+        self._trigger_ref_zones.cancel()
+        if self.content is not None and _layout_pending(self.content):
+            self._trigger_ref_zones()
+            return
+        zones: RefZones = {}
+        if self.content is not None:
+            collect_ref_zones(self.content, zones, -self.content.x, -self.content.y)
+        self.ref_zones = zones
+
+    def on_touch_down(self, touch):
+        """Dispatch ``on_ref_press`` for touches on links."""
+        if self._trigger_ref_zones.is_triggered:
+            # Text laid out since the last collection may have moved links.
+            self.update_ref_zones()
+        return super().on_touch_down(touch)
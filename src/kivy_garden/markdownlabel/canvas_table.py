@@ -0,0 +1,390 @@
+"""
+Canvas Table
+============
+
+Table widget drawing all cells into one canvas.
+
+The default table renderer creates a GridLayout with one Label per cell, so
+a 200 x 8 table costs 1,600 Labels with their own bindings and layout work.
+A :class:`CanvasTable` is a single widget instead: it computes the column
+widths once per width change, rasterizes every cell with core text
+(:class:`kivy.core.text.markup.MarkupLabel`) and draws the cell textures and
+the grid lines as instructions of its own canvas. Links stay clickable
+through :attr:`CanvasTable.ref_zones`, the ref boxes of all cells in widget
+coordinates, which :class:`~kivy_garden.markdownlabel.ref_zones.RefZoneBehavior`
+checks on touch before dispatching ``on_ref_press`` like a Label does.
+
+For tables with thousands of rows, :attr:`CanvasTable.virtualized` limits
+rasterization to the rows near the visible region of the closest ScrollView.
+Other rows are represented by their height only: the measured height of rows
+that were rasterized before, else an estimate from the length of their text,
+so the table has its full height while memory and build time depend on the
+viewport rather than the row count.
+
+KivyRenderer creates CanvasTables when ``table_mode`` is ``'canvas'``, and
+virtualized ones when it is ``'virtual'``.
+"""
+
+from math import ceil
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from kivy.clock import Clock
+from kivy.core.text.markup import MarkupLabel as CoreMarkupLabel
+from kivy.graphics import (
+    Color,
+    InstructionGroup,
+    Mesh,
+    PopMatrix,
+    PushMatrix,
+    Rectangle,
+    Translate,
+)
+from kivy.graphics.texture import Texture
+from kivy.properties import (
+    BooleanProperty,
+    ColorProperty,
+    DictProperty,
+    ListProperty,
+    NumericProperty,
+    OptionProperty,
+    StringProperty,
+    VariableListProperty,
+)
+from kivy.uix.widget import Widget
+from kivy.utils import get_hex_from_color
+
+from .column_widths import get_column_width_cache, make_table_key, strip_markup
+from .ref_zones import RefZone, RefZoneBehavior
+from .viewport import ViewportTracker, index_range
+
+# Label options forwarded to core text through CanvasTable.label_options
+CORE_LABEL_OPTIONS = (
+    'font_family', 'font_context', 'font_features', 'font_hinting', 'font_kerning',
+    'font_blended', 'outline_width', 'outline_color', 'unicode_errors', 'strip',
+    'base_direction', 'text_language', 'mipmap', 'padding',
+)
+
+# Cell textures with their refs, and the row height
+RenderedRow = Tuple[List[Tuple[Optional[Texture], Dict[str, Any]]], float]
+
+# Text measured once per font to estimate the height of virtualized rows
+_METRICS_SAMPLE = 'the quick brown fox jumps over the lazy dog'
+
+
+class CanvasTableCell(NamedTuple):
+    """Content of one table cell.
+
+    Attributes:
+        text: Kivy markup of the cell
+        halign: Horizontal alignment: 'left', 'center' or 'right'
+        is_header: Whether the cell is drawn bold as a header cell
+    """
+
+    text: str
+    halign: str = 'left'
+    is_header: bool = False
+
+
+class CanvasTable(RefZoneBehavior, Widget):
+    """Widget drawing a table's cell textures and grid lines in one canvas.
+
+    Rows are lists of :class:`CanvasTableCell`. By default all columns get
+    the same width, as in a GridLayout of Labels with ``size_hint_x=1``;
+    with :attr:`column_sizing` ``'content'`` widths follow the cell text.
+    With ``size_hint_y=None`` the table sets its height to
+    :attr:`minimum_height`.
+
+    Events:
+        on_ref_press: Dispatched with the ref name when a link in a cell is
+            touched
+    """
+
+    rows = ListProperty([])
+    """Rows of :class:`CanvasTableCell`, header row first."""
+
+    cols = NumericProperty(1)
+    """Number of columns; cells beyond it are not drawn."""
+
+    font_name = StringProperty('Roboto')
+    """Font name or path for cell text."""
+
+    font_size = NumericProperty(15)
+    """Font size of cell text in pixels."""
+
+    color = ColorProperty([1, 1, 1, 1])
+    """Color of cell text."""
+
+    line_height = NumericProperty(1.0)
+    """Line height multiplier of cell text."""
+
+    label_options = DictProperty({})
+    """Further core text options, see :data:`CORE_LABEL_OPTIONS`."""
+
+    padding = VariableListProperty([5, 5, 5, 5])
+    """Padding [left, top, right, bottom] around the grid."""
+
+    spacing = NumericProperty(2)
+    """Gap between rows and between columns; grid lines run through it."""
+
+    grid_color = ColorProperty([0.5, 0.5, 0.5, 1])
+    """Color of the grid lines."""
+
+    minimum_height = NumericProperty(0)
+    """Height of all rows plus padding and spacing, computed by :meth:`measure`."""
+
+    col_widths = ListProperty([])
+    """Column widths computed by :meth:`measure`."""
+
+    column_sizing = OptionProperty('equal', options=['equal', 'content'])
+    """'equal' gives every column the same width; 'content' distributes the
+    width by the measured text of each column, see
+    :mod:`~kivy_garden.markdownlabel.column_widths`."""
+
+    virtualized = BooleanProperty(False)
+    """Rasterize only rows near the visible region of the closest ScrollView
+    (or the window); other rows use cached or estimated heights."""
+
+    overscan = NumericProperty(200)
+    """Distance in pixels beyond the visible region in which virtualized rows
+    are rasterized and kept."""
+
+    def __init__(self, **kwargs):
+        self._dirty = True
+        self._measured_width: Optional[float] = None
+        self._col_lefts: List[float] = []
+        self._table_key: Optional[int] = None
+        self._options: Dict[str, Any] = {}
+        # Rasterized rows by index, and the height and top offset of every row
+        self._rendered: Dict[int, RenderedRow] = {}
+        self._row_heights: List[float] = []
+        self._row_offsets: List[float] = [0.0]
+        self._trigger_measure = Clock.create_trigger(self.measure, -1)
+        self._trigger_viewport = Clock.create_trigger(self._update_viewport, -1)
+        self._viewport = ViewportTracker(self, self._trigger_viewport)
+        super().__init__(**kwargs)
+        with self.canvas:
+            PushMatrix()
+            self._translate = Translate(self.x, self.y)
+            self._content = InstructionGroup()
+            PopMatrix()
+        fbind = self.fbind
+        for name in ('rows', 'cols', 'font_name', 'font_size', 'color', 'line_height',
+                     'label_options', 'padding', 'spacing', 'grid_color', 'virtualized', 'column_sizing'):
+            fbind(name, self._invalidate)
+        fbind('rows', self._reset_table_key)
+        # Width changes come from the parent's layout pass; measuring right
+        # away lets that pass see the new height.
+        fbind('width', self.measure)
+        fbind('pos', self._update_translate)
+        fbind('pos', self._trigger_viewport)
+        fbind('overscan', self._trigger_viewport)
+        self._trigger_measure()
+
+    def _invalidate(self, *largs):
+        """Schedule a new measurement after a content or style change."""
+        self._dirty = True
+        self._trigger_measure()
+
+    def _reset_table_key(self, *largs):
+        """Forget the content hash of the rows after they changed."""
+        self._table_key = None
+
+    def _update_translate(self, *largs):
+        """Move the drawn table with the widget."""
+        self._translate.xy = self.pos
+
+    def measure(self, *largs) -> None:
+        """Compute the column widths and row heights and redraw the table.
+
+        All rows are rasterized, or with :attr:`virtualized` only the rows
+        near the visible region while the others get estimated heights.
+        Does nothing if neither the width nor the content changed since the
+        last measurement.
+        """
+        self._trigger_measure.cancel()
+        width = float(self.width)
+        if not self._dirty and width == self._measured_width:
+            return
+        self._dirty = False
+        self._measured_width = width
+
+        cols = max(1, int(self.cols))
+        pad_left, pad_top, pad_right, pad_bottom = self.padding
+        spacing = self.spacing
+        available = max(0.0, width - pad_left - pad_right - spacing * (cols - 1))
+        self._options = {name: value for name, value in self.label_options.items()
+                         if name in CORE_LABEL_OPTIONS}
+        if self.column_sizing == 'content':
+            if self._table_key is None:
+                self._table_key = make_table_key(self.rows)
+            col_widths = list(get_column_width_cache().get_widths(
+                self.rows, cols, available, self.font_name, self.font_size,
+                self._options, table_key=self._table_key))
+        else:
+            col_widths = [available / cols] * cols
+        lefts = []
+        left = pad_left
+        for col_width in col_widths:
+            lefts.append(left)
+            left += col_width + spacing
+        self._col_lefts = lefts
+        self.col_widths = col_widths
+
+        rendered = self._rendered = {}
+        if self.virtualized:
+            line_height, char_width = self._font_metrics()
+            self._row_heights = [self._estimate_row_height(row, line_height, char_width)
+                                 for row in self.rows]
+        else:
+            for index, row in enumerate(self.rows):
+                rendered[index] = self._render_row(row)
+            self._row_heights = [rendered[index][1] for index in range(len(self.rows))]
+        self._update_offsets()
+
+        if self.virtualized:
+            self._update_viewport()
+        else:
+            self._draw()
+
+    def _update_offsets(self) -> None:
+        """Recompute row offsets from the row heights and resize the table."""
+        spacing = self.spacing
+        offsets = [0.0]
+        for height in self._row_heights:
+            offsets.append(offsets[-1] + height + spacing)
+        self._row_offsets = offsets
+
+        pad_left, pad_top, pad_right, pad_bottom = self.padding
+        total = pad_top + pad_bottom + sum(self._row_heights)
+        total += spacing * max(0, len(self._row_heights) - 1)
+        self.minimum_height = total
+        if self.size_hint_y is None:
+            self.height = total
+
+    def _render_row(self, row: Sequence[CanvasTableCell]) -> RenderedRow:
+        """Rasterize the cells of ``row`` and return them with the row height."""
+        cells = [self._render_cell(cell, col_width, self._options)
+                 for cell, col_width in zip(row, self.col_widths)]
+        height = max((texture.height for texture, refs in cells if texture is not None), default=0)
+        return cells, height
+
+    def _font_metrics(self) -> Tuple[float, float]:
+        """Return the line height and average character width of cell text."""
+        core = CoreMarkupLabel(font_name=self.font_name, font_size=self.font_size, **self._options)
+        width, height = core.get_extents(_METRICS_SAMPLE)
+        return height * self.line_height, width / len(_METRICS_SAMPLE)
+
+    def _estimate_row_height(self, row: Sequence[CanvasTableCell], line_height: float,
+                             char_width: float) -> float:
+        """Estimate the height of a row that was not rasterized yet."""
+        lines = 1
+        for cell, col_width in zip(row, self.col_widths):
+            text_width = len(strip_markup(cell.text)) * char_width
+            if col_width > 0 and text_width > col_width:
+                lines = max(lines, ceil(text_width / col_width))
+        return lines * line_height
+
+    def _update_viewport(self, *largs) -> None:
+        """Rasterize the rows near the visible region and drop the others."""
+        self._trigger_viewport.cancel()
+        if not self.virtualized or self._dirty:
+            return
+        low, high = self._viewport.visible_range()
+        pad_top = self.padding[1]
+        first, last = index_range(self._row_offsets, low - pad_top - self.overscan,
+                                  high - pad_top + self.overscan)
+
+        rendered = self._rendered
+        for index in [index for index in rendered if not first <= index < last]:
+            del rendered[index]
+        heights_changed = False
+        rows = self.rows
+        for index in range(first, last):
+            if index not in rendered:
+                rendered[index] = self._render_row(rows[index])
+                if rendered[index][1] != self._row_heights[index]:
+                    self._row_heights[index] = rendered[index][1]
+                    heights_changed = True
+        if heights_changed:
+            # Measured heights are kept, so the table converges as rows are seen.
+            self._update_offsets()
+        self._draw()
+
+    def _render_cell(self, cell: CanvasTableCell, width: float,
+                     options: Dict[str, Any]) -> Tuple[Optional[Texture], Dict[str, Any]]:
+        """Rasterize one cell wrapped to ``width``.
+
+        Returns:
+            Tuple of the cell texture (None for empty cells) and its refs in
+            texture coordinates
+        """
+        if not cell.text:
+            return None, {}
+        # As in Label, markup text gets its color through a color tag.
+        core = CoreMarkupLabel(
+            text=f'[color={get_hex_from_color(self.color)}]{cell.text}[/color]',
+            font_name=self.font_name,
+            font_size=self.font_size,
+            line_height=self.line_height,
+            halign=cell.halign,
+            valign='top',
+            bold=cell.is_header,
+            text_size=(width, None),
+            **options
+        )
+        core.refresh()
+        texture = core.texture
+        if texture is None:
+            return None, {}
+        # Rendering is lazy; binding the texture renders it and fills refs.
+        texture.bind()
+        return texture, dict(core.refs)
+
+    def _draw(self) -> None:
+        """Replace the drawn cells, grid lines and ref zones."""
+        pad_left, pad_top, pad_right, pad_bottom = self.padding
+        spacing = self.spacing
+        lefts = self._col_lefts
+        height = self.minimum_height
+        offsets = self._row_offsets
+        content = self._content
+        content.clear()
+        ref_zones: Dict[str, List[RefZone]] = {}
+
+        content.add(Color(1, 1, 1, 1))
+        grid_top = height - pad_top
+        for index in sorted(self._rendered):
+            cells, row_height = self._rendered[index]
+            top = grid_top - offsets[index]
+            for x, (texture, refs) in zip(lefts, cells):
+                if texture is None:
+                    continue
+                y = top - texture.height
+                content.add(Rectangle(texture=texture, pos=(x, y), size=texture.size))
+                for ref_name, boxes in refs.items():
+                    zones = ref_zones.setdefault(ref_name, [])
+                    for x1, y1, x2, y2 in boxes:
+                        zones.append((x + x1, y + texture.height - y2, x2 - x1, y2 - y1))
+        self.ref_zones = ref_zones
+
+        if not self._row_heights:
+            return
+
+        # Grid lines: the outer border, a line through the gap above each
+        # drawn row and one through each column gap.
+        left = pad_left
+        right = lefts[-1] + self.col_widths[-1]
+        grid_bottom = pad_bottom
+        segments = [(left, grid_top, right, grid_top), (left, grid_bottom, right, grid_bottom)]
+        for index in self._rendered:
+            if index > 0:
+                y = grid_top - offsets[index] + spacing / 2.0
+                segments.append((left, y, right, y))
+        xs = [left, right] + [col_left - spacing / 2.0 for col_left in lefts[1:]]
+        segments.extend((x, grid_bottom, x, grid_top) for x in xs)
+
+        vertices = []
+        for x1, y1, x2, y2 in segments:
+            vertices.extend((x1, y1, 0, 0, x2, y2, 0, 0))
+        content.add(Color(*self.grid_color))
+        content.add(Mesh(vertices=vertices, indices=list(range(len(segments) * 2)), mode='lines'))
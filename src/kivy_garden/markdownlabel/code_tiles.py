@@ -0,0 +1,256 @@
+"""
+Code Tiles
+==========
+
+Long code blocks rasterized as line-range tiles.
+
+A code block is normally a single Label, so a 5,000-line log or source dump
+becomes one texture taller than the GPU's maximum texture size, rasterized
+in one go on the main loop. A :class:`TiledCodeBlock` instead holds the block
+as tiles of a fixed number of lines. Each tile is rasterized with core text
+(:class:`kivy.core.text.markup.MarkupLabel`) into its own texture and drawn
+as a Rectangle in the widget's canvas.
+
+With :attr:`TiledCodeBlock.lazy`, only tiles near the visible region of the
+closest ScrollView (or the window) are rasterized. Other tiles take the
+height of their lines, measured once they were rasterized and estimated from
+their line count and length before, and tiles leaving the region release
+their textures.
+
+KivyRenderer creates TiledCodeBlocks for code blocks with more than
+``code_tile_lines`` lines, inside the same container that draws the
+``code_bg_color`` background of single-Label code blocks.
+"""
+
+from math import ceil
+from typing import Any, Dict, List, Optional, Tuple
+
+from kivy.clock import Clock
+from kivy.core.text.markup import MarkupLabel as CoreMarkupLabel
+from kivy.graphics import Color, InstructionGroup, PopMatrix, PushMatrix, Rectangle, Translate
+from kivy.graphics.texture import Texture
+from kivy.properties import (
+    BooleanProperty,
+    ColorProperty,
+    DictProperty,
+    ListProperty,
+    NumericProperty,
+    StringProperty,
+)
+from kivy.uix.widget import Widget
+from kivy.utils import get_hex_from_color
+
+from .canvas_table import CORE_LABEL_OPTIONS
+from .column_widths import strip_markup
+from .viewport import ViewportTracker, index_range
+
+# Default number of source lines per tile
+DEFAULT_TILE_LINES = 200
+
+# Text measured once per font to estimate the height of tiles not rasterized yet
+_METRICS_SAMPLE = 'the quick brown fox jumps over the lazy dog'
+
+
+def split_lines(text: str, tile_lines: int) -> List[str]:
+    """Split ``text`` into chunks of at most ``tile_lines`` lines.
+
+    Args:
+        text: Source text, without markup
+        tile_lines: Maximum number of lines per chunk
+
+    Returns:
+        Chunks of consecutive lines, joined with newlines
+    """
+    lines = text.split('\n')
+    size = max(1, int(tile_lines))
+    return ['\n'.join(lines[start:start + size]) for start in range(0, len(lines), size)]
+
+
+class TiledCodeBlock(Widget):
+    """Widget drawing a code block as a column of tile textures.
+
+    Tiles are Kivy markup strings, one per line range, stacked top to bottom
+    without gaps. Text wraps to the widget's width as in a code Label. With
+    ``size_hint_y=None`` the widget sets its height to :attr:`minimum_height`.
+    """
+
+    tiles = ListProperty([])
+    """Markup of each tile, first lines first."""
+
+    font_name = StringProperty('RobotoMono-Regular')
+    """Font name or path of the code text."""
+
+    font_size = NumericProperty(15)
+    """Font size of the code text in pixels."""
+
+    color = ColorProperty([0.9, 0.9, 0.9, 1])
+    """Color of the code text."""
+
+    line_height = NumericProperty(1.0)
+    """Line height multiplier of the code text."""
+
+    label_options = DictProperty({})
+    """Further core text options, see
+    :data:`~kivy_garden.markdownlabel.canvas_table.CORE_LABEL_OPTIONS`."""
+
+    lazy = BooleanProperty(True)
+    """Rasterize only tiles near the visible region of the closest ScrollView
+    (or the window); other tiles use measured or estimated heights."""
+
+    overscan = NumericProperty(400)
+    """Distance in pixels beyond the visible region in which lazy tiles are
+    rasterized and kept."""
+
+    minimum_height = NumericProperty(0)
+    """Height of all tiles, computed by :meth:`measure`."""
+
+    def __init__(self, **kwargs):
+        self._dirty = True
+        self._measured_width: Optional[float] = None
+        self._options: Dict[str, Any] = {}
+        # Rasterized tiles by index, and the height and top offset of every tile
+        self._rendered: Dict[int, Texture] = {}
+        self._tile_heights: List[float] = []
+        self._tile_offsets: List[float] = [0.0]
+        self._trigger_measure = Clock.create_trigger(self.measure, -1)
+        self._trigger_viewport = Clock.create_trigger(self._update_viewport, -1)
+        self._viewport = ViewportTracker(self, self._trigger_viewport)
+        super().__init__(**kwargs)
+        with self.canvas:
+            PushMatrix()
+            self._translate = Translate(self.x, self.y)
+            self._content = InstructionGroup()
+            PopMatrix()
+        fbind = self.fbind
+        for name in ('tiles', 'font_name', 'font_size', 'color', 'line_height',
+                     'label_options', 'lazy'):
+            fbind(name, self._invalidate)
+        # Width changes come from the parent's layout pass; measuring right
+        # away lets that pass see the new height.
+        fbind('width', self.measure)
+        fbind('pos', self._update_translate)
+        fbind('pos', self._trigger_viewport)
+        fbind('overscan', self._trigger_viewport)
+        self._trigger_measure()
+
+    def _invalidate(self, *largs):
+        """Schedule a new measurement after a content or style change."""
+        self._dirty = True
+        self._trigger_measure()
+
+    def _update_translate(self, *largs):
+        """Move the drawn tiles with the widget."""
+        self._translate.xy = self.pos
+
+    def measure(self, *largs) -> None:
+        """Compute the tile heights and redraw the block.
+
+        All tiles are rasterized, or with :attr:`lazy` only the tiles near
+        the visible region while the others get estimated heights. Does
+        nothing if neither the width nor the content changed since the last
+        measurement.
+        """
+        self._trigger_measure.cancel()
+        width = float(self.width)
+        if not self._dirty and width == self._measured_width:
+            return
+        self._dirty = False
+        self._measured_width = width
+        self._options = {name: value for name, value in self.label_options.items()
+                         if name in CORE_LABEL_OPTIONS}
+
+        rendered = self._rendered = {}
+        if self.lazy:
+            line_height, char_width = self._font_metrics()
+            self._tile_heights = [self._estimate_tile_height(tile, line_height, char_width)
+                                  for tile in self.tiles]
+        else:
+            for index, tile in enumerate(self.tiles):
+                rendered[index] = self._render_tile(tile)
+            self._tile_heights = [texture.height for texture in rendered.values()]
+        self._update_offsets()
+
+        if self.lazy:
+            self._update_viewport()
+        else:
+            self._draw()
+
+    def _update_offsets(self) -> None:
+        """Recompute tile offsets from the tile heights and resize the block."""
+        offsets = [0.0]
+        for height in self._tile_heights:
+            offsets.append(offsets[-1] + height)
+        self._tile_offsets = offsets
+        self.minimum_height = offsets[-1]
+        if self.size_hint_y is None:
+            self.height = offsets[-1]
+
+    def _font_metrics(self) -> Tuple[float, float]:
+        """Return the line height and average character width of the code text."""
+        core = CoreMarkupLabel(font_name=self.font_name, font_size=self.font_size, **self._options)
+        width, height = core.get_extents(_METRICS_SAMPLE)
+        return height * self.line_height, width / len(_METRICS_SAMPLE)
+
+    def _estimate_tile_height(self, tile: str, line_height: float, char_width: float) -> float:
+        """Estimate the height of a tile that was not rasterized yet."""
+        width = self.width
+        lines = 0
+        for line in strip_markup(tile).split('\n'):
+            text_width = len(line) * char_width
+            lines += ceil(text_width / width) if width > 0 and text_width > width else 1
+        return lines * line_height
+
+    def _render_tile(self, tile: str) -> Texture:
+        """Rasterize one tile wrapped to the widget's width."""
+        # As in Label, markup text gets its color through a color tag.
+        core = CoreMarkupLabel(
+            text=f'[color={get_hex_from_color(self.color)}]{tile}[/color]',
+            font_name=self.font_name,
+            font_size=self.font_size,
+            line_height=self.line_height,
+            halign='left',
+            valign='top',
+            text_size=(self.width, None),
+            **self._options
+        )
+        core.refresh()
+        texture = core.texture
+        # Rendering is lazy; binding the texture renders it.
+        texture.bind()
+        return texture
+
+    def _update_viewport(self, *largs) -> None:
+        """Rasterize the tiles near the visible region and drop the others."""
+        self._trigger_viewport.cancel()
+        if not self.lazy or self._dirty:
+            return
+        low, high = self._viewport.visible_range()
+        first, last = index_range(self._tile_offsets, low - self.overscan, high + self.overscan)
+
+        rendered = self._rendered
+        for index in [index for index in rendered if not first <= index < last]:
+            del rendered[index]
+        heights_changed = False
+        tiles = self.tiles
+        for index in range(first, last):
+            if index not in rendered:
+                texture = rendered[index] = self._render_tile(tiles[index])
+                if texture.height != self._tile_heights[index]:
+                    self._tile_heights[index] = texture.height
+                    heights_changed = True
+        if heights_changed:
+            # Measured heights are kept, so the block converges as tiles are seen.
+            self._update_offsets()
+        self._draw()
+
+    def _draw(self) -> None:
+        """Replace the drawn tiles."""
+        content = self._content
+        content.clear()
+        content.add(Color(1, 1, 1, 1))
+        top = self.minimum_height
+        offsets = self._tile_offsets
+        for index in sorted(self._rendered):
+            texture = self._rendered[index]
+            y = top - offsets[index] - texture.height
+            content.add(Rectangle(texture=texture, pos=(0, y), size=texture.size))
@@ -0,0 +1,251 @@
+"""
+Column Widths
+=============
+
+Content-aware table column widths, measured with the core text provider.
+
+Tables normally give every column the same width, so a column holding short
+numbers is as wide as one holding sentences, and cells wrap wherever the
+equal split cuts them. :func:`measure_column_extents` instead measures each
+column's minimum width (its widest word) and maximum width (its widest cell
+on one line) from text extents, without creating widgets or textures, and
+:func:`distribute_widths` shares the available width between the columns
+like an automatic HTML table layout.
+
+Both steps are cached by the process-wide :class:`ColumnWidthCache`: extents
+by table content and font, widths additionally by available width. Tables
+laid out again at a width seen before get their final column widths at once
+and wrap their cells a single time.
+"""
+
+import re
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from kivy.core.text.markup import MarkupLabel as CoreMarkupLabel
+
+# Default number of tables whose extents and widths are kept by the shared cache
+DEFAULT_MAX_ENTRIES = 256
+
+# Core text options that do not change text extents
+_UNMEASURED_OPTIONS = ('outline_color', 'mipmap', 'font_blended', 'unicode_errors')
+
+_MARKUP_TAG = re.compile(r'\[/?[a-z_]+(?:=[^\]]*)?\]')
+
+_MARKUP_ESCAPES = (('&bl;', '['), ('&br;', ']'), ('&amp;', '&'))
+
+# Minimum and maximum intrinsic width of each column
+ColumnExtents = Tuple[Tuple[float, float], ...]
+
+FontKey = Tuple[Any, ...]
+
+
+def strip_markup(text: str) -> str:
+    """Return the text of Kivy markup without tags and escapes."""
+    text = _MARKUP_TAG.sub('', text)
+    for escape, char in _MARKUP_ESCAPES:
+        text = text.replace(escape, char)
+    return text
+
+
+def make_table_key(rows: Iterable[Sequence[Any]]) -> int:
+    """Return a hash of the cell texts and header flags of ``rows``.
+
+    Rows hold cells with ``text`` and ``is_header`` attributes, such as
+    :class:`~kivy_garden.markdownlabel.canvas_table.CanvasTableCell`.
+    """
+    return hash(tuple(tuple((cell.text, cell.is_header) for cell in row) for row in rows))
+
+
+def make_font_key(font_name: str, font_size: float, options: Mapping[str, Any]) -> FontKey:
+    """Return the cache key of the font configuration cells are measured in."""
+    frozen = tuple(sorted(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in options.items() if name not in _UNMEASURED_OPTIONS
+    ))
+    return (font_name, float(font_size), frozen)
+
+
+def _horizontal_padding(padding: Any) -> float:
+    """Return the left plus right text padding of a core text ``padding``."""
+    if isinstance(padding, (list, tuple)):
+        if len(padding) == 4:
+            return float(padding[0] + padding[2])
+        if padding:
+            return 2.0 * padding[0]
+        return 0.0
+    return 2.0 * (padding or 0)
+
+
+def measure_column_extents(rows: Sequence[Sequence[Any]], cols: int, font_name: str,
+                           font_size: float,
+                           options: Optional[Mapping[str, Any]] = None) -> ColumnExtents:
+    """Measure the minimum and maximum intrinsic width of each column.
+
+    The minimum is the widest word of a column, the maximum its widest cell
+    laid out on one line, both including the text padding. Header cells are
+    measured bold. Markup tags are ignored, so cells with inline styles in a
+    different font are approximations.
+
+    Args:
+        rows: Rows of cells with ``text`` and ``is_header`` attributes
+        cols: Number of columns; cells beyond it are ignored
+        font_name: Font name or path of cell text
+        font_size: Font size in pixels
+        options: Further core text options, e.g. ``font_family``
+
+    Returns:
+        ``(minimum, maximum)`` width per column
+    """
+    options = {name: value for name, value in (options or {}).items()
+               if name not in _UNMEASURED_OPTIONS}
+    padding = _horizontal_padding(options.pop('padding', 0))
+    cores = {}
+    widths: Dict[Tuple[bool, str], float] = {}
+
+    def text_width(text: str, bold: bool) -> float:
+        key = (bold, text)
+        width = widths.get(key)
+        if width is None:
+            core = cores.get(bold)
+            if core is None:
+                core = cores[bold] = CoreMarkupLabel(
+                    font_name=font_name, font_size=font_size, bold=bold, **options)
+            width = widths[key] = float(core.get_extents(text)[0])
+        return width
+
+    extents: List[List[float]] = [[0.0, 0.0] for _ in range(max(1, cols))]
+    for row in rows:
+        for column, cell in zip(extents, row):
+            text = strip_markup(cell.text)
+            if not text.strip():
+                continue
+            bold = cell.is_header
+            widest_line = max(text_width(line, bold) for line in text.split('\n'))
+            widest_word = max((text_width(word, bold) for word in text.split()), default=0.0)
+            column[0] = max(column[0], widest_word + padding)
+            column[1] = max(column[1], widest_line + padding)
+    return tuple((low, high) for low, high in extents)
+
+
+def distribute_widths(extents: Sequence[Tuple[float, float]],
+                      available: float) -> Tuple[float, ...]:
+    """Divide ``available`` width between columns with the given extents.
+
+    If every column fits on one line, columns get their maximum width and
+    the remainder in proportion to it. Otherwise each column gets its
+    minimum width plus a share of the remainder proportional to how much
+    it would still grow, and if even the minimum widths do not fit, they
+    are scaled down. Tables without any text are split equally.
+
+    Returns:
+        Width per column, summing to ``available``
+    """
+    count = len(extents)
+    if not count:
+        return ()
+    available = max(0.0, float(available))
+    minimums = [low for low, high in extents]
+    maximums = [max(low, high) for low, high in extents]
+    total_min = sum(minimums)
+    total_max = sum(maximums)
+
+    if total_max <= 0:
+        return (available / count,) * count
+    if total_max <= available:
+        return tuple(high * available / total_max for high in maximums)
+    if total_min >= available:
+        if total_min <= 0:
+            return (available / count,) * count
+        return tuple(low * available / total_min for low in minimums)
+    extra = available - total_min
+    flex = total_max - total_min
+    return tuple(low + extra * (high - low) / flex for low, high in zip(minimums, maximums))
+
+
+class ColumnWidthCache:
+    """Bounded cache of column extents and widths of tables.
+
+    Extents are keyed by table content and font configuration, widths
+    additionally by the available width. Entries are evicted least recently
+    used first once ``max_entries`` is exceeded.
+
+    Attributes:
+        max_entries: Maximum number of extents and of widths entries kept
+        hits: Lookups answered without measuring text
+        misses: Lookups that measured the table's text
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._extents: 'OrderedDict[Tuple[int, FontKey], ColumnExtents]' = OrderedDict()
+        self._widths: 'OrderedDict[Tuple[int, float, FontKey], Tuple[float, ...]]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._extents)
+
+    def _store(self, entries: 'OrderedDict', key: Any, value: Any) -> None:
+        entries[key] = value
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def get_widths(self, rows: Sequence[Sequence[Any]], cols: int, available: float,
+                   font_name: str, font_size: float,
+                   options: Optional[Mapping[str, Any]] = None,
+                   table_key: Optional[int] = None) -> Tuple[float, ...]:
+        """Return content-aware column widths of a table.
+
+        Args:
+            rows: Rows of cells with ``text`` and ``is_header`` attributes
+            cols: Number of columns
+            available: Width shared by the columns, without padding and spacing
+            font_name: Font name or path of cell text
+            font_size: Font size in pixels
+            options: Further core text options
+            table_key: :func:`make_table_key` of ``rows``, if already known
+
+        Returns:
+            Width per column
+        """
+        if table_key is None:
+            table_key = make_table_key(rows)
+        font_key = make_font_key(font_name, font_size, options or {})
+        width_key = (table_key, float(available), font_key)
+        widths = self._widths.get(width_key)
+        if widths is not None:
+            self._widths.move_to_end(width_key)
+            self.hits += 1
+            return widths
+
+        extents_key = (table_key, font_key)
+        extents = self._extents.get(extents_key)
+        if extents is not None and len(extents) == max(1, cols):
+            self._extents.move_to_end(extents_key)
+            self.hits += 1
+        else:
+            extents = measure_column_extents(rows, cols, font_name, font_size, options)
+            self.misses += 1
+            self._store(self._extents, extents_key, extents)
+        widths = distribute_widths(extents, available)
+        self._store(self._widths, width_key, widths)
+        return widths
+
+    def clear(self) -> None:
+        """Drop all cached extents and widths."""
+        self._extents.clear()
+        self._widths.clear()
+
+
+_shared_cache = ColumnWidthCache()
+
+
+def get_column_width_cache() -> ColumnWidthCache:
+    """Return the process-wide column width cache."""
+    return _shared_cache
+
+
+def clear_column_width_cache() -> None:
+    """Drop all entries of the process-wide column width cache."""
+    _shared_cache.clear()
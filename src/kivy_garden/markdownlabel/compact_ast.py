@@ -0,0 +1,159 @@
+"""
+Compact AST
+===========
+
+Memory-efficient, read-only representation of mistune token trees.
+
+mistune produces one dict per token and one list per children sequence, and
+every token repeats its keys. :class:`Node` stores the common fields in
+``__slots__``, children as tuples and type tags as interned strings;
+identical ``attrs`` and rare fields (``style``, ``tight``, ``bullet``,
+``marker``) are shared between nodes.
+
+Nodes support the read API of token dicts (``get``, ``[]``, ``in``,
+``keys``), so :class:`~kivy_garden.markdownlabel.kivy_renderer.KivyRenderer`,
+:class:`~kivy_garden.markdownlabel.inline_renderer.InlineRenderer` and
+:class:`~kivy_garden.markdownlabel.markdown_serializer.MarkdownSerializer`
+consume both forms without conversion.
+"""
+
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Token fields stored in dedicated slots; everything else goes to ``extra``
+_SLOT_FIELDS = ('type', 'raw', 'children', 'attrs')
+_SLOT_FIELD_SET = frozenset(_SLOT_FIELDS)
+
+_MISSING = object()
+
+
+class Node:
+    """A read-only AST token with slotted fields.
+
+    Absent fields are stored as None and behave like missing dict keys.
+
+    Args:
+        type: Token type tag
+        raw: Raw text of leaf tokens
+        children: Child nodes
+        attrs: Token attributes (shared; must not be mutated)
+        extra: Other token fields (shared; must not be mutated)
+    """
+
+    __slots__ = ('type', 'raw', 'children', 'attrs', 'extra')
+
+    def __init__(self, type: str, raw: Optional[str] = None,
+                 children: Optional[Tuple['Node', ...]] = None,
+                 attrs: Optional[Dict[str, Any]] = None,
+                 extra: Optional[Dict[str, Any]] = None):
+        self.type = type
+        self.raw = raw
+        self.children = children
+        self.attrs = attrs
+        self.extra = extra
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value of field ``key`` like ``dict.get``."""
+        if key in _SLOT_FIELD_SET:
+            value = getattr(self, key)
+            return default if value is None else value
+        if self.extra is not None:
+            return self.extra.get(key, default)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def keys(self) -> List[str]:
+        """Return the names of the fields present on this node."""
+        keys = [field for field in _SLOT_FIELDS if getattr(self, field) is not None]
+        if self.extra is not None:
+            keys.extend(self.extra)
+        return keys
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the token as a new mistune-style dict tree."""
+        token: Dict[str, Any] = {'type': self.type}
+        if self.raw is not None:
+            token['raw'] = self.raw
+        if self.attrs is not None:
+            token['attrs'] = dict(self.attrs)
+        if self.extra is not None:
+            token.update(self.extra)
+        if self.children is not None:
+            token['children'] = [child.to_dict() for child in self.children]
+        return token
+
+    def __repr__(self) -> str:
+        return f'Node({self.to_dict()!r})'
+
+
+def is_token(value: Any) -> bool:
+    """Return True for token dicts and compact nodes."""
+    return isinstance(value, (dict, Node))
+
+
+class _Compactor:
+    """Converts token dicts to nodes, sharing equal attribute dicts."""
+
+    def __init__(self):
+        self._shared: Dict[Tuple[Tuple[str, Any], ...], Dict[str, Any]] = {}
+
+    def share(self, mapping: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a shared copy of ``mapping`` if its items are hashable."""
+        try:
+            key = tuple(sorted(mapping.items()))
+            hash(key)
+        except TypeError:
+            return dict(mapping)
+        shared = self._shared.get(key)
+        if shared is None:
+            shared = self._shared[key] = dict(mapping)
+        return shared
+
+    def node(self, token: Dict[str, Any]) -> Node:
+        """Convert one token dict (recursively) to a Node."""
+        children = token.get('children')
+        if children is not None:
+            children = tuple(self.node(child) for child in children)
+        attrs = token.get('attrs')
+        if attrs is not None:
+            attrs = self.share(attrs)
+        extra = {key: value for key, value in token.items() if key not in _SLOT_FIELD_SET}
+        extra = self.share(extra) if extra else None
+        return Node(sys.intern(token['type']), token.get('raw'), children, attrs, extra)
+
+
+def compact(tokens: Iterable[Any]) -> Tuple[Node, ...]:
+    """Convert mistune token dicts to compact nodes.
+
+    Nodes in ``tokens`` are kept as they are.
+
+    Args:
+        tokens: Top-level token dicts or nodes
+
+    Returns:
+        Tuple of nodes
+    """
+    compactor = _Compactor()
+    return tuple(token if isinstance(token, Node) else compactor.node(token) for token in tokens)
+
+
+def to_dicts(tokens: Iterable[Any]) -> List[Dict[str, Any]]:
+    """Convert compact nodes back to mistune-style token dicts.
+
+    Token dicts in ``tokens`` are returned as they are.
+
+    Args:
+        tokens: Top-level nodes or token dicts
+
+    Returns:
+        List of token dicts
+    """
+    return [token.to_dict() if isinstance(token, Node) else token for token in tokens]
@@ -0,0 +1,131 @@
+"""
+Document Statistics
+===================
+
+Structural statistics of a parsed document, computed once per parse.
+
+Render-mode decisions need to know how large and how complex a document is.
+Walking the token tree for every decision (on each width change or touch)
+is linear in the document size, so ``MarkdownLabel`` computes a
+:class:`DocumentStats` record when it parses and keeps it next to the AST.
+
+Statistics are computed per top-level block and merged, so a streamed append
+only walks the blocks it re-parsed.
+"""
+
+from collections import Counter
+from typing import Any, Iterable, Mapping, NamedTuple
+
+from .compact_ast import is_token
+
+
+class DocumentStats(NamedTuple):
+    """Structural statistics of a token tree.
+
+    Attributes:
+        token_count: Number of tokens, including inline tokens
+        max_depth: Nesting depth of the deepest token (top level is 1)
+        type_counts: Number of tokens per token type
+    """
+    token_count: int = 0
+    max_depth: int = 0
+    type_counts: Mapping[str, int] = {}
+
+    @property
+    def has_table(self) -> bool:
+        """True if the document contains a table or table part."""
+        return any(
+            tok_type == 'table' or (isinstance(tok_type, str) and tok_type.startswith('table_'))
+            for tok_type in self.type_counts
+        )
+
+    @property
+    def has_list(self) -> bool:
+        """True if the document contains a list."""
+        return 'list' in self.type_counts or 'list_item' in self.type_counts
+
+    @property
+    def has_block_code(self) -> bool:
+        """True if the document contains a code block."""
+        return 'block_code' in self.type_counts
+
+    @property
+    def complexity_score(self) -> int:
+        """Heuristic cost of rendering the document as a widget tree.
+
+        The score is biased toward constructs that produce deep, wide widget
+        trees (tables, lists, code blocks).
+        """
+        score = self.token_count
+        if self.has_table:
+            score += 80
+        if self.has_list:
+            score += 40
+        if self.has_block_code:
+            score += 50
+        if self.max_depth > 6:
+            score += (self.max_depth - 6) * 10
+        return score
+
+
+EMPTY_STATS = DocumentStats()
+
+
+def compute_block_stats(token: Any) -> DocumentStats:
+    """Compute the statistics of one top-level token.
+
+    Args:
+        token: Token dict or compact node
+
+    Returns:
+        DocumentStats of the token and its descendants
+    """
+    if not is_token(token):
+        return EMPTY_STATS
+
+    type_counts: Counter = Counter()
+    token_count = 0
+    max_depth = 0
+    stack = [(token, 1)]
+    while stack:
+        tok, depth = stack.pop()
+        if not is_token(tok):
+            continue
+        token_count += 1
+        if depth > max_depth:
+            max_depth = depth
+        type_counts[tok.get('type')] += 1
+        for child in (tok.get('children') or ()):
+            stack.append((child, depth + 1))
+    return DocumentStats(token_count, max_depth, dict(type_counts))
+
+
+def merge_stats(stats: Iterable[DocumentStats]) -> DocumentStats:
+    """Combine the statistics of consecutive top-level blocks.
+
+    Args:
+        stats: Per-block statistics
+
+    Returns:
+        DocumentStats of the whole document
+    """
+    type_counts: Counter = Counter()
+    token_count = 0
+    max_depth = 0
+    for block in stats:
+        token_count += block.token_count
+        max_depth = max(max_depth, block.max_depth)
+        type_counts.update(block.type_counts)
+    return DocumentStats(token_count, max_depth, dict(type_counts))
+
+
+def compute_stats(tokens: Iterable[Any]) -> DocumentStats:
+    """Compute the statistics of a list of top-level tokens.
+
+    Args:
+        tokens: Top-level token dicts or compact nodes
+
+    Returns:
+        DocumentStats of the document
+    """
+    return merge_stats(compute_block_stats(token) for token in tokens)
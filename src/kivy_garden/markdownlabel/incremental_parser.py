@@ -0,0 +1,388 @@
+"""
+IncrementalParser
+=================
+
+Incremental block-level re-parsing of Markdown documents.
+
+The document is split into *segments*: runs of top-level blocks that mistune
+is guaranteed to parse identically whether it sees the whole document or only
+the segment. When the text changes, only the segments overlapping the changed
+line range are parsed again and their tokens are spliced into the previous
+token list.
+"""
+
+import re
+from bisect import bisect_left
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Mirrors of the mistune block rules that can swallow following lines
+# (including blank lines) into a single top-level block.
+_FENCE_OPEN = re.compile(r' {0,3}(`{3,}|~{3,})[ \t]*(.*)')
+_RAW_HTML_OPEN = re.compile(
+    r' {0,3}(</?[A-Za-z][A-Za-z0-9-]*|<!--|<\?|<![A-Z]|<!\[CDATA\[)'
+)
+_HTML_PRE_TAGS = frozenset({'pre', 'script', 'style', 'textarea'})
+_LIST_MARKER = re.compile(r' {0,3}(?:[*+-]|\d{1,9}[.)])(?:[ \t]*|[ \t].+)$')
+_BLOCK_QUOTE = re.compile(r' {0,3}>')
+_BLANK_LINE_CHARS = ' \t\v\f\n'
+# Whitespace-only lines matching mistune's indented code opener are blank
+# only within a run of blank lines; otherwise they continue a paragraph or
+# open a code block.
+_INDENTED_WHITESPACE = re.compile(r'(?: {4}| *\t)[^\n]')
+# First characters of lines that may start a block interrupting a list item.
+_CONTAINER_BREAK_CHARS = frozenset('-_*+#>`~<0123456789')
+
+# Link reference definitions are document-global: their presence anywhere in a
+# changed region forces a full parse so `ref_links` stays consistent.
+_REF_DEF_MARKER = ']:'
+# Mirror of mistune's link reference definition opener; the label may span
+# lines, including blank ones.
+_REF_DEF_LABEL = re.compile(r' {0,3}\[(?:[^\\\[\]]|\\.){0,500}\]:')
+
+
+def normalize_markdown_source(text: str) -> str:
+    """Normalize line endings the same way ``mistune.Markdown.parse`` does."""
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    if not text.endswith('\n'):
+        text += '\n'
+    return text
+
+
+def iter_block_boundaries(text: str, pos: int = 0) -> Iterator[int]:
+    """Yield offsets after ``pos`` where an independent top-level parse may start.
+
+    A boundary is a line with no leading whitespace that follows a blank line
+    and cannot continue the previous block (a list item after an open list or
+    block quote never starts a boundary).
+    Fenced code and HTML blocks of CommonMark types 1-5 are skipped exactly as
+    mistune does. Whenever the top-level structure becomes ambiguous (for
+    example a fence opener that could belong to a list item), scanning stops so
+    the remainder of the document is treated as a single segment.
+
+    Args:
+        text: Normalized Markdown source (see :func:`normalize_markdown_source`)
+        pos: Offset of a known boundary (or 0) to resume scanning from
+
+    Yields:
+        Boundary offsets in increasing order
+    """
+    length = len(text)
+    prev_blank = False
+    # True while a list or block quote may still be open at top level.
+    in_container = False
+    # Start offset of the current run of non-blank lines.
+    run_start = pos
+
+    while pos < length:
+        end = text.find('\n', pos)
+        end = length if end == -1 else end + 1
+
+        if not text[pos:end].strip(_BLANK_LINE_CHARS) and (
+                prev_blank or not _INDENTED_WHITESPACE.match(text, pos, end)):
+            prev_blank = True
+            pos = end
+            continue
+
+        first = text[pos]
+        if prev_blank:
+            # A container ended by a block-starting line parses that block
+            # itself, and mistune's token ordering for the pair then depends
+            # on what follows, so only plain lines may close a container.
+            if first not in ' \t' and not (in_container and first in _CONTAINER_BREAK_CHARS):
+                yield pos
+                in_container = False
+            run_start = pos
+        prev_blank = False
+
+        ref_def = _REF_DEF_LABEL.match(text, pos)
+        if ref_def is not None and ref_def.end() > end:
+            # Continue after the label, whose lines belong to the definition.
+            pos = text.rfind('\n', pos, ref_def.end()) + 1
+            continue
+
+        fence = _FENCE_OPEN.match(text, pos, end - 1)
+        if fence is not None:
+            marker, info = fence.group(1), fence.group(2)
+            if marker[0] == '`' and '`' in info:
+                fence = None
+        html = None if fence is not None else _RAW_HTML_OPEN.match(text, pos, end - 1)
+
+        if fence is not None or html is not None:
+            if _is_ambiguous_opener(text, pos, end, first, in_container, run_start):
+                return
+
+        if fence is not None:
+            closing = re.compile(
+                r'^ {0,3}' + re.escape(marker[0]) + '{' + str(len(marker)) + r',}[ \t]*(?:\n|$)',
+                re.M,
+            )
+            match = closing.search(text, end)
+            if match is None:
+                return
+            pos = match.end()
+            in_container = False
+            continue
+
+        if html is not None:
+            end_marker = _html_end_marker(html.group(1))
+            if end_marker is not None:
+                marker_pos = text.find(end_marker, html.end())
+                if marker_pos == -1:
+                    return
+                line_end = text.find('\n', marker_pos)
+                pos = length if line_end == -1 else line_end + 1
+                continue
+            # Types 6/7 run to the next blank line, or are plain paragraph
+            # text; an opener inside the run could be read either way.
+            blank = _find_blank_line(text, end)
+            if _contains_opener(text, end, length if blank is None else blank):
+                return
+
+        if _LIST_MARKER.match(text, pos, end - 1) or _BLOCK_QUOTE.match(text, pos, end - 1):
+            in_container = True
+        pos = end
+
+
+def _is_ambiguous_opener(text: str, pos: int, end: int, first: str,
+                         in_container: bool, run_start: int) -> bool:
+    """Return True when a fence/HTML opener may not be a top-level opener."""
+    if in_container and (first in ' \t' or text[pos:end].lstrip(' ').startswith('<')):
+        return True
+    # Table rows and multi-line link reference titles can contain lines that
+    # look like openers.
+    if '|' in text[pos:end]:
+        return True
+    return run_start < pos and _REF_DEF_MARKER in text[run_start:pos]
+
+
+def _html_end_marker(marker: str) -> Optional[str]:
+    """Return the end marker for HTML block types 1-5, else None."""
+    if marker == '<!--':
+        return '-->'
+    if marker == '<?':
+        return '?>'
+    if marker == '<![CDATA[':
+        return ']]>'
+    if marker.startswith('<!'):
+        return '>'
+    if not marker.startswith('</') and marker[1:].lower() in _HTML_PRE_TAGS:
+        return '</' + marker[1:].lower() + '>'
+    return None
+
+
+def _find_blank_line(text: str, pos: int) -> Optional[int]:
+    """Return the offset of the first blank line at or after ``pos``."""
+    length = len(text)
+    while pos < length:
+        end = text.find('\n', pos)
+        end = length if end == -1 else end + 1
+        if not text[pos:end].strip(_BLANK_LINE_CHARS):
+            return pos
+        pos = end
+    return None
+
+
+def _contains_opener(text: str, pos: int, end: int) -> bool:
+    """Return True if any line in ``text[pos:end]`` looks like a block opener."""
+    while pos < end:
+        line_end = text.find('\n', pos, end)
+        line_end = end if line_end == -1 else line_end
+        if _FENCE_OPEN.match(text, pos, line_end) or _RAW_HTML_OPEN.match(text, pos, line_end):
+            return True
+        pos = line_end + 1
+    return False
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    """Return the length of the common prefix of two strings."""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[low:mid] == b[low:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _common_suffix_length(a: str, b: str, limit: int) -> int:
+    """Return the length of the common suffix of two strings, capped at ``limit``."""
+    len_a, len_b = len(a), len(b)
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[len_a - mid:len_a - low] == b[len_b - mid:len_b - low]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+class IncrementalParser:
+    """Keeps a segmented parse of one document and updates it incrementally.
+
+    The parser wraps a mistune ``Markdown`` instance created with
+    ``renderer=None``. Each call to :meth:`parse` compares the new text with
+    the previous one, re-parses only the segments covering the changed lines
+    and splices their tokens into the cached token list. Edits touching link
+    reference definitions fall back to a full parse.
+
+    Example::
+
+        parser = IncrementalParser(mistune.create_markdown(renderer=None))
+        tokens = parser.parse('# Title\\n\\nBody')
+        tokens = parser.parse('# Title\\n\\nBody, edited')  # reparses one block
+    """
+
+    def __init__(self, markdown: Any):
+        """Initialize the IncrementalParser.
+
+        Args:
+            markdown: mistune ``Markdown`` instance with ``renderer=None``
+        """
+        self.markdown = markdown
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all cached state so the next parse is a full parse."""
+        self._source = None
+        self._starts: List[int] = []
+        self._segment_tokens: List[List[Dict[str, Any]]] = []
+        self._tokens: List[Dict[str, Any]] = []
+        self._env: Dict[str, Any] = {'ref_links': {}}
+        self.last_mode = None
+        self.last_reparsed_span: Tuple[int, int] = (0, 0)
+
+    @property
+    def source(self) -> Optional[str]:
+        """Normalized source of the last parse, or None."""
+        return self._source
+
+    @property
+    def segment_count(self) -> int:
+        """Number of independently parsed segments in the last parse."""
+        return len(self._starts)
+
+    def parse(self, text: str) -> List[Dict[str, Any]]:
+        """Parse ``text``, reusing tokens of unchanged segments.
+
+        Args:
+            text: Markdown source
+
+        Returns:
+            New list of top-level AST tokens, equal to a full mistune parse
+        """
+        source = normalize_markdown_source(text)
+        old = self._source
+
+        if old is None:
+            self._full_parse(source)
+        elif source == old:
+            self.last_mode = 'unchanged'
+            self.last_reparsed_span = (0, 0)
+        elif not self._incremental_parse(old, source):
+            self._full_parse(source)
+
+        return list(self._tokens)
+
+    def _full_parse(self, source: str) -> None:
+        """Segment and parse the whole document."""
+        starts = [0]
+        starts.extend(iter_block_boundaries(source))
+        env = {'ref_links': {}}
+        segments = self._slice_segments(source, starts, len(source))
+
+        self._source = source
+        self._starts = starts
+        self._env = env
+        self._segment_tokens = self._parse_segments(segments, env)
+        self._tokens = [token for tokens in self._segment_tokens for token in tokens]
+        self.last_mode = 'full'
+        self.last_reparsed_span = (0, len(source))
+
+    def _incremental_parse(self, old: str, new: str) -> bool:
+        """Reparse only the segments touched by the edit.
+
+        Returns:
+            False when the edit requires a full parse instead
+        """
+        prefix = _common_prefix_length(old, new)
+        suffix = _common_suffix_length(old, new, min(len(old), len(new)) - prefix)
+        delta = len(new) - len(old)
+        new_change_end = len(new) - suffix
+
+        # Restart from the last boundary whose own line is untouched; the
+        # boundary decision depends on that line.
+        line_start = old.rfind('\n', 0, prefix) + 1
+        starts = self._starts
+        first = max(bisect_left(starts, line_start) - 1, 0)
+        scan_from = starts[first]
+
+        new_starts = [scan_from]
+        last = len(starts)
+        sync_end = len(new)
+        for boundary in iter_block_boundaries(new, scan_from):
+            if boundary >= new_change_end:
+                index = bisect_left(starts, boundary - delta)
+                if index < len(starts) and starts[index] == boundary - delta and index > first:
+                    last = index
+                    sync_end = boundary
+                    break
+            new_starts.append(boundary)
+
+        old_end = starts[last] if last < len(starts) else len(old)
+        if _REF_DEF_MARKER in old[scan_from:old_end] or _REF_DEF_MARKER in new[scan_from:sync_end]:
+            return False
+
+        segments = self._slice_segments(new, new_starts, sync_end)
+        segment_tokens = self._parse_segments(segments, self._env)
+
+        token_start = sum(map(len, self._segment_tokens[:first]))
+        token_end = token_start + sum(map(len, self._segment_tokens[first:last]))
+        self._tokens[token_start:token_end] = [
+            token for tokens in segment_tokens for token in tokens
+        ]
+        self._segment_tokens[first:last] = segment_tokens
+
+        tail = [start + delta for start in starts[last:]] if delta else starts[last:]
+        starts[first:] = new_starts + tail
+
+        self._source = new
+        self.last_mode = 'incremental'
+        self.last_reparsed_span = (scan_from, sync_end)
+        return True
+
+    @staticmethod
+    def _slice_segments(source: str, starts: List[int], end: int) -> List[str]:
+        """Cut ``source`` into segment strings at the given start offsets."""
+        bounds = list(starts) + [end]
+        return [source[bounds[i]:bounds[i + 1]] for i in range(len(starts))]
+
+    def _parse_segments(self, segments: List[str],
+                        env: Dict[str, Any]) -> List[List[Dict[str, Any]]]:
+        """Parse segments with a shared environment.
+
+        Block parsing runs for every segment before any inline rendering, so
+        reference links resolve against definitions from all segments, exactly
+        like a single mistune parse of the concatenated text.
+        """
+        md = self.markdown
+        states = []
+        for segment in segments:
+            state = md.block.state_cls()
+            state.env = env
+            state.process(segment)
+            for hook in md.before_parse_hooks:
+                hook(md, state)
+            md.block.parse(state)
+            states.append(state)
+
+        results = []
+        for state in states:
+            for hook in md.before_render_hooks:
+                hook(md, state)
+            result = md.render_state(state)
+            for hook in md.after_render_hooks:
+                result = hook(md, result, state)
+            results.append(result)
+        return results
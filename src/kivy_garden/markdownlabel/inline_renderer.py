@@ -7,6 +7,7 @@ Converts inline Markdown AST tokens to Kivy markup strings.
 
 from typing import Any, Dict, List, Optional
 
+from .compact_ast import is_token
 from .font_fallback import apply_fallback_markup
 
 
@@ -26,6 +27,9 @@ class InlineRenderer:
     BBCode-like markup format.
     """
 
+    # Block token types whose children are inline tokens
+    INLINE_CONTAINER_TYPES = frozenset({'paragraph', 'block_text', 'heading', 'table_cell'})
+
     def __init__(self,
                  link_color: Optional[List[float]] = None,
                  code_font_name: str = 'RobotoMono-Regular',
@@ -67,6 +71,29 @@ class InlineRenderer:
             result.append(method(token))
         return ''.join(result)
 
+    def prerender(self, tokens: List[Dict[str, Any]]) -> Dict[int, str]:
+        """Render the inline content of every block in a token tree.
+
+        Args:
+            tokens: Block-level AST tokens from mistune
+
+        Returns:
+            Dict mapping ``id()`` of each inline children list to its markup.
+            Entries are only meaningful while ``tokens`` is alive.
+        """
+        markup: Dict[int, str] = {}
+        stack = list(tokens)
+        while stack:
+            token = stack.pop()
+            children = token.get('children')
+            if not isinstance(children, (list, tuple)):
+                continue
+            if token.get('type') in self.INLINE_CONTAINER_TYPES:
+                markup[id(children)] = self.render(children)
+            else:
+                stack.extend(child for child in children if is_token(child))
+        return markup
+
     def _unknown(self, token: Dict[str, Any]) -> str:
         """Handle unknown token types by returning raw text if available."""
         return self._escape_markup(token.get('raw', ''))
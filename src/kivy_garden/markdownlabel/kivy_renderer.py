@@ -6,7 +6,7 @@ Renders mistune AST to Kivy widgets for block-level elements.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
@@ -14,10 +14,15 @@ from kivy.uix.widget import Widget
 from kivy.uix.image import AsyncImage
 from kivy.graphics import Color, Rectangle, Line
 
+from .canvas_table import CORE_LABEL_OPTIONS
+from .code_tiles import TiledCodeBlock, split_lines
 from .font_fallback import apply_fallback_markup
 from .inline_renderer import InlineRenderer, escape_kivy_markup
 from .kivy_renderer_tables import KivyRendererTableMixin
+from .list_layout import ListLayout
+from .list_marker import MARKER_LABEL_OPTIONS, ListMarker
 from .rendering import apply_text_size_binding as _apply_text_size_binding_helper
+from .widget_pool import get_widget_pool
 
 logger = logging.getLogger(__name__)
 
@@ -79,10 +84,14 @@ class KivyRenderer(KivyRendererTableMixin):
                  text_padding: Optional[List[float]] = None,
                  strict_label_mode: bool = False,
                  image_size_mode: str = 'contain_no_upscale',
+                 table_mode: str = 'grid',
+                 table_column_sizing: str = 'equal',
+                 code_tile_lines: int = 0,
                  ellipsis_options: Optional[Dict] = None,
                  fallback_enabled: bool = False,
                  fallback_fonts: Optional[List[str]] = None,
-                 fallback_font_scales: Optional[Dict[str, float]] = None):
+                 fallback_font_scales: Optional[Dict[str, float]] = None,
+                 widget_pooling: bool = False):
         """Initialize the KivyRenderer.
 
         Args:
@@ -124,7 +133,17 @@ class KivyRenderer(KivyRendererTableMixin):
             image_size_mode: Global image sizing policy. 'contain_no_upscale' keeps
                 native size unless constrained by layout width; 'fill_width' scales
                 images to full available width while preserving aspect ratio.
+            table_mode: 'grid' renders tables as a GridLayout of Labels; 'canvas'
+                renders each table as one CanvasTable widget and 'virtual' as a
+                CanvasTable rasterizing only rows near the viewport (default: 'grid')
+            table_column_sizing: 'equal' gives all table columns the same width;
+                'content' sizes them by their measured text (default: 'equal')
+            code_tile_lines: Render code blocks with more lines than this as a
+                TiledCodeBlock of tiles with this many lines; 0 renders every
+                code block as one Label (default: 0)
             ellipsis_options: Dictionary of ellipsis options for text shortening (default: {})
+            widget_pooling: Take Labels and layout containers from the shared
+                widget pool instead of constructing them (default: False)
         """
         self.base_font_size = base_font_size
         self.code_font_name = code_font_name
@@ -162,10 +181,15 @@ class KivyRenderer(KivyRendererTableMixin):
         self.text_padding = text_padding or [0, 0, 0, 0]
         self.strict_label_mode = strict_label_mode
         self.image_size_mode = image_size_mode
+        self.table_mode = table_mode
+        self.table_column_sizing = table_column_sizing
+        self.code_tile_lines = code_tile_lines
         self.ellipsis_options = ellipsis_options or {}
         self.fallback_enabled = fallback_enabled
         self.fallback_fonts = fallback_fonts or []
         self.fallback_font_scales = fallback_font_scales or {}
+        self.widget_pooling = widget_pooling
+        self.widget_pool = get_widget_pool() if widget_pooling else None
 
         # Compute effective color based on disabled state
         self.effective_color = self.disabled_color if self.disabled else self.color
@@ -183,6 +207,12 @@ class KivyRenderer(KivyRendererTableMixin):
             base_font_size=self.base_font_size,
             fallback_font_scales=self.fallback_font_scales,
         )
+        # Label kwargs per block kind, copied for every Label
+        self._label_templates = self._create_label_templates()
+
+        # Inline markup rendered ahead of time (see InlineRenderer.prerender),
+        # keyed by id() of the inline children list
+        self.inline_markup: Dict[int, str] = {}
 
         # Track nesting depth for deep nesting protection
         self._nesting_depth = 0
@@ -192,27 +222,41 @@ class KivyRenderer(KivyRendererTableMixin):
         self._list_depth = 0
         self._list_counters = []  # Stack of counters for ordered lists
 
+    def _create_widget(self, kind: str, widget_class: type, **kwargs: Any) -> Widget:
+        """Construct a widget, reusing a pooled one when pooling is enabled.
+
+        Args:
+            kind: Block kind the widget is pooled under
+            widget_class: Label, BoxLayout or GridLayout
+            **kwargs: Widget properties
+
+        Returns:
+            Widget configured with ``kwargs``
+        """
+        if self.widget_pool is not None:
+            return self.widget_pool.acquire(kind, widget_class, **kwargs)
+        return widget_class(**kwargs)
+
     def _apply_text_size_binding(self, label: Label) -> None:
         """Backward-compatible text_size binding using shared logic."""
         _apply_text_size_binding_helper(label, self.text_size, self.strict_label_mode)
 
-    def _build_label_kwargs(self, *, text: str, font_size: float, halign: Optional[str] = None,
-                            valign: Optional[str] = None, bold: bool = False,
-                            markup: bool = True, padding: Optional[List[float]] = None,
-                            size_hint_x: Optional[float] = 1, size_hint_y: Optional[float] = None,
-                            color: Optional[List[float]] = None) -> Dict[str, Any]:
-        """Assemble common Label kwargs used by block-level renderers."""
-        kwargs = {
-            'text': text,
-            'markup': markup,
+    def _create_label_templates(self) -> Dict[str, Dict[str, Any]]:
+        """Precompute Label kwargs shared by all Labels of each block kind.
+
+        Returns:
+            Mapping of block kind (``'body'``, ``'heading'``, ``'code'``) to
+            Label kwargs without ``text`` and ``font_size``
+        """
+        body = {
+            'markup': True,
             'font_name': self.font_name,
-            'font_size': font_size,
-            'color': color if color is not None else self.effective_color,
+            'color': self.effective_color,
             'line_height': self.line_height,
-            'size_hint_x': size_hint_x,
-            'size_hint_y': size_hint_y,
-            'halign': halign if halign is not None else self.halign,
-            'valign': valign if valign is not None else self.valign,
+            'size_hint_x': 1,
+            'size_hint_y': None,
+            'halign': self.halign,
+            'valign': self.valign,
             'unicode_errors': self.unicode_errors,
             'strip': self.strip,
             'font_features': self.font_features,
@@ -221,7 +265,7 @@ class KivyRenderer(KivyRendererTableMixin):
             'shorten': self.shorten,
             'shorten_from': self.shorten_from,
             'split_str': self.split_str,
-            'padding': padding if padding is not None else self.text_padding,
+            'padding': self.text_padding,
             'mipmap': self.mipmap,
             'outline_width': self.outline_width,
             'outline_color': self.effective_outline_color,
@@ -229,26 +273,81 @@ class KivyRenderer(KivyRendererTableMixin):
             'base_direction': self.base_direction,
             'text_language': self.text_language,
             'limit_render_to_text_bbox': self.limit_render_to_text_bbox,
-            'ellipsis_options': self.ellipsis_options,
         }
-
-        if bold:
-            kwargs['bold'] = True
-
+        # Avoid passing empty ellipsis options explicitly when not set
+        if self.ellipsis_options:
+            body['ellipsis_options'] = self.ellipsis_options
         if self.max_lines > 0:
-            kwargs['max_lines'] = self.max_lines
-
+            body['max_lines'] = self.max_lines
         if self.font_family is not None:
-            kwargs['font_family'] = self.font_family
+            body['font_family'] = self.font_family
         if self.font_context is not None:
-            kwargs['font_context'] = self.font_context
+            body['font_context'] = self.font_context
         if self.font_hinting is not None:
-            kwargs['font_hinting'] = self.font_hinting
+            body['font_hinting'] = self.font_hinting
 
-        # Avoid passing empty ellipsis options explicitly when not set
-        if not self.ellipsis_options:
-            kwargs.pop('ellipsis_options', None)
+        # Note: code blocks use code_font_name and fixed light color, not font_name/color
+        # font_family is intentionally excluded from code blocks to preserve monospace
+        # appearance (Requirement 6.1). Other font properties (font_context, font_features,
+        # font_hinting, font_kerning, font_blended) are forwarded per Requirements 6.2-6.5.
+        code = {
+            'markup': True,
+            'font_name': self.code_font_name,
+            'line_height': self.line_height,
+            'size_hint_y': None,
+            'halign': 'left',
+            'valign': 'top',
+            'color': list(self.disabled_color) if self.disabled else list(self.CODE_TEXT_COLOR),
+            'unicode_errors': self.unicode_errors,
+            'strip': self.strip,
+            'font_features': self.font_features,
+            'font_kerning': self.font_kerning,
+            'font_blended': self.font_blended,
+            'mipmap': self.mipmap,
+            'outline_width': self.outline_width,
+            'outline_color': self.effective_outline_color,
+            'disabled_outline_color': self.disabled_outline_color,
+            'base_direction': self.base_direction,
+            'text_language': self.text_language,
+            'limit_render_to_text_bbox': self.limit_render_to_text_bbox,
+            'ellipsis_options': self.ellipsis_options,
+        }
+        if self.font_context is not None:
+            code['font_context'] = self.font_context
+        if self.font_hinting is not None:
+            code['font_hinting'] = self.font_hinting
+
+        return {
+            'body': body,
+            'heading': dict(body, bold=True),
+            'code': code,
+        }
 
+    def _label_kwargs(self, kind: str, text: str, font_size: float) -> Dict[str, Any]:
+        """Return Label kwargs for a block kind from its precomputed template."""
+        kwargs = dict(self._label_templates[kind])
+        kwargs['text'] = text
+        kwargs['font_size'] = font_size
+        return kwargs
+
+    def _build_label_kwargs(self, *, text: str, font_size: float, halign: Optional[str] = None,
+                            valign: Optional[str] = None, bold: bool = False,
+                            markup: bool = True, padding: Optional[List[float]] = None,
+                            size_hint_x: Optional[float] = 1, size_hint_y: Optional[float] = None,
+                            color: Optional[List[float]] = None) -> Dict[str, Any]:
+        """Assemble common Label kwargs used by block-level renderers."""
+        kwargs = self._label_kwargs('heading' if bold else 'body', text, font_size)
+        kwargs['markup'] = markup
+        kwargs['size_hint_x'] = size_hint_x
+        kwargs['size_hint_y'] = size_hint_y
+        if color is not None:
+            kwargs['color'] = color
+        if halign is not None:
+            kwargs['halign'] = halign
+        if valign is not None:
+            kwargs['valign'] = valign
+        if padding is not None:
+            kwargs['padding'] = padding
         return kwargs
 
     def __call__(self, tokens: List[Dict[str, Any]], state: Any = None) -> BoxLayout:
@@ -261,11 +360,53 @@ class KivyRenderer(KivyRendererTableMixin):
         Returns:
             BoxLayout containing rendered widgets
         """
+        return self.create_root(self.render_blocks(tokens, state))
+
+    def render_blocks(self, tokens: List[Dict[str, Any]],
+                      state: Any = None) -> List[Optional[Widget]]:
+        """Render top-level tokens to one widget per token.
+
+        Args:
+            tokens: List of top-level AST tokens from mistune
+            state: Block state from mistune (optional)
+
+        Returns:
+            List parallel to ``tokens``; entries are None for skipped tokens
+        """
+        return [self.render_block(token, state) for token in tokens]
+
+    def render_block(self, token: Dict[str, Any], state: Any = None) -> Optional[Widget]:
+        """Render a single top-level token.
+
+        Args:
+            token: Top-level AST token
+            state: Block state from mistune (optional)
+
+        Returns:
+            Rendered widget, or None for skipped tokens
+        """
+        try:
+            return self._render_token(token, state)
+        finally:
+            # Renderers are shared (see render_config.get_renderer); start the
+            # next block from a clean nesting state even after an error.
+            self._nesting_depth = 0
+            self._list_depth = 0
+            self._list_counters = []
+
+    def create_root(self, widgets: List[Optional[Widget]]) -> BoxLayout:
+        """Create the vertical root BoxLayout holding rendered block widgets.
+
+        Args:
+            widgets: Block widgets as returned by :meth:`render_blocks`
+
+        Returns:
+            BoxLayout containing the non-None widgets in order
+        """
         root = BoxLayout(orientation='vertical', size_hint_y=None)
         root.bind(minimum_height=root.setter('height'))
 
-        for token in tokens:
-            widget = self._render_token(token, state)
+        for widget in widgets:
             if widget is not None:
                 root.add_widget(widget)
 
@@ -309,7 +450,8 @@ class KivyRenderer(KivyRendererTableMixin):
         Returns:
             Label widget indicating content was truncated
         """
-        label = Label(
+        label = self._create_widget(
+            'placeholder', Label,
             text='[...content truncated due to deep nesting...]',
             markup=False,
             font_size=self.base_font_size,
@@ -330,6 +472,9 @@ class KivyRenderer(KivyRendererTableMixin):
         Returns:
             Kivy markup string
         """
+        markup = self.inline_markup.get(id(children))
+        if markup is not None:
+            return markup
         return self.inline_renderer.render(children)
 
     @staticmethod
@@ -376,14 +521,8 @@ class KivyRenderer(KivyRendererTableMixin):
 
         text = self._render_inline(children)
 
-        label_kwargs = self._build_label_kwargs(
-            text=text,
-            font_size=self.base_font_size,
-            size_hint_y=None,
-            size_hint_x=1,
-        )
-
-        label = Label(**label_kwargs)
+        label = self._create_widget('paragraph', Label,
+                                    **self._label_kwargs('body', text, self.base_font_size))
 
         # Set font scale metadata for body text
         label._font_scale = 1.0
@@ -407,14 +546,8 @@ class KivyRenderer(KivyRendererTableMixin):
 
         text = self._render_inline(children)
 
-        label_kwargs = self._build_label_kwargs(
-            text=text,
-            font_size=self.base_font_size,
-            size_hint_y=None,
-            size_hint_x=1,
-        )
-
-        label = Label(**label_kwargs)
+        label = self._create_widget('paragraph', Label,
+                                    **self._label_kwargs('body', text, self.base_font_size))
 
         # Set font scale metadata for body text
         label._font_scale = 1.0
@@ -450,15 +583,7 @@ class KivyRenderer(KivyRendererTableMixin):
         multiplier = self.HEADING_SIZES.get(level, 1.0)
         font_size = self.base_font_size * multiplier
 
-        label_kwargs = self._build_label_kwargs(
-            text=text,
-            font_size=font_size,
-            bold=True,
-            size_hint_y=None,
-            size_hint_x=1,
-        )
-
-        label = Label(**label_kwargs)
+        label = self._create_widget('heading', Label, **self._label_kwargs('heading', text, font_size))
 
         # Store heading level as metadata
         label.heading_level = level
@@ -481,15 +606,15 @@ class KivyRenderer(KivyRendererTableMixin):
         widget = Widget(size_hint_y=None, height=self.base_font_size)
         return widget
 
-    def list(self, token: Dict[str, Any], state: Any = None) -> BoxLayout:
-        """Render a list as a vertical BoxLayout.
+    def list(self, token: Dict[str, Any], state: Any = None) -> ListLayout:
+        """Render a list as a ListLayout of markers and item bodies.
 
         Args:
             token: List token with 'children' and 'attrs'
             state: Block state
 
         Returns:
-            BoxLayout containing list items
+            ListLayout containing the marker and blocks of every item
         """
         attrs = token.get('attrs', {})
         ordered = attrs.get('ordered', False)
@@ -509,17 +634,17 @@ class KivyRenderer(KivyRendererTableMixin):
         indent = self._list_depth * 20
         align_right = self.halign == 'right'
 
-        container = BoxLayout(
-            orientation='vertical',
+        # ListLayout sizes itself to its items when size_hint_y is None.
+        container = self._create_widget(
+            'list', ListLayout,
             size_hint_y=None,
+            marker_side='right' if align_right else 'left',
             padding=[0, 0, indent, bottom_padding] if align_right else [indent, 0, 0, bottom_padding]
         )
-        container.bind(minimum_height=container.setter('height'))
 
         for i, child in enumerate(children):
-            item_widget = self._render_list_item(child, ordered, i, state)
-            if item_widget is not None:
-                container.add_widget(item_widget)
+            marker, blocks = self._render_list_item(child, ordered, i, state)
+            container.add_item(marker, blocks)
 
         # Pop counter for ordered lists
         if ordered:
@@ -531,8 +656,8 @@ class KivyRenderer(KivyRendererTableMixin):
         return container
 
     def _render_list_item(self, token: Dict[str, Any], ordered: bool,
-                          index: int, state: Any = None) -> BoxLayout:
-        """Render a list item with bullet/number prefix.
+                          index: int, state: Any = None) -> Tuple[ListMarker, List[Widget]]:
+        """Render the marker and body blocks of a list item.
 
         Args:
             token: List item token
@@ -541,15 +666,8 @@ class KivyRenderer(KivyRendererTableMixin):
             state: Block state
 
         Returns:
-            BoxLayout with marker and content
+            Tuple of the ListMarker and the item's block widgets
         """
-        # Create horizontal layout for marker + content
-        item_layout = BoxLayout(
-            orientation='horizontal',
-            size_hint_y=None
-        )
-        item_layout.bind(minimum_height=item_layout.setter('height'))
-
         # Create marker (bullet or number)
         if ordered:
             counter = self._list_counters[-1] if self._list_counters else 1
@@ -557,67 +675,29 @@ class KivyRenderer(KivyRendererTableMixin):
         else:
             marker_text = '•'
 
-        marker_kwargs = self._build_label_kwargs(
-            text=marker_text,
-            font_size=self.base_font_size,
-            halign='right',
-            valign='top',  # Force top alignment so bullets align with first line
-            markup=False,
-            size_hint_x=None,
-            # IMPORTANT: do NOT use size_hint_y=1 here. item_layout's height is
-            # driven by minimum_height (children heights), and a child whose
-            # height is driven by the parent creates a feedback loop that can
-            # hit Clock.max_iteration.
-            size_hint_y=None,
-        )
-
-        marker = Label(**marker_kwargs)
-        marker.width = 30
-        # The marker's height is driven by the list item content column height
-        # (see binding below). Disable auto texture_size->height binding to avoid
-        # a feedback loop (height changes -> size changes -> text_size changes ->
-        # texture_size changes -> height changes ...).
-        marker._md_disable_tex_height_binding = True
-
-        # Bind text_size to enable valign to work properly. Use width/height
-        # bindings rather than size to reduce churn.
-        def _update_marker_text_size(*_args):
-            marker.text_size = (marker.width, marker.height)
-
-        marker.bind(width=_update_marker_text_size, height=_update_marker_text_size)
-        _update_marker_text_size()
+        # Markers draw a shared cached texture at their top so bullets align
+        # with the first line; ListLayout sizes and positions them.
+        template = self._label_templates['body']
+        marker = self._create_widget('marker', ListMarker,
+                                     text=marker_text,
+                                     font_name=self.font_name,
+                                     font_size=self.base_font_size,
+                                     color=self.effective_color,
+                                     label_options={name: template[name] for name in MARKER_LABEL_OPTIONS
+                                                    if name in template},
+                                     size_hint_x=None)
 
         # Set font scale metadata for list markers
         marker._font_scale = 1.0
 
-        # Create content container
-        content = BoxLayout(
-            orientation='vertical',
-            size_hint_y=None
-        )
-        content.bind(minimum_height=content.setter('height'))
-
         # Render children of list item
-        children = token.get('children', [])
-        for child in children:
+        blocks = []
+        for child in token.get('children', []):
             child_widget = self._render_token(child, state)
             if child_widget is not None:
-                content.add_widget(child_widget)
-
-        align_right = self.halign == 'right'
-        if align_right:
-            item_layout.add_widget(content)
-            item_layout.add_widget(marker)
-        else:
-            item_layout.add_widget(marker)
-            item_layout.add_widget(content)
-
-        # Keep the marker column aligned to the content column height without
-        # introducing a parent-driven size_hint_y cycle.
-        content.bind(height=marker.setter('height'))
-        marker.height = content.height
+                blocks.append(child_widget)
 
-        return item_layout
+        return marker, blocks
 
     def list_item(self, token: Dict[str, Any], state: Any = None) -> BoxLayout:
         """Render a list item (called directly if needed).
@@ -631,7 +711,8 @@ class KivyRenderer(KivyRendererTableMixin):
         Returns:
             BoxLayout with content
         """
-        content = BoxLayout(
+        content = self._create_widget(
+            'list_content', BoxLayout,
             orientation='vertical',
             size_hint_y=None
         )
@@ -658,20 +739,11 @@ class KivyRenderer(KivyRendererTableMixin):
         raw = token.get('raw', '')
         attrs = token.get('attrs', {})
         language = attrs.get('info', '')
-
-        # Escape the code text for Kivy markup
-        escaped_text = apply_fallback_markup(
-            raw.rstrip('\n'),
-            primary_font=self.code_font_name,
-            fallback_fonts=self.fallback_fonts,
-            enabled=self.fallback_enabled,
-            wrap_primary=True,
-            base_font_size=self.base_font_size,
-            font_scales=self.fallback_font_scales
-        )
+        code = raw.rstrip('\n')
 
         # Create container with background
-        container = BoxLayout(
+        container = self._create_widget(
+            'code_block', BoxLayout,
             orientation='vertical',
             size_hint_y=None,
             padding=[10, 10, 10, 10]
@@ -689,54 +761,23 @@ class KivyRenderer(KivyRendererTableMixin):
 
         container.bind(pos=update_bg, size=update_bg)
 
-        # Create label with monospace font
-        # Note: code blocks use code_font_name and fixed light color, not font_name/color
-        # font_family is intentionally excluded from code blocks to preserve monospace
-        # appearance (Requirement 6.1). Other font properties (font_context, font_features,
-        # font_hinting, font_kerning, font_blended) are forwarded per Requirements 6.2-6.5.
-        label_kwargs = {
-            'text': escaped_text,
-            'markup': True,
-            'font_name': self.code_font_name,
-            'font_size': self.base_font_size,
-            'line_height': self.line_height,
-            'size_hint_y': None,
-            'halign': 'left',
-            'valign': 'top',
-            'color': list(self.disabled_color) if self.disabled else list(self.CODE_TEXT_COLOR),
-            'unicode_errors': self.unicode_errors,
-            'strip': self.strip,
-            'font_features': self.font_features,
-            'font_kerning': self.font_kerning,
-            'font_blended': self.font_blended,
-            'mipmap': self.mipmap,
-            'outline_width': self.outline_width,
-            'outline_color': self.effective_outline_color,
-            'disabled_outline_color': self.disabled_outline_color,
-            'base_direction': self.base_direction,
-            'text_language': self.text_language,
-            'limit_render_to_text_bbox': self.limit_render_to_text_bbox,
-            'ellipsis_options': self.ellipsis_options,
-        }
-
-        # Add optional font properties if set (excluding font_family for code blocks)
-        if self.font_context is not None:
-            label_kwargs['font_context'] = self.font_context
-        if self.font_hinting is not None:
-            label_kwargs['font_hinting'] = self.font_hinting
-
-        label = Label(**label_kwargs)
-        # NOTE: Don't bind size/texture_size here; MarkdownLabel applies a
-        # consistent text_size + texture_size->height binding pass across all
-        # Labels after rendering. Duplicating bindings here can create layout
-        # thrash and trigger Clock.max_iteration warnings on complex content.
+        if self.code_tile_lines > 0 and code.count('\n') >= self.code_tile_lines:
+            content = self._render_code_tiles(code)
+        else:
+            # Create label with monospace font (see the 'code' template)
+            label_kwargs = self._label_kwargs('code', self._code_markup(code), self.base_font_size)
+            content = self._create_widget('code', Label, **label_kwargs)
+            # NOTE: Don't bind size/texture_size here; MarkdownLabel applies a
+            # consistent text_size + texture_size->height binding pass across all
+            # Labels after rendering. Duplicating bindings here can create layout
+            # thrash and trigger Clock.max_iteration warnings on complex content.
 
         # Set font scale metadata for code blocks
-        label._font_scale = 1.0
-        label._is_code = True
-        label._code_color = list(self.CODE_TEXT_COLOR)
+        content._font_scale = 1.0
+        content._is_code = True
+        content._code_color = list(self.CODE_TEXT_COLOR)
 
-        container.add_widget(label)
+        container.add_widget(content)
         container.bind(minimum_height=container.setter('height'))
 
         # Store language info as metadata
@@ -744,6 +785,45 @@ class KivyRenderer(KivyRendererTableMixin):
 
         return container
 
+    def _code_markup(self, code: str) -> str:
+        """Escape code text for Kivy markup in the code font with fallbacks."""
+        return apply_fallback_markup(
+            code,
+            primary_font=self.code_font_name,
+            fallback_fonts=self.fallback_fonts,
+            enabled=self.fallback_enabled,
+            wrap_primary=True,
+            base_font_size=self.base_font_size,
+            font_scales=self.fallback_font_scales
+        )
+
+    def _render_code_tiles(self, code: str) -> TiledCodeBlock:
+        """Render long code as a TiledCodeBlock of ``code_tile_lines``-line tiles.
+
+        Each tile gets its own markup, so tags never span tiles. ``strip`` is
+        applied to the whole block before it is split, as a code Label would.
+
+        Args:
+            code: Code text without trailing newlines
+
+        Returns:
+            TiledCodeBlock rasterizing the tiles near the viewport
+        """
+        if self.strip:
+            code = code.strip()
+        template = self._label_templates['code']
+        return self._create_widget(
+            'code_tiles', TiledCodeBlock,
+            tiles=[self._code_markup(chunk) for chunk in split_lines(code, self.code_tile_lines)],
+            font_name=self.code_font_name,
+            font_size=self.base_font_size,
+            color=template['color'],
+            line_height=self.line_height,
+            label_options={name: template[name] for name in CORE_LABEL_OPTIONS
+                           if name in template and name != 'strip'},
+            size_hint_y=None
+        )
+
     def block_quote(self, token: Dict[str, Any], state: Any = None) -> BoxLayout:
         """Render a block quote with left border and indentation.
 
@@ -760,7 +840,8 @@ class KivyRenderer(KivyRendererTableMixin):
         self._nesting_depth += 1
 
         # Create container with left padding for indentation
-        container = BoxLayout(
+        container = self._create_widget(
+            'block_quote', BoxLayout,
             orientation='vertical',
             size_hint_y=None,
             padding=[20, 5, 5, 5]  # Left padding for quote indentation
@@ -903,15 +984,9 @@ class KivyRenderer(KivyRendererTableMixin):
         # User requested plain text styling, same as paragraph
         text = escape_kivy_markup(raw.rstrip('\n'))
 
-        label_kwargs = self._build_label_kwargs(
-            text=text,
-            font_size=self.base_font_size,
-            size_hint_y=None,
-            size_hint_x=1,
-            # Use default font_name (Roboto), not code_font_name
-        )
-
-        label = Label(**label_kwargs)
+        # Use default font_name (Roboto), not code_font_name
+        label = self._create_widget('paragraph', Label,
+                                    **self._label_kwargs('body', text, self.base_font_size))
         # Set font scale metadata (same as paragraph)
         label._font_scale = 1.0
 
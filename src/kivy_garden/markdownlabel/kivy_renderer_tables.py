@@ -3,34 +3,54 @@ KivyRenderer Table Support
 ==========================
 
 Table rendering functionality for KivyRenderer as a mixin class.
+
+With ``table_mode='grid'`` (the default) tables are GridLayouts with one
+Label per cell; with ``table_mode='canvas'`` they are single
+:class:`~kivy_garden.markdownlabel.canvas_table.CanvasTable` widgets, and
+with ``table_mode='virtual'`` CanvasTables that only rasterize the rows near
+the visible region.
+
+With ``table_column_sizing='content'`` columns in all modes are sized by
+their measured text (see :mod:`~kivy_garden.markdownlabel.column_widths`)
+instead of sharing the width equally.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple, Union
 
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
 
+from .canvas_table import CORE_LABEL_OPTIONS, CanvasTable, CanvasTableCell
+from .column_widths import get_column_width_cache, make_table_key
+
 
 class KivyRendererTableMixin:
     """Mixin class providing table rendering functionality for KivyRenderer."""
 
-    def table(self, token: Dict[str, Any], state: Any = None) -> GridLayout:
+    def table(self, token: Dict[str, Any], state: Any = None) -> Union[GridLayout, CanvasTable]:
         """Render a table as a GridLayout with bottom spacing.
 
+        With ``table_mode='canvas'`` or ``'virtual'`` the table is rendered
+        by :meth:`_render_canvas_table` instead.
+
         Args:
             token: Table token with 'children' containing head and body
             state: Block state
 
         Returns:
-            GridLayout containing table cells
+            GridLayout containing table cells, or a CanvasTable
         """
+        if self.table_mode in ('canvas', 'virtual'):
+            return self._render_canvas_table(token, state)
+
         children = token.get('children', [])
 
         # Determine number of columns from the first row
         num_cols = self._get_table_column_count(token)
 
         # Create GridLayout with correct number of columns and bottom padding
-        grid = GridLayout(
+        grid = self._create_widget(
+            'table', GridLayout,
             cols=num_cols,
             size_hint_y=None,
             spacing=[2, 2],
@@ -46,8 +66,110 @@ class KivyRendererTableMixin:
             elif child_type == 'table_body':
                 self._render_table_section(child, grid, state, is_head=False)
 
+        if self.table_column_sizing == 'content':
+            self._bind_content_column_widths(grid, self._collect_table_rows(token))
+
         return grid
 
+    def _render_canvas_table(self, token: Dict[str, Any], state: Any = None) -> CanvasTable:
+        """Render a table as one CanvasTable widget.
+
+        The table is virtualized when ``table_mode`` is ``'virtual'``.
+
+        Args:
+            token: Table token with 'children' containing head and body
+            state: Block state
+
+        Returns:
+            CanvasTable drawing all cells of the table
+        """
+        table = self._create_widget(
+            'canvas_table', CanvasTable,
+            rows=self._collect_table_rows(token),
+            cols=self._get_table_column_count(token),
+            font_name=self.font_name,
+            font_size=self.base_font_size,
+            color=self.effective_color,
+            line_height=self.line_height,
+            label_options=self._table_label_options(),
+            virtualized=self.table_mode == 'virtual',
+            column_sizing=self.table_column_sizing,
+            size_hint_y=None,
+            spacing=2,
+            padding=[5, 5, 5, 5 + self.base_font_size]  # Add bottom spacing via padding
+        )
+
+        # Set font scale metadata for the cell text
+        table._font_scale = 1.0
+
+        return table
+
+    def _collect_table_rows(self, token: Dict[str, Any]) -> List[List[CanvasTableCell]]:
+        """Return the cells of a table as rows of CanvasTableCell, header first.
+
+        Args:
+            token: Table token with 'children' containing head and body
+
+        Returns:
+            List of rows, each a list of cells
+        """
+        rows: List[List[CanvasTableCell]] = []
+        for section in token.get('children', []):
+            section_type = section.get('type', '')
+            if section_type not in ('table_head', 'table_body'):
+                continue
+            is_head = section_type == 'table_head'
+            section_children = section.get('children', [])
+            if section_children and section_children[0].get('type') == 'table_cell':
+                # table_head: direct table_cell children
+                section_rows = [section_children]
+            else:
+                section_rows = [row.get('children', []) for row in section_children]
+            for cells in section_rows:
+                rows.append([CanvasTableCell(*self._get_table_cell_content(cell), is_header=is_head)
+                             for cell in cells])
+        return rows
+
+    def _table_label_options(self) -> Dict[str, Any]:
+        """Return the core text options of table cell text."""
+        template = self._label_templates['body']
+        return {name: template[name] for name in CORE_LABEL_OPTIONS if name in template}
+
+    def _bind_content_column_widths(self, grid: GridLayout,
+                                    rows: List[List[CanvasTableCell]]) -> None:
+        """Size the grid's columns by their text whenever its width changes.
+
+        Column widths come from the shared column width cache and are applied
+        as ``cols_minimum``, which adds up to the available width, so the
+        cells get their final width in the grid's first layout pass. The
+        font of the text is read from the first cell, and the callback is
+        kept as ``grid._update_columns`` so in-place font size and style
+        updates can size the columns again.
+
+        Args:
+            grid: Table GridLayout with its cells added
+            rows: Cells of the table, see :meth:`_collect_table_rows`
+        """
+        if not grid.children:
+            return
+        cols = grid.cols
+        option_names = tuple(self._table_label_options())
+        table_key = make_table_key(rows)
+
+        def update_columns(instance, width):
+            cell = instance.children[-1]
+            options = {name: getattr(cell, name) for name in option_names}
+            pad_left, pad_top, pad_right, pad_bottom = instance.padding
+            available = max(0.0, width - pad_left - pad_right - instance.spacing[0] * (cols - 1))
+            widths = get_column_width_cache().get_widths(
+                rows, cols, available, cell.font_name, cell.font_size, options,
+                table_key=table_key)
+            instance.cols_minimum = dict(enumerate(widths))
+
+        grid._update_columns = update_columns
+        grid.bind(width=update_columns)
+        update_columns(grid, grid.width)
+
     def _get_table_column_count(self, token: Dict[str, Any]) -> int:
         """Get the number of columns in a table.
 
@@ -127,20 +249,7 @@ class KivyRendererTableMixin:
         Returns:
             Label widget for the cell
         """
-        children = cell.get('children', [])
-        attrs = cell.get('attrs', {})
-
-        # Get alignment from attrs - table cells use their own alignment from markdown
-        # but fall back to the renderer's halign if not specified or invalid
-        align = attrs.get('align', None)
-        if align in ('left', 'center', 'right'):
-            cell_halign = align
-        else:
-            # Fall back to renderer's halign, but convert 'auto' to 'left' for table cells
-            cell_halign = 'left' if self.halign == 'auto' else self.halign
-
-        # Render inline content
-        text = self._render_inline(children) if children else ''
+        text, cell_halign = self._get_table_cell_content(cell)
 
         # Create label with appropriate styling
         label_kwargs = self._build_label_kwargs(
@@ -152,7 +261,7 @@ class KivyRendererTableMixin:
             size_hint_x=1,
         )
 
-        label = Label(**label_kwargs)
+        label = self._create_widget('table_cell', Label, **label_kwargs)
 
         # Store alignment as metadata
         label.cell_align = cell_halign
@@ -163,6 +272,31 @@ class KivyRendererTableMixin:
 
         return label
 
+    def _get_table_cell_content(self, cell: Dict[str, Any]) -> Tuple[str, str]:
+        """Return the markup and horizontal alignment of a table cell.
+
+        Args:
+            cell: Table cell token
+
+        Returns:
+            Tuple of the cell's inline markup and its halign
+        """
+        children = cell.get('children', [])
+        attrs = cell.get('attrs', {})
+
+        # Get alignment from attrs - table cells use their own alignment from markdown
+        # but fall back to the renderer's halign if not specified or invalid
+        align = attrs.get('align', None)
+        if align in ('left', 'center', 'right'):
+            cell_halign = align
+        else:
+            # Fall back to renderer's halign, but convert 'auto' to 'left' for table cells
+            cell_halign = 'left' if self.halign == 'auto' else self.halign
+
+        # Render inline content
+        text = self._render_inline(children) if children else ''
+        return text, cell_halign
+
     def table_head(self, token: Dict[str, Any], state: Any = None) -> None:
         """Handle table_head token (processed by table()).
 
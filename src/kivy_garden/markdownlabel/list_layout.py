@@ -0,0 +1,126 @@
+"""
+List Layout
+===========
+
+Flat layout for rendered Markdown lists.
+
+A :class:`ListLayout` holds the markers and body blocks of all items of one
+list as direct children and positions them in a single ``do_layout`` pass:
+each marker sits in a fixed-width column next to the blocks of its item,
+which are stacked vertically, and the marker is as tall as its item. Markers
+are :class:`~kivy_garden.markdownlabel.list_marker.ListMarker` widgets.
+Nested lists are ListLayouts among the blocks of an item.
+
+Compared to one horizontal BoxLayout with a marker Label and a vertical
+content BoxLayout per item, this creates two fewer widgets per item and no
+height bindings between markers, contents and items.
+"""
+
+from typing import List, Sequence, Tuple
+
+from kivy.properties import NumericProperty, OptionProperty, VariableListProperty
+from kivy.uix.layout import Layout
+from kivy.uix.widget import Widget
+
+from .list_marker import ListMarker
+
+
+def is_list_marker(widget: Widget) -> bool:
+    """Return True if ``widget`` is the marker of a ListLayout item."""
+    return isinstance(widget, ListMarker)
+
+
+class ListLayout(Layout):
+    """Layout placing list markers beside the blocks of their items.
+
+    Children are kept in document order: each item is its ListMarker
+    followed by its body blocks. The size and position of markers are
+    managed by the layout.
+    """
+
+    padding = VariableListProperty([0, 0, 0, 0])
+    """Padding [left, top, right, bottom] around the items."""
+
+    marker_width = NumericProperty(30)
+    """Width of the marker column."""
+
+    marker_side = OptionProperty('left', options=['left', 'right'])
+    """Side of the marker column; 'right' for right-aligned (RTL) lists."""
+
+    minimum_height = NumericProperty(0)
+    """Height needed by the padding and all items, computed by do_layout."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        trigger = self._trigger_layout
+        fbind = self.fbind
+        for name in ('padding', 'marker_width', 'marker_side', 'children', 'size', 'pos'):
+            fbind(name, trigger)
+
+    def add_item(self, marker: ListMarker, blocks: Sequence[Widget]) -> None:
+        """Append an item with its marker and body blocks.
+
+        Args:
+            marker: ListMarker showing the bullet or number
+            blocks: Widgets of the item body, in document order
+        """
+        self.add_widget(marker, index=0)
+        for block in blocks:
+            self.add_widget(block, index=0)
+
+    @property
+    def items(self) -> List[Tuple[ListMarker, List[Widget]]]:
+        """Items as ``(marker, blocks)`` pairs in document order."""
+        items = []
+        for child in reversed(self.children):
+            if is_list_marker(child):
+                items.append((child, []))
+            elif items:
+                items[-1][1].append(child)
+            else:
+                items.append((None, [child]))
+        return items
+
+    def do_layout(self, *largs):
+        """Position all markers and blocks in one pass."""
+        pad_left, pad_top, pad_right, pad_bottom = self.padding
+        marker_width = self.marker_width
+        body_width = max(0, self.width - pad_left - pad_right - marker_width)
+        if self.marker_side == 'left':
+            marker_x = self.x + pad_left
+            body_x = marker_x + marker_width
+        else:
+            body_x = self.x + pad_left
+            marker_x = body_x + body_width
+
+        items = self.items
+        total = pad_top + pad_bottom
+        for marker, blocks in items:
+            item_height = sum(block.height for block in blocks)
+            if not blocks and marker is not None:
+                item_height = marker.texture_size[1]
+            total += item_height
+
+        if self.size_hint_y is None and self.height != total:
+            # Resizing triggers another pass with the final position.
+            self.minimum_height = total
+            self.height = total
+            return
+        self.minimum_height = total
+
+        top = self.top - pad_top
+        for marker, blocks in items:
+            item_top = top
+            for block in blocks:
+                if block.size_hint_x is not None:
+                    block.width = body_width * block.size_hint_x
+                top -= block.height
+                block.pos = (body_x, top)
+            if marker is None:
+                continue
+            if not blocks:
+                top -= marker.texture_size[1]
+            marker_size = (marker_width, item_top - top)
+            if tuple(marker.size) != marker_size:
+                marker.size = marker_size
+            marker.pos = (marker_x, top)
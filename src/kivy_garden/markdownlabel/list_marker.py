@@ -0,0 +1,208 @@
+"""
+List Marker
+===========
+
+List bullets and ordinal numbers drawn from shared textures.
+
+Every list item shows a marker such as ``'•'`` or ``'3.'``, and a document
+usually repeats the same few markers many times. Instead of a Label that
+rasterizes its glyphs again for every item and every rebuild, each item gets
+a :class:`ListMarker` that draws a texture from the process-wide
+:class:`MarkerTextureCache` with a single Rectangle instruction. Textures are
+keyed by marker text, font name, font size, color and the further core text
+options that change the rasterized glyphs (outline, font family and features,
+shaping), so a marker is rasterized once per process for each style it is
+shown in.
+
+Cached textures are shared between all markers using them and must be
+treated as read-only.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from kivy.base import EventLoop
+from kivy.core.text import Label as CoreLabel
+from kivy.graphics import Color, Rectangle
+from kivy.graphics.texture import Texture
+from kivy.properties import (
+    ColorProperty,
+    DictProperty,
+    ListProperty,
+    NumericProperty,
+    OptionProperty,
+    StringProperty,
+)
+from kivy.uix.widget import Widget
+
+# Default number of marker textures kept by the shared cache
+DEFAULT_MAX_ENTRIES = 512
+
+# Core text options that ListMarker.label_options forwards to rasterization,
+# with the Label defaults that leave the glyphs unchanged
+MARKER_LABEL_OPTIONS = {
+    'font_family': None,
+    'font_context': None,
+    'font_features': '',
+    'font_hinting': 'normal',
+    'font_kerning': True,
+    'font_blended': True,
+    'outline_width': None,
+    'outline_color': (0.0, 0.0, 0.0, 1.0),
+    'base_direction': None,
+    'text_language': None,
+}
+
+MarkerKey = Tuple[str, str, float, Tuple[float, ...], Tuple[Tuple[str, Any], ...]]
+
+
+def _freeze(value: Any) -> Any:
+    """Return ``value`` with lists turned into tuples, for use in a key."""
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    return value
+
+
+class MarkerTextureCache:
+    """Bounded cache of rasterized marker textures.
+
+    Entries are evicted least recently used first once ``max_entries`` is
+    exceeded. Textures must only be created on the main thread.
+
+    Attributes:
+        max_entries: Maximum number of textures kept
+        hits: Lookups answered from the cache
+        misses: Lookups that rasterized a new texture
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._textures: 'OrderedDict[MarkerKey, Texture]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._textures)
+
+    @staticmethod
+    def make_key(text: str, font_name: str, font_size: float, color: Sequence[float],
+                 options: Optional[Dict[str, Any]] = None) -> MarkerKey:
+        """Return the cache key of a marker style."""
+        options = options or {}
+        style = []
+        for name, default in MARKER_LABEL_OPTIONS.items():
+            value = _freeze(options.get(name))
+            if value is not None and value != default:
+                style.append((name, value))
+        return (text, font_name, float(font_size), tuple(float(c) for c in color), tuple(style))
+
+    def get(self, text: str, font_name: str, font_size: float, color: Sequence[float],
+            options: Optional[Dict[str, Any]] = None) -> Optional[Texture]:
+        """Return the texture of ``text`` in the given style.
+
+        Args:
+            text: Marker text, e.g. ``'•'`` or ``'12.'``
+            font_name: Font name or path
+            font_size: Font size in pixels
+            color: RGBA color the glyphs are rasterized in
+            options: Further core text options; names outside
+                :data:`MARKER_LABEL_OPTIONS`, None and default values are
+                ignored
+
+        Returns:
+            Shared texture, or None for empty text
+        """
+        if not text:
+            return None
+        key = self.make_key(text, font_name, font_size, color, options)
+        texture = self._textures.get(key)
+        if texture is not None:
+            self._textures.move_to_end(key)
+            self.hits += 1
+            return texture
+
+        # Textures need the GL context, as for any widget.
+        EventLoop.ensure_window()
+        core = CoreLabel(text=text, font_name=font_name, font_size=font_size, color=key[3],
+                         **dict(key[4]))
+        core.refresh()
+        texture = core.texture
+        self.misses += 1
+        self._textures[key] = texture
+        while len(self._textures) > self.max_entries:
+            self._textures.popitem(last=False)
+        return texture
+
+    def clear(self) -> None:
+        """Drop all cached textures."""
+        self._textures.clear()
+
+
+_shared_cache = MarkerTextureCache()
+
+
+def get_marker_texture_cache() -> MarkerTextureCache:
+    """Return the process-wide marker texture cache."""
+    return _shared_cache
+
+
+def clear_marker_texture_cache() -> None:
+    """Drop all textures of the process-wide marker texture cache."""
+    _shared_cache.clear()
+
+
+class ListMarker(Widget):
+    """Widget drawing a list marker from the shared texture cache.
+
+    The texture is drawn at the top of the widget so the marker lines up
+    with the first line of its item, aligned to the side given by
+    :attr:`halign`. ListLayout sets the widget's size and position.
+    """
+
+    text = StringProperty('')
+    """Marker text, e.g. ``'•'`` or ``'3.'``."""
+
+    font_name = StringProperty('Roboto')
+    """Font name or path the marker is rasterized with."""
+
+    font_size = NumericProperty(15)
+    """Font size in pixels."""
+
+    color = ColorProperty([1, 1, 1, 1])
+    """Color of the marker glyphs."""
+
+    label_options = DictProperty({})
+    """Further core text options, see :data:`MARKER_LABEL_OPTIONS`."""
+
+    halign = OptionProperty('right', options=['left', 'right'])
+    """Horizontal alignment of the texture within the widget."""
+
+    texture_size = ListProperty([0, 0])
+    """Size of the marker texture, [0, 0] when there is no text."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        with self.canvas:
+            Color(1, 1, 1, 1)
+            self._rect = Rectangle()
+        fbind = self.fbind
+        for name in ('text', 'font_name', 'font_size', 'color', 'label_options'):
+            fbind(name, self._update_texture)
+        for name in ('pos', 'size', 'halign'):
+            fbind(name, self._update_rect)
+        self._update_texture()
+
+    def _update_texture(self, *largs):
+        """Look up the texture for the current text and style."""
+        texture = _shared_cache.get(self.text, self.font_name, self.font_size, self.color,
+                                    self.label_options)
+        self._rect.texture = texture
+        self.texture_size = list(texture.size) if texture is not None else [0, 0]
+        self._update_rect()
+
+    def _update_rect(self, *largs):
+        """Place the texture at the top of the widget."""
+        tex_w, tex_h = self.texture_size
+        x = self.right - tex_w if self.halign == 'right' else self.x
+        self._rect.pos = (x, self.top - tex_h)
+        self._rect.size = (tex_w, tex_h)
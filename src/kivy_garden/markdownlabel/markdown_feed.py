@@ -0,0 +1,396 @@
+"""
+Markdown Feed
+=============
+
+A virtualized list of Markdown messages for chat-style screens.
+
+:class:`MarkdownFeed` is a :class:`~kivy.uix.recycleview.RecycleView` whose
+data model is a list of Markdown strings. Only messages near the viewport are
+displayed, by a small pool of recycled rows. Each row hosts a
+``MarkdownLabel``; labels of recently displayed messages are kept so they
+scroll back into view without rendering again, and older labels are reused
+for new messages, so widget construction is paid per visible message instead
+of per message in the feed.
+
+Measured message heights are cached by (text digest, width, style), so
+messages that scroll back into view, re-opened conversations and repeated
+messages are laid out without measuring again. Messages that were never
+displayed use an estimate. Appending and prepending insert rows without
+recomputing the rest of the feed and keep the visible messages in place.
+"""
+
+import hashlib
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from kivy.clock import Clock
+from kivy.properties import AliasProperty, DictProperty
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+
+from . import MarkdownLabel
+from .markdown_view import estimate_text_height
+
+# Measured heights kept across all messages of a feed
+_HEIGHT_CACHE_SIZE = 10000
+
+# Rendered labels of recently displayed messages kept for reuse
+_LABEL_CACHE_SIZE = 64
+
+
+def message_key(text: str) -> bytes:
+    """Return the digest identifying a message text in the height cache.
+
+    Args:
+        text: Markdown message text
+
+    Returns:
+        16-byte digest of ``text``
+    """
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+class MarkdownFeedRow(RecycleDataViewBehavior, BoxLayout):
+    """Recycled row of :class:`MarkdownFeed` hosting one message label."""
+
+    def __init__(self, **kwargs):
+        super(MarkdownFeedRow, self).__init__(**kwargs)
+        self.size_hint_y = None
+        self.index = None
+        self.message_key = None
+        self._feed = None
+        self.bind(minimum_height=self._on_minimum_height)
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Show message ``index`` of ``rv``, swapping labels if it changed."""
+        self.index = index
+        if rv is not self._feed:
+            # Kivy pools recycled rows across views; drop the other feed's label.
+            self.clear_widgets()
+            self.message_key = None
+            self._feed = rv
+            rv._rows.add(self)
+        if data['key'] != self.message_key:
+            for child in list(self.children):
+                self.remove_widget(child)
+                rv._release_label(self.message_key, child)
+            self.message_key = data['key']
+            self.add_widget(rv._acquire_label(data['key'], data['text']))
+        super(MarkdownFeedRow, self).refresh_view_attrs(rv, index, {'height': data['height']})
+        rv._measure_trigger()
+
+    def _on_minimum_height(self, instance, value):
+        """Ask the feed to measure its rows again."""
+        if self._feed is not None:
+            self._feed._measure_trigger()
+
+
+class MarkdownFeed(RecycleView):
+    """Scrollable, virtualized list of Markdown messages.
+
+    ``label_options`` holds ``MarkdownLabel`` properties applied to every
+    message row (for example ``base_font_size`` or ``link_style``).
+
+    Events:
+        on_ref_press: Dispatched when a link in a displayed message is
+            clicked. The event data contains the URL of the clicked link.
+
+    Example::
+
+        feed = MarkdownFeed(label_options={'base_font_size': 16})
+        feed.messages = history
+        feed.append_message('**New** message')
+    """
+
+    __events__ = ('on_ref_press',)
+
+    label_options = DictProperty({})
+
+    def __init__(self, **kwargs):
+        # (message key, width, style key) -> measured height
+        self._height_cache: 'OrderedDict[Any, float]' = OrderedDict()
+        # message key -> rendered label of a message scrolled out of view
+        self._label_cache: 'OrderedDict[bytes, MarkdownLabel]' = OrderedDict()
+        # Labels evicted from the cache, reused for other messages
+        self._free_labels: List[MarkdownLabel] = []
+        # Rows that have shown messages of this feed
+        self._rows: 'weakref.WeakSet[MarkdownFeedRow]' = weakref.WeakSet()
+        self._style_key = ''
+        # Message index -> height change not yet applied to the layout
+        self._height_deltas: Dict[int, float] = {}
+        self._data_trigger = Clock.create_trigger(self._refresh_heights, timeout=-1)
+        self._heights_trigger = Clock.create_trigger(self._apply_measured_heights, timeout=-1)
+        self._measure_trigger = Clock.create_trigger(self._measure_rows, timeout=0)
+        super(MarkdownFeed, self).__init__(**kwargs)
+
+        layout = RecycleBoxLayout(
+            orientation='vertical',
+            size_hint_y=None,
+            default_size_hint=(1, None),
+        )
+        layout.bind(minimum_height=layout.setter('height'))
+        self.add_widget(layout)
+        self.viewclass = MarkdownFeedRow
+
+        self._style_key = repr(sorted(self.label_options.items()))
+        self.bind(label_options=self._on_label_options, width=self._on_width_changed)
+
+    def _get_messages(self) -> List[str]:
+        return [row['text'] for row in self.data]
+
+    def _set_messages(self, messages: Iterable[str]) -> bool:
+        self.data = [self._make_row(text) for text in messages]
+        return True
+
+    messages = AliasProperty(_get_messages, _set_messages, bind=['data'])
+    """Markdown texts of all messages. Assigning replaces the whole feed."""
+
+    def _height_key(self, key: bytes):
+        return key, round(self.width), self._style_key
+
+    def _make_row(self, text: str) -> Dict[str, Any]:
+        """Return row data with a cached or estimated height."""
+        key = message_key(text)
+        height = self._height_cache.get(self._height_key(key))
+        if height is None:
+            options = self.label_options
+            height = estimate_text_height(
+                text, self.width, options.get('base_font_size', 15), options.get('line_height', 1.0)
+            )
+        return {'text': text, 'key': key, 'height': height}
+
+    def append_message(self, text: str) -> None:
+        """Add a message at the end of the feed.
+
+        Args:
+            text: Markdown text of the message
+        """
+        self.append_messages([text])
+
+    def append_messages(self, texts: Iterable[str]) -> None:
+        """Add messages at the end of the feed.
+
+        Rows for the new messages are laid out without recomputing the rest
+        of the feed. A feed scrolled to the bottom stays at the bottom;
+        otherwise the visible messages stay in place.
+
+        Args:
+            texts: Markdown texts in display order
+        """
+        rows = [self._make_row(text) for text in texts]
+        if not rows:
+            return
+        anchor = self._save_scroll()
+        self.data.extend(rows)
+        self._restore_scroll(anchor, 0)
+
+    def prepend_message(self, text: str) -> None:
+        """Add a message at the start of the feed.
+
+        Args:
+            text: Markdown text of the message
+        """
+        self.prepend_messages([text])
+
+    def prepend_messages(self, texts: Iterable[str]) -> None:
+        """Add messages at the start of the feed, e.g. older history.
+
+        The visible messages stay in place.
+
+        Args:
+            texts: Markdown texts in display order
+        """
+        rows = [self._make_row(text) for text in texts]
+        if not rows:
+            return
+        anchor = self._save_scroll()
+        for row in reversed(rows):
+            self.data.insert(0, row)
+        self._restore_scroll(anchor, sum(row['height'] for row in rows))
+
+    def update_message(self, index: int, text: str) -> None:
+        """Replace the text of one message, e.g. while it is streamed.
+
+        A displayed message keeps its label, which updates in place.
+
+        Args:
+            index: Message index; negative values count from the end
+            text: New Markdown text
+        """
+        index = range(len(self.data))[index]
+        row = self._make_row(text)
+        view = self.view_adapter.get_visible_view(index)
+        if view is not None and view.children and view.message_key == self.data[index]['key']:
+            view.message_key = row['key']
+            view.children[0].text = text
+        self.data[index] = row
+
+    def _acquire_label(self, key: bytes, text: str) -> MarkdownLabel:
+        """Return a label showing ``text``, reusing a rendered or free one."""
+        label = self._label_cache.pop(key, None)
+        if label is None:
+            label = self._take_pooled_label(key)
+        if label is not None:
+            return label
+        if self._free_labels:
+            label = self._free_labels.pop()
+            label.text = text
+            return label
+        options = self.label_options
+        label = MarkdownLabel(text=text, auto_size_height=True, **options)
+        label.bind(on_ref_press=self._on_label_ref_press)
+        label._feed_options = tuple(options)
+        return label
+
+    def _take_pooled_label(self, key: bytes) -> Optional[MarkdownLabel]:
+        """Detach the label of ``key`` from a row waiting in Kivy's view pool.
+
+        Data changes send every row to the pool still holding its label, and
+        rows come back for other messages in arbitrary order.
+        """
+        adapter = self.view_adapter
+        in_use = set(adapter.views.values())
+        for views in adapter.dirty_views.values():
+            in_use.update(views.values())
+        for row in self._rows:
+            if row._feed is self and row.message_key == key and row.children and row not in in_use:
+                label = row.children[0]
+                row.remove_widget(label)
+                row.message_key = None
+                return label
+        return None
+
+    def _release_label(self, key: Optional[bytes], label: MarkdownLabel) -> None:
+        """Keep the label of a recycled row for when the message returns."""
+        if key is None:
+            self._free_labels.append(label)
+            return
+        cache = self._label_cache
+        cache[key] = label
+        cache.move_to_end(key)
+        while len(cache) > _LABEL_CACHE_SIZE:
+            self._free_labels.append(cache.popitem(last=False)[1])
+        del self._free_labels[_LABEL_CACHE_SIZE:]
+
+    def _on_label_ref_press(self, instance, ref):
+        """Bubble ``on_ref_press`` of message labels."""
+        self.dispatch('on_ref_press', ref)
+
+    def on_ref_press(self, ref):
+        """Event handler for link clicks."""
+        pass
+
+    def _iter_labels(self):
+        """Yield every label of the feed: displayed, cached and free."""
+        for row in list(self._rows):
+            if row._feed is self:
+                yield from row.children
+        yield from self._label_cache.values()
+        yield from self._free_labels
+
+    @staticmethod
+    def _apply_options(label: MarkdownLabel, options: Dict[str, Any]) -> None:
+        """Apply label options, resetting options that were removed."""
+        for name in label._feed_options:
+            if name not in options:
+                setattr(label, name, label.property(name).defaultvalue)
+        for name, value in options.items():
+            setattr(label, name, value)
+        label._feed_options = tuple(options)
+
+    def _save_scroll(self) -> Optional[float]:
+        """Return the scroll distance from the top, or None when at the bottom."""
+        layout = self.layout_manager
+        scrollable = layout.height - self.height if layout is not None else 0
+        if scrollable > 0 and self.scroll_y <= 0:
+            return None
+        return max(0.0, scrollable) * (1.0 - self.scroll_y)
+
+    def _restore_scroll(self, offset: Optional[float], added_above: float) -> None:
+        """Scroll so the content at ``offset`` stays in view after an insert."""
+        # Lay out now so the new content height is known.
+        self.refresh_views()
+        scrollable = self.layout_manager.height - self.height
+        if scrollable <= 0:
+            return
+        if offset is None:
+            self.scroll_y = 0
+        else:
+            self.scroll_y = max(0.0, min(1.0, 1.0 - (offset + added_above) / scrollable))
+
+    def _measure_rows(self, dt=None):
+        """Record the heights of the displayed messages.
+
+        Labels still building or not yet laid out at the feed width are
+        measured again on the next frame.
+        """
+        retry = False
+        for index, row in list(self.view_adapter.views.items()):
+            if row._feed is not self or not row.children:
+                continue
+            label = row.children[0]
+            if label._pending_rebuild or round(label.width) != round(self.width):
+                retry = True
+                continue
+            self._on_message_measured(index, row.message_key, label.minimum_height)
+        if retry:
+            self._measure_trigger()
+
+    def _on_message_measured(self, index: int, key: bytes, height: float) -> None:
+        """Record the measured height of a displayed message."""
+        if height <= 0 or index >= len(self.data) or self.data[index]['key'] != key:
+            return
+        cache = self._height_cache
+        cache_key = self._height_key(key)
+        cache[cache_key] = height
+        cache.move_to_end(cache_key)
+        while len(cache) > _HEIGHT_CACHE_SIZE:
+            cache.popitem(last=False)
+        row = self.data[index]
+        if abs(row['height'] - height) > 0.5:
+            self._height_deltas[index] = self._height_deltas.get(index, 0) + height - row['height']
+            row['height'] = height
+            self._heights_trigger()
+
+    def _apply_measured_heights(self, dt=None):
+        """Relayout rows once after a batch of measurements.
+
+        Height changes of messages above the first visible one are
+        compensated, so the visible messages do not jump.
+        """
+        deltas, self._height_deltas = self._height_deltas, {}
+        first = self._first_visible_index()
+        above = sum(delta for index, delta in deltas.items() if first is not None and index < first)
+        anchor = self._save_scroll()
+        if anchor is not None and self.layout_manager is not None:
+            # The layout still has the pre-measurement height here.
+            self.refresh_from_data()
+            self._restore_scroll(anchor, above)
+        else:
+            self.refresh_from_data()
+
+    def _first_visible_index(self) -> Optional[int]:
+        """Return the index of the topmost message intersecting the viewport."""
+        layout = self.layout_manager
+        if layout is None:
+            return None
+        view_top = layout.height - max(0.0, layout.height - self.height) * (1.0 - self.scroll_y)
+        indices = [row.index for row in layout.children if row.index is not None and row.y < view_top]
+        return min(indices) if indices else None
+
+    def _on_label_options(self, instance, value):
+        self._style_key = repr(sorted(value.items()))
+        for label in self._iter_labels():
+            self._apply_options(label, value)
+        self._data_trigger()
+
+    def _on_width_changed(self, instance, value):
+        self._data_trigger()
+
+    def _refresh_heights(self, dt=None):
+        """Re-derive all row heights after a width or style change."""
+        self._height_deltas = {}
+        self.data = [self._make_row(row['text']) for row in self.data]
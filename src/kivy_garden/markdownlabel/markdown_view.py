@@ -0,0 +1,421 @@
+"""
+Markdown View
+=============
+
+A virtualized, scrollable view for very long Markdown documents.
+
+:class:`MarkdownView` is a :class:`~kivy.uix.recycleview.RecycleView` with
+one data row per top-level block of the document. Only the rows near the
+viewport have widgets; they are rendered with the regular
+:class:`~kivy_garden.markdownlabel.kivy_renderer.KivyRenderer` block
+renderers and recycled as the user scrolls. The document is parsed through
+the shared AST cache.
+
+Row heights are cached per block (keyed by the block's structural key, the
+view width and the styling), so a block is measured once. Rows that were
+never displayed use an estimate derived from their tokens until they are
+measured.
+"""
+
+import math
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from kivy.clock import Clock
+from kivy.properties import (
+    BooleanProperty,
+    ColorProperty,
+    NumericProperty,
+    OptionProperty,
+    StringProperty,
+)
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.widget import Widget
+
+from .ast_cache import get_ast_cache
+from .block_reconciler import block_key, renderer_signature
+from .compact_ast import is_token
+from .kivy_renderer import KivyRenderer
+from .parser_registry import DEFAULT_PLUGINS, get_parser
+from .render_config import RenderConfig, get_renderer
+from .rendering import apply_text_size_binding
+from .utils import find_labels_recursive
+
+# Rendered block widgets kept for rows that scroll back into view
+_WIDGET_CACHE_SIZE = 64
+
+# Measured heights kept across all blocks, widths and stylings of a view
+_HEIGHT_CACHE_SIZE = 10000
+
+# Average glyph width relative to the font size, used for estimates
+_CHAR_WIDTH_RATIO = 0.5
+# Rendered line height relative to font_size * line_height
+_LINE_HEIGHT_RATIO = 1.2
+
+
+def _plain_text(token: Any) -> str:
+    """Concatenate the raw text of ``token`` and its descendants."""
+    parts = []
+    stack = [token]
+    while stack:
+        tok = stack.pop()
+        if not is_token(tok):
+            continue
+        raw = tok.get('raw')
+        if isinstance(raw, str):
+            parts.append(raw)
+        stack.extend(reversed(tok.get('children') or ()))
+    return ''.join(parts)
+
+
+def estimate_text_height(text: str, width: float, font_size: float = 15,
+                         line_height: float = 1.0) -> float:
+    """Estimate the height of plain ``text`` wrapped to ``width``.
+
+    Args:
+        text: Text; newlines start new lines
+        width: Available width in pixels
+        font_size: Font size in pixels
+        line_height: Line height multiplier
+
+    Returns:
+        Estimated height in pixels
+    """
+    chars_per_line = max(1, int(width / (font_size * _CHAR_WIDTH_RATIO)))
+    lines = sum(max(1, math.ceil(len(line) / chars_per_line)) for line in text.split('\n'))
+    return lines * font_size * line_height * _LINE_HEIGHT_RATIO
+
+
+def estimate_block_height(token: Any, width: float, font_size: float = 15,
+                          line_height: float = 1.0) -> float:
+    """Estimate the rendered height of a top-level block before it is measured.
+
+    Args:
+        token: Top-level token dict or compact node
+        width: Available width in pixels
+        font_size: Base font size of the renderer
+        line_height: Line height multiplier of the renderer
+
+    Returns:
+        Estimated height in pixels
+    """
+    width = max(float(width), font_size)
+    tok_type = token.get('type')
+
+    if tok_type == 'blank_line':
+        return font_size
+    if tok_type == 'thematic_break':
+        return 20
+    if tok_type == 'heading':
+        level = (token.get('attrs') or {}).get('level', 1)
+        size = font_size * KivyRenderer.HEADING_SIZES.get(level, 1.0)
+        return estimate_text_height(_plain_text(token), width, size, line_height)
+    if tok_type == 'block_code':
+        lines = (token.get('raw') or '').rstrip('\n').count('\n') + 1
+        return lines * font_size * line_height * _LINE_HEIGHT_RATIO + 20
+    if tok_type == 'list':
+        items = [child for child in token.get('children') or () if is_token(child)]
+        text_width = width - 20
+        return font_size + sum(
+            estimate_text_height(_plain_text(item), text_width, font_size, line_height)
+            for item in items
+        )
+    if tok_type == 'table':
+        rows = sum(
+            1 if part.get('type') == 'table_head' else len(part.get('children') or ())
+            for part in token.get('children') or () if is_token(part)
+        )
+        return rows * (font_size * line_height * _LINE_HEIGHT_RATIO + 10)
+    return estimate_text_height(_plain_text(token), width, font_size, line_height)
+
+
+class MarkdownBlockView(RecycleDataViewBehavior, BoxLayout):
+    """Recycled row of :class:`MarkdownView` showing one top-level block."""
+
+    def __init__(self, **kwargs):
+        super(MarkdownBlockView, self).__init__(**kwargs)
+        self.orientation = 'vertical'
+        self.size_hint_y = None
+        self.index = None
+        self.block_key = None
+        self._markdown_view = None
+        self._signature = None
+        self.bind(minimum_height=self._on_minimum_height)
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Show block ``index`` of ``rv``, rendering it if it changed."""
+        self.index = index
+        if rv is not self._markdown_view:
+            # Kivy pools recycled rows across views; drop the other view's block.
+            self.clear_widgets()
+            self.block_key = None
+            self._markdown_view = rv
+        if data['key'] != self.block_key or rv._signature != self._signature:
+            for child in list(self.children):
+                self.remove_widget(child)
+                rv._release_block_widget(self.block_key, self._signature, child)
+            widget = rv._acquire_block_widget(data['key'], data['token'])
+            self.block_key = data['key']
+            self._signature = rv._signature
+            if widget is not None:
+                self.add_widget(widget)
+        super(MarkdownBlockView, self).refresh_view_attrs(rv, index, {'height': data['height']})
+
+    def _on_minimum_height(self, instance, value):
+        """Report the measured height of the block to the view."""
+        if self._markdown_view is not None and self.index is not None:
+            self._markdown_view._on_block_measured(self.index, self.block_key, value)
+
+
+class MarkdownView(RecycleView):
+    """Scrollable, virtualized view of a long Markdown document.
+
+    Only top-level blocks near the viewport have widgets. Blocks are rendered
+    with :class:`~kivy_garden.markdownlabel.kivy_renderer.KivyRenderer` and
+    their widgets are recycled while scrolling.
+
+    Events:
+        on_ref_press: Dispatched when a link in a displayed block is clicked.
+            The event data contains the URL of the clicked link.
+
+    Example::
+
+        view = MarkdownView(text=open('CHANGELOG.md').read())
+        view.bind(on_ref_press=lambda instance, ref: print(ref))
+    """
+
+    __events__ = ('on_ref_press',)
+
+    text = StringProperty('')
+    base_font_size = NumericProperty(15)
+    font_name = StringProperty('Roboto')
+    code_font_name = StringProperty('RobotoMono-Regular')
+    color = ColorProperty([1, 1, 1, 1])
+    link_color = ColorProperty([0, 0.5, 1, 1])
+    link_style = OptionProperty('styled', options=['unstyled', 'styled'])
+    code_bg_color = ColorProperty([0.15, 0.15, 0.15, 1])
+    line_height = NumericProperty(1.0)
+    halign = OptionProperty('left', options=['left', 'center', 'right', 'justify'])
+    # Keep the parsed AST as compact slotted nodes (see compact_ast)
+    compact_ast = BooleanProperty(False)
+
+    def __init__(self, **kwargs):
+        self._tokens = []
+        self._keys = []
+        self._signature = None
+        self._renderer = None
+        # ((block key, occurrence), width, styling signature) -> measured height
+        self._block_heights: 'OrderedDict[Any, float]' = OrderedDict()
+        self._widget_cache: 'OrderedDict[Any, Widget]' = OrderedDict()
+        # Block kept at the top by scroll_to_block() while heights settle
+        self._scroll_target = None
+        self._data_trigger = Clock.create_trigger(self._refresh_data, timeout=-1)
+        self._heights_trigger = Clock.create_trigger(self._apply_measured_heights, timeout=-1)
+        super(MarkdownView, self).__init__(**kwargs)
+
+        layout = RecycleBoxLayout(
+            orientation='vertical',
+            size_hint_y=None,
+            default_size_hint=(1, None),
+        )
+        layout.bind(minimum_height=layout.setter('height'))
+        self.add_widget(layout)
+        self.viewclass = MarkdownBlockView
+
+        self.bind(text=self._on_text_changed, compact_ast=self._on_text_changed)
+        for prop in ('base_font_size', 'font_name', 'code_font_name', 'color', 'link_color',
+                     'link_style', 'code_bg_color', 'line_height', 'halign'):
+            self.bind(**{prop: self._on_style_changed})
+        self.bind(width=self._on_width_changed)
+
+        self._parse()
+        self._update_renderer()
+        self._refresh_data()
+
+    def _get_renderer_kwargs(self) -> Dict[str, Any]:
+        """Return KivyRenderer keyword arguments for the current styling."""
+        return dict(
+            base_font_size=self.base_font_size,
+            font_name=self.font_name,
+            code_font_name=self.code_font_name,
+            color=list(self.color),
+            link_color=list(self.link_color),
+            link_style=self.link_style,
+            code_bg_color=list(self.code_bg_color),
+            line_height=self.line_height,
+            halign=self.halign,
+        )
+
+    def _parse(self):
+        """Parse ``text`` through the shared AST cache."""
+        if not self.text:
+            self._tokens = []
+        else:
+            self._tokens = get_ast_cache().parse(
+                get_parser(DEFAULT_PLUGINS), self.text, DEFAULT_PLUGINS, compact=self.compact_ast
+            )
+        # Identical blocks get their own keys, numbered in document order, so
+        # their rows cache separate widgets.
+        occurrences: Dict[bytes, int] = {}
+        keys = []
+        for token in self._tokens:
+            key = block_key(token)
+            occurrence = occurrences.get(key, 0)
+            occurrences[key] = occurrence + 1
+            keys.append((key, occurrence))
+        self._keys = keys
+
+    def _update_renderer(self):
+        """Create the renderer for the current styling."""
+        config = RenderConfig.from_kwargs(**self._get_renderer_kwargs())
+        self._renderer = get_renderer(config)
+        self._signature = renderer_signature(config, 'widgets')
+        self._widget_cache.clear()
+
+    def _on_text_changed(self, instance, value):
+        self._parse()
+        self._data_trigger()
+
+    def _on_style_changed(self, instance, value):
+        self._update_renderer()
+        self._data_trigger()
+
+    def _on_width_changed(self, instance, value):
+        self._data_trigger()
+
+    def _height_key(self, key: Hashable):
+        return key, round(self.width), self._signature
+
+    def _refresh_data(self, dt=None):
+        """Rebuild the row data with cached or estimated heights."""
+        heights = self._block_heights
+        width = self.width
+        font_size = self.base_font_size
+        line_height = self.line_height
+        data = []
+        for token, key in zip(self._tokens, self._keys):
+            height = heights.get(self._height_key(key))
+            if height is None:
+                height = estimate_block_height(token, width, font_size, line_height)
+            data.append({'token': token, 'key': key, 'height': height})
+        self.data = data
+
+    def _acquire_block_widget(self, key: Hashable, token: Any) -> Optional[Widget]:
+        """Return a widget for a block, reusing a cached one when possible."""
+        widget = self._widget_cache.pop(key, None)
+        if widget is not None:
+            return widget
+        widget = self._renderer.render_block(token)
+        if widget is None:
+            return None
+        for label in find_labels_recursive(widget):
+            apply_text_size_binding(label, None, False)
+            if label.markup:
+                label.bind(on_ref_press=self._on_child_ref_press)
+        return widget
+
+    def _release_block_widget(self, key: Optional[Hashable], signature: Optional[Hashable],
+                              widget: Widget) -> None:
+        """Keep the widget of a recycled row for when the block returns."""
+        if key is None or signature != self._signature:
+            return
+        self._widget_cache[key] = widget
+        self._widget_cache.move_to_end(key)
+        while len(self._widget_cache) > _WIDGET_CACHE_SIZE:
+            self._widget_cache.popitem(last=False)
+
+    def _on_block_measured(self, index: int, key: Hashable, height: float) -> None:
+        """Record the measured height of a displayed block."""
+        if height <= 0 or index >= len(self.data) or self.data[index]['key'] != key:
+            return
+        heights = self._block_heights
+        height_key = self._height_key(key)
+        heights[height_key] = height
+        heights.move_to_end(height_key)
+        while len(heights) > _HEIGHT_CACHE_SIZE:
+            heights.popitem(last=False)
+        if abs(self.data[index]['height'] - height) > 0.5:
+            self.data[index]['height'] = height
+            self._heights_trigger()
+
+    def _apply_measured_heights(self, dt=None):
+        """Relayout rows once after a batch of measurements."""
+        self.refresh_from_data()
+        if self._scroll_target is not None:
+            # Lay out now so restoring the viewport cannot undo the scroll.
+            self.refresh_views()
+            self._scroll_to(self._scroll_target)
+
+    def on_touch_down(self, touch):
+        if self.collide_point(*touch.pos):
+            self._scroll_target = None
+        return super(MarkdownView, self).on_touch_down(touch)
+
+    def _on_child_ref_press(self, instance, ref):
+        """Bubble ``on_ref_press`` of block Labels."""
+        self.dispatch('on_ref_press', ref)
+
+    def on_ref_press(self, ref):
+        """Event handler for link clicks."""
+        pass
+
+    def get_ast(self):
+        """Return the parsed top-level tokens (shared, read-only).
+
+        Returns:
+            List of top-level tokens
+        """
+        return list(self._tokens)
+
+    @property
+    def anchors(self) -> Dict[str, tuple]:
+        """Anchors of the displayed blocks in layout coordinates.
+
+        Positions use the same convention as ``MarkdownLabel.anchors``,
+        relative to the scrolled layout (``layout_manager``). Blocks that are
+        not near the viewport have no widgets and contribute no anchors.
+        """
+        layout = self.layout_manager
+        anchors = {}
+        if layout is None:
+            return anchors
+        for view in layout.children:
+            for label in find_labels_recursive(view):
+                if not label.anchors:
+                    continue
+                tex_w, tex_h = label.texture_size
+                if not tex_w and not tex_h:
+                    tex_w, tex_h = label.width, label.height
+                x, y = label.to_parent(label.center_x - tex_w / 2.0, label.center_y + tex_h / 2.0)
+                parent = label.parent
+                while parent is not None and parent is not layout:
+                    x, y = parent.to_parent(x, y)
+                    parent = parent.parent
+                for name, pos in label.anchors.items():
+                    anchors[name] = (x + pos[0], y - pos[1])
+        return anchors
+
+    def scroll_to_block(self, index: int) -> None:
+        """Scroll so the top of block ``index`` is at the top of the view.
+
+        Measured heights of newly displayed blocks can move the block; the
+        position is corrected until the user touches the view.
+
+        Args:
+            index: Index of the top-level block
+        """
+        self._scroll_target = index
+        self._scroll_to(index)
+
+    def _scroll_to(self, index: int) -> None:
+        layout = self.layout_manager
+        if layout is None or not self.data:
+            return
+        index = max(0, min(index, len(self.data) - 1))
+        above = sum(row['height'] for row in self.data[:index])
+        scrollable = sum(row['height'] for row in self.data) - self.height
+        if scrollable > 0:
+            self.scroll_y = max(0.0, min(1.0, 1.0 - above / scrollable))
@@ -0,0 +1,77 @@
+"""
+Parser Registry
+===============
+
+Shared mistune parsers keyed by plugin set.
+
+Building a mistune ``Markdown`` instance compiles its block and inline rules,
+which is wasted work when every widget uses the same configuration. The
+registry hands out one parser per plugin set instead.
+
+mistune parsers keep small lazily-filled caches (such as the inline fast-path
+regex) that are not safe to update from several threads at once, so each
+thread gets its own instance: all widgets on the Kivy main thread share one
+parser, and worker threads never contend with it.
+"""
+
+import threading
+from typing import Any, Dict, Iterable, Tuple
+
+import mistune
+
+# Plugins MarkdownLabel enables, in the order they are applied
+DEFAULT_PLUGINS = ('table', 'strikethrough')
+
+_local = threading.local()
+
+
+def normalize_plugins(plugins: Iterable[str]) -> Tuple[str, ...]:
+    """Return the registry key for a plugin sequence.
+
+    Duplicates are dropped; order is kept because mistune applies plugins in
+    sequence.
+
+    Args:
+        plugins: mistune plugin names
+
+    Returns:
+        Tuple of unique plugin names
+    """
+    return tuple(dict.fromkeys(plugins))
+
+
+def create_parser(plugins: Iterable[str] = DEFAULT_PLUGINS) -> Any:
+    """Create a new, unshared mistune parser that produces AST tokens.
+
+    Args:
+        plugins: mistune plugin names
+
+    Returns:
+        mistune ``Markdown`` instance with ``renderer=None``
+    """
+    return mistune.create_markdown(renderer=None, plugins=list(normalize_plugins(plugins)))
+
+
+def get_parser(plugins: Iterable[str] = DEFAULT_PLUGINS) -> Any:
+    """Return the shared parser for ``plugins`` on the calling thread.
+
+    Args:
+        plugins: mistune plugin names
+
+    Returns:
+        mistune ``Markdown`` instance with ``renderer=None``
+    """
+    key = normalize_plugins(plugins)
+    parsers: Dict[Tuple[str, ...], Any] = getattr(_local, 'parsers', None)
+    if parsers is None:
+        parsers = _local.parsers = {}
+
+    parser = parsers.get(key)
+    if parser is None:
+        parser = parsers[key] = create_parser(key)
+    return parser
+
+
+def clear_parsers() -> None:
+    """Drop the shared parsers of the calling thread."""
+    _local.parsers = {}
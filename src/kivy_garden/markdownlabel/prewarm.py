@@ -0,0 +1,85 @@
+"""
+Prewarm
+=======
+
+Bulk parsing of document sets into the shared AST cache.
+
+Applications that load many documents at startup (archived chat messages,
+help pages) can parse them in worker processes up front. ``MarkdownLabel``
+instances created afterwards for those texts find their tokens in the cache
+and skip parsing entirely. The workers also compute the statistics of each
+top-level block, so the labels do not walk the token trees either.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from .ast_cache import get_ast_cache, make_cache_key
+from .compact_ast import compact as compact_tokens
+from .document_stats import DocumentStats, compute_block_stats
+from .parser_registry import DEFAULT_PLUGINS, get_parser, normalize_plugins
+
+# Batches per worker process; more batches balance uneven document sizes,
+# fewer reduce inter-process overhead.
+_BATCHES_PER_PROCESS = 4
+
+
+def _parse_batch(texts: Sequence[str], plugins: Tuple[str, ...], compact: bool
+                 ) -> List[Tuple[bytes, Sequence[Any], List[DocumentStats]]]:
+    """Parse ``texts`` and return ``(cache key, tokens, block stats)`` triples."""
+    parser = get_parser(plugins)
+    results = []
+    for text in texts:
+        tokens = parser.parse(text)[0]
+        if compact:
+            tokens = compact_tokens(tokens)
+        block_stats = [compute_block_stats(token) for token in tokens]
+        results.append((make_cache_key(text, plugins, compact), tokens, block_stats))
+    return results
+
+
+def prewarm(documents: Iterable[str], processes: Optional[int] = None,
+            plugins: Iterable[str] = DEFAULT_PLUGINS, compact: bool = False) -> int:
+    """Parse ``documents`` in worker processes and fill the shared AST cache.
+
+    Tokens are stored with the statistics of each top-level block. Inline
+    markup is not prerendered: it depends on the styling of each label and is
+    generated when widgets are built.
+
+    Empty, duplicate and already cached documents are skipped. The cache's
+    byte budget still applies, so prewarming more than fits evicts the
+    earliest documents; raise ``get_ast_cache().max_bytes`` first if needed.
+
+    Args:
+        documents: Markdown texts that will be displayed later
+        processes: Number of worker processes (default: CPU count). With 1,
+            documents are parsed in the calling process.
+        plugins: mistune plugin names; must match the labels' parser
+        compact: Store compact nodes, for labels with ``compact_ast`` enabled
+
+    Returns:
+        Number of documents parsed and stored in the cache
+    """
+    plugins = normalize_plugins(plugins)
+    cache = get_ast_cache()
+    texts = [text for text in dict.fromkeys(documents)
+             if text and make_cache_key(text, plugins, compact) not in cache]
+    if not texts:
+        return 0
+
+    processes = min(processes or os.cpu_count() or 1, len(texts))
+    if processes == 1:
+        results = [_parse_batch(texts, plugins, compact)]
+    else:
+        batch_count = min(processes * _BATCHES_PER_PROCESS, len(texts))
+        batches = [texts[index::batch_count] for index in range(batch_count)]
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = list(pool.map(_parse_batch, batches, repeat(plugins), repeat(compact)))
+
+    stored = 0
+    for batch in results:
+        for key, tokens, block_stats in batch:
+            stored += cache.put(key, tokens, block_stats)
+    return stored
@@ -0,0 +1,68 @@
+"""
+Progressive Build
+=================
+
+Time-sliced rendering of top-level blocks for MarkdownLabel's
+``build_budget_ms`` mode.
+
+Rendering a large document in one pass can take several frames. A
+:class:`ProgressiveBuild` renders the top-level tokens in slices that each
+stay within a time budget, so MarkdownLabel can spread the work over frames
+and show the first blocks immediately.
+"""
+
+import time
+from typing import Any, Hashable, List, Optional, Sequence
+
+from kivy.uix.widget import Widget
+
+
+class ProgressiveBuild:
+    """Incremental rendering state of one widget-tree build.
+
+    Args:
+        renderer: KivyRenderer used for every block of the build
+        tokens: Top-level AST tokens to render
+        keys: Structural keys parallel to ``tokens``
+        signature: Renderer signature the build was started with
+        render_mode: Effective render mode of the build
+        budget_ms: Time budget of one slice in milliseconds
+    """
+
+    def __init__(self, renderer: Any, tokens: Sequence[Any], keys: Sequence[bytes],
+                 signature: Hashable, render_mode: str, budget_ms: float):
+        self.renderer = renderer
+        self.tokens = tokens
+        self.keys = keys
+        self.signature = signature
+        self.render_mode = render_mode
+        self.budget = max(0.0, float(budget_ms)) / 1000.0
+        self.widgets: List[Optional[Widget]] = []
+        self.slices = 0
+
+    @property
+    def done(self) -> bool:
+        """True once every token has been rendered."""
+        return len(self.widgets) >= len(self.tokens)
+
+    def render_slice(self) -> List[Optional[Widget]]:
+        """Render tokens until the time budget of one slice is used up.
+
+        At least one token is rendered per slice, so every build finishes
+        regardless of the budget.
+
+        Returns:
+            Widgets rendered by this slice (None for skipped tokens)
+        """
+        start = len(self.widgets)
+        deadline = time.perf_counter() + self.budget
+        render_block = self.renderer.render_block
+        tokens = self.tokens
+        index = start
+        while index < len(tokens):
+            self.widgets.append(render_block(tokens[index]))
+            index += 1
+            if time.perf_counter() >= deadline:
+                break
+        self.slices += 1
+        return self.widgets[start:]
@@ -64,6 +64,9 @@ class MarkdownLabelProperties:
         'link_style',
         'render_mode',
         'image_size_mode',
+        'table_mode',
+        'table_column_sizing',
+        'code_tile_lines',
         'strict_label_mode',
         'link_color',
         'code_bg_color',
@@ -155,11 +158,58 @@ class MarkdownLabelProperties:
     # Sizing properties
     auto_size_height = BooleanProperty(False)
     strict_label_mode = BooleanProperty(False)
-    render_mode = OptionProperty('widgets', options=['widgets', 'texture', 'auto'])
+    # 'hybrid' keeps paragraphs, headings and images as widgets and captures
+    # tables, code blocks and long lists into per-block textures. 'canvas'
+    # draws all blocks from the canvas of a single CanvasDocument widget.
+    render_mode = OptionProperty(
+        'widgets', options=['widgets', 'texture', 'auto', 'hybrid', 'canvas']
+    )
+    # Texture mode captures content taller than this many pixels in bands of
+    # this height, one Fbo each (0 uses single textures up to the 8192 px
+    # Fbo limit and bands of that size beyond it). Takes effect on the next
+    # capture.
+    texture_tile_height = NumericProperty(0)
+    # Capture texture-mode bands only when they come within texture_prefetch
+    # pixels of the visible region of the closest ScrollView, keeping at most
+    # texture_max_tiles of them (0 for no limit). Bands are 1024 px high
+    # unless texture_tile_height is set. Take effect on the next capture.
+    texture_lazy_tiles = BooleanProperty(False)
+    texture_prefetch = NumericProperty(400)
+    texture_max_tiles = NumericProperty(0)
+    # Keep the widgets captured in texture mode and, after text changes,
+    # redraw only the region of the blocks that changed.
+    incremental_texture = BooleanProperty(False)
+    # Build large documents in slices of at most this many milliseconds per
+    # frame (0 builds synchronously). on_render_complete fires when done.
+    build_budget_ms = NumericProperty(0)
+    # Reuse Labels and layout containers of discarded blocks in later builds
+    # instead of constructing new ones. Takes effect on the next rebuild.
+    widget_pooling = BooleanProperty(False)
+
+    # Parsing properties
+    # Reparse only the blocks touched by a text change. Output is identical to
+    # a full parse, so toggling this never requires a rebuild.
+    incremental_parse = BooleanProperty(False)
+    # Parse and prerender inline markup on a worker thread; widgets are built
+    # on the main thread once the result arrives.
+    async_parse = BooleanProperty(False)
+    # Keep the parsed AST as compact slotted nodes instead of mistune dicts.
+    # get_ast() still returns dicts; takes effect on the next parse.
+    compact_ast = BooleanProperty(False)
     image_size_mode = OptionProperty(
         'contain_no_upscale',
         options=['contain_no_upscale', 'fill_width']
     )
+    # 'grid' renders tables as a GridLayout of Labels, 'canvas' as a single
+    # CanvasTable widget drawing all cells into its canvas, and 'virtual' as a
+    # CanvasTable rasterizing only the rows near the visible scroll region.
+    table_mode = OptionProperty('grid', options=['grid', 'canvas', 'virtual'])
+    # 'equal' gives all table columns the same width, 'content' sizes them by
+    # the measured width of their text (see the column_widths module).
+    table_column_sizing = OptionProperty('equal', options=['equal', 'content'])
+    # Code blocks with more lines than this are drawn as tiles of this many
+    # lines, rasterized only near the viewport (0 keeps one Label per block).
+    code_tile_lines = NumericProperty(0)
 
     # Internal storage for texture mode
     _aggregated_refs = DictProperty({})
@@ -179,6 +229,8 @@ class MarkdownLabelProperties:
         from kivy.uix.gridlayout import GridLayout
         from kivy.uix.boxlayout import BoxLayout
         from kivy.uix.widget import Widget
+        from .list_layout import ListLayout
+        from .list_marker import ListMarker
 
         if not self.children:
             return [0, 0]
@@ -219,7 +271,7 @@ class MarkdownLabelProperties:
             local_x = parent_offset_x + float(getattr(widget, 'x', 0.0))
             local_y = parent_offset_y + float(getattr(widget, 'y', 0.0))
 
-            if isinstance(widget, Label) and hasattr(widget, 'texture_size'):
+            if isinstance(widget, (Label, ListMarker)) and hasattr(widget, 'texture_size'):
                 ts = widget.texture_size
                 tex_w = ts[0] if ts and ts[0] > 0 else float(widget.width)
                 tex_h = ts[1] if ts and ts[1] > 0 else float(widget.height)
@@ -236,7 +288,7 @@ class MarkdownLabelProperties:
                     widget.height
                 )
                 include_rect(local_x, local_y, width, height)
-            elif isinstance(widget, BoxLayout):
+            elif isinstance(widget, (BoxLayout, ListLayout)):
                 for child in widget.children:
                     collect_bounds(child, local_x, local_y)
             elif isinstance(widget, Widget):
@@ -281,6 +333,7 @@ class MarkdownLabelProperties:
         Walks the widget tree; reflects current rendered widget positions.
         """
         from kivy.uix.label import Label
+        from .ref_zones import RefZoneBehavior
 
         refs = {}
 
@@ -307,6 +360,16 @@ class MarkdownLabelProperties:
             return [base_x + x1, base_y - y1, base_x + x2, base_y - y2]
 
         def collect_refs(widget):
+            if isinstance(widget, RefZoneBehavior):
+                parent_offset_x, parent_offset_y = get_parent_offset(widget)
+                base_x = parent_offset_x + widget.x
+                base_y = parent_offset_y + widget.y
+                for ref_name, zones in widget.ref_zones.items():
+                    refs.setdefault(ref_name, []).extend(
+                        [base_x + x, base_y + y + h, base_x + x + w, base_y + y]
+                        for x, y, w, h in zones
+                    )
+
             if isinstance(widget, Label) and hasattr(widget, 'refs') and widget.refs:
                 for ref_name, ref_boxes in widget.refs.items():
                     if ref_name not in refs:
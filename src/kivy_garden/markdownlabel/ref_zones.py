@@ -0,0 +1,117 @@
+"""
+Ref Zones
+=========
+
+Link hit-testing for widgets that draw text as textures.
+
+Labels report the links in their text through ``refs`` and dispatch
+``on_ref_press`` themselves. Widgets that draw rasterized text into their
+canvas instead, such as canvas tables and block textures, keep the ref boxes
+as zones in widget coordinates. :class:`RefZoneBehavior` dispatches
+``on_ref_press`` for touches inside those zones, and
+:func:`collect_ref_zones` gathers the zones of a widget tree, for example
+before the tree is captured into a texture.
+"""
+
+from typing import Dict, List, Tuple
+
+from kivy.uix.label import Label
+from kivy.uix.relativelayout import RelativeLayout
+from kivy.uix.widget import Widget
+
+# Zone of a ref: (x, y, width, height)
+RefZone = Tuple[float, float, float, float]
+
+RefZones = Dict[str, List[RefZone]]
+
+
+class RefZoneBehavior:
+    """Mixin dispatching ``on_ref_press`` for touches on ref zones.
+
+    Subclasses keep :attr:`ref_zones` up to date, relative to the widget's
+    position.
+
+    Events:
+        on_ref_press: Dispatched with the ref name when a link is touched
+    """
+
+    __events__ = ('on_ref_press',)
+
+    def __init__(self, **kwargs):
+        self.ref_zones: RefZones = {}
+        super().__init__(**kwargs)
+
+    def on_touch_down(self, touch):
+        """Dispatch ``on_ref_press`` for touches on links."""
+        if super().on_touch_down(touch):
+            return True
+        if not self.collide_point(*touch.pos):
+            return False
+        local_x = touch.x - self.x
+        local_y = touch.y - self.y
+        for ref_name, zones in self.ref_zones.items():
+            for zone_x, zone_y, zone_w, zone_h in zones:
+                if zone_x <= local_x <= zone_x + zone_w and zone_y <= local_y <= zone_y + zone_h:
+                    self.dispatch('on_ref_press', ref_name)
+                    return True
+        return False
+
+    def on_ref_press(self, ref: str) -> None:
+        """Default handler for link presses."""
+        pass
+
+
+def collect_ref_zones(widget: Widget, zones: RefZones, offset_x: float = 0,
+                      offset_y: float = 0) -> None:
+    """Add the ref zones of ``widget`` and its descendants to ``zones``.
+
+    Zones of Labels are computed from their ``refs`` and texture size, zones
+    of :class:`RefZoneBehavior` widgets are taken over. Zones are relative to
+    the origin that ``offset_x`` and ``offset_y`` translate the widget's
+    parent coordinates to. Children share the coordinates of their parent
+    except in a :class:`~kivy.uix.relativelayout.RelativeLayout`, whose
+    position is then added to the offset.
+
+    Args:
+        widget: Root of the widget tree
+        zones: Mapping of ref name to zones, extended in place
+        offset_x: Horizontal offset of the widget's parent coordinates
+        offset_y: Vertical offset of the widget's parent coordinates
+    """
+    if isinstance(widget, RefZoneBehavior):
+        for ref_name, widget_zones in widget.ref_zones.items():
+            zones.setdefault(ref_name, []).extend(
+                (offset_x + widget.x + zone_x, offset_y + widget.y + zone_y, zone_w, zone_h)
+                for zone_x, zone_y, zone_w, zone_h in widget_zones
+            )
+
+    if isinstance(widget, Label) and getattr(widget, 'refs', None):
+        tex_w, tex_h = getattr(widget, 'texture_size', (widget.width, widget.height))
+        if tex_w <= 0:
+            tex_w = widget.width
+        if tex_h <= 0:
+            tex_h = widget.height
+
+        # Label textures are centered in the widget.
+        base_x = offset_x + widget.x + (widget.width - tex_w) / 2.0
+        base_y = offset_y + widget.y + (widget.height - tex_h) / 2.0
+        for ref_name, ref_boxes in widget.refs.items():
+            ref_zones = zones.setdefault(ref_name, [])
+            for x1, y1, x2, y2 in ref_boxes:
+                ref_zones.append((base_x + x1, base_y + (tex_h - y2), x2 - x1, y2 - y1))
+
+    child_offset_x, child_offset_y = offset_x, offset_y
+    if isinstance(widget, RelativeLayout):
+        child_offset_x += widget.x
+        child_offset_y += widget.y
+    for child in widget.children:
+        collect_ref_zones(child, zones, child_offset_x, child_offset_y)
+
+
+def shift_ref_zones(zones: RefZones, offset_x: float, offset_y: float) -> RefZones:
+    """Return a copy of ``zones`` moved by ``offset_x`` and ``offset_y``."""
+    return {
+        ref_name: [(zone_x + offset_x, zone_y + offset_y, zone_w, zone_h)
+                   for zone_x, zone_y, zone_w, zone_h in ref_zones]
+        for ref_name, ref_zones in zones.items()
+    }
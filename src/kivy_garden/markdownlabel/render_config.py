@@ -0,0 +1,153 @@
+"""
+Render Configuration
+====================
+
+Frozen, hashable rendering configuration and a shared renderer cache.
+
+MarkdownLabel derives a :class:`RenderConfig` from its styling properties,
+keeps it until one of them changes, and obtains its
+:class:`~kivy_garden.markdownlabel.kivy_renderer.KivyRenderer` from
+:func:`get_renderer`. Rebuilds and labels with identical styling therefore
+share one renderer, including its inline renderer and precomputed Label
+keyword templates, instead of constructing them per rebuild.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from .kivy_renderer import KivyRenderer
+
+# Renderers kept for distinct configurations
+_RENDERER_CACHE_SIZE = 32
+
+# Fields stored as tuples, passed to KivyRenderer as lists
+_LIST_FIELDS = frozenset((
+    'link_color', 'code_bg_color', 'color', 'outline_color', 'disabled_outline_color',
+    'text_size', 'disabled_color', 'text_padding', 'fallback_fonts',
+))
+
+# Fields stored as sorted item tuples, passed to KivyRenderer as dicts
+_DICT_FIELDS = frozenset(('ellipsis_options', 'fallback_font_scales'))
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable copy of nested lists and dicts."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class RenderConfig(NamedTuple):
+    """Immutable KivyRenderer configuration.
+
+    Fields mirror the KivyRenderer keyword arguments. Lists are stored as
+    tuples and dicts as sorted item tuples, so configurations can be compared
+    cheaply and used as cache keys.
+    """
+
+    base_font_size: float = 15
+    code_font_name: str = 'RobotoMono-Regular'
+    link_color: Tuple[float, ...] = (0, 0.5, 1, 1)
+    link_style: str = 'unstyled'
+    code_bg_color: Tuple[float, ...] = (0.15, 0.15, 0.15, 1)
+    font_name: str = 'Roboto'
+    color: Tuple[float, ...] = (1, 1, 1, 1)
+    outline_width: Optional[float] = None
+    outline_color: Tuple[float, ...] = (0, 0, 0, 1)
+    disabled_outline_color: Tuple[float, ...] = (0, 0, 0, 1)
+    line_height: float = 1.0
+    halign: str = 'auto'
+    valign: str = 'bottom'
+    text_size: Tuple[Any, ...] = (None, None)
+    unicode_errors: str = 'replace'
+    strip: bool = False
+    font_family: Optional[str] = None
+    font_context: Optional[str] = None
+    font_features: str = ''
+    font_hinting: Optional[str] = 'normal'
+    font_kerning: bool = True
+    font_blended: bool = True
+    disabled: bool = False
+    disabled_color: Tuple[float, ...] = (1, 1, 1, 0.3)
+    mipmap: bool = False
+    base_direction: Optional[str] = None
+    text_language: Optional[str] = None
+    shorten: bool = False
+    max_lines: int = 0
+    shorten_from: str = 'center'
+    split_str: str = ''
+    text_padding: Tuple[float, ...] = (0, 0, 0, 0)
+    strict_label_mode: bool = False
+    image_size_mode: str = 'contain_no_upscale'
+    table_mode: str = 'grid'
+    table_column_sizing: str = 'equal'
+    code_tile_lines: int = 0
+    ellipsis_options: Tuple[Tuple[str, Any], ...] = ()
+    limit_render_to_text_bbox: bool = False
+    fallback_enabled: bool = False
+    fallback_fonts: Tuple[str, ...] = ()
+    fallback_font_scales: Tuple[Tuple[str, float], ...] = ()
+    widget_pooling: bool = False
+
+    @classmethod
+    def from_kwargs(cls, **kwargs: Any) -> 'RenderConfig':
+        """Create a configuration from KivyRenderer keyword arguments.
+
+        Args:
+            **kwargs: KivyRenderer keyword arguments; lists and dicts are
+                frozen
+
+        Returns:
+            RenderConfig with the given values
+        """
+        for name, value in kwargs.items():
+            if name in _DICT_FIELDS:
+                kwargs[name] = _freeze(dict(value or {}))
+            elif name in _LIST_FIELDS and value is not None:
+                kwargs[name] = _freeze(value)
+        return cls(**kwargs)
+
+    def renderer_kwargs(self) -> Dict[str, Any]:
+        """Return KivyRenderer keyword arguments as fresh lists and dicts."""
+        kwargs = self._asdict()
+        for name in _LIST_FIELDS:
+            if kwargs[name] is not None:
+                kwargs[name] = list(kwargs[name])
+        for name in _DICT_FIELDS:
+            kwargs[name] = dict(kwargs[name])
+        return kwargs
+
+
+_renderers: 'OrderedDict[RenderConfig, KivyRenderer]' = OrderedDict()
+
+
+def get_renderer(config: RenderConfig) -> KivyRenderer:
+    """Return the shared KivyRenderer for ``config``.
+
+    Renderers keep no per-document state between top-level blocks, so one
+    instance serves every rebuild and label with the same configuration.
+    They must only be used from the main thread and must not be given
+    prerendered ``inline_markup``.
+
+    Args:
+        config: Rendering configuration
+
+    Returns:
+        KivyRenderer created with ``config``
+    """
+    renderer = _renderers.get(config)
+    if renderer is None:
+        renderer = KivyRenderer(**config.renderer_kwargs())
+        _renderers[config] = renderer
+        while len(_renderers) > _RENDERER_CACHE_SIZE:
+            _renderers.popitem(last=False)
+    else:
+        _renderers.move_to_end(config)
+    return renderer
+
+
+def clear_renderer_cache() -> None:
+    """Drop all shared renderers."""
+    _renderers.clear()
@@ -5,14 +5,26 @@ building, texture rendering, and style updates.
 """
 
 import logging
+import warnings
 
 from kivy.uix.label import Label
 from kivy.uix.image import Image, AsyncImage
+from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.widget import Widget
-from kivy.graphics import Fbo, ClearColor, ClearBuffers
+
+from .block_texture import BlockTexture, wants_block_texture
+from .canvas_document import CanvasDocument, rasterize_whole_blocks
+from .canvas_table import CORE_LABEL_OPTIONS, CanvasTable
+from .code_tiles import TiledCodeBlock
+from .document_stats import DocumentStats, compute_stats
+from .list_marker import MARKER_LABEL_OPTIONS, ListMarker
+from .ref_zones import RefZoneBehavior, collect_ref_zones, shift_ref_zones
+from .texture_bands import DEFAULT_BAND_HEIGHT, TextureBands, capture_band
 
 _DEFAULT_CODE_LABEL_COLOR = [0.9, 0.9, 0.9, 1]
+# Guardrail for GPU-backed FBO dimensions
+MAX_FBO_DIM = 8192
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -78,6 +90,49 @@ def apply_text_size_binding(label, text_size, strict_label_mode):
         label.bind(texture_size=tex_cb)
 
 
+def child_widgets(widget):
+    """Return the children of ``widget`` for style traversals.
+
+    A BlockTexture's block is not parented while it is shown as a texture,
+    and a CanvasDocument's content never is, so they are returned in place
+    of the widget's children.
+    """
+    if isinstance(widget, BlockTexture):
+        return [widget.block] if widget.block is not None else []
+    if isinstance(widget, CanvasDocument):
+        return [widget.content] if widget.content is not None else []
+    return getattr(widget, 'children', [])
+
+
+def block_extent(widget, content_height):
+    """Return the ``(top, height)`` of a laid-out block in a texture capture.
+
+    ``top`` is the distance of the block's top edge below the top of the
+    content, as for the band offsets of
+    :class:`~kivy_garden.markdownlabel.texture_bands.TextureBands`. Returns
+    None for skipped blocks (``widget`` None).
+    """
+    if widget is None:
+        return None
+    return content_height - (widget.y + widget.height), widget.height
+
+
+def update_table_columns(widget):
+    """Size the columns of a content-sized grid table again.
+
+    Call after the font or style of its cells changed in place.
+    """
+    update_columns = getattr(widget, '_update_columns', None)
+    if update_columns is not None:
+        update_columns(widget, widget.width)
+
+
+def refresh_block_textures(widget):
+    """Schedule a new capture of ``widget`` if it is a BlockTexture."""
+    if isinstance(widget, BlockTexture):
+        widget._trigger_refresh()
+
+
 class MarkdownLabelRendering:
     """Mixin class containing rendering logic for MarkdownLabel.
 
@@ -88,15 +143,16 @@ class MarkdownLabelRendering:
     def _update_font_sizes_in_place(self):
         """Update font sizes on existing child widgets without rebuild."""
         def update_font_size(widget):
-            if isinstance(widget, Label):
+            if isinstance(widget, (Label, ListMarker, CanvasTable, TiledCodeBlock)):
                 if hasattr(widget, '_font_scale'):
                     widget.font_size = self.base_font_size * widget._font_scale
                 else:
                     widget.font_size = self.base_font_size
 
-            if hasattr(widget, 'children'):
-                for child in widget.children:
-                    update_font_size(child)
+            for child in child_widgets(widget):
+                update_font_size(child)
+            update_table_columns(widget)
+            refresh_block_textures(widget)
 
         for child in self.children:
             update_font_size(child)
@@ -120,6 +176,17 @@ class MarkdownLabelRendering:
         )
         effective_halign = self._get_effective_halign()
         effective_text_padding = list(self.text_padding)
+        table_label_options = {
+            name: getattr(self, name) for name in CORE_LABEL_OPTIONS
+            if name not in ('outline_color', 'padding')
+        }
+        table_label_options['outline_color'] = effective_outline_color
+        table_label_options['padding'] = effective_text_padding
+        # Code keeps its monospace font family and is stripped before tiling.
+        code_label_options = {
+            name: value for name, value in table_label_options.items()
+            if name not in ('font_family', 'padding', 'strip')
+        }
 
         def update_widget(widget):
             if isinstance(widget, Label):
@@ -184,10 +251,29 @@ class MarkdownLabelRendering:
                     widget.shorten_from = self.shorten_from
                 if hasattr(widget, 'split_str'):
                     widget.split_str = self.split_str
+            elif isinstance(widget, ListMarker):
+                # Markers switch to the cached texture of the new style.
+                widget.color = effective_color
+                widget.font_name = self.font_name
+                widget.label_options = {name: value for name, value in table_label_options.items()
+                                        if name in MARKER_LABEL_OPTIONS}
+            elif isinstance(widget, CanvasTable):
+                # Cells keep their own alignment; the rest re-rasterizes them.
+                widget.color = effective_color
+                widget.font_name = self.font_name
+                widget.line_height = self.line_height
+                widget.label_options = table_label_options
+            elif isinstance(widget, TiledCodeBlock):
+                code_color = list(getattr(widget, '_code_color', _DEFAULT_CODE_LABEL_COLOR))
+                widget.color = list(self.disabled_color) if self.disabled else code_color
+                widget.font_name = self.code_font_name
+                widget.line_height = self.line_height
+                widget.label_options = code_label_options
 
-            if hasattr(widget, 'children'):
-                for child in widget.children:
-                    update_widget(child)
+            for child in child_widgets(widget):
+                update_widget(child)
+            update_table_columns(widget)
+            refresh_block_textures(widget)
 
         for child in self.children:
             update_widget(child)
@@ -211,13 +297,12 @@ class MarkdownLabelRendering:
         def update(widget):
             if isinstance(widget, Label):
                 self._apply_text_size_to_label(widget)
-            if hasattr(widget, 'children'):
-                for child in widget.children:
-                    update(child)
-
-        if hasattr(traversal_root, 'children'):
-            for child in traversal_root.children:
+            for child in child_widgets(widget):
                 update(child)
+            refresh_block_textures(widget)
+
+        for child in child_widgets(traversal_root):
+            update(child)
 
     def _needs_clipping(self):
         """Determine if content clipping is needed."""
@@ -229,12 +314,27 @@ class MarkdownLabelRendering:
 
         return False
 
+    def _get_document_stats(self) -> DocumentStats:
+        """Return the statistics of the current AST.
+
+        Statistics are computed when the document is parsed, so this is O(1)
+        on every call after a parse. They are recomputed only if
+        ``_ast_tokens`` was replaced without going through ``_set_ast_tokens``.
+        """
+        tokens = getattr(self, '_ast_tokens', None) or []
+        if getattr(self, '_ast_stats_tokens', None) is not tokens:
+            self._ast_stats = compute_stats(tokens)
+            self._ast_stats_tokens = tokens
+        return self._ast_stats
+
     def _get_effective_render_mode(self):
         """Determine the effective render mode based on settings and content."""
         if self.render_mode == 'widgets':
             return 'widgets'
         elif self.render_mode == 'texture':
             return 'texture'
+        elif self.render_mode in ('hybrid', 'canvas'):
+            return self.render_mode
         else:  # 'auto' mode
             # Heuristic selection:
             # - Prefer widgets for simple content (fast + interactive widget tree)
@@ -251,49 +351,11 @@ class MarkdownLabelRendering:
             # Complexity-based fallback for common "chat feed" pattern:
             # a dynamic-height MarkdownLabel inside a ScrollView can be extremely
             # expensive to converge for mixed content (lists + tables + code).
-            # Note: `_ast_tokens` is populated during `_rebuild_widgets()` before
-            # this method is used for rendering decisions.
-            try:
-                tokens = self._ast_tokens
-            except AttributeError:
-                tokens = []
-
-            token_count = 0
-            max_depth = 0
-            has_table = False
-            has_list = False
-            has_block_code = False
-
-            if tokens:
-                stack = [(tok, 1) for tok in tokens if isinstance(tok, dict)]
-                while stack:
-                    tok, depth = stack.pop()
-                    if not isinstance(tok, dict):
-                        continue
-                    token_count += 1
-                    if depth > max_depth:
-                        max_depth = depth
-                    tok_type = tok.get('type')
-                    if tok_type == 'table' or (isinstance(tok_type, str) and tok_type.startswith('table_')):
-                        has_table = True
-                    elif tok_type in ('list', 'list_item'):
-                        has_list = True
-                    elif tok_type == 'block_code':
-                        has_block_code = True
-                    for child in (tok.get('children') or []):
-                        stack.append((child, depth + 1))
-
-            # Score is intentionally biased toward constructs that produce deep,
-            # wide widget trees (tables/lists/code blocks).
-            complexity_score = token_count
-            if has_table:
-                complexity_score += 80
-            if has_list:
-                complexity_score += 40
-            if has_block_code:
-                complexity_score += 50
-            if max_depth > 6:
-                complexity_score += (max_depth - 6) * 10
+            stats = self._get_document_stats()
+            complexity_score = stats.complexity_score
+            has_table = stats.has_table
+            has_list = stats.has_list
+            has_block_code = stats.has_block_code
 
             dynamic_height_layout = self.auto_size_height or self.size_hint_y is None
 
@@ -312,12 +374,70 @@ class MarkdownLabelRendering:
 
             return 'widgets'
 
-    def _render_as_texture(self, content):
-        """Render content widget tree to a single texture."""
-        import warnings
+    def _wrap_heavy_blocks(self, block_widgets):
+        """Wrap the blocks captured in hybrid mode in BlockTextures.
 
-        MAX_FBO_DIM = 8192  # guardrail for GPU-backed FBO dimensions
+        Blocks are chosen by the complexity score of their statistics, see
+        :func:`~kivy_garden.markdownlabel.block_texture.wants_block_texture`.
 
+        Args:
+            block_widgets: Widgets parallel to the current AST tokens (None
+                for skipped tokens)
+
+        Returns:
+            List of block widgets, heavy blocks replaced by BlockTextures
+        """
+        wrapped = list(block_widgets)
+        blocks = zip(self._ast_tokens, self._ast_block_stats, block_widgets)
+        for index, (token, stats, widget) in enumerate(blocks):
+            if wants_block_texture(token, stats, widget):
+                wrapped[index] = BlockTexture(block=widget, size_hint_y=None)
+        return wrapped
+
+    def _get_texture_band_height(self):
+        """Return the height of the bands texture mode captures content in.
+
+        ``texture_tile_height`` when set, at most MAX_FBO_DIM; otherwise
+        DEFAULT_BAND_HEIGHT with ``texture_lazy_tiles`` or
+        ``incremental_texture``, and MAX_FBO_DIM without them, so content up
+        to MAX_FBO_DIM is one texture.
+        """
+        tile_height = int(self.texture_tile_height)
+        if tile_height > 0:
+            return min(tile_height, MAX_FBO_DIM)
+        if self.texture_lazy_tiles or self.incremental_texture:
+            return DEFAULT_BAND_HEIGHT
+        return MAX_FBO_DIM
+
+    def _make_texture_image(self, texture, width, height):
+        """Return an Image showing ``texture`` stretched to ``width`` x ``height``."""
+        image = Image(
+            texture=texture,
+            size=(width, height),
+            size_hint=(None, None),
+        )
+        # Kivy 2.2+ deprecates allow_stretch/keep_ratio in favor of fit_mode.
+        # We want the rendered texture to stretch to our explicit size without
+        # preserving aspect ratio (equivalent to allow_stretch=True, keep_ratio=False).
+        try:
+            if 'fit_mode' in image.properties():
+                image.fit_mode = 'fill'
+            else:
+                image.allow_stretch = True
+                image.keep_ratio = False
+        except Exception:
+            # Defensive: never fail rendering due to a sizing hint.
+            pass
+        return image
+
+    def _layout_texture_content(self, content):
+        """Lay out ``content`` at the label's width for a texture capture.
+
+        Returns:
+            ``(width, height)`` of the laid-out content positioned at the
+            origin, or None when it cannot be captured (too wide, or with
+            Markdown images); texture hit-test zones are then cleared
+        """
         def _sync_async_image_geometry(widget):
             """Synchronize AsyncImage width/height with parent constraints.
 
@@ -356,6 +476,8 @@ class MarkdownLabelRendering:
         content.width = content_width
         content.do_layout()
         _sync_async_image_geometry(content)
+        # The texture captures everything, not only the visible rows and tiles.
+        rasterize_whole_blocks(content)
         content.do_layout()
 
         for child in content.children:
@@ -378,7 +500,7 @@ class MarkdownLabelRendering:
         if content_width <= 0:
             content_width = 100
 
-        if content_width > MAX_FBO_DIM or content_height > MAX_FBO_DIM:
+        if content_width > MAX_FBO_DIM:
             warnings.warn(
                 f"Texture render size too large ({content_width}x{content_height}); "
                 "falling back to widget mode.",
@@ -393,8 +515,6 @@ class MarkdownLabelRendering:
         _sync_async_image_geometry(content)
         content.do_layout()
 
-        self._collect_refs_for_texture(content, content_height)
-
         def _has_unloaded_images(widget):
             if isinstance(widget, AsyncImage):
                 coreimage = getattr(widget, '_coreimage', None)
@@ -430,39 +550,55 @@ class MarkdownLabelRendering:
             self._aggregated_refs = {}
             return None
 
-        try:
-            fbo = Fbo(size=(int(content_width), int(content_height)))
+        return content_width, content_height
 
-            with fbo:
-                ClearColor(0, 0, 0, 0)
-                ClearBuffers()
+    def _render_as_texture(self, content):
+        """Render content widget tree to a texture, or a column of band textures.
+
+        Content taller than the band height (see
+        :meth:`_get_texture_band_height`) is captured in horizontal bands,
+        each into its own Fbo, and returned as a vertical BoxLayout of
+        Images, so its height is not limited by the maximum Fbo size. With
+        ``texture_lazy_tiles`` or ``incremental_texture`` the content is
+        returned in a TextureBands widget instead, which keeps it to capture
+        bands as they near the viewport or to redraw changed regions.
+        """
+        size = self._layout_texture_content(content)
+        if size is None:
+            return None
+        content_width, content_height = size
 
-            fbo.add(content.canvas)
-            fbo.draw()
+        self._collect_refs_for_texture(content, content_height)
 
-            texture = fbo.texture
+        try:
+            band_height = self._get_texture_band_height()
+            if self.texture_lazy_tiles or self.incremental_texture:
+                return TextureBands(
+                    content=content,
+                    band_height=band_height,
+                    lazy=self.texture_lazy_tiles,
+                    prefetch=self.texture_prefetch,
+                    max_bands=int(self.texture_max_tiles),
+                    size_hint=(None, None),
+                )
+            if content_height <= band_height:
+                texture = capture_band(content, 0, content_width, content_height).texture
+                return self._make_texture_image(texture, content_width, content_height)
 
-            image = Image(
-                texture=texture,
+            # Bands from the top down; the last one holds the remainder.
+            column = BoxLayout(
+                orientation='vertical',
                 size=(content_width, content_height),
                 size_hint=(None, None),
             )
-            # Kivy 2.2+ deprecates allow_stretch/keep_ratio in favor of fit_mode.
-            # We want the rendered texture to stretch to our explicit size without
-            # preserving aspect ratio (equivalent to allow_stretch=True, keep_ratio=False).
-            try:
-                if 'fit_mode' in image.properties():
-                    image.fit_mode = 'fill'
-                else:
-                    image.allow_stretch = True
-                    image.keep_ratio = False
-            except Exception:
-                # Defensive: never fail rendering due to a sizing hint.
-                pass
+            top = content_height
+            while top > 0:
+                height = min(band_height, top)
+                texture = capture_band(content, top - height, content_width, height).texture
+                column.add_widget(self._make_texture_image(texture, content_width, height))
+                top -= height
 
-            fbo.remove(content.canvas)
-
-            return image
+            return column
 
         except Exception as e:
             warnings.warn(
@@ -477,46 +613,122 @@ class MarkdownLabelRendering:
         if widget is self or (hasattr(widget, 'parent') and widget.parent is self):
             self._aggregated_refs = {}
 
-        if isinstance(widget, Label) and hasattr(widget, 'refs') and widget.refs:
-            label_x = offset_x + widget.x
-            label_y = offset_y + widget.y
-
-            tex_w, tex_h = getattr(widget, 'texture_size', (widget.width, widget.height))
-            if tex_w <= 0:
-                tex_w = widget.width
-            if tex_h <= 0:
-                tex_h = widget.height
+        zones = {}
+        collect_ref_zones(widget, zones, offset_x, offset_y)
+        for ref_name, ref_zones in zones.items():
+            self._aggregated_refs.setdefault(ref_name, []).extend(ref_zones)
 
-            base_x = label_x + (widget.width - tex_w) / 2.0
-            base_y = label_y + (widget.height - tex_h) / 2.0
+    def _record_texture_blocks(self, bands, block_widgets):
+        """Remember the layout and link zones of the blocks captured in ``bands``.
 
-            for ref_name, ref_boxes in widget.refs.items():
-                if ref_name not in self._aggregated_refs:
-                    self._aggregated_refs[ref_name] = []
-
-                for box in ref_boxes:
-                    x1, y1, x2, y2 = box
-
-                    zone_x = base_x + x1
-                    zone_y = base_y + (tex_h - y2)
-                    zone_width = x2 - x1
-                    zone_height = y2 - y1
+        Kept for :meth:`_update_texture_blocks` in incremental texture mode.
+        """
+        content = bands.content
+        self._texture_bands = bands
+        self._texture_block_extents = [block_extent(widget, content.height)
+                                       for widget in block_widgets]
+        zones_list = []
+        for widget in block_widgets:
+            zones = {}
+            if widget is not None:
+                collect_ref_zones(widget, zones, content.x, content.y)
+            zones_list.append(zones)
+        self._texture_block_zones = zones_list
+
+    def _update_texture_blocks(self, block_widgets):
+        """Redraw only the region of changed blocks in incremental texture mode.
+
+        The blocks, with unchanged ones reused from the previous build,
+        replace the children of the captured content, which is laid out
+        again. Bands are redrawn from the top of the first changed block to
+        the bottom of the last one, or to the end of the content when its
+        height changed. Link zones are collected for new blocks and shifted
+        for moved ones; zones of blocks that stayed in place are kept.
 
-                    self._aggregated_refs[ref_name].append(
-                        (zone_x, zone_y, zone_width, zone_height)
-                    )
+        Args:
+            block_widgets: Block widgets parallel to the new tokens
 
-        if hasattr(widget, 'children'):
-            child_offset_x = offset_x + widget.x
-            child_offset_y = offset_y + widget.y
-            for child in widget.children:
-                self._collect_refs_for_texture(
-                    child, content_height, child_offset_x, child_offset_y
-                )
+        Returns:
+            False when there is no captured content to update or the new
+            content cannot be captured in place; the blocks are then left
+            detached for a full capture
+        """
+        bands = self._texture_bands
+        if (not self.incremental_texture or bands is None or bands.content is None
+                or self._block_widgets is None):
+            return False
+        content = bands.content
+        old_widgets = self._block_widgets
+        old_extents = self._texture_block_extents
+        old_zones = self._texture_block_zones
+        old_width, old_height = content.size
+
+        content.clear_widgets()
+        for widget in block_widgets:
+            if widget is not None:
+                content.add_widget(widget)
+        self._update_text_size_bindings_in_place(content)
+        size = self._layout_texture_content(content)
+        if size is None or size[0] != old_width:
+            content.clear_widgets()
+            return False
+        height = size[1]
+
+        old_indices = {id(widget): index for index, widget in enumerate(old_widgets)
+                       if widget is not None}
+        extents = [block_extent(widget, height) for widget in block_widgets]
+        # (top, height) of every area drawn differently than before
+        dirty = []
+        kept = set()
+        zones_list = []
+        for widget, extent in zip(block_widgets, extents):
+            zones = {}
+            old_index = old_indices.get(id(widget)) if widget is not None else None
+            if widget is None:
+                pass
+            elif old_index is None:
+                collect_ref_zones(widget, zones, content.x, content.y)
+                self._bind_ref_press_events(widget)
+                dirty.append(extent)
+            else:
+                kept.add(old_index)
+                old_extent = old_extents[old_index]
+                if extent != old_extent:
+                    dirty.extend((extent, old_extent))
+                # Zones are relative to the content's bottom edge.
+                shift = (height - sum(extent)) - (old_height - sum(old_extent))
+                zones = old_zones[old_index]
+                if shift:
+                    zones = shift_ref_zones(zones, 0, shift)
+            zones_list.append(zones)
+        dirty.extend(extent for index, extent in enumerate(old_extents)
+                     if extent is not None and index not in kept)
+
+        if dirty or height != old_height:
+            top = min((extent[0] for extent in dirty), default=min(height, old_height))
+            if height != old_height:
+                bottom = height
+            else:
+                bottom = max(sum(extent) for extent in dirty)
+            bands.redraw_region(top, bottom)
+
+        # Same order as collect_ref_zones() on the content.
+        refs = {}
+        for zones in reversed(zones_list):
+            for ref_name, ref_zones in zones.items():
+                refs.setdefault(ref_name, []).extend(ref_zones)
+        self._aggregated_refs = refs
+        self._texture_block_extents = extents
+        self._texture_block_zones = zones_list
+        return True
 
     def _bind_ref_press_events(self, widget):
         """Recursively bind on_ref_press events from child Labels."""
-        if isinstance(widget, Label) and widget.markup:
+        if isinstance(widget, RefZoneBehavior):
+            # Also forwards presses on links of its children, if any.
+            widget.bind(on_ref_press=self._on_child_ref_press)
+            return
+        if isinstance(widget, Label) and getattr(widget, 'markup', True):
             widget.bind(on_ref_press=self._on_child_ref_press)
 
         if hasattr(widget, 'children'):
@@ -524,9 +736,12 @@ class MarkdownLabelRendering:
                 self._bind_ref_press_events(child)
 
     def _bind_child_size_changes(self, widget):
-        """Recursively bind to child widget size changes for texture_size updates."""
-        def on_child_size_change(instance, value):
-            self._texture_size_version += 1
+        """Recursively bind to child widget size changes for texture_size updates.
+
+        Uses a bound method as callback so re-binding widgets kept across
+        rebuilds does not register duplicate callbacks.
+        """
+        on_child_size_change = self._on_child_size_change
 
         if isinstance(widget, Label):
             if hasattr(widget, 'texture_size'):
@@ -544,6 +759,10 @@ class MarkdownLabelRendering:
             for child in widget.children:
                 self._bind_child_size_changes(child)
 
+    def _on_child_size_change(self, instance, value):
+        """Bump the texture_size version when a descendant resizes."""
+        self._texture_size_version += 1
+
     def _on_child_ref_press(self, instance, ref):
         """Handle ref_press from child Label and bubble up."""
         self.dispatch('on_ref_press', ref)
@@ -52,6 +52,27 @@ TEST_MODULES = [
     'test_kivy_renderer_tables.py',
     'test_inline_renderer.py',
     'test_reference_style_links.py',
+    'test_incremental_parsing.py',
+    'test_streaming_append.py',
+    'test_parser_registry.py',
+    'test_ast_cache.py',
+    'test_async_parse.py',
+    'test_prewarm.py',
+    'test_compact_ast.py',
+    'test_document_stats.py',
+    'test_progressive_build.py',
+    'test_markdown_view.py',
+    'test_markdown_feed.py',
+    'test_render_config.py',
+    'test_widget_pool.py',
+    'test_list_layout.py',
+    'test_list_marker.py',
+    'test_canvas_table.py',
+    'test_column_widths.py',
+    'test_code_tiles.py',
+    'test_hybrid_render_mode.py',
+    'test_canvas_render_mode.py',
+    'test_texture_bands.py',
 ]
 
 
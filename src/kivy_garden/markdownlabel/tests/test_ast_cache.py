@@ -0,0 +1,178 @@
+"""
+Tests for the content-addressed AST cache.
+
+This module verifies cache keys, hit/miss accounting, byte-budget LRU
+eviction, copy-on-write semantics of cached token lists, and that
+MarkdownLabel rebuilds reuse cached tokens without corrupting shared entries.
+"""
+
+import uuid
+
+from kivy_garden.markdownlabel import MarkdownLabel
+from kivy_garden.markdownlabel.ast_cache import (
+    ASTCache,
+    estimate_size,
+    get_ast_cache,
+    make_cache_key,
+)
+from kivy_garden.markdownlabel.document_stats import compute_block_stats
+from kivy_garden.markdownlabel.parser_registry import DEFAULT_PLUGINS, create_parser
+
+
+class _CountingParser:
+    """Parser wrapper that counts parse() calls."""
+
+    def __init__(self):
+        self._parser = create_parser()
+        self.calls = 0
+
+    def parse(self, text):
+        self.calls += 1
+        return self._parser.parse(text)
+
+
+def _unique_text(prefix='Paragraph'):
+    """Return Markdown text that no other test has parsed."""
+    return f'# {prefix}\n\nBody {uuid.uuid4().hex}'
+
+
+class TestCacheKeys:
+    """Tests for make_cache_key()."""
+
+    def test_key_depends_on_text_and_plugins(self):
+        """Text and plugin set both contribute to the key."""
+        key = make_cache_key('~~x~~', DEFAULT_PLUGINS)
+
+        assert key == make_cache_key('~~x~~', list(DEFAULT_PLUGINS))
+        assert key != make_cache_key('~~y~~', DEFAULT_PLUGINS)
+        assert key != make_cache_key('~~x~~', ('table',))
+
+
+class TestASTCacheAccounting:
+    """Tests for hits, misses and the byte budget."""
+
+    def test_parse_counts_hits_and_misses(self):
+        """A repeated parse is a hit and skips the parser."""
+        cache = ASTCache()
+        parser = _CountingParser()
+
+        first = cache.parse(parser, '# Title', DEFAULT_PLUGINS)
+        second = cache.parse(parser, '# Title', DEFAULT_PLUGINS)
+
+        assert parser.calls == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert first == second
+        assert cache.stats()['entries'] == 1
+
+    def test_lru_eviction_respects_byte_budget(self):
+        """The least recently used entry is evicted when over budget."""
+        tokens = create_parser().parse('Some paragraph text')[0]
+        size = estimate_size(tuple(tokens))
+        cache = ASTCache(max_bytes=size * 2)
+
+        cache.put(b'a', tokens)
+        cache.put(b'b', tokens)
+        cache.get(b'a')
+        cache.put(b'c', tokens)
+
+        assert b'a' in cache
+        assert b'b' not in cache
+        assert b'c' in cache
+        assert cache.current_bytes <= cache.max_bytes
+
+    def test_block_stats_are_kept_with_their_entry(self):
+        """Block stats stored with an entry are found by token until it is evicted."""
+        tokens = create_parser().parse('# Title\n\nBody')[0]
+        block_stats = [compute_block_stats(token) for token in tokens]
+        cache = ASTCache()
+
+        cache.put(b'k', tokens, block_stats)
+        cached = cache.get(b'k')
+
+        assert [cache.block_stats(token) for token in cached] == block_stats
+        assert cache.block_stats({'type': 'paragraph', 'children': []}) is None
+
+        cache.max_bytes = 0
+
+        assert cache.block_stats(cached[0]) is None
+
+    def test_oversized_entry_is_not_stored(self):
+        """Entries larger than the whole budget are skipped."""
+        cache = ASTCache(max_bytes=16)
+
+        assert cache.put(b'k', [{'type': 'paragraph', 'children': []}]) is False
+        assert len(cache) == 0
+
+    def test_lowering_budget_evicts(self):
+        """Shrinking max_bytes evicts entries immediately."""
+        cache = ASTCache()
+        cache.put(b'k', [{'type': 'blank_line'}])
+
+        cache.max_bytes = 0
+
+        assert len(cache) == 0
+        assert cache.current_bytes == 0
+
+    def test_clear_resets_counters(self):
+        """clear() drops entries and counters."""
+        cache = ASTCache()
+        cache.parse(create_parser(), 'text', DEFAULT_PLUGINS)
+        cache.clear()
+
+        assert cache.stats() == {
+            'hits': 0, 'misses': 0, 'entries': 0, 'current_bytes': 0,
+            'max_bytes': cache.max_bytes,
+        }
+
+
+class TestCopyOnWrite:
+    """Tests that cached entries cannot be changed through returned lists."""
+
+    def test_returned_lists_are_independent(self):
+        """Replacing tokens in a returned list leaves the entry intact."""
+        cache = ASTCache()
+        parser = create_parser()
+        first = cache.parse(parser, '- item', DEFAULT_PLUGINS)
+        first[:] = [{'type': 'paragraph', 'children': []}]
+
+        second = cache.parse(parser, '- item', DEFAULT_PLUGINS)
+
+        assert second[0]['type'] == 'list'
+        assert second is not first
+
+
+class TestMarkdownLabelCache:
+    """Tests for MarkdownLabel's use of the shared cache."""
+
+    def test_same_text_is_parsed_once(self):
+        """A second label with the same text hits the cache."""
+        text = _unique_text()
+        cache = get_ast_cache()
+        first = MarkdownLabel(text=text)
+        hits_before = cache.hits
+
+        second = MarkdownLabel(text=text)
+
+        assert cache.hits == hits_before + 1
+        assert second.get_ast() == first.get_ast()
+        assert second.get_ast() is not first.get_ast()
+
+    def test_unchanged_text_skips_parser(self):
+        """Re-parsing unchanged text uses the cached tokens."""
+        label = MarkdownLabel(text=_unique_text())
+        parser = _CountingParser()
+        label._parser = parser
+
+        label.force_rebuild()
+
+        assert parser.calls == 0
+
+    def test_degenerate_normalization_keeps_entry(self):
+        """Normalizing a lone list marker does not alter the cached tokens."""
+        label = MarkdownLabel(text='-')
+        assert label.get_ast()[0]['type'] == 'paragraph'
+
+        cached = get_ast_cache().get(make_cache_key('-', label._parser_plugins))
+
+        assert cached[0]['type'] == 'list'
+        assert MarkdownLabel(text='-').get_ast()[0]['type'] == 'paragraph'
@@ -0,0 +1,138 @@
+"""
+Tests for background-thread parsing.
+
+This module verifies that the ``async_parse`` option parses on the worker
+thread and builds the same widgets on the main thread, that results made
+stale by text changes or synchronous rebuilds are dropped, and that
+prerendered markup is discarded when styling changed in the meantime.
+"""
+
+import threading
+from concurrent.futures import wait
+
+from kivy.clock import Clock
+
+from kivy_garden.markdownlabel import MarkdownLabel
+from kivy_garden.markdownlabel.background_parser import parse_document
+from kivy_garden.markdownlabel.parser_registry import DEFAULT_PLUGINS
+from .test_utils import collect_widget_ids, find_labels_recursive
+
+
+DOCUMENT = (
+    '# Title\n\n'
+    'Some **bold** text with a [link](http://example.com).\n\n'
+    '- one\n'
+    '- `two`\n\n'
+    '| a | b |\n'
+    '|---|---|\n'
+    '| 1 | 2 |'
+)
+
+
+def _finish(label):
+    """Wait for the label's background parse and run the main-thread commit."""
+    future = label._async_parse_future
+    if future is not None:
+        future.result(timeout=10)
+    Clock.tick()
+
+
+class TestBackgroundParser:
+    """Tests for the worker-side parse job."""
+
+    def test_parse_document_runs_off_main_thread(self):
+        """parse_document works from a worker thread."""
+        renderer_kwargs = MarkdownLabel()._get_renderer_kwargs()
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(parse_document(DOCUMENT, DEFAULT_PLUGINS, renderer_kwargs))
+        )
+        thread.start()
+        thread.join()
+
+        tokens, inline_markup = results[0]
+        assert tokens[0]['type'] == 'heading'
+        assert inline_markup[id(tokens[0]['children'])] == 'Title'
+
+
+class TestAsyncParseBuild:
+    """Tests that asynchronous builds match synchronous builds."""
+
+    def test_async_parse_default_is_false(self):
+        """async_parse is disabled by default."""
+        assert MarkdownLabel().async_parse is False
+
+    def test_construction_defers_widget_creation(self):
+        """Widgets appear only after the main-thread commit."""
+        label = MarkdownLabel(text=DOCUMENT, async_parse=True)
+        assert label.children == []
+        assert label._async_parse_future is not None
+
+        _finish(label)
+
+        reference = MarkdownLabel(text=DOCUMENT)
+        assert label.get_ast() == reference.get_ast()
+        assert ([lbl.text for lbl in find_labels_recursive(label)]
+                == [lbl.text for lbl in find_labels_recursive(reference)])
+
+    def test_text_change_parses_in_background(self):
+        """A text change is parsed on the worker and committed later."""
+        label = MarkdownLabel(text='Before', async_parse=True)
+        _finish(label)
+
+        label.text = DOCUMENT
+        label._do_rebuild()
+        assert label._async_parse_future is not None
+        assert find_labels_recursive(label)[0].text == 'Before'
+
+        _finish(label)
+
+        assert label.get_ast()[0]['type'] == 'heading'
+
+    def test_incremental_parse_stays_synchronous(self):
+        """incremental_parse keeps parsing on the main thread."""
+        label = MarkdownLabel(text=DOCUMENT, async_parse=True, incremental_parse=True)
+
+        assert label._async_parse_future is None
+        assert label.get_ast()[0]['type'] == 'heading'
+
+
+class TestAsyncParseCancellation:
+    """Tests that stale background results are never committed."""
+
+    def test_text_change_cancels_stale_result(self):
+        """A result for replaced text is dropped."""
+        label = MarkdownLabel(text='# Stale', async_parse=True)
+        stale_future = label._async_parse_future
+
+        label.text = 'Fresh'
+        wait([stale_future], timeout=10)
+        Clock.tick()
+
+        assert all(lbl.text != 'Stale' for lbl in find_labels_recursive(label))
+
+        _finish(label)
+
+        assert [lbl.text for lbl in find_labels_recursive(label)] == ['Fresh']
+
+    def test_force_rebuild_supersedes_background_result(self):
+        """A synchronous rebuild invalidates the in-flight job."""
+        label = MarkdownLabel(text=DOCUMENT, async_parse=True)
+        stale_future = label._async_parse_future
+
+        label.force_rebuild()
+        ids_before = collect_widget_ids(label)
+        wait([stale_future], timeout=10)
+        Clock.tick()
+
+        assert label._async_parse_future is None
+        assert collect_widget_ids(label) == ids_before
+
+    def test_style_change_discards_prerendered_markup(self):
+        """Markup rendered with outdated styling is not used."""
+        label = MarkdownLabel(text='Use `code` here', async_parse=True)
+        label.code_font_name = 'Roboto'
+
+        _finish(label)
+
+        assert '[font=Roboto]' in find_labels_recursive(label)[0].text
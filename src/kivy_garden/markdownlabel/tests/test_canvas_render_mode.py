@@ -0,0 +1,141 @@
+"""
+Tests for the canvas render mode.
+
+This module verifies that ``render_mode='canvas'`` gives MarkdownLabel a
+single CanvasDocument child drawing the detached blocks, that the document
+has the height of the widget-mode content and is not limited by the texture
+size, that links dispatch ``on_ref_press`` through its ref zones, and that
+width and style changes apply without a rebuild.
+"""
+
+import pytest
+
+from kivy.clock import Clock
+from kivy.uix.label import Label
+
+from kivy_garden.markdownlabel.canvas_document import CanvasDocument
+
+from .test_utils import ref_center, FakeTouch, make_label
+
+DOCUMENT = (
+    '# Title\n\nSome text with a [link](http://example.com).\n\n'
+    '- one\n- two\n\n| A | B |\n| --- | --- |\n| 1 | 2 |\n\n```\ncode\n```\n'
+)
+
+TABLE_LINK = '| A | B |\n| --- | --- |\n| 1 | [cell](http://table.example) |\n\nText below.\n'
+NESTED_LINK = '- one\n  - two with [item](http://list.example)\n\nText below.\n'
+
+
+def _document(label):
+    """Return the label's CanvasDocument."""
+    assert len(label.children) == 1
+    document = label.children[0]
+    assert isinstance(document, CanvasDocument)
+    return document
+
+
+class TestCanvasDocumentStructure:
+    """Tests for the widget tree of canvas mode."""
+
+    def test_single_child(self):
+        """The label holds one CanvasDocument whose content is not parented."""
+        label = make_label(DOCUMENT, render_mode='canvas')
+        document = _document(label)
+
+        assert document.content.parent is None
+        assert document.children == []
+        assert document.content.children
+
+    def test_height_matches_widget_mode(self):
+        """The document is as tall as the blocks in widget mode."""
+        canvas = make_label(DOCUMENT, render_mode='canvas')
+        widgets = make_label(DOCUMENT)
+
+        assert _document(canvas).height > 0
+        assert canvas.minimum_height == widgets.minimum_height
+
+    def test_tall_documents_are_drawn(self):
+        """Documents beyond the texture size limit keep canvas mode."""
+        text = '\n\n'.join(f'Paragraph {i}' for i in range(600))
+        label = make_label(text, render_mode='canvas')
+
+        assert _document(label).height > 8192
+
+
+class TestCanvasDocumentLinks:
+    """Tests for link hit-testing in canvas mode."""
+
+    def test_touch_on_link_dispatches_ref_press(self):
+        """Touching a link zone bubbles on_ref_press to the MarkdownLabel."""
+        label = make_label(DOCUMENT, render_mode='canvas')
+        document = _document(label)
+        pressed = []
+        label.bind(on_ref_press=lambda instance, ref: pressed.append(ref))
+
+        zone_x, zone_y, zone_w, zone_h = document.ref_zones['http://example.com'][0]
+        assert document.on_touch_down(FakeTouch(document.x + zone_x + 1, document.y + zone_y + 1))
+
+        assert pressed == ['http://example.com']
+
+    @pytest.mark.parametrize('text, ref', [
+        (TABLE_LINK, 'http://table.example'),
+        (NESTED_LINK, 'http://list.example'),
+    ], ids=['table', 'nested_list'])
+    def test_links_in_containers_dispatch_ref_press(self, text, ref):
+        """Links in table cells and nested lists are hit where widget mode draws them."""
+        label = make_label(text, render_mode='canvas')
+        document = _document(label)
+        pressed = []
+        label.bind(on_ref_press=lambda instance, name: pressed.append(name))
+
+        assert document.on_touch_down(FakeTouch(*ref_center(make_label(text), ref)))
+
+        assert pressed == [ref]
+
+    def test_refs_match_widget_mode(self):
+        """MarkdownLabel.refs reports links at the widget-mode position."""
+        canvas_refs = make_label(DOCUMENT, render_mode='canvas').refs['http://example.com']
+        widget_refs = make_label(DOCUMENT).refs['http://example.com']
+
+        assert canvas_refs == widget_refs
+
+
+class TestCanvasDocumentUpdates:
+    """Tests for in-place updates in canvas mode."""
+
+    def test_width_change_relayouts_content(self):
+        """Width changes reach the content without a rebuild."""
+        label = make_label(DOCUMENT, render_mode='canvas')
+        document = _document(label)
+
+        label.width = 200
+        for _ in range(5):
+            Clock.tick()
+
+        assert _document(label) is document
+        assert document.content.width == 200
+
+    def test_font_size_update_keeps_document(self):
+        """base_font_size changes reach the detached Labels."""
+        label = make_label(DOCUMENT, render_mode='canvas')
+        document = _document(label)
+        old_height = document.height
+
+        label.base_font_size = 30
+        for _ in range(5):
+            Clock.tick()
+
+        assert _document(label) is document
+        assert document.height > old_height
+
+    def test_color_update_reaches_labels(self):
+        """Color changes are applied to the detached Labels."""
+        label = make_label(DOCUMENT, render_mode='canvas')
+        document = _document(label)
+
+        label.color = [1, 0, 0, 1]
+
+        paragraphs = [child for child in document.content.children
+                      if isinstance(child, Label) and 'Some text' in child.text]
+        assert paragraphs
+        assert list(paragraphs[0].color) == [1, 0, 0, 1]
@@ -0,0 +1,221 @@
+"""
+Tests for the single-canvas table renderer.
+
+This module verifies that ``table_mode='canvas'`` renders each table as one
+CanvasTable without child Labels, with the same height and column widths as
+the GridLayout renderer, that links in cells dispatch ``on_ref_press`` and
+appear in ``refs`` and the texture mode ref zones, that in-place font
+size and style updates re-rasterize the cells, and that ``table_mode='virtual'``
+rasterizes only the rows near the visible region of a ScrollView.
+"""
+
+import pytest
+
+from kivy.clock import Clock
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.scrollview import ScrollView
+from kivy.uix.widget import Widget
+
+from kivy_garden.markdownlabel import MarkdownLabel
+from kivy_garden.markdownlabel.canvas_table import CanvasTable, CanvasTableCell
+
+from .test_utils import find_images, FakeTouch, make_label
+
+TABLE = """| Name | Value |
+|:-----|------:|
+| [docs](http://example.com) | 1 |
+| a longer cell that wraps onto several lines in a narrow column | 2 |
+"""
+
+LARGE_TABLE = '| Id | Value |\n|---|---|\n' + ''.join(f'| {i} | value {i} |\n' for i in range(500))
+
+
+def _table(label, table_class=CanvasTable):
+    """Return the first top-level table of ``label``."""
+    return next(child for child in label.children if isinstance(child, table_class))
+
+
+class TestCanvasTableStructure:
+    """Tests for the widget created in canvas table mode."""
+
+    def test_grid_mode_is_default(self):
+        """Tables are GridLayouts of Labels unless canvas mode is selected."""
+        label = make_label(TABLE)
+
+        assert label.table_mode == 'grid'
+        assert isinstance(_table(label, GridLayout), GridLayout)
+
+    def test_table_is_single_widget(self):
+        """A canvas table has no child widgets and keeps cell content and alignment."""
+        table = _table(make_label(TABLE, table_mode='canvas'))
+
+        assert table.children == []
+        assert table.cols == 2
+        assert [cell.text for cell in table.rows[0]] == ['Name', 'Value']
+        assert table.rows[0][0] == CanvasTableCell('Name', 'left', True)
+        assert table.rows[2][1].halign == 'right'
+        assert not table.rows[2][1].is_header
+
+    def test_size_matches_grid_renderer(self):
+        """Column widths and table height equal those of the GridLayout renderer."""
+        grid = _table(make_label(TABLE), GridLayout)
+        table = _table(make_label(TABLE, table_mode='canvas'))
+
+        assert table.height == grid.height == table.minimum_height
+        cell_widths = [cell.width for cell in grid.children[:2]]
+        assert table.col_widths == cell_widths
+
+    def test_switching_mode_replaces_table(self):
+        """Changing table_mode replaces the table widget."""
+        label = make_label(TABLE)
+        label.table_mode = 'canvas'
+        label.force_rebuild()
+
+        assert isinstance(_table(label), CanvasTable)
+
+
+class TestCanvasTableRefs:
+    """Tests for links in canvas table cells."""
+
+    def test_touch_on_link_dispatches_ref_press(self):
+        """Touching a link zone bubbles on_ref_press to the MarkdownLabel."""
+        label = make_label(TABLE, table_mode='canvas')
+        table = _table(label)
+        pressed = []
+        label.bind(on_ref_press=lambda instance, ref: pressed.append(ref))
+
+        zone_x, zone_y, zone_w, zone_h = table.ref_zones['http://example.com'][0]
+        assert table.on_touch_down(FakeTouch(table.x + zone_x + 1, table.y + zone_y + 1))
+        assert not table.on_touch_down(FakeTouch(table.right - 2, table.y + zone_y + 1))
+
+        assert pressed == ['http://example.com']
+
+    def test_refs_aggregated_like_labels(self):
+        """MarkdownLabel.refs reports canvas table links at the grid renderer position."""
+        grid_refs = make_label(TABLE).refs['http://example.com']
+        canvas_refs = make_label(TABLE, table_mode='canvas').refs['http://example.com']
+
+        assert canvas_refs == grid_refs
+
+    def test_texture_mode_collects_ref_zones(self):
+        """Texture mode hit-testing includes links in canvas tables."""
+        label = make_label(TABLE, table_mode='canvas', render_mode='texture')
+
+        assert list(label._aggregated_refs) == ['http://example.com']
+
+
+class TestCanvasTableStyleUpdates:
+    """Tests for in-place updates of canvas tables."""
+
+    def test_font_size_update_rerasterizes_cells(self):
+        """base_font_size changes keep the table and grow its rows."""
+        label = make_label(TABLE, table_mode='canvas')
+        table = _table(label)
+        old_height = table.height
+
+        label.base_font_size = 30
+        Clock.tick()
+
+        assert _table(label) is table
+        assert table.font_size == 30
+        assert table.height > old_height
+
+    def test_style_update_recolors_cells(self):
+        """color changes are applied to the existing table."""
+        label = make_label(TABLE, table_mode='canvas')
+        table = _table(label)
+
+        label.color = [1, 0, 0, 1]
+        label.outline_width = 2
+
+        assert _table(label) is table
+        assert list(table.color) == [1, 0, 0, 1]
+        assert table.label_options['outline_width'] == 2
+
+
+class TestCanvasTableVirtualization:
+    """Tests for row virtualization in virtual table mode."""
+
+    def _scrolled_label(self):
+        """Return a virtual mode label inside a 300px high ScrollView."""
+        scroll_view = ScrollView(size=(400, 300), size_hint=(None, None))
+        label = MarkdownLabel(text=LARGE_TABLE, table_mode='virtual', size_hint=(1, None))
+        label.bind(minimum_height=label.setter('height'))
+        scroll_view.add_widget(label)
+        for _ in range(5):
+            Clock.tick()
+        return scroll_view, _table(label)
+
+    def test_virtual_mode_creates_virtualized_table(self):
+        """table_mode='virtual' creates a CanvasTable with virtualization on."""
+        table = _table(make_label(TABLE, table_mode='virtual'))
+
+        assert table.virtualized
+        assert not _table(make_label(TABLE, table_mode='canvas')).virtualized
+
+    def test_only_visible_rows_are_rasterized(self):
+        """Rows far below the viewport are not rasterized but have a height."""
+        scroll_view, table = self._scrolled_label()
+
+        assert 0 in table._rendered
+        assert len(table._rendered) < len(table.rows) / 4
+        assert len(table._row_heights) == len(table.rows)
+        assert all(height > 0 for height in table._row_heights)
+        assert table.height > scroll_view.height * 10
+
+    def test_scrolling_moves_rasterized_rows(self):
+        """Scrolling to the bottom rasterizes the last rows and drops the first."""
+        scroll_view, table = self._scrolled_label()
+
+        scroll_view.scroll_y = 0
+        for _ in range(5):
+            Clock.tick()
+
+        assert len(table.rows) - 1 in table._rendered
+        assert 0 not in table._rendered
+
+    def test_content_growing_above_moves_rasterized_rows(self):
+        """Content growing above the label pushes its rows out of the viewport.
+
+        The ScrollView moves its content with a canvas translate, so the
+        table keeps its position and only the viewport size changes.
+        """
+        scroll_view = ScrollView(size=(400, 300), size_hint=(None, None))
+        content = BoxLayout(orientation='vertical', size_hint=(1, None))
+        content.bind(minimum_height=content.setter('height'))
+        spacer = Widget(size_hint_y=None, height=0)
+        label = MarkdownLabel(text=LARGE_TABLE, table_mode='virtual', size_hint=(1, None))
+        label.bind(minimum_height=label.setter('height'))
+        content.add_widget(spacer)
+        content.add_widget(label)
+        scroll_view.add_widget(content)
+        for _ in range(5):
+            Clock.tick()
+        table = _table(label)
+        assert 0 in table._rendered
+
+        spacer.height = 5000
+        for _ in range(5):
+            Clock.tick()
+
+        assert table.y == label.y
+        assert 0 not in table._rendered
+
+    def test_estimates_match_measured_heights(self):
+        """Estimated heights of single-line rows are close to the measured ones."""
+        _, table = self._scrolled_label()
+        line_height, char_width = table._font_metrics()
+
+        for index, (cells, height) in table._rendered.items():
+            estimate = table._estimate_row_height(table.rows[index], line_height, char_width)
+            assert estimate == pytest.approx(height, abs=2)
+
+    def test_texture_mode_rasterizes_whole_table(self):
+        """Texture mode captures every row, like a canvas table."""
+        virtual = make_label(LARGE_TABLE, table_mode='virtual', render_mode='texture')
+        canvas = make_label(LARGE_TABLE, table_mode='canvas', render_mode='texture')
+
+        virtual_texture = find_images(virtual)[0].texture
+        canvas_texture = find_images(canvas)[0].texture
+        assert virtual_texture.size == canvas_texture.size
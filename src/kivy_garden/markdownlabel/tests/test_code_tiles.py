@@ -0,0 +1,152 @@
+"""
+Tests for tiled rendering of long code blocks.
+
+This module verifies that code blocks longer than ``code_tile_lines`` are
+drawn by a TiledCodeBlock split into line-range tiles inside the usual
+background container, that only tiles near the visible region of a
+ScrollView are rasterized, that texture mode rasterizes every tile, and
+that in-place font and color updates reach the tiles.
+"""
+
+import pytest
+from kivy.clock import Clock
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.label import Label
+from kivy.uix.scrollview import ScrollView
+
+from kivy_garden.markdownlabel import MarkdownLabel
+from kivy_garden.markdownlabel.code_tiles import TiledCodeBlock, split_lines
+
+from .test_utils import find_images, make_label
+
+LONG_CODE = '```\n' + '\n'.join(f'line {i}' for i in range(1000)) + '\n```\n'
+
+
+def _code_content(label):
+    """Return the widget inside the label's first code block container."""
+    return label.children[0].children[0]
+
+
+class TestSplitLines:
+    """Tests for splitting code into tiles."""
+
+    def test_chunks_of_lines(self):
+        """Lines are grouped in order, the last chunk holding the rest."""
+        assert split_lines('a\nb\nc\nd\ne', 2) == ['a\nb', 'c\nd', 'e']
+
+    def test_empty_lines_kept(self):
+        """Blank lines at chunk boundaries are preserved."""
+        assert '\n'.join(split_lines('a\n\n\nb', 2)) == 'a\n\n\nb'
+
+
+class TestTiledCodeStructure:
+    """Tests for the widgets created for long code blocks."""
+
+    def test_tiling_is_off_by_default(self):
+        """Without code_tile_lines every code block is one Label."""
+        label = make_label(LONG_CODE)
+
+        assert label.code_tile_lines == 0
+        assert isinstance(_code_content(label), Label)
+
+    def test_short_blocks_stay_labels(self):
+        """Blocks with no more lines than a tile keep their Label."""
+        label = make_label('```\nprint(1)\n```\n', code_tile_lines=100)
+
+        assert isinstance(_code_content(label), Label)
+
+    def test_long_block_is_tiled(self):
+        """Long blocks become a TiledCodeBlock inside the background container."""
+        label = make_label(LONG_CODE, code_tile_lines=100)
+        container = label.children[0]
+        block = _code_content(label)
+
+        assert isinstance(container, BoxLayout)
+        assert hasattr(container, '_bg_rect')
+        assert isinstance(block, TiledCodeBlock)
+        assert len(block.tiles) == 10
+        assert block.font_name == label.code_font_name
+        assert block._is_code
+
+    def test_height_matches_single_label(self):
+        """Fully rasterized tiles stack to the height of the single Label."""
+        single = _code_content(make_label(LONG_CODE))
+        block = _code_content(make_label(LONG_CODE, code_tile_lines=100))
+        block.lazy = False
+        block.measure()
+
+        assert block.height == pytest.approx(single.height, abs=len(block.tiles))
+
+
+class TestTiledCodeViewport:
+    """Tests for lazy tile rasterization."""
+
+    def _scrolled_block(self):
+        """Return a tiled code block inside a 300px high ScrollView."""
+        scroll_view = ScrollView(size=(400, 300), size_hint=(None, None))
+        label = MarkdownLabel(text=LONG_CODE, code_tile_lines=50, size_hint=(1, None))
+        label.bind(minimum_height=label.setter('height'))
+        scroll_view.add_widget(label)
+        for _ in range(5):
+            Clock.tick()
+        return scroll_view, _code_content(label)
+
+    def test_only_visible_tiles_are_rasterized(self):
+        """Tiles far below the viewport are not rasterized but have a height."""
+        scroll_view, block = self._scrolled_block()
+
+        assert 0 in block._rendered
+        assert len(block._rendered) < len(block.tiles) / 2
+        assert all(height > 0 for height in block._tile_heights)
+        assert block.height > scroll_view.height * 10
+
+    def test_scrolling_moves_rasterized_tiles(self):
+        """Scrolling to the bottom rasterizes the last tile and drops the first."""
+        scroll_view, block = self._scrolled_block()
+
+        scroll_view.scroll_y = 0
+        for _ in range(5):
+            Clock.tick()
+
+        assert len(block.tiles) - 1 in block._rendered
+        assert 0 not in block._rendered
+
+    def test_texture_mode_rasterizes_all_tiles(self):
+        """Texture mode turns lazy rasterization off for the capture."""
+        text = '```\n' + '\n'.join(f'line {i}' for i in range(60)) + '\n```\n'
+        tiled = make_label(text, code_tile_lines=10, render_mode='texture')
+        single = make_label(text, render_mode='texture')
+
+        tiled_texture = find_images(tiled)[0].texture
+        single_texture = find_images(single)[0].texture
+        assert tiled_texture.width == single_texture.width
+        assert tiled_texture.height == pytest.approx(single_texture.height, abs=6)
+
+
+class TestTiledCodeStyleUpdates:
+    """Tests for in-place updates of tiled code blocks."""
+
+    def test_font_size_update_keeps_block(self):
+        """base_font_size changes re-rasterize the tiles without a rebuild."""
+        label = make_label(LONG_CODE, code_tile_lines=100)
+        block = _code_content(label)
+        old_height = block.height
+
+        label.base_font_size = 30
+        Clock.tick()
+
+        assert _code_content(label) is block
+        assert block.font_size == 30
+        assert block.height > old_height
+
+    def test_code_font_and_disabled_color(self):
+        """code_font_name and disabled_color reach the tiles."""
+        label = make_label(LONG_CODE, code_tile_lines=100)
+        block = _code_content(label)
+
+        label.code_font_name = 'Roboto'
+        label.disabled = True
+
+        assert _code_content(label) is block
+        assert block.font_name == 'Roboto'
+        assert list(block.color) == list(label.disabled_color)
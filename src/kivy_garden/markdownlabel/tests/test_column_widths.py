@@ -0,0 +1,184 @@
+"""
+Tests for content-aware table column widths.
+
+This module verifies that column extents are measured from cell text,
+that the available width is distributed by those extents, that
+ColumnWidthCache measures a table once per font configuration, and that
+``table_column_sizing='content'`` sizes the columns of grid and canvas
+tables by their text.
+"""
+
+import pytest
+from kivy.clock import Clock
+from kivy.uix.gridlayout import GridLayout
+
+from kivy_garden.markdownlabel.canvas_table import CanvasTable, CanvasTableCell
+from kivy_garden.markdownlabel.column_widths import (
+    ColumnWidthCache,
+    distribute_widths,
+    get_column_width_cache,
+    make_table_key,
+    measure_column_extents,
+    strip_markup,
+)
+
+from .test_utils import make_label
+
+ROWS = [
+    [CanvasTableCell('Id', is_header=True), CanvasTableCell('Description', is_header=True)],
+    [CanvasTableCell('1'), CanvasTableCell('a description that is much longer than its id')],
+    [CanvasTableCell('2'), CanvasTableCell('[b]short[/b]')],
+]
+
+TABLE = """| Id | Description |
+|----|-------------|
+| 1 | a description that is much longer than its id |
+| 2 | short |
+"""
+
+
+@pytest.fixture
+def cache():
+    """Empty process-wide column width cache."""
+    shared = get_column_width_cache()
+    shared.clear()
+    yield shared
+    shared.clear()
+
+
+class TestColumnExtents:
+    """Tests for measuring and distributing column widths."""
+
+    def test_strip_markup(self):
+        """Tags are removed and escapes replaced."""
+        assert strip_markup('[b]a &bl;1&br;[/b] [ref=x]&amp;[/ref]') == 'a [1] &'
+
+    def test_extents_follow_text(self):
+        """Minimum is the widest word, maximum the widest one-line cell."""
+        (id_min, id_max), (text_min, text_max) = measure_column_extents(ROWS, 2, 'Roboto', 15)
+
+        assert 0 < id_min <= id_max
+        assert id_max < text_min < text_max
+        single = measure_column_extents([[CanvasTableCell('x'), ROWS[1][1]]], 2, 'Roboto', 15)
+        assert single[1][1] == pytest.approx(text_max)
+
+    def test_everything_fits(self):
+        """Columns get their maximum width scaled to fill the available width."""
+        assert distribute_widths([(5, 10), (10, 30)], 80) == (20.0, 60.0)
+
+    def test_wrapping_columns_keep_minimum(self):
+        """Each column gets its minimum plus a share of what it could still grow."""
+        assert distribute_widths([(10, 10), (20, 100)], 50) == (10.0, 40.0)
+
+    def test_too_narrow_scales_minimums(self):
+        """If minimum widths do not fit, they are scaled down."""
+        assert distribute_widths([(10, 20), (30, 40)], 20) == (5.0, 15.0)
+
+    def test_empty_table_splits_equally(self):
+        """Tables without text get equal columns."""
+        assert distribute_widths([(0, 0), (0, 0)], 50) == (25.0, 25.0)
+        assert distribute_widths([], 50) == ()
+
+
+class TestColumnWidthCache:
+    """Tests for the column width cache."""
+
+    def test_widths_measured_once(self):
+        """A table is measured once per font; new widths reuse its extents."""
+        cache = ColumnWidthCache()
+
+        first = cache.get_widths(ROWS, 2, 300, 'Roboto', 15)
+        assert cache.get_widths(ROWS, 2, 300, 'Roboto', 15) is first
+        cache.get_widths(ROWS, 2, 200, 'Roboto', 15)
+
+        assert (cache.misses, cache.hits) == (1, 2)
+        assert sum(first) == pytest.approx(300)
+
+    def test_font_is_part_of_key(self):
+        """Font size and options select separate extents."""
+        cache = ColumnWidthCache()
+        cache.get_widths(ROWS, 2, 300, 'Roboto', 15)
+        cache.get_widths(ROWS, 2, 300, 'Roboto', 30)
+        cache.get_widths(ROWS, 2, 300, 'Roboto', 15, {'font_kerning': False})
+        cache.get_widths(ROWS, 2, 300, 'Roboto', 15, {'outline_color': [1, 0, 0, 1]})
+
+        assert (cache.misses, cache.hits) == (3, 1)
+
+    def test_table_key_covers_content(self):
+        """Cell text and header flags change the table key."""
+        changed = [list(row) for row in ROWS]
+        changed[2][0] = CanvasTableCell('3')
+
+        assert make_table_key(ROWS) == make_table_key([list(row) for row in ROWS])
+        assert make_table_key(changed) != make_table_key(ROWS)
+
+    def test_eviction(self):
+        """Least recently used tables are evicted beyond max_entries."""
+        cache = ColumnWidthCache(max_entries=1)
+        cache.get_widths(ROWS, 2, 300, 'Roboto', 15)
+        cache.get_widths(ROWS[:2], 2, 300, 'Roboto', 15)
+        cache.get_widths(ROWS, 2, 300, 'Roboto', 15)
+
+        assert len(cache) == 1
+        assert cache.misses == 3
+
+
+class TestContentColumnSizing:
+    """Tests for table_column_sizing on MarkdownLabel."""
+
+    def test_equal_is_default(self, cache):
+        """Columns share the width equally unless content sizing is selected."""
+        table = next(child for child in make_label(TABLE, table_mode='canvas').children
+                     if isinstance(child, CanvasTable))
+
+        assert table.column_sizing == 'equal'
+        assert table.col_widths[0] == table.col_widths[1]
+
+    @pytest.mark.parametrize('table_mode', ['canvas', 'virtual'])
+    def test_canvas_table_columns_follow_text(self, cache, table_mode):
+        """The narrow Id column is narrower than the description column."""
+        label = make_label(TABLE, table_mode=table_mode, table_column_sizing='content')
+        table = next(child for child in label.children if isinstance(child, CanvasTable))
+
+        id_width, text_width = table.col_widths
+        assert id_width < text_width
+        pad_left, pad_top, pad_right, pad_bottom = table.padding
+        assert id_width + text_width + table.spacing == pytest.approx(
+            table.width - pad_left - pad_right)
+
+    def test_grid_columns_match_canvas_table(self, cache):
+        """Grid cells get the same widths as canvas table columns."""
+        grid = next(child for child in make_label(TABLE, table_column_sizing='content').children
+                    if isinstance(child, GridLayout))
+        table = next(child for child in make_label(
+            TABLE, table_mode='canvas', table_column_sizing='content').children
+            if isinstance(child, CanvasTable))
+
+        header_cells = grid.children[-2:][::-1]
+        assert [cell.width for cell in header_cells] == pytest.approx(table.col_widths)
+
+    def test_grid_columns_follow_font_size_update(self, cache):
+        """In-place font size changes size grid columns for the new font."""
+        label = make_label(TABLE, table_column_sizing='content', base_font_size=15)
+        grid = next(child for child in label.children if isinstance(child, GridLayout))
+
+        label.base_font_size = 40
+        for _ in range(3):
+            Clock.tick()
+        fresh = next(child for child in make_label(
+            TABLE, table_column_sizing='content', base_font_size=40).children
+            if isinstance(child, GridLayout))
+
+        assert next(child for child in label.children if isinstance(child, GridLayout)) is grid
+        assert grid.cols_minimum == pytest.approx(fresh.cols_minimum)
+
+    def test_resize_reuses_measurement(self, cache):
+        """Width changes distribute cached extents without measuring again."""
+        label = make_label(TABLE, table_mode='canvas', table_column_sizing='content')
+        misses = cache.misses
+
+        label.width = 600
+        for _ in range(3):
+            Clock.tick()
+
+        assert cache.misses == misses
@@ -0,0 +1,160 @@
+"""
+Tests for the compact slotted AST representation.
+
+This module verifies that compact nodes round-trip to mistune's token dicts,
+expose the read API of token dicts, use less memory, and that MarkdownLabel
+renders, serializes and reconciles compact ASTs exactly like dict ASTs.
+"""
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from kivy_garden.markdownlabel import MarkdownLabel
+from kivy_garden.markdownlabel.ast_cache import estimate_size, make_cache_key
+from kivy_garden.markdownlabel.compact_ast import Node, compact, to_dicts
+from kivy_garden.markdownlabel.markdown_serializer import MarkdownSerializer
+from kivy_garden.markdownlabel.parser_registry import DEFAULT_PLUGINS, create_parser
+from .test_utils import find_labels_recursive
+
+
+MARKDOWN_BLOCKS = [
+    '# Heading with *emphasis*',
+    'Paragraph with **bold**, `code`, ~~strike~~ and a [link](http://example.com "t").',
+    '- one\n- two\n  - nested',
+    '1. first\n2. second',
+    '> quoted **text**',
+    '```python\nprint("hi")\n```',
+    '| a | b |\n|:--|--:|\n| 1 | 2 |',
+    '![alt](http://example.com/img.png)',
+    '***',
+    'line one  \nline two',
+    '<div>html</div>',
+]
+
+DOCUMENT = '\n\n'.join(MARKDOWN_BLOCKS)
+
+
+class TestCompactRoundTrip:
+    """Tests that compact nodes preserve the token tree."""
+
+    @pytest.mark.property
+    @given(st.lists(st.sampled_from(MARKDOWN_BLOCKS), min_size=1, max_size=8))
+    # Complex strategy: 50 examples (adequate coverage)
+    @settings(max_examples=50, deadline=None)
+    def test_to_dicts_restores_mistune_tokens(self, blocks):
+        """Converting to nodes and back yields the original tokens."""
+        tokens = create_parser().parse('\n\n'.join(blocks))[0]
+
+        assert to_dicts(compact(tokens)) == tokens
+
+    def test_compact_uses_less_memory(self):
+        """Compact nodes are smaller than the token dicts they replace."""
+        tokens = create_parser().parse(DOCUMENT * 10)[0]
+
+        assert estimate_size(compact(tokens)) < estimate_size(tokens) / 2
+
+    def test_equal_attrs_are_shared(self):
+        """Identical attribute dicts are stored once."""
+        nodes = compact(create_parser().parse('- a\n\n---\n\n- b')[0])
+
+        assert nodes[0].attrs is nodes[-1].attrs
+        assert nodes[0].extra is nodes[-1].extra
+
+
+class TestNodeMappingAPI:
+    """Tests for the dict-like read API of Node."""
+
+    def test_get_and_getitem(self):
+        """Present fields are returned; absent ones use defaults or raise."""
+        node = compact(create_parser().parse('# Title')[0])[0]
+
+        assert node.get('type') == node['type'] == 'heading'
+        assert node.get('attrs')['level'] == 1
+        assert node['style'] == 'atx'
+        assert node.get('raw') is None
+        assert node.get('raw', '') == ''
+        with pytest.raises(KeyError):
+            node['raw']
+
+    def test_contains_and_keys(self):
+        """Membership and keys reflect the original token's keys."""
+        token = create_parser().parse('```py\nx\n```')[0][0]
+        node = compact([token])[0]
+
+        assert sorted(node.keys()) == sorted(token.keys())
+        assert 'marker' in node
+        assert 'children' not in node
+
+    def test_to_dict_returns_independent_copy(self):
+        """Mutating a converted dict leaves the node unchanged."""
+        node = Node('heading', children=(Node('text', raw='x'),), attrs={'level': 2})
+        token = node.to_dict()
+        token['attrs']['level'] = 3
+        token['children'].append({'type': 'text', 'raw': 'y'})
+
+        assert node.attrs['level'] == 2
+        assert len(node.children) == 1
+
+
+class TestCompactConsumers:
+    """Tests that renderers and the serializer consume nodes natively."""
+
+    def test_serializer_output_matches(self):
+        """MarkdownSerializer produces the same Markdown for both forms."""
+        tokens = create_parser().parse(DOCUMENT)[0]
+        serializer = MarkdownSerializer()
+
+        assert serializer.serialize(compact(tokens)) == serializer.serialize(tokens)
+
+    def test_label_renders_identically(self):
+        """Labels with and without compact_ast build the same labels."""
+        compact_label = MarkdownLabel(text=DOCUMENT, compact_ast=True)
+        reference = MarkdownLabel(text=DOCUMENT)
+
+        assert isinstance(compact_label._ast_tokens[0], Node)
+        assert ([lbl.text for lbl in find_labels_recursive(compact_label)]
+                == [lbl.text for lbl in find_labels_recursive(reference)])
+        assert compact_label.to_markdown() == reference.to_markdown()
+
+    def test_get_ast_returns_dicts(self):
+        """get_ast() converts compact nodes to token dicts on demand."""
+        label = MarkdownLabel(text=DOCUMENT, compact_ast=True)
+
+        assert label.get_ast() == MarkdownLabel(text=DOCUMENT).get_ast()
+        assert all(isinstance(token, dict) for token in label.get_ast())
+
+    def test_degenerate_input_normalizes_to_node(self):
+        """A lone list marker is normalized to a paragraph node."""
+        label = MarkdownLabel(text='-', compact_ast=True)
+
+        assert isinstance(label._ast_tokens[0], Node)
+        assert label.get_ast() == [{'type': 'paragraph', 'children': [{'type': 'text', 'raw': '-'}]}]
+
+    def test_texture_mode_decision_matches(self):
+        """auto render mode picks the same effective mode for both forms."""
+        compact_label = MarkdownLabel(text=DOCUMENT * 8, compact_ast=True, render_mode='auto')
+        reference = MarkdownLabel(text=DOCUMENT * 8, render_mode='auto')
+
+        assert compact_label._get_effective_render_mode() == reference._get_effective_render_mode()
+
+    def test_text_edit_reuses_unchanged_block_widgets(self):
+        """Block reconciliation matches compact nodes by content."""
+        label = MarkdownLabel(text='# Title\n\nBody', compact_ast=True)
+        heading = list(reversed(label.children))[0]
+
+        label.text = '# Title\n\nBody, edited'
+        label.force_rebuild()
+
+        assert list(reversed(label.children))[0] is heading
+
+    def test_cache_keeps_forms_separate(self):
+        """Compact and dict entries of one text are cached under different keys."""
+        assert (make_cache_key(DOCUMENT, DEFAULT_PLUGINS, compact=True)
+                != make_cache_key(DOCUMENT, DEFAULT_PLUGINS))
+
+    def test_incremental_parse_keeps_dicts(self):
+        """Incremental parsing ignores compact_ast and keeps mistune dicts."""
+        label = MarkdownLabel(text=DOCUMENT, compact_ast=True, incremental_parse=True)
+
+        assert isinstance(label._ast_tokens[0], dict)
@@ -12,6 +12,7 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 
 from kivy_garden.markdownlabel import MarkdownLabel
+from kivy_garden.markdownlabel.list_layout import ListLayout
 from .test_utils import (
     markdown_heading,
     markdown_paragraph,
@@ -119,7 +120,7 @@ class TestMarkdownToWidgetTreeGeneration:
     def test_non_degenerate_markers_keep_structural_rendering(self):
         """Markers with content should render as structural widgets."""
         list_label = MarkdownLabel(text='- item')
-        assert any(isinstance(child, BoxLayout) for child in list_label.children), \
+        assert any(isinstance(child, ListLayout) for child in list_label.children), \
             "Expected a list container for '- item'"
 
         quote_label = MarkdownLabel(text='> quote')
@@ -0,0 +1,145 @@
+"""
+Tests for per-parse document statistics.
+
+This module verifies that DocumentStats counts tokens, depth and token types
+like a full tree walk, that MarkdownLabel computes the statistics once per
+parse (reusing them for unchanged blocks), and that render-mode decisions
+read the stored statistics instead of walking the AST.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from kivy_garden.markdownlabel import MarkdownLabel
+from kivy_garden.markdownlabel import document_stats
+from kivy_garden.markdownlabel.compact_ast import compact
+from kivy_garden.markdownlabel.document_stats import (
+    EMPTY_STATS, compute_block_stats, compute_stats, merge_stats
+)
+from kivy_garden.markdownlabel.parser_registry import create_parser
+
+
+MARKDOWN_BLOCKS = [
+    '# Heading with *emphasis*',
+    'Paragraph with **bold** and `code`.',
+    '- one\n- two\n  - nested',
+    '> quoted **text**',
+    '```python\nprint("hi")\n```',
+    '| a | b |\n|---|---|\n| 1 | 2 |',
+    '***',
+]
+
+
+def _walk(tokens):
+    """Reference statistics from a recursive walk."""
+    counts = {}
+    total = 0
+    deepest = 0
+
+    def visit(token, depth):
+        nonlocal total, deepest
+        total += 1
+        deepest = max(deepest, depth)
+        counts[token['type']] = counts.get(token['type'], 0) + 1
+        for child in token.get('children') or []:
+            visit(child, depth + 1)
+
+    for token in tokens:
+        visit(token, 1)
+    return total, deepest, counts
+
+
+class TestComputeStats:
+    """Tests for compute_stats() and merge_stats()."""
+
+    @pytest.mark.property
+    @given(st.lists(st.sampled_from(MARKDOWN_BLOCKS), min_size=0, max_size=8))
+    # Complex strategy: 50 examples (adequate coverage)
+    @settings(max_examples=50, deadline=None)
+    def test_matches_full_walk(self, blocks):
+        """Counts, depth and type counts match a recursive walk."""
+        tokens = create_parser().parse('\n\n'.join(blocks))[0]
+        stats = compute_stats(tokens)
+
+        assert (stats.token_count, stats.max_depth, dict(stats.type_counts)) == _walk(tokens)
+
+    def test_compact_nodes_give_same_stats(self):
+        """Compact nodes and token dicts produce identical statistics."""
+        tokens = create_parser().parse('\n\n'.join(MARKDOWN_BLOCKS))[0]
+
+        assert compute_stats(compact(tokens)) == compute_stats(tokens)
+
+    def test_flags(self):
+        """has_table, has_list and has_block_code reflect the content."""
+        stats = compute_stats(create_parser().parse('\n\n'.join(MARKDOWN_BLOCKS))[0])
+        plain = compute_stats(create_parser().parse('Just text')[0])
+
+        assert stats.has_table and stats.has_list and stats.has_block_code
+        assert not (plain.has_table or plain.has_list or plain.has_block_code)
+
+    def test_merge_of_blocks_equals_document(self):
+        """Merged per-block statistics equal whole-document statistics."""
+        tokens = create_parser().parse('\n\n'.join(MARKDOWN_BLOCKS))[0]
+
+        assert merge_stats(compute_block_stats(t) for t in tokens) == compute_stats(tokens)
+
+    def test_complexity_score(self):
+        """The score adds construct weights and a depth penalty to the token count."""
+        stats = document_stats.DocumentStats(10, 8, {'table': 1, 'list': 1, 'block_code': 1})
+
+        assert stats.complexity_score == 10 + 80 + 40 + 50 + 20
+        assert EMPTY_STATS.complexity_score == 0
+
+
+class TestLabelStats:
+    """Tests for the statistics MarkdownLabel keeps next to its AST."""
+
+    def test_stats_describe_current_ast(self):
+        """_ast_stats matches the statistics of _ast_tokens after a build."""
+        label = MarkdownLabel(text='\n\n'.join(MARKDOWN_BLOCKS))
+
+        assert label._ast_stats == compute_stats(label._ast_tokens)
+
+        label.text = 'Short'
+        label.force_rebuild()
+
+        assert label._ast_stats == compute_stats(label._ast_tokens)
+
+    def test_render_mode_decision_does_not_walk_ast(self):
+        """Repeated auto-mode decisions reuse the parse-time statistics."""
+        label = MarkdownLabel(text='\n\n'.join(MARKDOWN_BLOCKS * 10), render_mode='auto')
+        mode = label._get_effective_render_mode()
+
+        with patch.object(document_stats, 'compute_block_stats',
+                          side_effect=AssertionError('AST walked')):
+            for _ in range(5):
+                assert label._get_effective_render_mode() == mode
+
+    def test_replaced_tokens_are_recounted(self):
+        """Assigning _ast_tokens directly still yields matching statistics."""
+        label = MarkdownLabel(text='Short')
+        tokens = create_parser().parse('\n\n'.join(MARKDOWN_BLOCKS))[0]
+        label._ast_tokens = tokens
+
+        assert label._get_document_stats() == compute_stats(tokens)
+
+    def test_append_walks_only_new_blocks(self):
+        """Streamed appends reuse the statistics of unchanged blocks."""
+        label = MarkdownLabel(text='# Title\n\nFirst paragraph.\n\n')
+        label.append_text('Second paragraph.\n\n')
+
+        calls = []
+        original = document_stats.compute_block_stats
+
+        def counting(token):
+            calls.append(token)
+            return original(token)
+
+        with patch('kivy_garden.markdownlabel.compute_block_stats', side_effect=counting):
+            label.append_text('Third paragraph.')
+
+        assert len(calls) < len(label._ast_tokens)
+        assert label._ast_stats == compute_stats(label._ast_tokens)
@@ -0,0 +1,143 @@
+"""
+Tests for the hybrid render mode.
+
+This module verifies that ``render_mode='hybrid'`` wraps tables, code blocks
+and long lists in BlockTextures chosen by their complexity score while
+paragraphs, headings and images stay widgets, that block textures have the
+height of the live block, dispatch ``on_ref_press`` for their links, and are
+recaptured after in-place style updates.
+"""
+
+from kivy.clock import Clock
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.label import Label
+from kivy.uix.widget import Widget
+
+from kivy_garden.markdownlabel import MarkdownLabel
+from kivy_garden.markdownlabel.block_texture import BlockTexture
+from kivy_garden.markdownlabel.document_stats import compute_block_stats
+
+from .test_utils import find_images, ref_center, FakeTouch, make_label
+
+TABLE = '| A | B |\n| --- | --- |\n| [link](http://example.com) | 2 |\n'
+LONG_LIST = '\n'.join(f'- item {i}' for i in range(30)) + '\n'
+SHORT_LIST = '- one\n- two\n'
+NESTED_LIST = ('- item\n  - nested [link](http://list.example)\n'
+               + LONG_LIST + '\nText below.\n')
+DOCUMENT = '# Title\n\nSome text.\n\n' + TABLE + '\n```\nprint(1)\n```\n\n' + LONG_LIST
+
+
+def _block_textures(label):
+    """Return the BlockTextures among the label's blocks."""
+    return [child for child in label.children if isinstance(child, BlockTexture)]
+
+
+class TestHybridBlockSelection:
+    """Tests for the blocks captured into textures."""
+
+    def test_heavy_blocks_are_textures(self):
+        """Table, code block and long list are BlockTextures, the rest widgets."""
+        label = make_label(DOCUMENT, render_mode='hybrid')
+        children = list(reversed(label.children))
+        # Plain Widgets are the blank-line spacers between blocks.
+        blocks = [type(child) for child in children if type(child) is not Widget]
+
+        assert blocks == [Label, Label, BlockTexture, BlockTexture, BlockTexture]
+        assert not any(isinstance(child, GridLayout) for child in children)
+
+    def test_short_list_stays_widgets(self):
+        """Lists below the list threshold keep their widgets."""
+        stats = compute_block_stats(MarkdownLabel(text=SHORT_LIST).get_ast()[0])
+        label = make_label(SHORT_LIST, render_mode='hybrid')
+
+        assert stats.complexity_score < 120
+        assert not _block_textures(label)
+
+    def test_virtual_tables_stay_widgets(self):
+        """Tables that already rasterize visible rows only are not captured."""
+        label = make_label(TABLE, render_mode='hybrid', table_mode='virtual')
+
+        assert not _block_textures(label)
+
+    def test_widget_mode_unchanged(self):
+        """Widget mode never creates BlockTextures."""
+        label = make_label(DOCUMENT)
+
+        assert not _block_textures(label)
+
+
+class TestBlockTextureCapture:
+    """Tests for captured block textures."""
+
+    def test_height_matches_widget_block(self):
+        """A captured table is as tall as the same table rendered as widgets."""
+        hybrid = make_label(TABLE, render_mode='hybrid')
+        widgets = make_label(TABLE)
+        block_texture = _block_textures(hybrid)[0]
+
+        assert not block_texture.live
+        assert block_texture.height == widgets.children[0].height
+        assert block_texture._rect.texture is not None
+
+    def test_links_dispatch_ref_press(self):
+        """Touches on a link zone in a block texture reach on_ref_press."""
+        label = make_label(TABLE, render_mode='hybrid')
+        block_texture = _block_textures(label)[0]
+        pressed = []
+        label.bind(on_ref_press=lambda instance, ref: pressed.append(ref))
+
+        zone_x, zone_y, zone_w, zone_h = block_texture.ref_zones['http://example.com'][0]
+        assert block_texture.on_touch_down(
+            FakeTouch(block_texture.x + zone_x + 1, block_texture.y + zone_y + 1))
+
+        assert pressed == ['http://example.com']
+        assert 'http://example.com' in label.refs
+
+    def test_nested_list_links_dispatch_ref_press(self):
+        """Links in nested lists are hit where the captured block draws them."""
+        label = make_label(NESTED_LIST, render_mode='hybrid')
+        block_texture = _block_textures(label)[0]
+        block = block_texture.block
+        pressed = []
+        label.bind(on_ref_press=lambda instance, ref: pressed.append(ref))
+
+        center_x, center_y = ref_center(block, 'http://list.example')
+        assert block_texture.on_touch_down(FakeTouch(block_texture.x + center_x - block.x,
+                                                     block_texture.y + center_y - block.y))
+
+        assert pressed == ['http://list.example']
+
+    def test_images_stay_widgets(self):
+        """Hybrid mode keeps documents with images, unlike texture mode."""
+        label = make_label('![alt](missing.png)\n\n' + TABLE, render_mode='hybrid')
+
+        assert len(_block_textures(label)) == 1
+        assert find_images(label)
+
+
+class TestHybridStyleUpdates:
+    """Tests for in-place updates of block textures."""
+
+    def test_font_size_update_recaptures(self):
+        """base_font_size changes reach the wrapped block and its texture."""
+        label = make_label(TABLE, render_mode='hybrid')
+        block_texture = _block_textures(label)[0]
+        old_height = block_texture.height
+
+        label.base_font_size = 30
+        for _ in range(3):
+            Clock.tick()
+
+        assert _block_textures(label)[0] is block_texture
+        assert block_texture.height > old_height
+
+    def test_color_update_reaches_block(self):
+        """Color changes are applied to the Labels of the wrapped block."""
+        label = make_label(TABLE, render_mode='hybrid')
+        block_texture = _block_textures(label)[0]
+
+        label.color = [1, 0, 0, 1]
+
+        cells = [child for child in block_texture.block.children if isinstance(child, Label)]
+        assert cells
+        assert all(list(cell.color) == [1, 0, 0, 1] for cell in cells)
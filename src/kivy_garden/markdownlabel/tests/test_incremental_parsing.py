@@ -0,0 +1,250 @@
+"""
+Tests for incremental block-level re-parsing.
+
+This module verifies that IncrementalParser produces exactly the tokens of a
+full mistune parse after arbitrary edits, that only the blocks touched by an
+edit are re-parsed, and that MarkdownLabel's ``incremental_parse`` option
+renders the same AST as the default full parse.
+"""
+
+import pytest
+import mistune
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from mistune.plugins.formatting import strikethrough
+from mistune.plugins.table import table
+
+from kivy_garden.markdownlabel import IncrementalParser, MarkdownLabel
+from kivy_garden.markdownlabel.incremental_parser import iter_block_boundaries
+
+
+# Line fragments covering every block rule that can span blank lines or
+# interrupt a list: fences, HTML blocks, lists, quotes, tables, link
+# reference definitions and lazy continuation lines.
+MARKDOWN_LINE_FRAGMENTS = [
+    '', '', '', 'plain text', 'foo **bold** ~~gone~~', '# Heading', '---', '***', '===',
+    '- item', '* item', '1. one', '2) two', '   - nested', '  indented', '    code',
+    '```', '```python', '~~~', '````', '  ```', '- ```', '```a`b', '\\```',
+    '> quote', '>', '<!--', '-->', '<pre>', '</pre>', '<div>', '</div>', '<?x', '?>',
+    '<![CDATA[', ']]>', '<span>x</span>', '| a | b |', '|---|---|', 'a | b', '--- | ---',
+    '[ref]: /url', "[ref]: /u 'multi", "line'", 'see [link][ref]', '[x', 'y]: /url', 'y]',
+    '\t ', '    \t', '.`', '`',
+]
+
+st_markdown_lines = st.lists(st.sampled_from(MARKDOWN_LINE_FRAGMENTS), min_size=1, max_size=20)
+
+
+def _create_parser():
+    """Create a mistune parser configured like MarkdownLabel's."""
+    parser = mistune.create_markdown(renderer=None)
+    table(parser)
+    strikethrough(parser)
+    return parser
+
+
+def _full_parse(text):
+    """Return the tokens of a fresh, non-incremental parse."""
+    return _create_parser().parse(text)[0]
+
+
+def _apply_edit(lines, edit):
+    """Apply an (operation, index, fragment) edit to a list of lines."""
+    operation, index, fragment = edit
+    lines = list(lines)
+    index = min(index, len(lines))
+    if operation == 'insert' or not lines:
+        lines.insert(index, fragment)
+    elif operation == 'delete':
+        del lines[min(index, len(lines) - 1)]
+    else:
+        lines[min(index, len(lines) - 1)] = fragment
+    return lines
+
+
+st_edit = st.tuples(
+    st.sampled_from(['insert', 'delete', 'replace']),
+    st.integers(min_value=0, max_value=20),
+    st.sampled_from(MARKDOWN_LINE_FRAGMENTS),
+)
+
+
+class TestIncrementalParseEquivalence:
+    """Differential tests: incremental parsing equals a full parse."""
+
+    @pytest.mark.property
+    @given(st_markdown_lines)
+    # Complex strategy: 100 examples (adequate coverage)
+    @settings(max_examples=100, deadline=None)
+    def test_segmented_parse_matches_full_parse(self, lines):
+        """Parsing a document segment by segment matches a full parse."""
+        text = '\n'.join(lines)
+        parser = IncrementalParser(_create_parser())
+
+        assert parser.parse(text) == _full_parse(text)
+        assert parser.last_mode == 'full'
+
+    @pytest.mark.property
+    @given(st_markdown_lines, st.lists(st_edit, min_size=1, max_size=4))
+    # Complex strategy: 100 examples (adequate coverage)
+    @settings(max_examples=100, deadline=None)
+    def test_edit_sequence_matches_full_parse(self, lines, edits):
+        """Every parse in a sequence of edits matches a full parse."""
+        parser = IncrementalParser(_create_parser())
+        parser.parse('\n'.join(lines))
+
+        for edit in edits:
+            lines = _apply_edit(lines, edit)
+            text = '\n'.join(lines)
+            assert parser.parse(text) == _full_parse(text), (
+                f"Incremental parse diverged ({parser.last_mode}) for {text!r}"
+            )
+
+    @pytest.mark.property
+    @given(st_markdown_lines, st.text(alphabet='ab `*|\n', min_size=1, max_size=5))
+    # Complex strategy: 50 examples (adequate coverage)
+    @settings(max_examples=50, deadline=None)
+    def test_appended_text_matches_full_parse(self, lines, suffix):
+        """Appending characters to a document matches a full parse."""
+        text = '\n'.join(lines)
+        parser = IncrementalParser(_create_parser())
+        parser.parse(text)
+
+        assert parser.parse(text + suffix) == _full_parse(text + suffix)
+
+    @pytest.mark.parametrize('text', [
+        '[x\n\ny]: /url\n\n[x\n\ny]\n',
+        '.`\n\t \n`\n',
+    ], ids=['ref_label_spanning_blank_line', 'tab_whitespace_line'])
+    def test_known_divergences_match_full_parse(self, text):
+        """Documents once split at a line mistune does not end a block at."""
+        parser = IncrementalParser(_create_parser())
+
+        assert parser.parse(text) == _full_parse(text)
+        assert parser.last_mode == 'full'
+
+
+class TestIncrementalParseScope:
+    """Tests that edits only re-parse the affected blocks."""
+
+    def _document(self, count=20):
+        return '\n\n'.join(f'Paragraph number {i} with *emphasis*.' for i in range(count))
+
+    def test_edit_reparses_only_affected_block(self):
+        """Editing one paragraph re-parses only that paragraph's segment."""
+        text = self._document()
+        parser = IncrementalParser(_create_parser())
+        parser.parse(text)
+        assert parser.segment_count == 20
+
+        edited = text.replace('number 10', 'number ten')
+        tokens = parser.parse(edited)
+
+        assert parser.last_mode == 'incremental'
+        start, end = parser.last_reparsed_span
+        assert edited.index('Paragraph number 9') <= start
+        assert end <= edited.index('Paragraph number 12')
+        assert tokens == _full_parse(edited)
+
+    def test_unchanged_text_is_not_reparsed(self):
+        """Parsing the same text twice reuses the cached tokens."""
+        parser = IncrementalParser(_create_parser())
+        first = parser.parse('# Title\n\nBody')
+        second = parser.parse('# Title\n\nBody')
+
+        assert parser.last_mode == 'unchanged'
+        assert first == second
+
+    def test_unchanged_blocks_keep_token_identity(self):
+        """Tokens of blocks outside the edit are reused, not rebuilt."""
+        text = self._document(5)
+        parser = IncrementalParser(_create_parser())
+        before = parser.parse(text)
+
+        after = parser.parse(text.replace('number 4', 'number four'))
+
+        assert after[0] is before[0]
+        assert after[-1] is not before[-1]
+
+    def test_opening_fence_reparses_rest_of_document(self):
+        """Opening an unclosed fence re-parses everything after it."""
+        text = self._document(5)
+        parser = IncrementalParser(_create_parser())
+        parser.parse(text)
+
+        edited = text.replace('Paragraph number 2', '```\nParagraph number 2')
+        tokens = parser.parse(edited)
+
+        assert parser.last_reparsed_span[1] == len(edited) + 1
+        assert tokens == _full_parse(edited)
+        assert tokens[-1]['type'] == 'block_code'
+
+    def test_reference_definition_edit_falls_back_to_full_parse(self):
+        """Editing a link reference definition triggers a full parse."""
+        text = 'See [docs][d].\n\nMiddle paragraph.\n\n[d]: http://a.example'
+        parser = IncrementalParser(_create_parser())
+        parser.parse(text)
+
+        edited = text.replace('http://a.example', 'http://b.example')
+        tokens = parser.parse(edited)
+
+        assert parser.last_mode == 'full'
+        assert tokens == _full_parse(edited)
+        assert tokens[0]['children'][1]['attrs']['url'] == 'http://b.example'
+
+    def test_reference_links_resolve_across_segments(self):
+        """Links in re-parsed blocks resolve definitions from other blocks."""
+        text = 'See [docs][d].\n\nMiddle paragraph.\n\n[d]: http://a.example'
+        parser = IncrementalParser(_create_parser())
+        parser.parse(text)
+
+        edited = text.replace('See [docs][d].', 'Read [docs][d] now.')
+        tokens = parser.parse(edited)
+
+        assert parser.last_mode == 'incremental'
+        assert tokens == _full_parse(edited)
+
+    def test_loose_list_items_are_not_boundaries(self):
+        """Loose list items stay in the same segment as their list."""
+        text = 'Before\n\n- one\n\n- two\n\nAfter\n'
+
+        assert list(iter_block_boundaries(text)) == [text.index('- one'), text.index('After')]
+
+
+class TestMarkdownLabelIncrementalParse:
+    """Tests for the MarkdownLabel ``incremental_parse`` option."""
+
+    def test_incremental_parse_default_is_false(self):
+        """incremental_parse is disabled by default."""
+        assert MarkdownLabel().incremental_parse is False
+
+    @pytest.mark.property
+    @given(st_markdown_lines, st_edit)
+    # Complex strategy: 20 examples (adequate coverage)
+    @settings(max_examples=20, deadline=None)
+    def test_incremental_parse_ast_matches_full_parse(self, lines, edit):
+        """Labels with and without incremental_parse produce the same AST."""
+        incremental = MarkdownLabel(text='\n'.join(lines), incremental_parse=True)
+        edited = '\n'.join(_apply_edit(lines, edit))
+        incremental.text = edited
+        incremental.force_rebuild()
+
+        reference = MarkdownLabel(text=edited)
+
+        assert incremental.get_ast() == reference.get_ast()
+
+    def test_text_change_uses_incremental_parser(self):
+        """Text changes after the first build are parsed incrementally."""
+        label = MarkdownLabel(text='# Title\n\nFirst\n\nSecond', incremental_parse=True)
+        label.text = '# Title\n\nFirst\n\nSecond, edited'
+        label.force_rebuild()
+
+        assert label._incremental_parser.last_mode == 'incremental'
+
+    def test_disabling_incremental_parse_drops_cached_state(self):
+        """Turning incremental_parse off discards the incremental parser."""
+        label = MarkdownLabel(text='# Title', incremental_parse=True)
+        assert label._incremental_parser is not None
+
+        label.incremental_parse = False
+
+        assert label._incremental_parser is None
@@ -10,6 +10,7 @@ from hypothesis import given, strategies as st, settings
 
 from kivy_garden.markdownlabel import font_fallback
 from kivy_garden.markdownlabel.inline_renderer import InlineRenderer, escape_kivy_markup
+from kivy_garden.markdownlabel.parser_registry import create_parser
 
 
 # Custom strategies for generating valid inline tokens
@@ -751,3 +752,26 @@ class TestInlineRendererEdgeCases:
         assert renderer._escape_markup('[b]') == '&bl;b&br;'
         # Test nothing to escape
         assert renderer._escape_markup('plain') == 'plain'
+
+
+class TestInlinePrerender:
+    """Tests for InlineRenderer.prerender()."""
+
+    def test_prerender_covers_nested_blocks(self):
+        """Markup is produced for paragraphs, list items, quotes and table cells."""
+        tokens = create_parser().parse(
+            '# **Title**\n\n- item *one*\n\n> quoted\n\n| a | b |\n|---|---|\n| 1 | `2` |'
+        )[0]
+        renderer = InlineRenderer()
+
+        markup = renderer.prerender(tokens)
+
+        assert markup[id(tokens[0]['children'])] == '[b]Title[/b]'
+        assert sorted(markup.values()) == sorted([
+            '[b]Title[/b]', 'item [i]one[/i]', 'quoted', 'a', 'b', '1',
+            renderer.render([{'type': 'codespan', 'raw': '2'}]),
+        ])
+
+    def test_prerender_empty_document(self):
+        """An empty token list yields no markup."""
+        assert InlineRenderer().prerender([]) == {}
@@ -17,6 +17,8 @@ from kivy.uix.image import AsyncImage
 from kivy.graphics import Rectangle, Line
 
 from kivy_garden.markdownlabel.kivy_renderer import KivyRenderer
+from kivy_garden.markdownlabel.list_layout import ListLayout
+from kivy_garden.markdownlabel.list_marker import ListMarker
 from .test_utils import (
     heading_token,
     paragraph_token,
@@ -155,8 +157,8 @@ class TestParagraphMarkupEnabled:
 
 
 # *For any* Markdown list (ordered or unordered), the rendered widget tree SHALL
-# contain a BoxLayout with one child BoxLayout per list item, and each item
-# SHALL be prefixed with the appropriate marker (bullet or number).
+# contain a ListLayout with one item per list item, and each item SHALL be
+# prefixed with the appropriate marker (bullet or number).
 
 
 class TestListStructurePreservation:
@@ -166,24 +168,24 @@ class TestListStructurePreservation:
     @given(list_token())
     # Complex strategy: 20 examples (adequate coverage)
     @settings(max_examples=20, deadline=None)
-    def test_list_returns_boxlayout(self, token):
-        """List tokens produce BoxLayout widgets."""
+    def test_list_returns_list_layout(self, token):
+        """List tokens produce ListLayout widgets."""
         renderer = KivyRenderer()
         widget = renderer.list(token, None)
 
-        assert isinstance(widget, BoxLayout), f"Expected BoxLayout, got {type(widget)}"
+        assert isinstance(widget, ListLayout), f"Expected ListLayout, got {type(widget)}"
 
     @pytest.mark.property
     @given(list_token())
     # Complex strategy: 20 examples (adequate coverage)
     @settings(max_examples=20, deadline=None)
     def test_list_has_correct_item_count(self, token):
-        """List has one child per list item."""
+        """List has one item per list item."""
         renderer = KivyRenderer()
         widget = renderer.list(token, None)
 
         expected_count = len(token['children'])
-        actual_count = len(widget.children)
+        actual_count = len(widget.items)
 
         assert actual_count == expected_count, \
             f"Expected {expected_count} children, got {actual_count}"
@@ -197,13 +199,9 @@ class TestListStructurePreservation:
         renderer = KivyRenderer()
         widget = renderer.list(token, None)
 
-        # Each child should be a horizontal BoxLayout with a marker Label
-        for child in widget.children:
-            assert isinstance(child, BoxLayout), "List item should be BoxLayout"
-            # First child of item layout should be the marker
-            # Note: Kivy children are in reverse order (last added is first)
-            marker = child.children[-1]  # Last in list = first added = marker
-            assert isinstance(marker, Label), "Marker should be Label"
+        # Each item starts with a ListMarker
+        for marker, blocks in widget.items:
+            assert isinstance(marker, ListMarker), "Marker should be ListMarker"
             assert '•' in marker.text, f"Unordered list marker should contain bullet, got: {marker.text}"
 
     @pytest.mark.property
@@ -215,18 +213,11 @@ class TestListStructurePreservation:
         renderer = KivyRenderer()
         widget = renderer.list(token, None)
 
-        num_items = len(token['children'])
-
-        # Each child should be a horizontal BoxLayout with a marker Label
-        # Note: Kivy children are in reverse order (last added is first in list)
-        for i, child in enumerate(widget.children):
-            assert isinstance(child, BoxLayout), "List item should be BoxLayout"
-            # First child of item layout should be the marker
-            marker = child.children[-1]  # Last in list = first added = marker
-            assert isinstance(marker, Label), "Marker should be Label"
+        # Each item starts with a ListMarker numbered in document order
+        for i, (marker, blocks) in enumerate(widget.items):
+            assert isinstance(marker, ListMarker), "Marker should be ListMarker"
             # Marker should contain a number followed by period
-            # Account for reverse order: item at index i corresponds to item (num_items - i)
-            expected_num = str(num_items - i)
+            expected_num = str(i + 1)
             assert expected_num in marker.text and '.' in marker.text, \
                 f"Ordered list marker should contain '{expected_num}.', got: {marker.text}"
 
@@ -279,7 +270,7 @@ class TestNestedListIndentation:
 
         for i in range(depth):
             # 1. Verify this is a List with padding proportional to depth
-            assert isinstance(current_list, BoxLayout), f"Level {i+1}: Expected BoxLayout"
+            assert isinstance(current_list, ListLayout), f"Level {i+1}: Expected ListLayout"
             # Lists in KivyRenderer get left padding = (list_depth * 20)
             expected_level_padding = (i + 1) * 20
             assert current_list.padding[0] == expected_level_padding, \
@@ -287,28 +278,14 @@ class TestNestedListIndentation:
 
             if i < depth - 1:
                 # Traverse to next nested list
-                # Current List -> [ListItem] (since we generate 1 item)
-                assert len(current_list.children) >= 1, f"Level {i+1}: List should have items"
-
-                # Find the ListItem (it's a horizontal BoxLayout containing marker and content)
-                # Kivy children are in reverse order of addition
-                list_item = current_list.children[0]
-                assert isinstance(list_item, BoxLayout), f"Level {i+1}: Expected ListItem BoxLayout"
-
-                # Find the 'content' vertical BoxLayout within the ListItem
-                content_container = None
-                for child in list_item.children:
-                    # The content container is a vertical BoxLayout (no padding, size_hint_y=None)
-                    if isinstance(child, BoxLayout) and child.orientation == 'vertical':
-                        content_container = child
-                        break
-                assert content_container is not None, \
-                    f"Level {i+1}: Could not find content container in ListItem"
+                # Current List -> [item] (since we generate 1 item)
+                assert len(current_list.items) >= 1, f"Level {i+1}: List should have items"
 
-                # Find the Nested List (BoxLayout with padding > 0) within the content container
+                # Find the nested ListLayout among the blocks of the item
+                marker, blocks = current_list.items[0]
                 next_list = None
-                for child in content_container.children:
-                    if isinstance(child, BoxLayout) and hasattr(child, 'padding') and child.padding[0] > 0:
+                for child in blocks:
+                    if isinstance(child, ListLayout):
                         next_list = child
                         break
 
@@ -735,11 +712,9 @@ class TestKivyRendererEdgeCases:
 
         with patch.object(renderer, 'list') as mock_list:
             mock_list.return_value = BoxLayout()
-            container = (
-                BoxLayout() if not hasattr(renderer, '_render_list_item')
-                else renderer._render_list_item(token, False, 0)
-            )
+            marker, blocks = renderer._render_list_item(token, False, 0)
             assert mock_list.called
+            assert blocks == [mock_list.return_value]
 
     def test_image_on_texture_callback(self, renderer):
         """Default image mode does not upscale images beyond native texture width."""
@@ -0,0 +1,99 @@
+"""
+Tests for the flat ListLayout used for Markdown lists.
+
+This module verifies that lists render as one ListLayout holding the markers
+and body blocks of their items, that markers and blocks are positioned in
+columns with markers as tall as their items, and that nested and
+right-aligned lists are laid out correctly.
+"""
+
+from kivy.clock import Clock
+from kivy.uix.label import Label
+
+from kivy_garden.markdownlabel import MarkdownLabel
+from kivy_garden.markdownlabel.list_layout import ListLayout, is_list_marker
+
+
+def _settle(frames=10):
+    """Run frames so labels render and layouts settle."""
+    for _ in range(frames):
+        Clock.tick()
+
+
+def _make_label(text, **kwargs):
+    """Create a 300px wide label and let it lay out."""
+    label = MarkdownLabel(text=text, size=(300, 600), size_hint=(None, None), **kwargs)
+    _settle()
+    return label
+
+
+def _count_widgets(widget):
+    """Count ``widget`` and all of its descendants."""
+    return 1 + sum(_count_widgets(child) for child in widget.children)
+
+
+class TestListStructure:
+    """Tests for the flat widget structure of lists."""
+
+    def test_items_are_direct_children(self):
+        """Each item adds only its marker and its blocks."""
+        label = _make_label('\n'.join(f'- item {i}' for i in range(50)))
+        layout = label.children[0]
+
+        assert isinstance(layout, ListLayout)
+        assert _count_widgets(layout) == 1 + 50 * 2
+        assert len(layout.items) == 50
+        assert all(is_list_marker(marker) for marker, blocks in layout.items)
+
+    def test_item_blocks_keep_document_order(self):
+        """Blocks of an item follow its marker in document order."""
+        label = _make_label('1. first\n\n   second paragraph\n2. other')
+        layout = label.children[0]
+
+        (marker, blocks), (other_marker, other_blocks) = layout.items
+        assert marker.text == '1.'
+        assert [b.text for b in blocks if isinstance(b, Label)] == ['first', 'second paragraph']
+        assert other_marker.text == '2.'
+        assert [b.text for b in other_blocks if isinstance(b, Label)] == ['other']
+
+
+class TestListLayoutPositions:
+    """Tests for marker and block positions."""
+
+    def test_markers_span_their_items(self):
+        """Markers sit left of their blocks and are as tall as their item."""
+        label = _make_label('- one\n\n  two\n- three')
+        layout = label.children[0]
+
+        for marker, blocks in layout.items:
+            assert marker.right == blocks[0].x
+            assert marker.top == blocks[0].top
+            assert marker.y == blocks[-1].y
+        assert layout.height == layout.minimum_height
+        assert layout.minimum_height == (
+            sum(block.height for marker, blocks in layout.items for block in blocks)
+            + layout.padding[1] + layout.padding[3])
+
+    def test_nested_list_is_indented_block(self):
+        """Nested lists are ListLayouts in the body column of their item."""
+        label = _make_label('- outer\n  - inner')
+        layout = label.children[0]
+
+        marker, blocks = layout.items[0]
+        nested = blocks[-1]
+        assert isinstance(nested, ListLayout)
+        assert nested.x == marker.right
+        inner_marker, inner_blocks = nested.items[0]
+        assert inner_marker.x == nested.x + nested.padding[0]
+        assert inner_blocks[0].text == 'inner'
+        assert inner_blocks[0].right == label.right
+
+    def test_right_aligned_list_puts_markers_right(self):
+        """Right-aligned lists place the marker column on the right."""
+        label = _make_label('- one\n- two', halign='right')
+        layout = label.children[0]
+
+        assert layout.marker_side == 'right'
+        for marker, blocks in layout.items:
+            assert marker.x == blocks[0].right
+            assert marker.right == layout.right - layout.padding[2]
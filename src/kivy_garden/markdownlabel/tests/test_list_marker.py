@@ -0,0 +1,162 @@
+"""
+Tests for list markers drawn from the shared marker texture cache.
+
+This module verifies that MarkerTextureCache rasterizes each marker style
+once and evicts least recently used textures, that list items of a
+MarkdownLabel share cached textures instead of rasterizing their markers,
+and that in-place font size and style updates switch markers to the
+texture of the new style, including outline and other core text options.
+"""
+
+import pytest
+from kivy.clock import Clock
+
+from kivy_garden.markdownlabel import MarkdownLabel
+from kivy_garden.markdownlabel.list_marker import (
+    ListMarker,
+    MarkerTextureCache,
+    get_marker_texture_cache,
+)
+
+
+def _markers(label):
+    """Return the markers of the label's first list in document order."""
+    return [marker for marker, blocks in label.children[0].items]
+
+
+@pytest.fixture
+def cache():
+    """Empty process-wide marker texture cache."""
+    shared = get_marker_texture_cache()
+    shared.clear()
+    yield shared
+    shared.clear()
+
+
+class TestMarkerTextureCache:
+    """Tests for the texture cache."""
+
+    def test_same_style_returns_same_texture(self):
+        """A marker style is rasterized once."""
+        cache = MarkerTextureCache()
+
+        first = cache.get('•', 'Roboto', 15, [1, 1, 1, 1])
+        second = cache.get('•', 'Roboto', 15.0, (1, 1, 1, 1))
+
+        assert first is second
+        assert (cache.misses, cache.hits) == (1, 1)
+        assert first.width > 0 and first.height > 0
+
+    def test_style_is_part_of_key(self):
+        """Text, font size and color each select a separate texture."""
+        cache = MarkerTextureCache()
+        base = cache.get('1.', 'Roboto', 15, [1, 1, 1, 1])
+
+        assert cache.get('2.', 'Roboto', 15, [1, 1, 1, 1]) is not base
+        assert cache.get('1.', 'Roboto', 30, [1, 1, 1, 1]) is not base
+        assert cache.get('1.', 'Roboto', 15, [1, 0, 0, 1]) is not base
+        assert len(cache) == 4
+
+    def test_label_options_are_part_of_key(self):
+        """Options that change the glyphs select a separate texture."""
+        cache = MarkerTextureCache()
+        base = cache.get('•', 'Roboto', 15, [1, 1, 1, 1])
+
+        outlined = cache.get('•', 'Roboto', 15, [1, 1, 1, 1], {'outline_width': 2})
+
+        assert outlined is not base
+        assert outlined.width > base.width
+        assert cache.get('•', 'Roboto', 15, [1, 1, 1, 1], {'font_family': None}) is base
+        assert cache.get('•', 'Roboto', 15, [1, 1, 1, 1], {'padding': [4, 4, 4, 4]}) is base
+
+    def test_empty_text_has_no_texture(self):
+        """Empty markers draw nothing and are not cached."""
+        cache = MarkerTextureCache()
+
+        assert cache.get('', 'Roboto', 15, [1, 1, 1, 1]) is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_evicted(self):
+        """The cache keeps at most max_entries textures."""
+        cache = MarkerTextureCache(max_entries=2)
+        one = cache.get('1.', 'Roboto', 15, [1, 1, 1, 1])
+        cache.get('2.', 'Roboto', 15, [1, 1, 1, 1])
+        cache.get('1.', 'Roboto', 15, [1, 1, 1, 1])
+        cache.get('3.', 'Roboto', 15, [1, 1, 1, 1])
+
+        assert len(cache) == 2
+        assert cache.get('1.', 'Roboto', 15, [1, 1, 1, 1]) is one
+        assert cache.misses == 3
+
+
+class TestLabelListMarkers:
+    """Tests for markers of rendered lists."""
+
+    def test_items_share_marker_texture(self, cache):
+        """All bullets of a list draw one texture, also after a rebuild."""
+        misses = cache.misses
+        label = MarkdownLabel(text='\n'.join(f'- item {i}' for i in range(20)))
+        label.force_rebuild()
+
+        markers = _markers(label)
+        assert all(isinstance(marker, ListMarker) for marker in markers)
+        assert len({id(marker._rect.texture) for marker in markers}) == 1
+        assert cache.misses == misses + 1
+
+    def test_marker_drawn_at_top_of_item(self, cache):
+        """The marker texture sits at the top right of the marker column."""
+        label = MarkdownLabel(text='- one\n\n  two', size=(300, 600), size_hint=(None, None))
+        for _ in range(10):
+            Clock.tick()
+
+        marker = _markers(label)[0]
+        rect = marker._rect
+        assert tuple(rect.size) == tuple(marker.texture_size)
+        assert rect.pos[0] + rect.size[0] == marker.right
+        assert rect.pos[1] + rect.size[1] == marker.top
+
+    def test_font_size_update_uses_new_texture(self, cache):
+        """base_font_size changes resize markers in place."""
+        label = MarkdownLabel(text='1. one\n2. two', base_font_size=15)
+        marker = _markers(label)[0]
+        old_height = marker.texture_size[1]
+
+        label.base_font_size = 30
+
+        assert _markers(label)[0] is marker
+        assert marker.font_size == 30
+        assert marker.texture_size[1] > old_height
+        assert marker._rect.texture is cache.get('1.', marker.font_name, 30, marker.color)
+
+    def test_style_update_recolors_markers(self, cache):
+        """color and disabled changes switch markers to recolored textures."""
+        label = MarkdownLabel(text='- one', color=[1, 1, 1, 1])
+        marker = _markers(label)[0]
+
+        label.color = [1, 0, 0, 1]
+        assert _markers(label)[0] is marker
+        assert list(marker.color) == [1, 0, 0, 1]
+
+        label.disabled = True
+        assert list(marker.color) == list(label.disabled_color)
+        assert marker._rect.texture is cache.get('•', marker.font_name, marker.font_size,
+                                                 label.disabled_color)
+
+    def test_outline_width_outlines_markers(self, cache):
+        """outline_width reaches the markers at build time and in place."""
+        plain = _markers(MarkdownLabel(text='- one\n- two'))[0]
+        label = MarkdownLabel(text='- one\n- two', outline_width=2, outline_color=[1, 0, 0, 1])
+        marker = _markers(label)[0]
+
+        assert marker.label_options['outline_width'] == 2
+        assert marker.texture_size[0] > plain.texture_size[0]
+        assert marker._rect.texture is cache.get('•', marker.font_name, marker.font_size,
+                                                 marker.color, {'outline_width': 2,
+                                                                'outline_color': [1, 0, 0, 1]})
+
+        label.outline_width = 4
+
+        marker = _markers(label)[0]
+        assert marker.label_options['outline_width'] == 4
+        assert marker._rect.texture is cache.get('•', marker.font_name, marker.font_size,
+                                                 marker.color, marker.label_options)
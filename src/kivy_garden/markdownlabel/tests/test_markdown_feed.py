@@ -0,0 +1,205 @@
+"""
+Tests for the virtualized MarkdownFeed.
+
+This module verifies that MarkdownFeed displays messages with a small pool of
+recycled rows hosting MarkdownLabel instances, caches measured heights by
+(text, width, style), appends, prepends and updates messages without
+disturbing the visible ones, applies its label options to rows recycled from
+another feed, and bubbles ``on_ref_press``.
+"""
+
+from unittest.mock import patch
+
+from kivy.clock import Clock
+
+from kivy_garden.markdownlabel import MarkdownFeed, MarkdownLabel
+from kivy_garden.markdownlabel.markdown_feed import message_key
+
+MESSAGES = [f'Message {i} with **bold** text and a [link](http://example.com/{i}).' for i in range(200)]
+
+
+def _make_feed(messages=MESSAGES, **kwargs):
+    """Create a 400x300 feed and let it lay out."""
+    feed = MarkdownFeed(size=(400, 300), size_hint=(None, None), **kwargs)
+    feed.messages = messages
+    _settle()
+    return feed
+
+
+def _settle(frames=30):
+    """Run frames so rows render, measure and relayout."""
+    for _ in range(frames):
+        Clock.tick()
+
+
+def _rows(feed):
+    """Return the displayed rows sorted by message index."""
+    return sorted(feed.layout_manager.children, key=lambda row: row.index)
+
+
+def _top_visible_index(feed):
+    """Return the index of the first message intersecting the viewport."""
+    view_top = feed.layout_manager.height - (feed.layout_manager.height - feed.height) * (1 - feed.scroll_y)
+    visible = [row for row in _rows(feed) if row.y < view_top <= row.top]
+    return visible[0].index
+
+
+class TestFeedVirtualization:
+    """Tests for row recycling."""
+
+    def test_only_visible_messages_have_rows(self):
+        """Two hundred messages are shown by a few recycled rows."""
+        feed = _make_feed()
+
+        assert feed.messages == MESSAGES
+        assert 0 < len(feed.layout_manager.children) < 30
+        assert all(isinstance(row.children[0], MarkdownLabel) for row in feed.layout_manager.children)
+
+    def test_scrolling_reuses_row_instances(self):
+        """Scrolling to the end shows the last messages with the same rows."""
+        feed = _make_feed()
+        rows = set(feed.layout_manager.children)
+
+        feed.scroll_y = 0
+        _settle()
+
+        assert _rows(feed)[-1].index == len(MESSAGES) - 1
+        assert _rows(feed)[-1].children[0].text == MESSAGES[-1]
+        assert len(set(feed.layout_manager.children) | rows) < 40
+
+    def test_rows_recycled_from_another_feed_use_its_options(self):
+        """Label options follow the feed, not the row's previous owner."""
+        first = _make_feed(label_options={'base_font_size': 30})
+        first.messages = []
+        _settle()
+
+        second = _make_feed()
+
+        assert second.layout_manager.children
+        assert all(row.children[0].base_font_size == 15 for row in second.layout_manager.children)
+        assert first.label_options == {'base_font_size': 30}
+
+    def test_new_labels_are_created_with_options(self):
+        """Label options are passed to the constructor of new labels."""
+        with patch('kivy_garden.markdownlabel.markdown_feed.MarkdownLabel', wraps=MarkdownLabel) as factory:
+            feed = _make_feed(label_options={'base_font_size': 20})
+
+        assert factory.call_count == len(feed.layout_manager.children)
+        assert all(call.kwargs['base_font_size'] == 20 for call in factory.call_args_list)
+
+    def test_ref_press_bubbles_from_messages(self):
+        """Links in displayed messages dispatch on_ref_press on the feed."""
+        feed = _make_feed()
+        pressed = []
+        feed.bind(on_ref_press=lambda instance, ref: pressed.append(ref))
+
+        _rows(feed)[0].children[0].dispatch('on_ref_press', 'http://example.com/0')
+
+        assert pressed == ['http://example.com/0']
+
+
+class TestFeedHeights:
+    """Tests for the per-message height cache."""
+
+    def test_displayed_messages_use_measured_heights(self):
+        """Row heights match the measured label heights."""
+        feed = _make_feed()
+
+        for row in _rows(feed):
+            assert feed.data[row.index]['height'] == row.children[0].minimum_height
+
+    def test_cache_reused_for_repeated_text(self):
+        """A message with a measured text starts with the cached height."""
+        feed = _make_feed()
+        index = _rows(feed)[0].index
+        measured = feed.data[index]['height']
+
+        feed.append_message(MESSAGES[index])
+
+        assert feed.data[-1]['height'] == measured
+        assert feed.data[-1]['key'] == message_key(MESSAGES[index])
+
+    def test_cache_keyed_by_width_and_style(self):
+        """Width and label option changes do not reuse stale heights."""
+        feed = _make_feed()
+        key = feed.data[0]['key']
+
+        feed.width = 200
+        _settle()
+        feed.label_options = {'base_font_size': 24}
+        _settle()
+
+        heights = {h for (k, w, s), h in feed._height_cache.items() if k == key}
+        assert len(heights) == 3
+        assert feed.data[0]['height'] == _rows(feed)[0].children[0].minimum_height
+
+    def test_update_message_keeps_displayed_label(self):
+        """A streamed message updates its label instead of swapping it."""
+        feed = _make_feed()
+        label = _rows(feed)[0].children[0]
+
+        feed.update_message(0, MESSAGES[0] + ' More.')
+        _settle()
+
+        assert _rows(feed)[0].children[0] is label
+        assert label.text == MESSAGES[0] + ' More.'
+
+    def test_update_message_remeasures(self):
+        """Updating a message text re-measures only that message."""
+        feed = _make_feed()
+        before = [row['height'] for row in feed.data]
+
+        feed.update_message(0, MESSAGES[0] + '\n\nA second paragraph.')
+        _settle()
+
+        assert feed.data[0]['height'] > before[0]
+        assert [row['height'] for row in feed.data][1:] == before[1:]
+
+
+class TestFeedInsertion:
+    """Tests for append and prepend APIs."""
+
+    def test_append_keeps_bottom_pinned(self):
+        """A feed scrolled to the bottom follows new messages."""
+        feed = _make_feed()
+        feed.scroll_y = 0
+        _settle()
+
+        feed.append_messages(['New **message**', 'Another one'])
+        _settle()
+
+        assert feed.scroll_y == 0
+        assert _rows(feed)[-1].children[0].text == 'Another one'
+
+    def test_append_keeps_viewport_when_scrolled_up(self):
+        """New messages do not move the visible messages."""
+        feed = _make_feed()
+        top = _top_visible_index(feed)
+
+        feed.append_message('New message')
+        _settle()
+
+        assert _top_visible_index(feed) == top
+
+    def test_prepend_keeps_viewport(self):
+        """Older messages inserted above keep the visible messages in place."""
+        feed = _make_feed()
+        feed.scroll_y = 0.5
+        _settle()
+        top_text = MESSAGES[_top_visible_index(feed)]
+
+        feed.prepend_messages([f'Older {i}' for i in range(20)])
+        _settle()
+
+        assert feed.messages[:20] == [f'Older {i}' for i in range(20)]
+        assert feed.messages[_top_visible_index(feed)] == top_text
+
+    def test_insert_does_not_recompute_existing_rows(self):
+        """Appending and prepending keep the existing row dicts."""
+        feed = _make_feed()
+        rows = list(feed.data)
+
+        feed.prepend_message('First')
+        feed.append_message('Last')
+
+        assert all(a is b for a, b in zip(feed.data[1:-1], rows))
@@ -0,0 +1,218 @@
+"""
+Tests for the virtualized MarkdownView.
+
+This module verifies that MarkdownView creates widgets only for blocks near
+the viewport, recycles them while scrolling, caches measured block heights
+up to a size limit and estimates unmeasured ones, reuses the shared AST cache, and keeps
+``on_ref_press`` and ``anchors`` working.
+"""
+
+from unittest.mock import patch
+
+from kivy.clock import Clock
+
+from kivy_garden.markdownlabel import MarkdownView
+from kivy_garden.markdownlabel.ast_cache import get_ast_cache
+from kivy_garden.markdownlabel.markdown_view import estimate_block_height
+from kivy_garden.markdownlabel.parser_registry import create_parser
+from .test_utils import find_labels_recursive
+
+BLOCK_COUNT = 300
+
+DOCUMENT = '\n\n'.join(
+    f'## Section {i}\n\nParagraph {i} with **bold** and a [link](http://example.com/{i}).'
+    for i in range(BLOCK_COUNT)
+)
+
+
+def _make_view(text=DOCUMENT, **kwargs):
+    """Create a 400x300 view and let it lay out."""
+    view = MarkdownView(text=text, size=(400, 300), size_hint=(None, None), **kwargs)
+    _settle()
+    return view
+
+
+def _settle(frames=30):
+    """Run frames so rows render, measure and relayout."""
+    for _ in range(frames):
+        Clock.tick()
+
+
+def _displayed_indices(view):
+    """Return the sorted block indices of the rows that have widgets."""
+    return sorted(row.index for row in view.layout_manager.children)
+
+
+class TestVirtualization:
+    """Tests for on-demand widget creation and recycling."""
+
+    def test_one_row_per_top_level_block(self):
+        """Row data mirrors the top-level tokens of the document."""
+        view = _make_view()
+
+        assert [row['token'] for row in view.data] == create_parser().parse(DOCUMENT)[0]
+
+    def test_only_rows_near_viewport_have_widgets(self):
+        """A long document creates widgets for a few rows only."""
+        view = _make_view()
+
+        assert 0 < len(view.layout_manager.children) < 30
+        assert _displayed_indices(view)[0] == 0
+        assert len(list(find_labels_recursive(view))) < 30
+
+    def test_scrolling_recycles_rows(self):
+        """Scrolling to the end shows the last blocks without more rows."""
+        view = _make_view()
+        row_count = len(view.layout_manager.children)
+
+        view.scroll_y = 0
+        _settle()
+
+        assert _displayed_indices(view)[-1] == len(view.data) - 1
+        assert len(view.layout_manager.children) < 30
+        assert row_count < 30
+
+    def test_identical_blocks_cache_separate_widgets(self):
+        """Rows of identical blocks keep their own widgets when recycled."""
+        view = _make_view(text='\n\n'.join(['The same paragraph.'] * BLOCK_COUNT))
+        displayed = [view.data[index]['key'] for index in _displayed_indices(view)]
+
+        view.scroll_y = 0
+        _settle()
+
+        assert len(set(row['key'] for row in view.data)) == len(view.data)
+        # Documented Exception: Verifying internal widget cache
+        assert len([key for key in displayed if key in view._widget_cache]) > 1
+
+    def test_scroll_to_block(self):
+        """scroll_to_block() brings the block into the displayed rows."""
+        view = _make_view()
+        target = len(view.data) // 2
+
+        view.scroll_to_block(target)
+        _settle()
+
+        assert target in _displayed_indices(view)
+
+    def test_parses_through_shared_cache(self):
+        """A second view of the same text hits the AST cache."""
+        _make_view()
+        hits = get_ast_cache().hits
+
+        _make_view()
+
+        assert get_ast_cache().hits == hits + 1
+
+
+class TestBlockHeights:
+    """Tests for height measurement, caching and estimation."""
+
+    def test_displayed_rows_use_measured_heights(self):
+        """Rows with widgets get their measured height."""
+        view = _make_view()
+
+        for row in view.layout_manager.children:
+            assert abs(row.height - row.minimum_height) <= 0.5
+            assert view.data[row.index]['height'] == row.height
+
+    def test_measured_heights_survive_text_edits(self):
+        """Unchanged blocks keep cached heights after the text changes."""
+        view = _make_view()
+        measured = {view.data[i]['key']: view.data[i]['height'] for i in _displayed_indices(view)}
+
+        view.text = 'Intro paragraph.\n\n' + DOCUMENT
+        _settle(0)
+        view._refresh_data()
+
+        for row in view.data:
+            if row['key'] in measured:
+                assert row['height'] == measured[row['key']]
+
+    def test_height_cache_is_bounded(self):
+        """Heights measured at many widths are evicted oldest first."""
+        with patch('kivy_garden.markdownlabel.markdown_view._HEIGHT_CACHE_SIZE', 20):
+            view = _make_view()
+            for width in range(300, 400, 20):
+                view.width = width
+                _settle()
+
+        # Documented Exception: Verifying internal cache size and eviction order
+        assert len(view._block_heights) == 20
+        assert all(width == round(view.width) for _, width, _ in list(view._block_heights)[-5:])
+
+    def test_unmeasured_rows_are_estimated(self):
+        """Rows never displayed carry a positive estimate."""
+        view = _make_view()
+        last = view.data[-1]
+
+        assert last['height'] == estimate_block_height(
+            last['token'], view.width, view.base_font_size, view.line_height
+        )
+        assert last['height'] > 0
+
+    def test_estimates_grow_with_content(self):
+        """Longer blocks and larger headings are estimated taller."""
+        parse = create_parser().parse
+        short, long_ = parse('Short.\n\n' + 'Long text. ' * 100)[0][::2]
+        h1, h6 = parse('# Title\n\n###### Title')[0][::2]
+        code = parse('```\na\nb\nc\n```')[0][0]
+
+        assert estimate_block_height(long_, 400) > estimate_block_height(short, 400)
+        assert estimate_block_height(short, 400) == estimate_block_height(long_, 1e6)
+        assert estimate_block_height(h1, 400) > estimate_block_height(h6, 400)
+        assert estimate_block_height(code, 400) > estimate_block_height(short, 400)
+
+    def test_style_change_rerenders_rows(self):
+        """Changing the font size re-renders displayed blocks."""
+        view = _make_view()
+        view.base_font_size = 30
+        _settle()
+
+        sizes = {label.font_size for label in find_labels_recursive(view)}
+        assert sizes and min(sizes) >= 30
+
+
+class TestViewEvents:
+    """Tests for on_ref_press and anchors."""
+
+    def test_ref_press_bubbles_from_blocks(self):
+        """Links in displayed blocks dispatch on_ref_press on the view."""
+        view = _make_view()
+        pressed = []
+        view.bind(on_ref_press=lambda instance, ref: pressed.append(ref))
+
+        label = next(lbl for lbl in find_labels_recursive(view) if '[ref=' in lbl.text)
+        label.dispatch('on_ref_press', 'http://example.com/0')
+
+        assert pressed == ['http://example.com/0']
+
+    def test_rows_recycled_from_another_view_rerender(self):
+        """Rows Kivy pools across views dispatch to the view showing them."""
+        first = _make_view()
+        first.text = ''
+        _settle()
+        second = _make_view()
+        pressed = []
+        second.bind(on_ref_press=lambda instance, ref: pressed.append(ref))
+
+        labels = [lbl for lbl in find_labels_recursive(second) if '[ref=' in lbl.text]
+        for label in labels:
+            label.dispatch('on_ref_press', 'x')
+
+        assert labels and len(pressed) == len(labels)
+
+    def test_anchors_of_displayed_blocks(self):
+        """Anchors of displayed Labels are reported in layout coordinates."""
+        view = _make_view()
+        label = next(iter(find_labels_recursive(view)))
+        label.text = '[anchor=intro]' + label.text
+        label.texture_update()
+        anchor_x, anchor_y = label.anchors['intro']
+
+        tex_w, tex_h = label.texture_size
+        top_left = label.to_window(label.center_x - tex_w / 2.0, label.center_y + tex_h / 2.0)
+        origin = view.layout_manager.to_window(0, 0)
+        x, y = view.anchors['intro']
+        assert x == top_left[0] - origin[0] + anchor_x
+        assert y == top_left[1] - origin[1] - anchor_y
+        assert 0 <= y <= view.layout_manager.height
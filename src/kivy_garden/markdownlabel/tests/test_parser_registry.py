@@ -0,0 +1,96 @@
+"""
+Tests for the shared mistune parser registry.
+
+This module verifies that parsers are shared per plugin set and per thread,
+that MarkdownLabel instances use the shared parser, and that the shared parser
+produces the same tokens as a privately configured one.
+"""
+
+import threading
+
+import mistune
+from mistune.plugins.formatting import strikethrough
+from mistune.plugins.table import table
+
+from kivy_garden.markdownlabel import MarkdownLabel
+from kivy_garden.markdownlabel.parser_registry import (
+    DEFAULT_PLUGINS,
+    clear_parsers,
+    create_parser,
+    get_parser,
+)
+
+
+class TestParserRegistry:
+    """Tests for get_parser() sharing rules."""
+
+    def test_same_plugin_set_returns_same_parser(self):
+        """Repeated lookups of one plugin set return one instance."""
+        assert get_parser() is get_parser(DEFAULT_PLUGINS)
+        assert get_parser(['table', 'strikethrough']) is get_parser()
+
+    def test_different_plugin_sets_return_different_parsers(self):
+        """Each plugin set gets its own parser."""
+        assert get_parser(['table']) is not get_parser()
+        assert get_parser([]) is not get_parser(['table'])
+
+    def test_duplicate_plugins_share_key(self):
+        """Duplicate plugin names do not create a separate entry."""
+        assert get_parser(['table', 'table', 'strikethrough']) is get_parser()
+
+    def test_create_parser_is_unshared(self):
+        """create_parser() always returns a new instance."""
+        assert create_parser() is not create_parser()
+        assert create_parser() is not get_parser()
+
+    def test_clear_parsers_drops_shared_instances(self):
+        """clear_parsers() makes the next lookup build a new parser."""
+        before = get_parser()
+        clear_parsers()
+
+        assert get_parser() is not before
+
+    def test_other_thread_gets_own_parser(self):
+        """Worker threads never share the calling thread's parser."""
+        main_parser = get_parser()
+        worker_parsers = []
+
+        def worker():
+            worker_parsers.append(get_parser())
+            worker_parsers.append(get_parser())
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert worker_parsers[0] is worker_parsers[1]
+        assert worker_parsers[0] is not main_parser
+
+    def test_shared_parser_matches_private_parser(self, sample_markdown_texts):
+        """The shared parser produces the tokens of the previous per-label setup."""
+        private = mistune.create_markdown(renderer=None)
+        table(private)
+        strikethrough(private)
+        text = '\n\n'.join(sample_markdown_texts.values()) + '\n\n~~gone~~\n\n| a |\n|---|\n| 1 |'
+
+        assert get_parser().parse(text)[0] == private.parse(text)[0]
+
+
+class TestMarkdownLabelSharedParser:
+    """Tests that MarkdownLabel instances share one parser."""
+
+    def test_labels_share_parser(self):
+        """Two labels on the same thread use the same parser."""
+        first = MarkdownLabel(text='# One')
+        second = MarkdownLabel(text='~~Two~~')
+
+        assert first._parser is second._parser
+        assert first._parser is get_parser(first._parser_plugins)
+
+    def test_shared_parser_keeps_labels_independent(self):
+        """Parsing through the shared parser does not leak state between labels."""
+        first = MarkdownLabel(text='See [docs][d].\n\n[d]: http://a.example')
+        second = MarkdownLabel(text='See [docs][d].')
+
+        assert first.get_ast()[0]['children'][1]['type'] == 'link'
+        assert all(child['type'] != 'link' for child in second.get_ast()[0]['children'])
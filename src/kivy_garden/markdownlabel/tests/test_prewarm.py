@@ -0,0 +1,101 @@
+"""
+Tests for bulk prewarming of the AST cache.
+
+This module verifies that prewarm() parses documents in worker processes (or
+in-process), stores tokens identical to a regular parse in the shared cache,
+together with their block statistics, skips documents it does not need to
+parse, and that labels created afterwards hit the cache.
+"""
+
+import uuid
+from unittest.mock import patch
+
+from kivy_garden.markdownlabel import MarkdownLabel, prewarm
+from kivy_garden.markdownlabel.ast_cache import get_ast_cache, make_cache_key
+from kivy_garden.markdownlabel.document_stats import compute_block_stats
+from kivy_garden.markdownlabel.parser_registry import DEFAULT_PLUGINS, create_parser
+
+
+def _documents(count):
+    """Return ``count`` distinct Markdown documents no other test has parsed."""
+    run = uuid.uuid4().hex
+    return [f'# Message {i}\n\nBody **{run}** with `code`.\n\n- a\n- b' for i in range(count)]
+
+
+class TestPrewarm:
+    """Tests for prewarm()."""
+
+    def test_worker_processes_fill_cache(self):
+        """Documents parsed in worker processes are stored in the cache."""
+        documents = _documents(6)
+
+        assert prewarm(documents, processes=2) == 6
+
+        cache = get_ast_cache()
+        for text in documents:
+            cached = cache.get(make_cache_key(text, DEFAULT_PLUGINS))
+            assert cached == create_parser().parse(text)[0]
+
+    def test_single_process_fills_cache(self):
+        """processes=1 parses in the calling process."""
+        documents = _documents(3)
+
+        assert prewarm(documents, processes=1) == 3
+        assert all(make_cache_key(text, DEFAULT_PLUGINS) in get_ast_cache() for text in documents)
+
+    def test_skips_empty_duplicate_and_cached_documents(self):
+        """Only documents that need parsing are parsed."""
+        documents = _documents(2)
+        prewarm(documents[:1], processes=1)
+
+        assert prewarm(['', documents[0], documents[1], documents[1]], processes=1) == 1
+        assert prewarm(documents, processes=1) == 0
+
+    def test_labels_skip_parsing_after_prewarm(self):
+        """A label for a prewarmed text hits the cache on its first build."""
+        text = _documents(1)[0]
+        prewarm([text], processes=1)
+        cache = get_ast_cache()
+        hits_before, misses_before = cache.hits, cache.misses
+
+        label = MarkdownLabel(text=text)
+
+        assert (cache.hits, cache.misses) == (hits_before + 1, misses_before)
+        assert label.get_ast()[0]['type'] == 'heading'
+
+    def test_worker_processes_store_block_stats(self):
+        """Block statistics computed in the workers are stored with the tokens."""
+        documents = _documents(2)
+
+        prewarm(documents, processes=2)
+
+        cache = get_ast_cache()
+        for text in documents:
+            cached = cache.get(make_cache_key(text, DEFAULT_PLUGINS))
+            assert [cache.block_stats(token) for token in cached] == [
+                compute_block_stats(token) for token in cached]
+
+    def test_labels_skip_stats_walk_after_prewarm(self):
+        """A label for a prewarmed text takes its statistics from the cache."""
+        text = _documents(1)[0]
+        prewarm([text], processes=1)
+
+        with patch('kivy_garden.markdownlabel.compute_block_stats') as compute:
+            label = MarkdownLabel(text=text)
+
+        compute.assert_not_called()
+        # Documented Exception: Verifying internal statistics taken from the cache
+        assert label._ast_stats.type_counts['heading'] == 1
+
+    def test_compact_prewarm_serves_compact_labels(self):
+        """compact=True stores nodes for labels with compact_ast enabled."""
+        text = _documents(1)[0]
+
+        assert prewarm([text], processes=2, compact=True) == 1
+
+        cache = get_ast_cache()
+        hits_before = cache.hits
+        label = MarkdownLabel(text=text, compact_ast=True)
+
+        assert cache.hits == hits_before + 1
+        assert label.get_ast() == create_parser().parse(text)[0]
@@ -0,0 +1,174 @@
+"""
+Tests for time-sliced progressive builds.
+
+This module verifies that ``build_budget_ms`` spreads widget construction of
+large documents over frames, shows early blocks immediately, builds the same
+widgets as a synchronous build, dispatches ``on_render_complete`` once per
+build, and interacts correctly with ``force_rebuild()``, text and style
+changes, and texture render mode.
+"""
+
+from kivy.clock import Clock
+from kivy.uix.image import Image
+
+from kivy_garden.markdownlabel import MarkdownLabel
+from kivy_garden.markdownlabel.kivy_renderer import KivyRenderer
+from kivy_garden.markdownlabel.parser_registry import create_parser
+from kivy_garden.markdownlabel.progressive_build import ProgressiveBuild
+from .test_utils import find_labels_recursive
+
+# A budget far below the cost of one block: every slice renders one token
+TINY_BUDGET = 0.001
+
+DOCUMENT = '\n\n'.join(
+    f'## Section {i}\n\nParagraph {i} with **bold** and a [link](http://example.com/{i}).'
+    for i in range(8)
+)
+
+
+def _finish(label, max_frames=200):
+    """Run frames until the label's progressive build has finished."""
+    frames = 0
+    while label._progressive_build is not None and frames < max_frames:
+        Clock.tick()
+        frames += 1
+    assert label._progressive_build is None
+    return frames
+
+
+def _completions(label):
+    """Record on_render_complete dispatches of ``label``."""
+    events = []
+    label.bind(on_render_complete=lambda instance: events.append(instance.text))
+    return events
+
+
+def _label_texts(label):
+    """Return the texts of all Labels under ``label`` in tree order."""
+    return [lbl.text for lbl in find_labels_recursive(label)]
+
+
+class TestProgressiveBuildSlices:
+    """Tests for ProgressiveBuild slicing."""
+
+    def test_each_slice_renders_at_least_one_token(self):
+        """A zero budget still makes progress one token at a time."""
+        tokens = create_parser().parse(DOCUMENT)[0]
+        build = ProgressiveBuild(KivyRenderer(), tokens, [b''] * len(tokens), '', 'widgets', 0)
+
+        for expected in range(1, len(tokens) + 1):
+            assert len(build.render_slice()) == 1
+            assert len(build.widgets) == expected
+        assert build.done
+        assert build.slices == len(tokens)
+
+    def test_large_budget_renders_everything_in_one_slice(self):
+        """A generous budget renders all tokens in the first slice."""
+        tokens = create_parser().parse(DOCUMENT)[0]
+        build = ProgressiveBuild(KivyRenderer(), tokens, [b''] * len(tokens), '', 'widgets', 10000)
+
+        assert len(build.render_slice()) == len(tokens)
+        assert build.done
+
+
+class TestProgressiveLabelBuild:
+    """Tests for MarkdownLabel with build_budget_ms."""
+
+    def test_budget_zero_builds_synchronously(self):
+        """Without a budget the build finishes in the constructor."""
+        label = MarkdownLabel(text=DOCUMENT)
+
+        assert label._progressive_build is None
+        assert label._block_widgets is not None
+
+    def test_first_blocks_shown_before_completion(self):
+        """The first slice is displayed immediately; the rest follows per frame."""
+        label = MarkdownLabel(text=DOCUMENT, build_budget_ms=TINY_BUDGET)
+        events = _completions(label)
+
+        assert label._progressive_build is not None
+        assert 0 < len(label.children) < len(MarkdownLabel(text=DOCUMENT).children)
+        assert events == []
+
+        frames = _finish(label)
+
+        assert frames > 1
+        assert events == [DOCUMENT]
+        assert _label_texts(label) == _label_texts(MarkdownLabel(text=DOCUMENT))
+
+    def test_completed_build_supports_block_reuse(self):
+        """A finished progressive build records its blocks for later reuse."""
+        label = MarkdownLabel(text=DOCUMENT, build_budget_ms=TINY_BUDGET)
+        _finish(label)
+        first = list(reversed(label.children))[0]
+
+        label.text = DOCUMENT + '\n\nOne more paragraph.'
+        label.force_rebuild()
+
+        assert list(reversed(label.children))[0] is first
+
+    def test_small_document_completes_in_first_slice(self):
+        """Documents that fit the budget are built synchronously."""
+        events = []
+        label = MarkdownLabel(build_budget_ms=1000)
+        label.bind(on_render_complete=lambda instance: events.append(instance.text))
+        label.text = 'Short **text**'
+        label.force_rebuild()
+
+        assert label._progressive_build is None
+        assert events == ['Short **text**']
+
+    def test_forced_build_completes_synchronously(self):
+        """force_rebuild() replaces a running build with a full synchronous one."""
+        label = MarkdownLabel(text=DOCUMENT, build_budget_ms=TINY_BUDGET)
+        events = _completions(label)
+
+        label.force_rebuild()
+
+        assert label._progressive_build is None
+        assert events == [DOCUMENT]
+        assert _label_texts(label) == _label_texts(MarkdownLabel(text=DOCUMENT))
+
+    def test_text_change_drops_running_build(self):
+        """Changing text stops the build; only the new text completes."""
+        label = MarkdownLabel(text=DOCUMENT, build_budget_ms=TINY_BUDGET)
+        events = _completions(label)
+        new_text = DOCUMENT.replace('Paragraph', 'Line')
+
+        label.text = new_text
+        assert label._progressive_build is None
+        Clock.tick()
+        _finish(label)
+
+        assert events == [new_text]
+        assert _label_texts(label) == _label_texts(MarkdownLabel(text=new_text))
+
+    def test_style_change_restarts_build(self):
+        """Blocks built after an in-place style update use the new styling."""
+        label = MarkdownLabel(text=DOCUMENT, build_budget_ms=TINY_BUDGET)
+        label.base_font_size = 22
+        _finish(label)
+
+        reference = MarkdownLabel(text=DOCUMENT, base_font_size=22)
+        assert _label_texts(label) == _label_texts(reference)
+        assert ([lbl.font_size for lbl in find_labels_recursive(label)]
+                == [lbl.font_size for lbl in find_labels_recursive(reference)])
+
+    def test_texture_mode_keeps_previous_content_until_done(self):
+        """Texture builds keep the old snapshot and capture once at the end."""
+        label = MarkdownLabel(text='Old text', render_mode='texture', width=400)
+        old_children = list(label.children)
+        label.build_budget_ms = TINY_BUDGET
+        events = _completions(label)
+
+        label.text = DOCUMENT
+        Clock.tick()
+
+        assert label._progressive_build is not None
+        assert list(label.children) == old_children
+
+        _finish(label)
+
+        assert events == [DOCUMENT]
+        assert any(isinstance(child, Image) for child in label.children)
+        assert label._aggregated_refs
@@ -3,15 +3,18 @@ Widget identity preservation tests for MarkdownLabel rebuild semantics.
 
 This module contains tests that verify widget identity preservation for style-only
 property changes. These tests ensure that changing style properties does not
-rebuild the widget tree, preserving all widget object IDs.
+rebuild the widget tree, preserving all widget object IDs. It also verifies that
+text changes keep the widgets of top-level blocks whose content is unchanged.
 
 Tests are designed to run in headless CI environments without requiring a Kivy window.
 """
 
+from unittest.mock import patch
+
 import pytest
 from hypothesis import given, strategies as st, settings, assume
 
-from kivy_garden.markdownlabel import MarkdownLabel
+from kivy_garden.markdownlabel import MarkdownLabel, block_reconciler
 from .test_utils import (
     simple_markdown_document,
     collect_widget_ids,
@@ -494,3 +497,106 @@ class TestRootIDPreservationPBT:
             if not is_code_label(lbl):
                 assert lbl.font_name == font_name, \
                     f"Expected font_name='{font_name}', got '{lbl.font_name}'"
+
+
+def _blocks(label):
+    """Return the label's top-level block widgets in display order."""
+    return list(reversed(label.children))
+
+
+@pytest.mark.unit
+class TestTextChangeBlockReconciliation:
+    """Tests that text changes keep the widgets of unchanged blocks."""
+
+    DOCUMENT = (
+        '# Title\n\n'
+        'First paragraph.\n\n'
+        '- item one\n- item two\n\n'
+        '```python\nprint("hi")\n```\n\n'
+        '| a | b |\n|---|---|\n| 1 | 2 |\n\n'
+        'Last paragraph.'
+    )
+
+    def test_text_change_preserves_unchanged_block_widgets(self):
+        """Editing one paragraph keeps every other block's widget subtree."""
+        label = MarkdownLabel(text=self.DOCUMENT)
+        blocks_before = _blocks(label)
+        ids_before = [collect_widget_ids(block) for block in blocks_before]
+
+        label.text = self.DOCUMENT.replace('First paragraph.', 'Edited paragraph.')
+        label.force_rebuild()
+
+        blocks_after = _blocks(label)
+        assert len(blocks_after) == len(blocks_before)
+        for index, (before, after) in enumerate(zip(blocks_before, blocks_after)):
+            if index == 2:
+                assert after is not before
+                assert after.text == 'Edited paragraph.'
+            else:
+                assert after is before
+                assert collect_widget_ids(after) == ids_before[index]
+
+    def test_inserted_block_keeps_surrounding_widgets(self):
+        """Inserting a block creates only the new block's widgets."""
+        label = MarkdownLabel(text='Alpha\n\nOmega')
+        alpha, spacer, omega = _blocks(label)
+
+        label.text = 'Alpha\n\nMiddle\n\nOmega'
+        label.force_rebuild()
+
+        blocks = _blocks(label)
+        assert blocks[0] is alpha
+        assert blocks[-1] is omega
+        assert [block.text for block in (blocks[0], blocks[2], blocks[4])] == ['Alpha', 'Middle', 'Omega']
+
+    def test_reconciled_tree_matches_fresh_build(self):
+        """A reconciled widget tree renders like a freshly built label."""
+        label = MarkdownLabel(text=self.DOCUMENT)
+        new_text = 'Intro\n\n' + self.DOCUMENT.replace('- item two', '- item 2')
+        label.text = new_text
+        label.force_rebuild()
+
+        reference = MarkdownLabel(text=new_text)
+
+        assert [type(block) for block in _blocks(label)] == [type(block) for block in _blocks(reference)]
+        assert ([lbl.text for lbl in find_labels_recursive(label)]
+                == [lbl.text for lbl in find_labels_recursive(reference)])
+
+    def test_structure_property_change_rebuilds_all_blocks(self):
+        """A structure property change alongside a text change rebuilds everything."""
+        label = MarkdownLabel(text='Alpha\n\nOmega', link_style='styled')
+        ids_before = collect_widget_ids(label, exclude_root=True)
+
+        label.text = 'Alpha\n\nOmega, edited'
+        label.link_style = 'unstyled'
+        label.force_rebuild()
+
+        ids_after = collect_widget_ids(label, exclude_root=True)
+        assert not set(ids_before) & set(ids_after)
+
+    def test_incremental_parse_hashes_only_new_tokens(self):
+        """Tokens kept by the incremental parser are not keyed again."""
+        text = '\n\n'.join(f'Paragraph {i}.' for i in range(50))
+        label = MarkdownLabel(text=text, incremental_parse=True)
+        label.force_rebuild()
+
+        with patch('kivy_garden.markdownlabel.block_reconciler.block_key',
+                   wraps=block_reconciler.block_key) as key:
+            label.text = text.replace('Paragraph 25.', 'Paragraph twenty-five.')
+            label.force_rebuild()
+
+        assert 0 < key.call_count < 5
+
+    def test_reused_label_dispatches_ref_press_once(self):
+        """Kept Labels are not bound to on_ref_press a second time."""
+        label = MarkdownLabel(text='See [docs](http://example.com)\n\nOther')
+        link_label = _blocks(label)[0]
+        label.text = 'See [docs](http://example.com)\n\nOther, edited'
+        label.force_rebuild()
+        assert _blocks(label)[0] is link_label
+
+        pressed = []
+        label.bind(on_ref_press=lambda instance, ref: pressed.append(ref))
+        link_label.dispatch('on_ref_press', 'http://example.com')
+
+        assert pressed == ['http://example.com']
@@ -0,0 +1,164 @@
+"""
+Tests for RenderConfig and shared renderers.
+
+This module verifies that RenderConfig freezes renderer keyword arguments
+into a hashable value, that MarkdownLabel caches its config until a styling
+property changes, that labels and rebuilds with identical styling share one
+KivyRenderer, and that the precomputed Label kwargs templates match the
+per-call kwargs.
+"""
+
+import pytest
+
+from kivy_garden.markdownlabel import MarkdownLabel
+from kivy_garden.markdownlabel.kivy_renderer import KivyRenderer
+from kivy_garden.markdownlabel.render_config import RenderConfig, get_renderer
+
+
+class TestRenderConfigValue:
+    """Tests for the frozen configuration value."""
+
+    def test_lists_and_dicts_are_frozen(self):
+        """Lists become tuples and dicts become sorted item tuples."""
+        config = RenderConfig.from_kwargs(
+            color=[1, 0, 0, 1],
+            ellipsis_options={'markup': True, 'color': [1, 1, 0, 1]},
+            fallback_font_scales={'b': 1.1, 'a': 0.9},
+        )
+
+        assert config.color == (1, 0, 0, 1)
+        assert config.ellipsis_options == (('color', (1, 1, 0, 1)), ('markup', True))
+        assert config.fallback_font_scales == (('a', 0.9), ('b', 1.1))
+        assert hash(config) == hash(RenderConfig.from_kwargs(
+            color=(1, 0, 0, 1),
+            ellipsis_options={'color': [1, 1, 0, 1], 'markup': True},
+            fallback_font_scales={'a': 0.9, 'b': 1.1},
+        ))
+
+    def test_renderer_kwargs_round_trip(self):
+        """renderer_kwargs() returns fresh lists and dicts KivyRenderer accepts."""
+        config = RenderConfig.from_kwargs(link_color=[0, 1, 0, 1], fallback_fonts=['A'])
+        kwargs = config.renderer_kwargs()
+
+        assert kwargs['link_color'] == [0, 1, 0, 1]
+        assert kwargs['fallback_fonts'] == ['A']
+        assert isinstance(kwargs['ellipsis_options'], dict)
+        assert kwargs['link_color'] is not config.renderer_kwargs()['link_color']
+        assert RenderConfig.from_kwargs(**kwargs) == config
+        assert KivyRenderer(**kwargs).link_color == [0, 1, 0, 1]
+
+
+class TestLabelRenderConfig:
+    """Tests for the config cached on MarkdownLabel."""
+
+    def test_config_kept_for_text_changes(self):
+        """Text-only rebuilds reuse the cached config and renderer."""
+        label = MarkdownLabel(text='Hello')
+        config = label._get_render_config()
+
+        label.text = 'World'
+        label.force_rebuild()
+
+        assert label._get_render_config() is config
+        assert label._create_renderer() is get_renderer(config)
+
+    @pytest.mark.parametrize('name, value', [
+        ('base_font_size', 22),
+        ('link_color', [1, 0, 0, 1]),
+        ('halign', 'center'),
+        ('strict_label_mode', True),
+    ])
+    def test_config_dropped_on_property_change(self, name, value):
+        """Changing a styling property produces a new config."""
+        label = MarkdownLabel(text='Hello')
+        config = label._get_render_config()
+
+        setattr(label, name, value)
+
+        assert label._get_render_config() != config
+
+    def test_config_dropped_by_update_style(self):
+        """Batched updates also drop the cached config."""
+        label = MarkdownLabel(text='Hello')
+        config = label._get_render_config()
+
+        label.update_style(color=[0, 1, 0, 1], link_style='styled')
+
+        new_config = label._get_render_config()
+        assert new_config != config
+        assert new_config.color == (0, 1, 0, 1)
+        assert new_config.link_style == 'styled'
+
+    def test_identical_styling_shares_renderer(self):
+        """Labels with the same styling use the same KivyRenderer."""
+        first = MarkdownLabel(text='One', base_font_size=17)
+        second = MarkdownLabel(text='Two', base_font_size=17)
+        other = MarkdownLabel(text='Three', base_font_size=18)
+
+        assert first._create_renderer() is second._create_renderer()
+        assert first._create_renderer() is not other._create_renderer()
+
+    def test_prerendered_markup_gets_private_renderer(self):
+        """Builds with prerendered inline markup never touch the shared renderer."""
+        label = MarkdownLabel(text='Hello')
+        shared = label._create_renderer()
+
+        private = label._create_renderer(inline_markup={1: 'markup'})
+
+        assert private is not shared
+        assert private.inline_markup == {1: 'markup'}
+        assert shared.inline_markup == {}
+
+
+class TestSharedRendererState:
+    """Tests for renderer state across blocks."""
+
+    def test_nesting_state_reset_after_error(self):
+        """A block that fails mid-render leaves no nesting state behind."""
+        renderer = get_renderer(RenderConfig())
+
+        def failing(token, state=None):
+            renderer._list_depth += 1
+            raise RuntimeError('render failed')
+
+        renderer.failing = failing
+        try:
+            with pytest.raises(RuntimeError):
+                renderer.render_block({'type': 'failing'})
+        finally:
+            del renderer.failing
+
+        assert renderer._list_depth == 0
+        assert renderer._nesting_depth == 0
+        assert renderer._list_counters == []
+
+
+class TestLabelTemplates:
+    """Tests for precomputed Label kwargs templates."""
+
+    def test_templates_match_built_kwargs(self):
+        """Template kwargs equal the kwargs assembled per call."""
+        renderer = KivyRenderer(font_family='Serif', max_lines=3, ellipsis_options={'markup': True})
+
+        assert (renderer._label_kwargs('body', 'x', 15)
+                == renderer._build_label_kwargs(text='x', font_size=15))
+        assert (renderer._label_kwargs('heading', 'x', 30)
+                == renderer._build_label_kwargs(text='x', font_size=30, bold=True))
+
+    def test_code_template_excludes_font_family(self):
+        """Code Labels keep the monospace font regardless of font_family."""
+        renderer = KivyRenderer(font_family='Serif', code_font_name='Mono')
+        kwargs = renderer._label_kwargs('code', 'x = 1', 15)
+
+        assert kwargs['font_name'] == 'Mono'
+        assert 'font_family' not in kwargs
+        assert kwargs['halign'] == 'left'
+
+    def test_templates_not_mutated_by_label_kwargs(self):
+        """Per-Label kwargs are copies of the templates."""
+        renderer = KivyRenderer()
+        kwargs = renderer._label_kwargs('body', 'x', 15)
+        kwargs['halign'] = 'right'
+
+        assert 'text' not in renderer._label_templates['body']
+        assert renderer._label_templates['body']['halign'] == renderer.halign
@@ -0,0 +1,177 @@
+"""
+Tests for the append-only streaming API.
+
+This module verifies that MarkdownLabel.append_text() produces the same AST
+and widget structure as assigning the full text, keeps widgets of closed
+blocks untouched, and falls back to regular rebuilds where no widget tree
+can be patched.
+"""
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from kivy_garden.markdownlabel import MarkdownLabel
+from .test_utils import collect_widget_ids, find_labels_recursive, has_clipping_container
+
+
+CHAT_RESPONSE = (
+    '# Answer\n\n'
+    'Here is a **short** explanation with a [link](http://example.com).\n\n'
+    '- first point\n'
+    '- second point\n\n'
+    '```python\n'
+    'print("hello")\n'
+    '```\n\n'
+    '| a | b |\n'
+    '|---|---|\n'
+    '| 1 | 2 |\n\n'
+    'Done.'
+)
+
+
+def _stream(label, text, chunk_size):
+    """Append ``text`` to ``label`` in chunks of ``chunk_size`` characters."""
+    for start in range(0, len(text), chunk_size):
+        label.append_text(text[start:start + chunk_size])
+
+
+def _widget_types(label):
+    """Return the class names of the label's top-level children in order."""
+    return [type(child).__name__ for child in reversed(label.children)]
+
+
+class TestAppendTextEquivalence:
+    """Tests that streamed text renders like the complete text."""
+
+    @pytest.mark.property
+    @given(st.integers(min_value=1, max_value=40))
+    # Small finite strategy: 40 examples (input space size: 40)
+    @settings(max_examples=40, deadline=None)
+    def test_streamed_ast_matches_full_text(self, chunk_size):
+        """Streaming a response in chunks yields the AST of the full text."""
+        label = MarkdownLabel()
+        _stream(label, CHAT_RESPONSE, chunk_size)
+        label.force_rebuild()
+
+        reference = MarkdownLabel(text=CHAT_RESPONSE)
+
+        assert label.text == CHAT_RESPONSE
+        assert label.get_ast() == reference.get_ast()
+
+    @pytest.mark.property
+    @given(st.integers(min_value=1, max_value=40))
+    # Small finite strategy: 40 examples (input space size: 40)
+    @settings(max_examples=40, deadline=None)
+    def test_patched_widgets_match_full_text_widgets(self, chunk_size):
+        """Patching trailing blocks yields the widgets of the complete text."""
+        label = MarkdownLabel(text=CHAT_RESPONSE[:1])
+        _stream(label, CHAT_RESPONSE[1:], chunk_size)
+
+        reference = MarkdownLabel(text=CHAT_RESPONSE)
+
+        assert _widget_types(label) == _widget_types(reference)
+        assert ([lbl.text for lbl in find_labels_recursive(label)]
+                == [lbl.text for lbl in find_labels_recursive(reference)])
+
+
+class TestAppendTextWidgetReuse:
+    """Tests that closed blocks keep their widgets while streaming."""
+
+    def test_closed_blocks_keep_widget_identity(self):
+        """Appending to the last paragraph keeps earlier block widgets."""
+        label = MarkdownLabel(text='# Title\n\nFirst paragraph.\n\nSecond')
+        label.append_text(' paragraph')
+        heading = list(reversed(label.children))[0]
+        ids_before = collect_widget_ids(heading)
+
+        label.append_text(' keeps growing.')
+
+        assert list(reversed(label.children))[0] is heading
+        assert collect_widget_ids(heading) == ids_before
+        assert label.get_ast()[-1]['children'][0]['raw'] == 'Second paragraph keeps growing.'
+
+    def test_append_replaces_only_trailing_block(self):
+        """Only widgets of the trailing open block are recreated."""
+        label = MarkdownLabel(text='Intro\n\n- one')
+        label.append_text('\n')
+        children_before = list(reversed(label.children))
+
+        label.append_text('- two')
+        children_after = list(reversed(label.children))
+
+        assert children_after[:-1] == children_before[:-1]
+        assert children_after[-1] is not children_before[-1]
+
+    def test_append_does_not_schedule_rebuild(self):
+        """Appending to a built tree patches it without a pending rebuild."""
+        label = MarkdownLabel(text='Hello')
+        label.append_text(' world')
+
+        assert label._pending_rebuild is False
+        assert find_labels_recursive(label)[0].text == 'Hello world'
+
+    def test_link_in_appended_block_dispatches_ref_press(self):
+        """Labels created by append_text forward on_ref_press events."""
+        label = MarkdownLabel(text='Intro')
+        label.append_text('\n\nSee [docs](http://example.com)')
+        pressed = []
+        label.bind(on_ref_press=lambda instance, ref: pressed.append(ref))
+
+        find_labels_recursive(label)[-1].dispatch('on_ref_press', 'http://example.com')
+
+        assert pressed == ['http://example.com']
+
+    def test_append_inside_clipping_container(self):
+        """Streaming into a height-constrained label patches the clipped content."""
+        label = MarkdownLabel(text='Intro', text_size=[200, 100])
+        label.append_text('\n\nMore text')
+
+        reference = MarkdownLabel(text='Intro\n\nMore text', text_size=[200, 100])
+
+        assert has_clipping_container(label)
+        assert ([lbl.text for lbl in find_labels_recursive(label)]
+                == [lbl.text for lbl in find_labels_recursive(reference)])
+
+
+class TestAppendTextFallbacks:
+    """Tests for the rebuild fallbacks of append_text."""
+
+    def test_first_chunk_schedules_rebuild(self):
+        """The first chunk on an empty label uses the deferred rebuild."""
+        label = MarkdownLabel()
+        label.append_text('# Title')
+
+        assert label._pending_rebuild is True
+        label.force_rebuild()
+        assert label.get_ast()[0]['type'] == 'heading'
+
+    def test_empty_chunk_is_ignored(self):
+        """Appending an empty string does nothing."""
+        label = MarkdownLabel(text='Hello')
+        ids_before = collect_widget_ids(label)
+
+        label.append_text('')
+
+        assert collect_widget_ids(label) == ids_before
+        assert label._streaming is False
+
+    def test_texture_mode_uses_full_rebuild(self):
+        """Texture mode falls back to a deferred rebuild."""
+        label = MarkdownLabel(text='Hello', render_mode='texture')
+        label.append_text(' world')
+
+        assert label._pending_rebuild is True
+
+    def test_text_assignment_ends_stream(self):
+        """Assigning text directly ends streaming and rebuilds normally."""
+        label = MarkdownLabel(text='Hello')
+        label.append_text(' world')
+        assert label._streaming is True
+
+        label.text = 'Replaced'
+        label.force_rebuild()
+
+        assert label._streaming is False
+        assert label._incremental_parser is None
+        assert find_labels_recursive(label)[0].text == 'Replaced'
@@ -0,0 +1,217 @@
+"""
+Tests for lazily captured texture-mode bands.
+
+This module verifies that ``texture_lazy_tiles`` shows texture-mode content
+through a TextureBands widget of the content's size, that only bands near
+the visible region of a ScrollView are captured, that scrolling captures
+and releases bands, that ``texture_max_tiles`` caps the captured bands, and
+that links keep their zones. With ``incremental_texture`` it verifies that
+text changes reuse the captured bands, redraw only the region of the changed
+blocks, and shift or recollect link zones as a full capture would place
+them.
+"""
+
+from unittest.mock import patch
+
+from kivy.clock import Clock
+from kivy.uix.scrollview import ScrollView
+
+from kivy_garden.markdownlabel import MarkdownLabel
+from kivy_garden.markdownlabel.texture_bands import TextureBands, band_offsets
+
+from .test_utils import find_images
+
+LONG_TEXT = '\n\n'.join(f'Paragraph {i}' for i in range(300)) + '\n\n[Link](http://example.com)'
+
+
+def _bands(label):
+    """Return the label's TextureBands."""
+    assert len(label.children) == 1
+    bands = label.children[0]
+    assert isinstance(bands, TextureBands)
+    return bands
+
+
+def _scrolled_label(**kwargs):
+    """Return a lazily banded label inside a 300px high ScrollView."""
+    scroll_view = ScrollView(size=(400, 300), size_hint=(None, None))
+    label = MarkdownLabel(text=LONG_TEXT, render_mode='texture', texture_lazy_tiles=True,
+                          texture_tile_height=200, texture_prefetch=100,
+                          size_hint=(1, None), **kwargs)
+    label.bind(minimum_height=label.setter('height'))
+    scroll_view.add_widget(label)
+    for _ in range(5):
+        Clock.tick()
+    return scroll_view, label
+
+
+class TestBandOffsets:
+    """Tests for cutting content into bands."""
+
+    def test_last_band_holds_remainder(self):
+        """Bands have the band height except the last one."""
+        assert band_offsets(450, 200) == [0.0, 200.0, 400.0, 450.0]
+
+    def test_exact_multiple(self):
+        """Content of a multiple of the band height has no empty band."""
+        assert band_offsets(400, 200) == [0.0, 200.0, 400.0]
+
+
+class TestTextureBandsStructure:
+    """Tests for the widget tree of lazily banded texture mode."""
+
+    def test_single_bands_widget(self):
+        """The label holds one TextureBands of the content's size."""
+        scroll_view, label = _scrolled_label()
+        bands = _bands(label)
+
+        assert bands.content.parent is None
+        assert bands.size == bands.content.size
+        assert bands.height > scroll_view.height * 10
+        assert not find_images(label)
+
+    def test_eager_mode_unchanged(self):
+        """Without texture_lazy_tiles texture mode shows captured Images."""
+        label = MarkdownLabel(text=LONG_TEXT, render_mode='texture', texture_tile_height=200,
+                              size=(400, 300), size_hint=(None, None))
+        label.force_rebuild()
+
+        assert not isinstance(label.children[0], TextureBands)
+        assert len(find_images(label)) > 1
+
+
+class TestTextureBandsViewport:
+    """Tests for capturing bands near the visible region."""
+
+    def test_only_visible_bands_are_captured(self):
+        """Bands far below the viewport are not captured."""
+        scroll_view, label = _scrolled_label()
+        bands = _bands(label)
+
+        # Documented Exception: Verifying internal band cache
+        assert 0 in bands._bands
+        assert len(bands._bands) <= 3
+        assert len(bands._band_offsets) - 2 not in bands._bands
+
+    def test_scrolling_moves_captured_bands(self):
+        """Scrolling to the bottom captures the last band and drops the first."""
+        scroll_view, label = _scrolled_label()
+        bands = _bands(label)
+
+        scroll_view.scroll_y = 0
+        for _ in range(5):
+            Clock.tick()
+
+        # Documented Exception: Verifying internal band cache
+        assert len(bands._band_offsets) - 2 in bands._bands
+        assert 0 not in bands._bands
+
+    def test_max_tiles_caps_captured_bands(self):
+        """texture_max_tiles keeps only the bands nearest the visible region."""
+        scroll_view, label = _scrolled_label(texture_max_tiles=1)
+        bands = _bands(label)
+
+        # Documented Exception: Verifying internal band cache
+        assert list(bands._bands) == [0]
+
+
+class TestTextureBandsLinks:
+    """Tests for links in lazily banded texture mode."""
+
+    def test_ref_zones_match_eager_capture(self):
+        """Link zones do not depend on which bands are captured."""
+        lazy = MarkdownLabel(text=LONG_TEXT, render_mode='texture', texture_lazy_tiles=True,
+                             size=(400, 300), size_hint=(None, None))
+        eager = MarkdownLabel(text=LONG_TEXT, render_mode='texture',
+                              size=(400, 300), size_hint=(None, None))
+        lazy.force_rebuild()
+        eager.force_rebuild()
+
+        # Documented Exception: Verifying internal link zones in texture mode
+        assert lazy._aggregated_refs['http://example.com'] == \
+            eager._aggregated_refs['http://example.com']
+
+
+DASHBOARD = 'Status: ok\n\nCPU: 10%\n\nMemory: 2 GB\n\nSee [details](http://example.com).'
+
+
+def _incremental_label(text=DASHBOARD, **kwargs):
+    """Create an incremental texture-mode label and let it lay out."""
+    label = MarkdownLabel(text=text, render_mode='texture', incremental_texture=True,
+                          size=(400, 600), size_hint=(None, None), **kwargs)
+    for _ in range(5):
+        Clock.tick()
+    return label
+
+
+def _set_text(label, text):
+    """Change the label's text and let the deferred rebuild run."""
+    label.text = text
+    for _ in range(5):
+        Clock.tick()
+
+
+class TestIncrementalTextureUpdates:
+    """Tests for redrawing changed regions in texture mode."""
+
+    def test_bands_and_blocks_are_kept(self):
+        """A changed line keeps the TextureBands, its Fbos and other blocks."""
+        label = _incremental_label()
+        bands = _bands(label)
+        # Documented Exception: Verifying internal band cache
+        fbos = dict(bands._bands)
+        first_block = bands.content.children[-1]
+
+        _set_text(label, DASHBOARD.replace('10%', '20%'))
+
+        assert _bands(label) is bands
+        assert bands._bands == fbos
+        assert bands.content.children[-1] is first_block
+        assert any('20%' in getattr(child, 'text', '') for child in bands.content.children)
+
+    def test_only_changed_region_is_redrawn(self):
+        """Same-height changes redraw from the changed block to its bottom."""
+        label = _incremental_label()
+        bands = _bands(label)
+        with patch.object(bands, 'redraw_region', wraps=bands.redraw_region) as redraw:
+            _set_text(label, DASHBOARD.replace('10%', '20%'))
+
+        redraw.assert_called_once()
+        top, bottom = redraw.call_args[0]
+        assert 0 < top < bottom < bands.content.height
+
+    def test_height_change_redraws_to_the_end(self):
+        """Blocks growing or added move everything below them."""
+        label = _incremental_label()
+        bands = _bands(label)
+        old_height = bands.height
+
+        with patch.object(bands, 'redraw_region', wraps=bands.redraw_region) as redraw:
+            _set_text(label, DASHBOARD.replace('CPU: 10%', 'CPU: 10%\n\nDisk: 50%'))
+
+        assert bands.height > old_height
+        assert redraw.call_args[0][1] == bands.content.height
+
+    def test_ref_zones_match_full_capture(self):
+        """Zones of moved links match those of a fresh capture."""
+        label = _incremental_label()
+        new_text = DASHBOARD.replace('CPU: 10%', 'CPU: 10%\n\nDisk: 50%')
+        _set_text(label, new_text)
+        fresh = _incremental_label(text=new_text)
+
+        # Documented Exception: Verifying internal link zones in texture mode
+        assert label._aggregated_refs['http://example.com'] == \
+            fresh._aggregated_refs['http://example.com']
+
+    def test_without_incremental_texture_recaptures(self):
+        """Plain texture mode replaces the captured content on text changes."""
+        label = MarkdownLabel(text=DASHBOARD, render_mode='texture',
+                              size=(400, 600), size_hint=(None, None))
+        for _ in range(5):
+            Clock.tick()
+        image = label.children[0]
+
+        _set_text(label, DASHBOARD.replace('10%', '20%'))
+
+        assert label.children[0] is not image
+        assert not isinstance(label.children[0], TextureBands)
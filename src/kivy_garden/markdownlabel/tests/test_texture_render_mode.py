@@ -8,6 +8,7 @@ This module contains tests for the texture render mode feature, including:
   on_ref_press event dispatching
 - Deterministic texture hit-testing: Touch event handling within and outside
   link zones
+- Texture bands: Tall content captured as a column of band textures
 - Texture fallback branch: Fallback to widgets mode when texture rendering
   fails
 - Auto render mode selection: Automatic selection between widgets
@@ -19,6 +20,8 @@ rendering for maximum Label compatibility while maintaining proper Markdown
 functionality.
 """
 
+import warnings
+
 import pytest
 from hypothesis import given, strategies as st, settings
 
@@ -512,6 +515,94 @@ class TestDeterministicTextureHitTesting:
 # content, texture for complex layouts or when strict_label_mode is True with
 # height constraints).
 
+# Content taller than the band height SHALL be captured as a column of band
+# textures whose link zones stay in content coordinates.
+
+@pytest.mark.slow
+class TestTextureBands:
+    """Tests for capturing tall texture-mode content in bands."""
+
+    @staticmethod
+    def _tall_text(paragraphs):
+        return '\n\n'.join(f'Paragraph {i}' for i in range(paragraphs))
+
+    @pytest.mark.unit
+    def test_short_content_is_one_image(self):
+        """Content below the band height stays a single Image."""
+        label = MarkdownLabel(
+            text='Hello World',
+            render_mode='texture',
+            texture_tile_height=512,
+            size=(400, 300),
+            size_hint=(None, None)
+        )
+        label.force_rebuild()
+
+        assert len(find_images(label)) == 1
+
+    @pytest.mark.unit
+    def test_tall_content_is_captured_in_bands(self):
+        """Content taller than texture_tile_height becomes a column of bands."""
+        label = MarkdownLabel(
+            text=self._tall_text(60),
+            render_mode='texture',
+            texture_tile_height=512,
+            size=(400, 300),
+            size_hint=(None, None)
+        )
+        label.force_rebuild()
+
+        images = find_images(label)
+        assert len(images) > 1, \
+            f"Expected several band Images, found {len(images)}"
+        assert all(image.height <= 512 for image in images)
+        column = images[0].parent
+        assert isinstance(column, BoxLayout)
+        assert sum(image.height for image in images) == column.height
+
+    @pytest.mark.unit
+    def test_content_beyond_fbo_limit_keeps_texture_mode(self):
+        """Content taller than the maximum Fbo size no longer falls back."""
+        label = MarkdownLabel(
+            text=self._tall_text(600),
+            render_mode='texture',
+            size=(400, 300),
+            size_hint=(None, None)
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', RuntimeWarning)
+            label.force_rebuild()
+
+        images = find_images(label)
+        assert len(images) >= 2
+        assert all(image.height <= rendering_module.MAX_FBO_DIM for image in images)
+        assert sum(image.height for image in images) > rendering_module.MAX_FBO_DIM
+
+    @pytest.mark.unit
+    def test_band_ref_zones_match_single_texture(self):
+        """Banding leaves link zones in content coordinates unchanged."""
+        text = self._tall_text(40) + '\n\n[Link](http://example.com)'
+        labels = []
+        for tile_height in (256, 0):
+            label = MarkdownLabel(
+                text=text,
+                render_mode='texture',
+                texture_tile_height=tile_height,
+                size=(400, 300),
+                size_hint=(None, None),
+                pos=(0, 0)
+            )
+            label.force_rebuild()
+            labels.append(label)
+        banded, single = labels
+
+        assert len(find_images(banded)) > 1
+        assert len(find_images(single)) == 1
+        # Documented Exception: Verifying internal link zones in texture mode
+        assert banded._aggregated_refs['http://example.com'] == \
+            single._aggregated_refs['http://example.com']
+
+
 # WHEN _render_as_texture returns None, THE MarkdownLabel SHALL fall back to
 # widgets-mode rendering.
 
@@ -13,6 +13,7 @@ from kivy.uix.label import Label
 from kivy.uix.boxlayout import BoxLayout
 
 from kivy_garden.markdownlabel import MarkdownLabel
+from kivy_garden.markdownlabel.list_layout import ListLayout
 from .test_utils import (
     simple_markdown_document, markdown_heading, markdown_paragraph
 )
@@ -130,15 +131,15 @@ class TestComprehensiveTextureSizeCalculation:
 
     @pytest.mark.unit
     def test_list_creates_container_widget(self):
-        """List content creates a BoxLayout container that is included in texture_size calculation."""
+        """List content creates a ListLayout container that is included in texture_size calculation."""
         markdown = '- Item 1\n- Item 2\n- Item 3'
         label = MarkdownLabel(text=markdown)
 
         # Verify list creates children
         assert len(label.children) >= 1, \
             f"Expected at least 1 child for list, got {len(label.children)}"
-        assert any(isinstance(c, BoxLayout) for c in label.children), \
-            "Expected at least one BoxLayout container for list"
+        assert any(isinstance(c, ListLayout) for c in label.children), \
+            "Expected at least one ListLayout container for list"
 
         # Verify texture_size is accessible and returns valid structure
         texture_size = label.texture_size
@@ -263,7 +264,7 @@ code = "block"
 
     @pytest.mark.unit
     def test_nested_list_creates_nested_containers(self):
-        """Nested list content creates nested BoxLayout containers for texture_size calculation."""
+        """Nested list content creates nested ListLayout containers for texture_size calculation."""
         markdown = '''- Item 1
   - Nested 1
   - Nested 2
@@ -273,8 +274,8 @@ code = "block"
         # Verify nested list creates children
         assert len(label.children) >= 1, \
             f"Expected at least 1 child for nested list, got {len(label.children)}"
-        assert any(isinstance(c, BoxLayout) for c in label.children), \
-            "Expected at least one BoxLayout container for nested list"
+        assert any(isinstance(c, ListLayout) for c in label.children), \
+            "Expected at least one ListLayout container for nested list"
 
         # Verify texture_size is accessible and returns valid structure
         texture_size = label.texture_size
@@ -283,15 +284,15 @@ code = "block"
 
     @pytest.mark.unit
     def test_ordered_list_creates_container_widget(self):
-        """Ordered list content creates a BoxLayout container for texture_size calculation."""
+        """Ordered list content creates a ListLayout container for texture_size calculation."""
         markdown = '1. First\n2. Second\n3. Third'
         label = MarkdownLabel(text=markdown)
 
         # Verify ordered list creates children
         assert len(label.children) >= 1, \
             f"Expected at least 1 child for ordered list, got {len(label.children)}"
-        assert any(isinstance(c, BoxLayout) for c in label.children), \
-            "Expected at least one BoxLayout container for ordered list"
+        assert any(isinstance(c, ListLayout) for c in label.children), \
+            "Expected at least one ListLayout container for ordered list"
 
         # Verify texture_size is accessible and returns valid structure
         texture_size = label.texture_size
@@ -6,11 +6,12 @@ functions used across multiple test modules in the MarkdownLabel test suite.
 """
 
 from hypothesis import strategies as st
+from kivy.clock import Clock
 from kivy.uix.label import Label
 from kivy.uix.widget import Widget
 from kivy.uix.image import Image
 from kivy.uix.stencilview import StencilView
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 
 # Touch Simulation Classes
@@ -33,6 +34,26 @@ class FakeTouch:
         self.pos = (x, y)
 
 
+# Widget Helpers
+
+def make_label(text: str, **kwargs):
+    """Create a 400px wide MarkdownLabel showing ``text`` and let it lay out.
+
+    Args:
+        text: Markdown text of the label
+        **kwargs: Further MarkdownLabel properties
+
+    Returns:
+        MarkdownLabel after five clock ticks
+    """
+    from kivy_garden.markdownlabel import MarkdownLabel
+
+    label = MarkdownLabel(text=text, size=(400, 600), size_hint=(None, None), **kwargs)
+    for _ in range(5):
+        Clock.tick()
+    return label
+
+
 # Constants
 KIVY_FONTS = ['Roboto', 'Roboto-Bold', 'Roboto-Italic', 'RobotoMono-Regular']
 
@@ -623,6 +644,26 @@ def find_images(widget: Widget, images: Optional[List[Image]] = None) -> List[Im
     return images
 
 
+def ref_center(widget: Widget, ref: str) -> Tuple[float, float]:
+    """Return the center of the first box of ``ref`` in a widget-mode tree.
+
+    Args:
+        widget: The root widget to search from, shown at the window origin
+        ref: Name of the link
+
+    Returns:
+        Window coordinates of the center of the link text
+    """
+    for label in find_labels_recursive(widget):
+        if ref in (label.refs or {}):
+            x1, y1, x2, y2 = label.refs[ref][0]
+            tex_w, tex_h = label.texture_size
+            left = label.center_x - tex_w / 2.0
+            top = label.center_y + tex_h / 2.0
+            return left + (x1 + x2) / 2.0, top - (y1 + y2) / 2.0
+    raise AssertionError(f'No label has the ref {ref!r}')
+
+
 def has_clipping_container(widget: Widget) -> bool:
     """Check if widget contains a clipping container (StencilView).
 
@@ -0,0 +1,215 @@
+"""
+Tests for the opt-in widget pool.
+
+This module verifies that WidgetPool resets released Labels and layout
+containers (renderer and MarkdownLabel bindings, metadata, canvas
+instructions and properties), that MarkdownLabel with ``widget_pooling``
+reuses the widgets of discarded blocks across rebuilds with the same result
+as fresh widgets, and that pooling stays off by default.
+"""
+
+import pytest
+from kivy.graphics import Color, Rectangle
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.label import Label
+
+from kivy_garden.markdownlabel import MarkdownLabel
+from kivy_garden.markdownlabel.widget_pool import WidgetPool, get_widget_pool
+
+DOCUMENT = """# Title
+
+Paragraph with a [link](http://example.com).
+
+- one
+- two
+
+> quoted
+
+```python
+x = 1
+```
+
+| a | b |
+|---|---|
+| 1 | 2 |
+"""
+
+
+def _external_observers(widget, name):
+    """Return callbacks bound to ``name`` with bind() rather than fbind()."""
+    return [obs for obs in widget.get_property_observers(name, True) if obs[4] is None]
+
+
+def _describe(widget):
+    """Return a comparable description of a rendered widget tree."""
+    entry = [type(widget).__name__]
+    if isinstance(widget, Label):
+        entry += [widget.text, widget.font_size, widget.bold, widget.halign,
+                  list(widget.color), getattr(widget, '_font_scale', None),
+                  getattr(widget, 'heading_level', None), getattr(widget, '_is_code', False)]
+    if isinstance(widget, BoxLayout):
+        entry += [widget.orientation, list(widget.padding)]
+    entry.append(len(widget.canvas.before.children))
+    return entry + [_describe(child) for child in reversed(widget.children)]
+
+
+@pytest.fixture
+def pool():
+    """Empty process-wide pool, cleared again afterwards."""
+    shared = get_widget_pool()
+    shared.clear()
+    yield shared
+    shared.clear()
+
+
+class TestWidgetPoolReset:
+    """Tests for resetting released widgets."""
+
+    def test_release_removes_bindings_and_metadata(self):
+        """Released Labels lose callbacks, ref bindings and renderer metadata."""
+        pool = WidgetPool()
+        label = pool.acquire('heading', Label, text='Title', size_hint_y=None)
+        label.heading_level = 1
+        label._font_scale = 2.5
+        label._md_text_size_width_cb = label.setter('text_size')
+        label.bind(width=label._md_text_size_width_cb, on_ref_press=lambda *args: None)
+
+        pool.release(label)
+
+        assert pool.acquire('heading', Label) is label
+        assert not _external_observers(label, 'width')
+        assert not _external_observers(label, 'on_ref_press')
+        assert not hasattr(label, 'heading_level')
+        assert not hasattr(label, '_font_scale')
+        assert getattr(label, '_md_text_size_width_cb', None) is None
+
+    def test_acquire_resets_properties_to_defaults(self):
+        """Properties not passed to acquire() return to their defaults."""
+        pool = WidgetPool()
+        label = pool.acquire('paragraph', Label, text='x', bold=True, halign='right',
+                             color=[1, 0, 0, 1], size_hint_y=None)
+        label.width = 300
+        pool.release(label)
+
+        reused = pool.acquire('paragraph', Label, text='y')
+
+        assert reused is label
+        assert reused.text == 'y'
+        assert reused.bold is False
+        assert reused.halign == 'auto'
+        assert list(reused.color) == [1, 1, 1, 1]
+        assert reused.size_hint_y == 1
+        assert reused.width == 100
+
+    def test_release_detaches_and_pools_descendants(self):
+        """Releasing a container pools its children and clears its canvas."""
+        pool = WidgetPool()
+        container = pool.acquire('block_quote', BoxLayout, orientation='vertical')
+        child = pool.acquire('paragraph', Label, text='quoted')
+        container.add_widget(child)
+        with container.canvas.before:
+            Color(0.5, 0.5, 0.5, 1)
+            container._bg_rect = Rectangle()
+
+        pool.release(container)
+
+        assert child.parent is None
+        assert not container.children
+        assert not container.canvas.before.children
+        assert not hasattr(container, '_bg_rect')
+        assert len(pool) == 2
+
+    def test_unpooled_widgets_are_dropped(self):
+        """Widgets not created by acquire() are never handed out."""
+        pool = WidgetPool()
+        foreign = Label(text='plain')
+
+        pool.release(foreign)
+
+        assert len(pool) == 0
+        assert pool.acquire('paragraph', Label, text='x') is not foreign
+
+    def test_kinds_are_bounded(self):
+        """At most max_per_kind widgets are kept per kind."""
+        pool = WidgetPool(max_per_kind=2)
+        for _ in range(4):
+            pool.release(pool.acquire('paragraph', Label))
+            pool.release(Label())
+        labels = [pool.acquire('paragraph', Label) for _ in range(3)]
+        for label in labels:
+            pool.release(label)
+
+        assert len(pool) == 2
+
+
+class TestLabelWidgetPooling:
+    """Tests for MarkdownLabel with widget_pooling enabled."""
+
+    def test_pooling_off_by_default(self, pool):
+        """Default labels neither take nor return pooled widgets."""
+        label = MarkdownLabel(text=DOCUMENT)
+        label.force_rebuild()
+
+        assert label.widget_pooling is False
+        assert pool.created == pool.reused == len(pool) == 0
+
+    def test_widgets_reused_across_builds(self, pool):
+        """A second build takes the widgets of the first from the pool."""
+        label = MarkdownLabel(text=DOCUMENT, widget_pooling=True)
+        created = pool.created
+
+        label.force_rebuild()
+
+        assert created > 0
+        assert pool.created == created
+        assert pool.reused == created
+
+    def test_reused_widgets_match_fresh_widgets(self, pool):
+        """Pooled builds produce the same widgets as unpooled builds."""
+        fresh = MarkdownLabel(text=DOCUMENT)
+        pooled = MarkdownLabel(text=DOCUMENT, widget_pooling=True)
+        other = MarkdownLabel(text='## Other\n\n- [x](y)\n\n```\ncode\n```', widget_pooling=True)
+
+        other.text = ''
+        other.force_rebuild()
+        pooled.force_rebuild()
+
+        assert pool.reused > 0
+        assert [_describe(w) for w in pooled.children] == [_describe(w) for w in fresh.children]
+
+    def test_reused_label_ref_press_goes_to_new_owner(self, pool):
+        """Links in reused Labels dispatch on the label that now shows them."""
+        first = MarkdownLabel(text='[old](old)', widget_pooling=True)
+        old_label = first.children[0]
+        first.text = ''
+        first.force_rebuild()
+        second = MarkdownLabel(text='[new](new)', widget_pooling=True)
+        pressed = []
+        first.bind(on_ref_press=lambda instance, ref: pressed.append(('first', ref)))
+        second.bind(on_ref_press=lambda instance, ref: pressed.append(('second', ref)))
+
+        second.children[0].dispatch('on_ref_press', 'new')
+
+        assert second.children[0] is old_label
+        assert pressed == [('second', 'new')]
+
+    def test_style_updates_apply_to_reused_widgets(self, pool):
+        """In-place font updates use the metadata set for the new block."""
+        label = MarkdownLabel(text='# Heading', widget_pooling=True)
+        label.text = 'Paragraph'
+        label.force_rebuild()
+        label.text = '# Heading'
+        label.force_rebuild()
+
+        label.base_font_size = 20
+
+        assert label.children[0].font_size == 20 * 2.5
+        assert label.children[0].bold is True
+
+    def test_texture_mode_returns_captured_widgets(self, pool):
+        """Widgets captured into a texture are returned to the pool."""
+        label = MarkdownLabel(text=DOCUMENT, render_mode='texture', widget_pooling=True,
+                              size=(400, 600))
+        label.force_rebuild()
+
+        assert len(pool) > 0
@@ -0,0 +1,271 @@
+"""
+Texture Bands
+=============
+
+Texture-mode content rasterized in bands as it scrolls into view.
+
+Texture mode captures the laid-out document into Fbo textures right after
+each build, so a long label inside a ScrollView pays for rasterizing every
+screen of it before the first one is shown, and keeps all of those textures
+in GPU memory. With ``texture_lazy_tiles`` MarkdownLabel instead hands the
+laid-out content to a :class:`TextureBands` widget, which cuts it into
+horizontal bands and captures only the bands near the visible region of the
+closest ScrollView (or the window). Bands leaving that region release their
+textures.
+
+With ``incremental_texture`` MarkdownLabel keeps the content in a
+TextureBands widget capturing all bands. After a text change it lays out
+the changed blocks in the same content and calls
+:meth:`TextureBands.redraw_region`, which clears and draws only the stripe
+of each band the changed blocks cover, or everything below them when their
+height changed.
+
+:func:`capture_band` captures one band, and is also used for the bands
+texture mode captures eagerly.
+"""
+
+from math import ceil, floor
+from typing import Dict, List, Optional, Tuple
+
+from kivy.clock import Clock
+from kivy.graphics import (
+    ClearBuffers,
+    ClearColor,
+    Color,
+    Fbo,
+    InstructionGroup,
+    PopMatrix,
+    PushMatrix,
+    Rectangle,
+    ScissorPop,
+    ScissorPush,
+    Translate,
+)
+from kivy.properties import BooleanProperty, NumericProperty, ObjectProperty
+from kivy.uix.widget import Widget
+
+from .viewport import ViewportTracker, index_range
+
+# Band height used when the label does not set texture_tile_height
+DEFAULT_BAND_HEIGHT = 1024
+
+
+def _draw_band(fbo: Fbo, content: Widget, bottom: float,
+               region: Optional[Tuple[float, float]] = None) -> None:
+    """Draw the band of ``content`` from ``bottom`` up into ``fbo``.
+
+    With ``region``, the ``(y, height)`` of a stripe in band coordinates,
+    only that stripe is cleared and drawn; the rest of the texture is kept.
+    """
+    width = int(fbo.size[0])
+    group = InstructionGroup()
+    if region is not None:
+        region_y, region_height = region
+        low = int(floor(region_y))
+        high = int(ceil(region_y + region_height))
+        group.add(ScissorPush(x=0, y=low, width=width, height=high - low))
+    group.add(ClearColor(0, 0, 0, 0))
+    group.add(ClearBuffers())
+    group.add(PushMatrix())
+    group.add(Translate(0, -bottom))
+    group.add(content.canvas)
+    group.add(PopMatrix())
+    if region is not None:
+        group.add(ScissorPop())
+
+    fbo.add(group)
+    fbo.draw()
+    fbo.remove(group)
+    group.remove(content.canvas)
+
+
+def capture_band(content: Widget, bottom: float, width: float, height: float) -> Fbo:
+    """Draw the part of ``content`` from ``bottom`` up into a new Fbo.
+
+    Args:
+        content: Laid-out widget tree positioned at the origin
+        bottom: Content y coordinate of the band's lower edge
+        width: Width of the band in pixels
+        height: Height of the band in pixels
+
+    Returns:
+        Fbo whose ``texture`` holds the band
+    """
+    fbo = Fbo(size=(int(width), int(height)))
+    _draw_band(fbo, content, bottom)
+    return fbo
+
+
+def band_offsets(height: float, band_height: float) -> List[float]:
+    """Return the top offsets of the bands of ``height`` pixels of content.
+
+    Offsets are distances below the content top, followed by the content
+    height, as for :func:`~kivy_garden.markdownlabel.viewport.index_range`.
+    The last band holds the remainder.
+    """
+    step = max(1, int(band_height))
+    offsets: List[float] = [float(top) for top in range(0, int(height), step)]
+    offsets.append(float(height))
+    return offsets
+
+
+class TextureBands(Widget):
+    """Widget drawing a detached, laid-out widget tree as captured bands.
+
+    :attr:`content` keeps its size and stays at the origin; the widget has
+    the same size and draws the captured bands at the content positions.
+    With :attr:`lazy`, bands within :attr:`prefetch` pixels of the visible
+    region are captured, at most :attr:`max_bands` of them, closest to the
+    visible region first. Otherwise all bands are captured.
+    """
+
+    content = ObjectProperty(None, allownone=True)
+    """Root widget of the captured content, laid out at its final size and
+    positioned at the origin. It must not have a parent."""
+
+    band_height = NumericProperty(DEFAULT_BAND_HEIGHT)
+    """Height of each band in pixels; the last band holds the remainder."""
+
+    lazy = BooleanProperty(True)
+    """Capture only bands near the visible region of the closest ScrollView
+    (or the window)."""
+
+    prefetch = NumericProperty(400)
+    """Distance in pixels beyond the visible region in which lazy bands are
+    captured and kept."""
+
+    max_bands = NumericProperty(0)
+    """Maximum number of lazy bands kept at once (0 for no limit)."""
+
+    def __init__(self, **kwargs):
+        # Fbos of the captured bands by index, and the top offset of every band
+        self._bands: Dict[int, Fbo] = {}
+        self._band_offsets: List[float] = [0.0]
+        self._trigger_viewport = Clock.create_trigger(self._update_viewport, -1)
+        self._viewport = ViewportTracker(self, self._trigger_viewport)
+        super().__init__(**kwargs)
+        with self.canvas:
+            PushMatrix()
+            self._translate = Translate(self.x, self.y)
+            self._content_group = InstructionGroup()
+            PopMatrix()
+        fbind = self.fbind
+        fbind('content', self._invalidate)
+        fbind('band_height', self._invalidate)
+        fbind('lazy', self._invalidate)
+        fbind('pos', self._update_translate)
+        fbind('pos', self._trigger_viewport)
+        fbind('prefetch', self._trigger_viewport)
+        fbind('max_bands', self._trigger_viewport)
+        self._invalidate()
+
+    def _invalidate(self, *largs):
+        """Drop the captured bands and cut the content into bands again."""
+        self._bands = {}
+        content = self.content
+        if content is None:
+            self._band_offsets = [0.0]
+            self._draw()
+            return
+        self.size = content.size
+        self._band_offsets = band_offsets(content.height, self.band_height)
+        if self.lazy:
+            self._trigger_viewport()
+        else:
+            self._update_viewport()
+
+    def _update_translate(self, *largs):
+        """Move the drawn bands with the widget."""
+        self._translate.xy = self.pos
+
+    def redraw_region(self, top: float, bottom: float) -> None:
+        """Draw the content between ``top`` and ``bottom`` again.
+
+        Call after the content changed in that region, with distances below
+        the content top. When the content height changed, the region has to
+        reach down to the new bottom. Captured bands overlapping the region
+        redraw only the overlapping stripe into their Fbo; bands above and
+        below it keep their textures.
+        """
+        content = self.content
+        if content is None:
+            return
+        self.size = content.size
+        offsets = self._band_offsets = band_offsets(content.height, self.band_height)
+        content_top = offsets[-1]
+        width = int(content.width)
+
+        bands = self._bands
+        for index in list(bands):
+            if index >= len(offsets) - 1:
+                del bands[index]
+                continue
+            band_top = offsets[index]
+            band_bottom = offsets[index + 1]
+            if band_bottom <= top or band_top >= bottom:
+                continue
+            fbo = bands[index]
+            band_y = content_top - band_bottom
+            if tuple(fbo.size) != (width, int(band_bottom - band_top)):
+                bands[index] = capture_band(content, band_y, width, band_bottom - band_top)
+                continue
+            stripe_top = max(band_top, top)
+            stripe_bottom = min(band_bottom, bottom)
+            _draw_band(fbo, content, band_y,
+                       (band_bottom - stripe_bottom, stripe_bottom - stripe_top))
+        self._update_viewport()
+
+    def _wanted_bands(self) -> List[int]:
+        """Return the bands to keep captured for the current visible region."""
+        offsets = self._band_offsets
+        if not self.lazy:
+            return list(range(len(offsets) - 1))
+        low, high = self._viewport.visible_range()
+        first, last = index_range(offsets, low - self.prefetch, high + self.prefetch)
+        wanted = list(range(first, last))
+        max_bands = int(self.max_bands)
+        if 0 < max_bands < len(wanted):
+            visible_first, visible_last = index_range(offsets, low, high)
+
+            def distance(index: int) -> int:
+                if index < visible_first:
+                    return visible_first - index
+                if index >= visible_last:
+                    return index - visible_last + 1
+                return 0
+
+            wanted = sorted(sorted(wanted, key=distance)[:max_bands])
+        return wanted
+
+    def _update_viewport(self, *largs) -> None:
+        """Capture the wanted bands, release the others and redraw."""
+        self._trigger_viewport.cancel()
+        content = self.content
+        if content is None:
+            return
+        wanted = self._wanted_bands()
+
+        bands = self._bands
+        for index in [index for index in bands if index not in wanted]:
+            del bands[index]
+        offsets = self._band_offsets
+        top = offsets[-1]
+        for index in wanted:
+            if index not in bands:
+                height = offsets[index + 1] - offsets[index]
+                bottom = top - offsets[index + 1]
+                bands[index] = capture_band(content, bottom, content.width, height)
+        self._draw()
+
+    def _draw(self) -> None:
+        """Replace the drawn bands."""
+        group = self._content_group
+        group.clear()
+        group.add(Color(1, 1, 1, 1))
+        offsets = self._band_offsets
+        top = offsets[-1]
+        for index in sorted(self._bands):
+            height = offsets[index + 1] - offsets[index]
+            group.add(Rectangle(texture=self._bands[index].texture,
+                                pos=(0, top - offsets[index + 1]),
+                                size=(self.width, height)))
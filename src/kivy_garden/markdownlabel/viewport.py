@@ -0,0 +1,101 @@
+"""
+Viewport
+========
+
+Visible-region tracking for widgets that rasterize only part of their content.
+
+Virtualized tables and tiled code blocks draw the rows or tiles near the
+visible region of their closest ScrollView (or the window) and represent the
+rest by its height. :class:`ViewportTracker` finds that ScrollView, calls
+back when it scrolls or resizes and reports the visible region in the
+widget's own terms, as distances below its top edge. :func:`index_range`
+turns such a region into the range of items to rasterize.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Callable, Optional, Sequence, Tuple
+
+from kivy.base import EventLoop
+from kivy.uix.scrollview import ScrollView
+from kivy.uix.widget import Widget
+
+
+def find_scroll_view(widget: Widget) -> Optional[ScrollView]:
+    """Return the closest ScrollView ancestor of ``widget``, if any."""
+    parent = widget.parent
+    while parent is not None and parent is not parent.parent:
+        if isinstance(parent, ScrollView):
+            return parent
+        parent = parent.parent
+    return None
+
+
+def index_range(offsets: Sequence[float], low: float, high: float) -> Tuple[int, int]:
+    """Return the items overlapping the region from ``low`` to ``high``.
+
+    Args:
+        offsets: Top offset of every item followed by the bottom offset of
+            the last one, increasing, as distances below the content top
+        low: Top of the region
+        high: Bottom of the region
+
+    Returns:
+        ``(first, last)`` indices of the items, ``last`` exclusive
+    """
+    count = len(offsets) - 1
+    first = max(0, bisect_right(offsets, low) - 1)
+    last = min(count, bisect_left(offsets, high))
+    return first, last
+
+
+class ViewportTracker:
+    """Visible region of a widget's closest ScrollView or of the window.
+
+    ``callback`` is bound to the widget's ``height`` and to the ``scroll_y``,
+    ``height`` and ``viewport_size`` of the current ScrollView, which is
+    looked up again on each :meth:`visible_range` call so widgets moved
+    between ScrollViews keep being tracked. The ScrollView moves its content
+    with a canvas translate, so content growing around the widget changes
+    only its ``viewport_size``.
+    """
+
+    def __init__(self, widget: Widget, callback: Callable[..., None]):
+        self.widget = widget
+        self.callback = callback
+        self.scroll_view: Optional[ScrollView] = None
+        widget.fbind('height', callback)
+
+    def _track(self, scroll_view: Optional[ScrollView]) -> None:
+        if scroll_view is self.scroll_view:
+            return
+        if self.scroll_view is not None:
+            self.scroll_view.funbind('scroll_y', self.callback)
+            self.scroll_view.funbind('height', self.callback)
+            self.scroll_view.funbind('viewport_size', self.callback)
+        if scroll_view is not None:
+            scroll_view.fbind('scroll_y', self.callback)
+            scroll_view.fbind('height', self.callback)
+            scroll_view.fbind('viewport_size', self.callback)
+        self.scroll_view = scroll_view
+
+    def visible_range(self) -> Tuple[float, float]:
+        """Return the visible region as distances below the widget's top edge.
+
+        Widgets not shown in a window are assumed to be at the top of one.
+        """
+        widget = self.widget
+        window = EventLoop.window
+        window_height = window.height if window is not None else 0
+        scroll_view = find_scroll_view(widget)
+        self._track(scroll_view)
+
+        if scroll_view is not None:
+            view_bottom = scroll_view.to_window(scroll_view.x, scroll_view.y)[1]
+            view_top = view_bottom + scroll_view.height
+        elif widget.get_root_window() is not None:
+            view_bottom, view_top = 0, window_height
+        else:
+            return 0, window_height
+
+        widget_top = widget.to_window(widget.x, widget.y)[1] + widget.height
+        return widget_top - view_top, widget_top - view_bottom
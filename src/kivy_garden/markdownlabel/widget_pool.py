@@ -0,0 +1,203 @@
+"""
+Widget Pool
+===========
+
+Reuse of Labels and layout containers across rebuilds.
+
+With ``MarkdownLabel.widget_pooling`` enabled, KivyRenderer takes Labels, list
+markers and layout containers (BoxLayout, GridLayout, ListLayout) from the shared
+:class:`WidgetPool` instead of constructing them, and MarkdownLabel returns
+the widgets of discarded blocks to the pool. Pooled widgets are kept per
+block kind (``'paragraph'``, ``'heading'``, ``'list'``, ``'table'``, ...), so
+a reused widget usually only needs its text and a few properties changed.
+
+Released widgets are reset to the state of a newly constructed widget:
+callbacks bound by the renderer and MarkdownLabel (``_md_text_size_*``
+callbacks, ``on_ref_press``, size and minimum size bindings) are removed,
+renderer metadata such as ``_font_scale``, ``heading_level`` and ``_is_code``
+is deleted, and canvas instructions added by the renderer are cleared.
+Properties are reset to their defaults when the widget is acquired again.
+"""
+
+from copy import copy
+from typing import Any, Dict, List, Tuple, Type
+
+from kivy.properties import AliasProperty, ReferenceListProperty
+from kivy.uix.label import Label
+from kivy.uix.widget import Widget
+
+from .rendering import clear_text_size_bindings
+
+# Widgets kept per block kind
+_DEFAULT_MAX_PER_KIND = 256
+
+# Properties and events the renderer and MarkdownLabel bind callbacks to
+_OBSERVED_NAMES = (
+    'pos', 'size', 'width', 'height', 'minimum_height', 'minimum_size',
+    'texture_size', 'on_ref_press',
+)
+
+# Per-widget metadata set by KivyRenderer and MarkdownLabel
+_METADATA_ATTRS = (
+    '_font_scale', 'heading_level', '_is_code', '_code_color', 'language_info',
+    '_md_disable_tex_height_binding', 'cell_align', 'is_header', '_bg_rect',
+    '_border_line', '_md_text_size_width_cb', '_md_text_size_tex_cb', '_update_columns',
+)
+
+# Properties not reset on reuse: widget tree, derived and read-only values
+_SKIPPED_PROPERTIES = frozenset((
+    'parent', 'children', 'cls', 'ids', 'disabled', 'motion_filter',
+    'texture', 'texture_size', 'refs', 'anchors', 'is_shortened',
+))
+
+_resettable_cache: Dict[type, Tuple[Tuple[str, Any], ...]] = {}
+
+
+def _resettable_properties(widget: Widget) -> Tuple[Tuple[str, Any], ...]:
+    """Return ``(name, default)`` pairs of the properties reset on reuse.
+
+    Alias and reference list properties are skipped; their underlying
+    properties are reset instead.
+    """
+    cls = type(widget)
+    properties = _resettable_cache.get(cls)
+    if properties is None:
+        properties = tuple(
+            (name, prop.defaultvalue)
+            for name, prop in widget.properties().items()
+            if name not in _SKIPPED_PROPERTIES
+            and not isinstance(prop, (AliasProperty, ReferenceListProperty))
+        )
+        _resettable_cache[cls] = properties
+    return properties
+
+
+def _unbind_observers(widget: Widget) -> None:
+    """Remove callbacks bound with ``bind()`` to the observed names.
+
+    Widgets bind their own internals with ``fbind()``, which records a uid;
+    callbacks without one were added by the renderer or MarkdownLabel.
+    """
+    for name in _OBSERVED_NAMES:
+        try:
+            observers = widget.get_property_observers(name, True)
+        except KeyError:
+            continue
+        for callback, _largs, _kwargs, is_ref, uid in observers:
+            if uid is not None:
+                continue
+            if is_ref:
+                callback = callback()
+            if callback is not None:
+                widget.unbind(**{name: callback})
+
+
+class WidgetPool:
+    """Detached Labels and layout containers available for reuse.
+
+    Widgets must only be acquired and released on the main thread.
+
+    Attributes:
+        max_per_kind: Widgets kept per block kind; further released widgets
+            are left to the garbage collector
+        created: Widgets constructed by :meth:`acquire`
+        reused: Widgets taken from the pool by :meth:`acquire`
+    """
+
+    def __init__(self, max_per_kind: int = _DEFAULT_MAX_PER_KIND):
+        self.max_per_kind = max_per_kind
+        self.created = 0
+        self.reused = 0
+        self._free: Dict[str, List[Widget]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(widgets) for widgets in self._free.values())
+
+    def acquire(self, kind: str, widget_class: Type[Widget], **kwargs: Any) -> Widget:
+        """Return a widget of ``kind`` configured with ``kwargs``.
+
+        Args:
+            kind: Block kind the widget is used for
+            widget_class: Class to construct when no pooled widget is free;
+                every kind must always use the same class
+            **kwargs: Widget properties, as passed to the constructor
+
+        Returns:
+            Pooled widget reset to defaults and updated with ``kwargs``, or a
+            new ``widget_class`` instance
+        """
+        free = self._free.get(kind)
+        if not free:
+            widget = widget_class(**kwargs)
+            widget._md_pool_kind = kind
+            self.created += 1
+            return widget
+
+        widget = free.pop()
+        for name, default in _resettable_properties(widget):
+            value = kwargs.pop(name, default)
+            if getattr(widget, name) != value:
+                setattr(widget, name, copy(value) if value is default else value)
+        for name, value in kwargs.items():
+            setattr(widget, name, value)
+        self.reused += 1
+        return widget
+
+    def release(self, widget: Widget) -> None:
+        """Detach ``widget`` and return it and its descendants to the pool.
+
+        Only widgets created by :meth:`acquire` are kept; other widgets in
+        the tree are detached from their pooled descendants and dropped.
+
+        Args:
+            widget: Root of the widget tree to release
+        """
+        if widget.parent is not None:
+            widget.parent.remove_widget(widget)
+        self._release_tree(widget)
+
+    def clear(self) -> None:
+        """Drop all pooled widgets."""
+        self._free.clear()
+
+    def _release_tree(self, widget: Widget) -> None:
+        """Reset ``widget`` and its descendants and pool the pooled ones."""
+        kind = getattr(widget, '_md_pool_kind', None)
+        if kind is not None:
+            # Unbind first so detaching children does not run layout
+            # callbacks or notify the previous owner.
+            _unbind_observers(widget)
+
+        children = list(widget.children)
+        if children:
+            widget.clear_widgets()
+            for child in children:
+                self._release_tree(child)
+
+        if kind is None:
+            return
+
+        if isinstance(widget, Label):
+            clear_text_size_bindings(widget)
+            widget.text = ''
+        for name in _METADATA_ATTRS:
+            widget.__dict__.pop(name, None)
+        widget.canvas.before.clear()
+        widget.canvas.after.clear()
+
+        free = self._free.setdefault(kind, [])
+        if len(free) < self.max_per_kind:
+            free.append(widget)
+
+
+_shared_pool = WidgetPool()
+
+
+def get_widget_pool() -> WidgetPool:
+    """Return the process-wide pool used by KivyRenderer and MarkdownLabel."""
+    return _shared_pool
+
+
+def clear_widget_pool() -> None:
+    """Drop all widgets of the process-wide pool."""
+    _shared_pool.clear()
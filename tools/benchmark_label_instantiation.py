@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-label cost of creating MarkdownLabel instances.
+
+Compares building a private mistune parser for every label (the behavior
+before the shared parser registry) with fetching the shared parser, and
+reports the cost of constructing empty MarkdownLabel widgets with private
+and with shared parsers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import Callable
+from unittest import mock
+
+
+def time_per_call(func: Callable[[], object], count: int) -> float:
+    """Return the mean wall time of ``func`` in microseconds."""
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--count", type=int, default=500,
+                        help="number of instances per measurement (default: 500)")
+    args = parser.parse_args()
+
+    # Keep Kivy import side effects minimal for this benchmark.
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+
+    import mistune
+    from mistune.plugins.formatting import strikethrough
+    from mistune.plugins.table import table
+
+    from kivy_garden.markdownlabel import MarkdownLabel
+    from kivy_garden.markdownlabel.parser_registry import create_parser, get_parser
+
+    def private_parser() -> object:
+        md = mistune.create_markdown(renderer=None)
+        table(md)
+        strikethrough(md)
+        return md
+
+    # Warm up imports and the shared registry entry
+    private_parser()
+    get_parser()
+    MarkdownLabel()
+
+    before = time_per_call(private_parser, args.count)
+    after = time_per_call(get_parser, args.count)
+    label = time_per_call(MarkdownLabel, args.count)
+    # MarkdownLabel looks the parser up through the package namespace.
+    with mock.patch("kivy_garden.markdownlabel.get_parser", create_parser):
+        private_label = time_per_call(MarkdownLabel, args.count)
+
+    print(f"Instances per measurement: {args.count}")
+    print(f"Parser per label, private (before): {before:10.1f} us")
+    print(f"Parser per label, shared (after):   {after:10.1f} us")
+    print(f"Saved per label:                    {before - after:10.1f} us")
+    print(f"MarkdownLabel(), private parser:    {private_label:10.1f} us")
+    print(f"MarkdownLabel(), shared parser:     {label:10.1f} us")
+    print(f"Saved per MarkdownLabel():          {private_label - label:10.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())